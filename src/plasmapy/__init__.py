@@ -24,17 +24,23 @@
     "__citation__",
 ]
 
+import importlib
 import sys
 
-from plasmapy import (
-    analysis,
-    diagnostics,
-    dispersion,
-    formulary,
-    particles,
-    plasma,
-    simulation,
-    utils,
+# Subpackages are imported on first attribute access (PEP 562) so that
+# ``import plasmapy`` does not pull in every subpackage and their
+# dependencies (e.g., lmfit, matplotlib, and h5py) up front.
+_subpackages = frozenset(
+    {
+        "analysis",
+        "diagnostics",
+        "dispersion",
+        "formulary",
+        "particles",
+        "plasma",
+        "simulation",
+        "utils",
+    }
 )
 
 try:
@@ -94,4 +100,16 @@ def online_help(query: str) -> None:  # coverage: ignore
     webbrowser.open(url)
 
 
+def __getattr__(name: str):
+    """Import a subpackage of `plasmapy` the first time it is accessed."""
+    if name in _subpackages:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported subpackages in `dir` of `plasmapy`."""
+    return sorted(set(globals()) | _subpackages)
+
+
 del sys
@@ -14,6 +14,26 @@
 from scipy.interpolate import interp1d
 
 
+def _log1p_ratio(x):
+    """
+    Return ``log(1 + x) / x``, which tends to 1 as ``x`` tends to 0.
+    """
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < 1e-8
+    x_safe = np.where(small, 1.0, x)
+    return np.where(small, 1 - x / 2, np.log1p(x_safe) / x_safe)
+
+
+def _expm1_ratio(y):
+    """
+    Return ``(exp(y) - 1) / y``, which tends to 1 as ``y`` tends to 0.
+    """
+    y = np.asarray(y, dtype=float)
+    small = np.abs(y) < 1e-8
+    y_safe = np.where(small, 1.0, y)
+    return np.where(small, 1 + y / 2, np.expm1(y_safe) / y_safe)
+
+
 class Layer:
     r"""
     A layer in a detector film stack.
@@ -54,6 +74,19 @@ class Layer:
 
     name : `str`, optional
         An optional name for the layer.
+
+    Notes
+    -----
+    The stopping power is linearly interpolated between the points of
+    ``energy_axis``.  The continuous slowing down approximation (CSDA)
+    range of the layer material, which `Stack.deposition_curves` uses
+    to transport particles through the layer, is the integral of the
+    inverse of the interpolated stopping power from the lowest energy
+    of ``energy_axis``.  Since the stopping power is piecewise linear,
+    this integral and its inverse are evaluated exactly.  Particles
+    with energies above ``energy_axis`` are stopped in the layer, while
+    the stopping power is taken to be zero below ``energy_axis``, so
+    particles with lower energies cross the layer without losing energy.
     """
 
     def __init__(
@@ -98,6 +131,131 @@ def __init__(
                 f"Units of stopping_power keyword not recognized:{stopping_power.unit}"
             )
 
+    @property
+    def _csda_range_table(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The energies (in J), linear stopping powers (in J/m), and CSDA
+        ranges (in m) at the points of the energy axis, in order of
+        increasing energy.
+
+        The table is cached together with the energy axis and stopping
+        power that it was computed from, and is computed again when
+        either has been reassigned or modified since.
+        """
+        energies = self.energy_axis.to(u.J).value
+        stopping_power = self.linear_stopping_power.to(u.J / u.m).value
+
+        cache = self.__dict__.get("_csda_range_cache")
+        if (
+            cache is not None
+            and np.array_equal(cache[0], energies)
+            and np.array_equal(cache[1], stopping_power)
+        ):
+            return cache[2]
+
+        key = (energies.copy(), stopping_power.copy())
+
+        order = np.argsort(energies)
+        energies = energies[order]
+        stopping_power = stopping_power[order]
+
+        # The stopping power is linear on each interval, so the range
+        # across it is the integral of dE / (S_k + b (E - E_k))
+        ranges = np.zeros_like(energies)
+        ranges[1:] = np.cumsum(
+            np.diff(energies)
+            / stopping_power[:-1]
+            * _log1p_ratio(stopping_power[1:] / stopping_power[:-1] - 1)
+        )
+
+        table = (energies, stopping_power, ranges)
+        self._csda_range_cache = (*key, table)
+        return table
+
+    def csda_range(self, energies: u.Quantity[u.J]) -> u.Quantity[u.m]:
+        """
+        Calculate the CSDA range of particles in the layer material.
+
+        Parameters
+        ----------
+        energies : `~astropy.units.Quantity`
+            The kinetic energies of the particles, in units convertible
+            to J.
+
+        Returns
+        -------
+        range : `~astropy.units.Quantity`
+            The distance, in m, over which particles with ``energies``
+            slow down to the lowest energy of the energy axis of the
+            layer. The range is `~numpy.nan` for energies outside of the
+            energy axis.
+        """
+        return self._csda_range(energies.to(u.J).value) * u.m
+
+    def _csda_range(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Calculate the CSDA range, in m, for ``energies`` in J.
+        """
+        table_energies, stopping_power, ranges = self._csda_range_table
+
+        energies = np.asarray(energies, dtype=float)
+        k = np.clip(
+            np.searchsorted(table_energies, energies) - 1, 0, table_energies.size - 2
+        )
+        slope = (stopping_power[k + 1] - stopping_power[k]) / (
+            table_energies[k + 1] - table_energies[k]
+        )
+        dE = energies - table_energies[k]
+        result = ranges[k] + dE / stopping_power[k] * _log1p_ratio(
+            slope * dE / stopping_power[k]
+        )
+
+        outside = (energies < table_energies[0]) | (energies > table_energies[-1])
+        return np.where(outside, np.nan, result)
+
+    def _csda_energy(self, ranges: np.ndarray) -> np.ndarray:
+        """
+        Calculate the energies, in J, that correspond to CSDA ranges in
+        m within the range table of the layer.
+        """
+        table_energies, stopping_power, table_ranges = self._csda_range_table
+
+        k = np.clip(
+            np.searchsorted(table_ranges, ranges) - 1, 0, table_energies.size - 2
+        )
+        slope = (stopping_power[k + 1] - stopping_power[k]) / (
+            table_energies[k + 1] - table_energies[k]
+        )
+        dR = ranges - table_ranges[k]
+
+        # Invert R = R_k + log(S(E) / S_k) / b, where S(E) = S_k + b (E - E_k)
+        return table_energies[k] + stopping_power[k] * dR * _expm1_ratio(slope * dR)
+
+    def _transmitted_energies(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Calculate the energies, in J, of particles with ``energies`` in J
+        after crossing the layer.
+
+        Particles are stopped in the layer if their range is shorter
+        than the layer thickness or if their energy is above the highest
+        energy of the energy axis.  As when the stopping power is
+        integrated numerically, the stopping power is zero below the
+        lowest energy of the energy axis, so particles with lower
+        energies cross the layer without losing energy.
+        """
+        table_energies = self._csda_range_table[0]
+
+        residual_range = self._csda_range(energies) - self.thickness.to(u.m).value
+        transmitted = (
+            (energies >= table_energies[0])
+            & (energies <= table_energies[-1])
+            & (residual_range > 0)
+        )
+
+        exit_energies = np.where(energies < table_energies[0], energies, 0.0)
+        exit_energies[transmitted] = self._csda_energy(residual_range[transmitted])
+        return exit_energies
+
 
 class Stack:
     r"""
@@ -139,7 +297,10 @@ def thickness(self):
         return np.sum(thickness) * u.m
 
     def deposition_curves(
-        self, energies: u.Quantity[u.J], dx=1 * u.um, return_only_active: bool = True
+        self,
+        energies: u.Quantity[u.J],
+        dx: u.Quantity[u.m] | None = None,
+        return_only_active: bool = True,
     ):
         """
         Calculate the deposition of an ensemble of particles over a range of
@@ -152,8 +313,10 @@ def deposition_curves(
             convertible to J.
 
         dx : `~astropy.units.Quantity`, optional
-            The spatial resolution of the numerical integration of the
-            stopping power. Defaults to 1 μm.
+            If provided, the stopping power is numerically integrated
+            through each layer in steps of ``dx``. By default, the energy
+            deposited in each layer is instead calculated exactly from
+            the CSDA range of the layer material (see |Layer|).
 
         return_only_active : `bool`, default: `True`
             If `True`, only the energy bands of layers in which the
@@ -175,6 +338,35 @@ def deposition_curves(
 
         deposited_energy = np.zeros([len(self._layers), energies.size])
 
+        if dx is None:
+            # Transport all of the particles through one layer at a time
+            # using the CSDA range tables of the layers
+            for i, layer in enumerate(self._layers):
+                exit_energies = layer._transmitted_energies(energies)  # noqa: SLF001
+                deposited_energy[i, :] = energies - exit_energies
+                energies = exit_energies
+        else:
+            self._integrate_deposition(energies, dx, deposited_energy)
+
+        # Normalize the deposited energy array so that each number represents
+        # the fraction of a population of particles of that energy stopped
+        # in that layer.
+        deposited_energy /= np.sum(deposited_energy, axis=0)
+
+        # If this flag is set, return only the layers that correspond to active
+        # medium, ignoring the filter and substrate layers
+        if return_only_active:
+            active_ind = [i for i in range(len(self._layers)) if self._layers[i].active]
+            deposited_energy = deposited_energy[active_ind, :]
+
+        return deposited_energy
+
+    def _integrate_deposition(self, energies, dx, deposited_energy) -> None:
+        """
+        Numerically integrate the stopping power through each layer in
+        steps of ``dx``, adding the energy deposited in each layer to
+        ``deposited_energy``.
+        """
         for i, layer in enumerate(self._layers):
             # Interpolate stopping power for each energy
             # stopping power here is in MeV/cm
@@ -205,24 +397,11 @@ def deposition_curves(
                 energies += -dE
                 deposited_energy[i, :] += dE
 
-        # Normalize the deposited energy array so that each number represents
-        # the fraction of a population of particles of that energy stopped
-        # in that layer.
-        deposited_energy /= np.sum(deposited_energy, axis=0)
-
-        # If this flag is set, return only the layers that correspond to active
-        # medium, ignoring the filter and substrate layers
-        if return_only_active:
-            active_ind = [i for i in range(len(self._layers)) if self._layers[i].active]
-            deposited_energy = deposited_energy[active_ind, :]
-
-        return deposited_energy
-
     def energy_bands(
         self,
         energy_range: u.Quantity[u.J],
         dE: u.Quantity[u.J],
-        dx=1e-6 * u.m,  # noqa: ARG002
+        dx: u.Quantity[u.m] | None = None,
         return_only_active: bool = True,
     ):
         """
@@ -239,7 +418,7 @@ def energy_bands(
             Spacing between energy bins in the calculation. Units convertible
             to J.
 
-        dx : `~astropy.units.Quantity`, default: 1 μm
+        dx : `~astropy.units.Quantity`, optional
             The spatial resolution of the numerical integration of the stopping
             power. Passed directly to the `~deposition_curves` method.
 
@@ -265,7 +444,7 @@ def energy_bands(
         )
 
         deposited = self.deposition_curves(
-            energies, return_only_active=return_only_active
+            energies, dx=dx, return_only_active=return_only_active
         )
 
         energy_bands = np.zeros([deposited.shape[0], 2]) * u.J
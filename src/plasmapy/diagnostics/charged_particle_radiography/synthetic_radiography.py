@@ -5,10 +5,12 @@
 original fields (under some set of assumptions).
 """
 
-__all__ = ["Tracker", "synthetic_radiograph"]
+__all__ = ["RadiographAccumulator", "Tracker", "synthetic_radiograph"]
 
+import time
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -16,6 +18,7 @@
 import astropy.units as u
 import h5py
 import numpy as np
+from scipy.stats import qmc
 
 from plasmapy import particles
 from plasmapy.formulary.mathematics import rot_a_to_b
@@ -94,6 +97,7 @@ def __init__(
             "x0": (u.m, "dataset"),
             "y0": (u.m, "dataset"),
             "v0": (u.m, "dataset"),
+            "weights": (None, "dataset"),
         }
 
     def save(self) -> None:
@@ -106,6 +110,10 @@ def save(self) -> None:
 
         with h5py.File(output_file_path, "w") as output_file:
             for key, (_units, data_type) in self._quantities.items():
+                # Optional quantities, such as the particle weights
+                if key not in result_dictionary:
+                    continue
+
                 match data_type:
                     case "attribute":
                         output_file.attrs.create(key, result_dictionary[key])
@@ -246,7 +254,7 @@ def __init__(
 
         # A list of wire meshes added to the grid with add_wire_mesh
         # Particles that would hit these meshes will be removed at runtime
-        # by _apply_wire_mesh
+        # before the particles are pushed
         self.mesh_list = []
 
         # ************************************************************************
@@ -482,21 +490,30 @@ def add_wire_mesh(
 
         self.mesh_list.append(mesh_entry)
 
-    def _apply_wire_mesh(
+    def _wire_mesh_hits(
         self,
-        location=None,
-        wire_radius=None,
-        radius=None,
-        width=None,
-        height=None,
-        nwires=None,
-        mesh_hdir=None,
-        mesh_vdir=None,
+        x,
+        v,
+        tracked,
+        *,
+        location,
+        wire_radius,
+        radius,
+        width,
+        height,
+        nwires,
+        mesh_hdir,
+        mesh_vdir,
     ):
         """
-        Apply wire meshes that were added to ``self.mesh_list``.
+        Return a boolean mask of the particles in a chunk that hit a wire
+        mesh added with `add_wire_mesh`.
         """
-        x = self._coast_to_plane(location, mesh_hdir, mesh_vdir)
+        # Positions of the tracked particles where they cross the mesh plane
+        x = x.copy()
+        x[tracked] = self._coast_chunk_to_plane(
+            x[tracked], v[tracked], location, np.cross(mesh_hdir, mesh_vdir)
+        )
 
         # Particle positions in 2D on the mesh plane
         xloc = np.dot(x - location, mesh_hdir)
@@ -504,7 +521,7 @@ def _apply_wire_mesh(
 
         # Create an array in which True indicates that a particle has hit
         # a wire and False indicates that it has not
-        hit = np.zeros(self.num_particles, dtype=bool)
+        hit = np.zeros(x.shape[0], dtype=bool)
 
         # Mark particles that overlap vertical or horizontal position with
         # a wire
@@ -542,19 +559,7 @@ def _apply_wire_mesh(
             # the outside edge
             hit[np.isclose(loc_rad, radius, atol=wire_radius)] = True
 
-        # Identify the particles that have hit something, then remove them from
-        # all of the arrays
-        keep_these_particles = ~hit
-        number_kept_particles = keep_these_particles.sum()
-        nremoved = self.num_particles - number_kept_particles
-
-        if self.num_particles - nremoved <= 0:
-            raise ValueError(
-                "The specified mesh is blocking all of the particles. "
-                f"The wire diameter ({2 * wire_radius}) may be too large."
-            )
-
-        self._stop_particles(~keep_these_particles)
+        return hit
 
     # *************************************************************************
     # Particle creation methods
@@ -609,6 +614,84 @@ def _angles_uniform(num_particles, max_theta):
 
         return theta.flatten(), phi.flatten()
 
+    @staticmethod
+    def _unit_square_samples(num_particles, distribution, random_seed=None):
+        """
+        Generates points in the unit square, with shape ``(num_particles, 2)``,
+        that are either random, stratified, or from a low-discrepancy
+        sequence. The ``'stratified'`` distribution requires that
+        `num_particles` be a perfect square. If it is not, `num_particles`
+        will be set as the largest perfect square smaller than the provided
+        `num_particles`.
+        """
+        rng = np.random.default_rng(seed=random_seed)
+
+        match distribution:
+            case "monte-carlo":
+                return rng.uniform(size=(num_particles, 2))
+            case "stratified":
+                # One random point in each cell of a square grid
+                n_per = np.floor(np.sqrt(num_particles)).astype(np.int32)
+                cells = np.stack(
+                    np.meshgrid(np.arange(n_per), np.arange(n_per), indexing="ij"),
+                    axis=-1,
+                ).reshape(-1, 2)
+                return (cells + rng.uniform(size=cells.shape)) / n_per
+            case "sobol":
+                with warnings.catch_warnings():
+                    # Sobol' points are best balanced for powers of 2, but
+                    # are still better distributed than random points
+                    warnings.filterwarnings(
+                        "ignore", message="The balance properties", category=UserWarning
+                    )
+                    return qmc.Sobol(d=2, seed=random_seed).random(num_particles)
+            case "halton":
+                return qmc.Halton(d=2, seed=random_seed).random(num_particles)
+
+    @staticmethod
+    def _angles_from_unit_square(
+        samples, max_theta, grid_theta=None, grid_fraction=None
+    ):
+        """
+        Maps points in the unit square onto angles such that the flux per
+        solid angle is uniform within ``max_theta``.
+
+        If ``grid_fraction`` is provided, that fraction of the particles is
+        placed within the cone of half angle ``grid_theta`` that contains
+        the grids, and the rest between ``grid_theta`` and ``max_theta``.
+        Each particle is then given a weight, which is the ratio of the
+        uniform flux per solid angle to the sampled one, so that the mean
+        weight is one. Otherwise, the returned weights are `None`.
+        """
+        u_theta, u_phi = samples.T
+        cos_max = np.cos(max_theta)
+
+        if grid_fraction is None or grid_theta >= max_theta:
+            cos_theta = 1 - u_theta * (1 - cos_max)
+            weights = None
+        else:
+            cos_grid = np.cos(grid_theta)
+            inside = u_theta < grid_fraction
+            cos_theta = np.where(
+                inside,
+                1 - u_theta / grid_fraction * (1 - cos_grid),
+                cos_grid
+                - (u_theta - grid_fraction)
+                / (1 - grid_fraction)
+                * (cos_grid - cos_max),
+            )
+
+            # The fraction of the solid angle within max_theta that is
+            # within grid_theta
+            solid_angle_fraction = (1 - cos_grid) / (1 - cos_max)
+            weights = np.where(
+                inside,
+                solid_angle_fraction / grid_fraction,
+                (1 - solid_angle_fraction) / (1 - grid_fraction),
+            )
+
+        return np.arccos(cos_theta), 2 * np.pi * u_phi, weights
+
     @particles.particle_input
     def create_particles(
         self,
@@ -616,9 +699,13 @@ def create_particles(
         particle_energy,
         max_theta=None,
         particle: Particle = Particle("p+"),  # noqa: B008
-        distribution: Literal["monte-carlo", "uniform"] = "monte-carlo",
+        distribution: Literal[
+            "monte-carlo", "uniform", "stratified", "sobol", "halton"
+        ] = "monte-carlo",
         source_vdir=None,
         random_seed=None,
+        *,
+        grid_fraction: float | None = None,
     ) -> None:
         r"""
         Generates the angular distributions about the Z-axis, then
@@ -666,9 +753,23 @@ def create_particles(
                    ``num_particles`` will be set as the largest perfect square smaller
                    than the provided ``num_particles``.
 
+                - 'stratified': velocities will be chosen randomly within
+                   the cells of a grid that divides the solid angle into
+                   equal parts, such that the flux per solid angle is
+                   uniform. Like ``'uniform'``, this method requires that
+                   ``num_particles`` be a perfect square.
+
+                - 'sobol' or 'halton': velocities will be chosen from a
+                   scrambled Sobol' or Halton low-discrepancy sequence,
+                   such that the flux per solid angle is uniform.
+
             Simulations run in the ``'uniform'`` mode will imprint a grid pattern
             on the image, but will well-sample the field grid with a
-            smaller number of particles. The default is ``'monte-carlo'``.
+            smaller number of particles. The ``'stratified'``, ``'sobol'``,
+            and ``'halton'`` modes cover the solid angle more evenly than
+            ``'monte-carlo'``, which reduces the noise in the synthetic
+            radiograph for a given number of particles without imprinting
+            a pattern. The default is ``'monte-carlo'``.
 
         source_vdir : (3,) |array_like|, default: None
             A unit vector (in Cartesian coordinates) defining the orientation
@@ -678,6 +779,16 @@ def create_particles(
         random_seed : int, optional
             A random seed to be used when generating random particle
             distributions, e.g. with the ``monte-carlo`` distribution.
+
+        grid_fraction : float, optional
+            If provided, this fraction of the particles is directed into
+            the cone from the source that contains the grids, and the rest
+            of the particles are spread over the remaining solid angle within
+            ``max_theta``. Each particle is given a weight that compensates
+            for the change in the flux per solid angle, and the weights are
+            used by `synthetic_radiograph`. This focuses the computational
+            resources on the particles that probe the fields. Cannot be
+            used with the ``'uniform'`` distribution.
         """
         self._log("Creating Particles")
 
@@ -703,12 +814,37 @@ def create_particles(
         ER = particle_energy * 1.6e-19 / (m * self._c**2)
         v0 = self._c * np.sqrt(1 - 1 / (ER + 1) ** 2)
 
-        if distribution == "monte-carlo":
+        if grid_fraction is not None and not 0 < grid_fraction < 1:
+            raise ValueError(
+                f"grid_fraction must be between 0 and 1, but got {grid_fraction}."
+            )
+
+        weights = None
+        if distribution == "monte-carlo" and grid_fraction is None:
             theta, phi = self._angles_monte_carlo(
                 num_particles, max_theta, random_seed=random_seed
             )
         elif distribution == "uniform":
+            if grid_fraction is not None:
+                raise ValueError(
+                    "grid_fraction cannot be used with the 'uniform' distribution."
+                )
             theta, phi = self._angles_uniform(num_particles, max_theta)
+        elif distribution in {"monte-carlo", "stratified", "sobol", "halton"}:
+            samples = self._unit_square_samples(
+                num_particles, distribution, random_seed=random_seed
+            )
+            theta, phi, weights = self._angles_from_unit_square(
+                samples,
+                max_theta,
+                grid_theta=self.max_theta_hit_grid,
+                grid_fraction=grid_fraction,
+            )
+        else:
+            raise ValueError(
+                f"Unknown distribution {distribution!r}. Valid distributions are "
+                "'monte-carlo', 'uniform', 'stratified', 'sobol', and 'halton'."
+            )
 
         # Adjust num_particles to reflex what the distribution function returned.
         # Some distributions will modify the number of particles to meet the
@@ -733,7 +869,7 @@ def create_particles(
 
         # Call the underlying load method to ensure consistency with
         # other properties within the ParticleTracker
-        self.load_particles(x * u.m, v * u.m / u.s, particle=particle)
+        self.load_particles(x * u.m, v * u.m / u.s, particle=particle, weights=weights)
 
     @particles.particle_input
     def load_particles(
@@ -741,6 +877,7 @@ def load_particles(
         x,
         v,
         particle: Particle = Particle("p+"),  # noqa: B008
+        weights=None,
     ) -> None:
         r"""
         Load arrays of particle positions and velocities.
@@ -756,10 +893,24 @@ def load_particles(
         particle : |particle-like|, optional
             Representation of the particle species as either a |Particle| object
             or a string representation. The default particle is protons.
+
+        weights : |array_like|, shape (N,), optional
+            A weight for each particle, which is used by
+            `synthetic_radiograph`. By default, each particle has a weight
+            of one.
         """
         # Load particles for particle tracker class
         super().load_particles(x, v, particle)
 
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            if weights.shape != (self.num_particles,):
+                raise ValueError(
+                    f"Expected weights of shape ({self.num_particles},), but "
+                    f"got shape {weights.shape}."
+                )
+        self.weights = weights
+
         # But also calculate geometry-dependent variables
         self.theta = np.arccos(
             np.inner(self.v, self.src_n) / np.linalg.norm(self.v, axis=-1)
@@ -778,117 +929,175 @@ def load_particles(
     # Run/push loop methods
     # *************************************************************************
 
-    def _coast_to_grid(self) -> None:
-        r"""
-        Coasts all particles to the timestep when the first particle should
-        be entering the grid. Doing in this in one step (rather than pushing
-        the particles through zero fields) saves computation time.
+    # Number of particles processed at once when projecting the particles
+    # between the source, the meshes, the grids, and the detector. Chunks
+    # of this size keep the temporary arrays small enough to stay in cache.
+    projection_chunk_size = 2**14
+
+    def _projection_chunks(self):
         """
-        # Distance from the source to the nearest point on any grid
-        dist = min(
-            np.min(np.linalg.norm(arr - self.source, axis=3)) for arr in self.grids_arr
-        )
+        Yield slices that split the particles into chunks of
+        ``projection_chunk_size``.
+        """
+        for start in range(0, self.num_particles, self.projection_chunk_size):
+            yield slice(start, start + self.projection_chunk_size)
 
-        tracked_mask = self._tracked_particle_mask
+    def _lap(self, stage, start):
+        """
+        Add the time since ``start`` to the timing counter of ``stage``
+        and return the current time.
+        """
+        now = time.perf_counter()
+        self.projection_timings[stage] += now - start
+        return now
 
-        # Find speed of each particle towards the grid.
-        vmax = np.dot(self.v[tracked_mask], self.src_n)
+    @staticmethod
+    def _coast_chunk_to_plane(x, v, center, normal):
+        """
+        Calculate the positions where the current trajectories of particles
+        with positions ``x`` and velocities ``v`` impact a plane, described
+        by its center and normal vector.
+        """
+        # Calculate the time required to evolve each particle into the
+        # plane
+        t = np.inner(center - x, normal) / np.inner(v, normal)
 
-        # Time for each particle to reach the grid
-        t = dist / vmax
+        # Calculate particle positions in the plane
+        x_plane = x + v * t[:, np.newaxis]
 
-        # Coast the particles to the advanced position
-        self.x[tracked_mask] = (
-            self.x[tracked_mask] + self.v[tracked_mask] * t[:, np.newaxis]
-        )
+        # Check that all points are now in the plane
+        # (Eq. of a plane is nhat*x + d = 0)
+        plane_eq = np.dot(x_plane - center, normal)
+        if not np.allclose(plane_eq, 0, atol=1e-6):
+            raise ValueError("Coasting particles to plane failed.")
 
-    def _coast_to_plane(self, center, hdir, vdir, x=None, mask=None):
+        return x_plane
+
+    def _project_from_source(self) -> None:
+        r"""
+        Prepare the particles for tracking through the grids.
+
+        In a single pass over chunks of the particles, this applies the
+        wire meshes, coasts the particles that will not hit the grids
+        directly to the detector plane and stops them, generates the null
+        distribution in the detector plane, and coasts the tracked
+        particles to the time step when the first particle should be
+        entering the grids.  Coasting the particles in one step (rather
+        than pushing the particles through zero fields) saves computation
+        time.
         """
-        Calculates the positions where the current trajectories of each
-        particle impact a plane, described by the plane's center and
-        horizontal and vertical unit vectors.
+        det_normal = np.cross(self.det_hdir, self.det_vdir)
 
-        Returns an [num_particles, 3] array of the particle positions in the plane
+        # Distance from the source to the nearest point on any grid
+        dist = min(
+            np.min(np.linalg.norm(arr - self.source, axis=3)) for arr in self.grids_arr
+        )
 
-        By default this function does not alter self.x. The optional keyword
-        x can be used to pass in an output array that will used to hold
-        the positions in the plane. This can be used to directly update self.x
-        as follows:
+        # Store a copy of the initial velocity distribution and a null
+        # distribution of points (the result in the absence of any fields)
+        # for statistical comparison
+        self.v0 = np.empty_like(self.v)
+        self.x0 = np.empty_like(self.x)
 
-        self._coast_to_plane(self.detector, self.det_hdir, self.det_vdir, x
-                             = self.x)
+        mesh_hits = [0] * len(self.mesh_list)
 
-        Parameters
-        ----------
-        center : float
-            The center of the plane towards which the particles are advanced
+        for chunk in self._projection_chunks():
+            x = self.x[chunk]
+            v = self.v[chunk]
+            tracked = ~np.isnan(x[:, 0]) & ~np.isnan(v[:, 0])
 
-        hdir : `numpy.ndarray`, shape (3)
-            A unit vector (in Cartesian coordinates) defining the horizontal
-            direction of the plane.
+            start = time.perf_counter()
 
-        vdir : `numpy.ndarray`, shape (3)
-            A unit vector (in Cartesian coordinates) defining the vertical
-            direction of the plane.
+            # Stop the particles that hit a mesh
+            for i, mesh in enumerate(self.mesh_list):
+                hit = self._wire_mesh_hits(x, v, tracked, **mesh)
+                mesh_hits[i] += np.count_nonzero(hit)
+                v[hit] = np.nan
+                tracked &= ~hit
 
-        x : `numpy.ndarray`, shape (num_particles), optional
-            The array to which the resulting particle positions are stored.
-            By default, the current position array will be used.
+            start = self._lap("wire_mesh", start)
 
-        mask : `numpy.ndarray`, shape (num_particles), optional
-            A boolean mask representing the particles to perform the coasting
-            operation. By default, only the tracked particles (i.e. those that
-            are going to hit the grids) will be coasted.
-        """
+            # Particles that will not hit the grids are not pushed through
+            # the fields, but instead advanced to the detector plane
+            untracked = self.theta[chunk] >= self.max_theta_hit_grid
+            coasted = untracked & tracked
+            x[coasted] = self._coast_chunk_to_plane(
+                x[coasted], v[coasted], self.detector, det_normal
+            )
+            v[untracked] = np.nan
+            tracked &= ~untracked
 
-        normal = np.cross(hdir, vdir)
+            start = self._lap("coast_untracked", start)
 
-        if mask is None:
-            mask = self._tracked_particle_mask
+            self.v0[chunk] = v
+            x0 = self.x0[chunk]
+            x0[...] = x
+            x0[tracked] = self._coast_chunk_to_plane(
+                x[tracked], v[tracked], self.detector, det_normal
+            )
 
-        # Calculate the time required to evolve each particle into the
-        # plane
-        t = np.inner(center[np.newaxis, :] - self.x[mask], normal) / np.inner(
-            self.v[mask], normal
-        )
+            start = self._lap("null_distribution", start)
 
-        # Calculate particle positions in the plane
-        if x is None:
-            # If no output array is provided, preallocate
-            x = np.copy(self.x)
+            # Advance the tracked particles to near the start of the grid,
+            # using the speed of each particle towards the grid
+            v_tracked = v[tracked]
+            x[tracked] += (
+                v_tracked * (dist / np.dot(v_tracked, self.src_n))[:, np.newaxis]
+            )
 
-        x[mask] = self.x[mask] + self.v[mask] * t[:, np.newaxis]
+            self._lap("coast_to_grid", start)
 
-        # Check that all points are now in the plane
-        # (Eq. of a plane is nhat*x + d = 0)
-        plane_eq = np.dot(x[mask] - center, normal)
-        if not np.allclose(plane_eq, 0, atol=1e-6):
-            raise ValueError("Coasting particles to plane failed.")
+        self._reset_cache()
 
-        return x
+        for hits, mesh in zip(mesh_hits, self.mesh_list, strict=True):
+            if hits >= self.num_particles:
+                raise ValueError(
+                    "The specified mesh is blocking all of the particles. "
+                    f"The wire diameter ({2 * mesh['wire_radius']}) may be too large."
+                )
 
-    def _remove_deflected_particles(self) -> None:
+    def _project_to_detector(self) -> None:
         r"""
-        Removes any particles that have been deflected away from the detector
-        plane (eg. those that will never hit the grid).
+        Remove any particles that have been deflected away from the detector
+        plane (eg. those that will never hit the grid), and advance the
+        remaining particles to the detector plane, in a single pass over
+        chunks of the particles.
         """
-        dist_remaining = np.dot(self.x, self.det_n) + np.linalg.norm(self.detector)
+        det_normal = np.cross(self.det_hdir, self.det_vdir)
+        det_distance = np.linalg.norm(self.detector)
+
+        num_deflected = 0
+
+        for chunk in self._projection_chunks():
+            x = self.x[chunk]
+            v = self.v[chunk]
+
+            start = time.perf_counter()
+
+            # If particles have not yet reached the detector plane and are
+            # moving away from it, they will never reach the detector.
+            # So, we can remove them from the arrays
+            dist_remaining = np.dot(x, self.det_n) + det_distance
+            v_towards_det = np.dot(v, -self.det_n)
+            deflected = (v_towards_det < 0) & (dist_remaining > 0)
+            x[deflected] = np.nan
+            v[deflected] = np.nan
+            num_deflected += np.count_nonzero(deflected)
 
-        v_towards_det = np.dot(self.v, -self.det_n)
+            start = self._lap("remove_deflected", start)
 
-        # If particles have not yet reached the detector plane and are moving
-        # away from it, they will never reach the detector.
-        # So, we can remove them from the arrays
+            # Advance the particles to the image plane
+            tracked = ~np.isnan(x[:, 0]) & ~np.isnan(v[:, 0])
+            x[tracked] = self._coast_chunk_to_plane(
+                x[tracked], v[tracked], self.detector, det_normal
+            )
 
-        # Find the indices of all particles that we should keep:
-        # i.e. those still moving towards the detector.
-        ind = np.logical_not((v_towards_det < 0) & (dist_remaining > 0)).nonzero()[0]
+            self._lap("coast_to_detector", start)
 
-        # Drop the other particles
-        self._remove_particles((v_towards_det < 0) & (dist_remaining > 0))
+        self._reset_cache()
 
         # Store the number of particles deflected
-        self.fract_deflected = (self.num_particles - ind.size) / self.num_particles
+        self.fract_deflected = num_deflected / self.num_particles
 
         # Warn the user if a large number of particles are being deflected
         if self.fract_deflected > 0.05:
@@ -900,7 +1109,7 @@ def _remove_deflected_particles(self) -> None:
                 RuntimeWarning,
             )
 
-    def run(self) -> None:
+    def run(self, n_workers: int | None = None, chunk_size: int | None = None) -> None:
         r"""
         Runs a particle-tracing simulation.
 
@@ -911,50 +1120,56 @@ def run(self) -> None:
         detector plane where they can be used to construct a synthetic
         diagnostic image.
 
+        Parameters
+        ----------
+        n_workers : int, optional
+            If provided, the particles are pushed through the grids in
+            chunks by a pool of ``n_workers`` processes. See
+            `~plasmapy.simulation.particle_tracker.particle_tracker.ParticleTracker.run`.
+
+        chunk_size : int, optional
+            The maximum number of particles in each chunk pushed by the
+            pool of processes.
+
         Returns
         -------
         None
+
+        Notes
+        -----
+        Before and after the particles are pushed through the grids, the
+        particles are projected between the source, any wire meshes, the
+        grids, and the detector plane analytically. Each projection is a
+        single pass over chunks of ``projection_chunk_size`` particles
+        (16384 by default), which can be changed by setting the
+        ``projection_chunk_size`` attribute before calling ``run``.
+        The time spent in each stage of the projections, in seconds, is
+        stored in the ``projection_timings`` dictionary.
         """
 
         self._enforce_particle_creation()
 
-        # If meshes have been added, apply them now
-        for mesh in self.mesh_list:
-            self._log("Applying meshes")
-            self._apply_wire_mesh(**mesh)
-
-        self._log("Coasting untracked particles to the detector plane")
-        # These particles will not be pushed through the fields
-        # but instead will be automatically advanced
-        # to the detector plane
-        theta_mask = self.theta >= self.max_theta_hit_grid
-
-        # Take the intersection of the theta mask and the tracked particle mask
-        # This must be done because some particles could have already been stopped
-        # by _apply_wire_mesh
-        self.x = self._coast_to_plane(
-            self.detector,
-            self.det_hdir,
-            self.det_vdir,
-            mask=theta_mask & self._tracked_particle_mask,
+        self.projection_timings = dict.fromkeys(
+            (
+                "wire_mesh",
+                "coast_untracked",
+                "null_distribution",
+                "coast_to_grid",
+                "remove_deflected",
+                "coast_to_detector",
+            ),
+            0.0,
         )
-        self._stop_particles(theta_mask)
-        self.fract_tracked = self.num_particles_tracked / self.num_particles
 
-        self._log("Generating null distribution in detector plane")
-        # Store a copy of the initial velocity distribution in memory
-        # This will be used later to calculate the maximum deflection
-        self.v0 = np.copy(self.v)
-        # Generate a null distribution of points (the result in the absence of
-        # any fields) for statistical comparison
-        self.x0 = self._coast_to_plane(self.detector, self.det_hdir, self.det_vdir)
-
-        self._log("Advancing tracked particles to the start of the grid")
-        # Advance the tracked particles to the near the start of the grid
-        self._coast_to_grid()
+        self._log(
+            "Applying meshes, coasting untracked particles to the detector "
+            "plane, and advancing tracked particles to the start of the grid"
+        )
+        self._project_from_source()
+        self.fract_tracked = self.num_particles_tracked / self.num_particles
         self.coasted_particles = np.copy(self.x)
 
-        super().run()
+        super().run(n_workers=n_workers, chunk_size=chunk_size)
 
         if self.num_entered < 0.1 * self.num_particles:
             warnings.warn(
@@ -965,11 +1180,9 @@ def run(self) -> None:
                 RuntimeWarning,
             )
 
-        # Remove particles that will never reach the detector
-        self._remove_deflected_particles()
-
-        # Advance the particles to the image plane
-        self._coast_to_plane(self.detector, self.det_hdir, self.det_vdir, x=self.x)
+        # Remove particles that will never reach the detector and advance
+        # the remaining particles to the image plane
+        self._project_to_detector()
 
         self.save_routine.save()
 
@@ -1076,6 +1289,10 @@ def results_dict(self):
                The velocity is in a coordinate system relative to the
                detector plane. The components are [normal, horizontal,
                vertical] relative to the detector plane coordinates.
+           * - ``"weights"``
+             - `~numpy.ndarray`, [``num_particles``,]
+             - The weight of each particle. Only included if the particles
+               were created or loaded with weights.
         """
 
         if not self._has_run:
@@ -1104,7 +1321,7 @@ def results_dict(self):
         v0[:, 1] = np.dot(self.v0, self.det_hdir)
         v0[:, 2] = np.dot(self.v0, self.det_vdir)
 
-        return {
+        results = {
             "source": self.source,
             "detector": self.detector,
             "mag": self.mag,
@@ -1118,6 +1335,11 @@ def results_dict(self):
             "v0": v0,
         }
 
+        if self.weights is not None:
+            results["weights"] = self.weights
+
+        return results
+
 
 # *************************************************************************
 # Synthetic diagnostic methods (creating output)
@@ -1165,13 +1387,20 @@ def synthetic_radiograph(obj, size=None, bins=None, ignore_grid: bool = False):
         The vertical axis of the synthetic radiograph in meters.
 
     intensity : `~numpy.ndarray`, shape ``(hbins, vbins)``
-        The number of particles counted in each bin of the histogram.
+        The number of particles counted in each bin of the histogram. If
+        the particles have weights (see |results_dict|), this is the sum of
+        the weights of the particles in each bin.
+
 
+    See Also
+    --------
+    RadiographAccumulator
 
     Notes
     -----
     This function ignores any particles that are stopped or removed before
-    reaching the detector plane.
+    reaching the detector plane. To histogram more particles than fit in
+    memory, use `RadiographAccumulator`.
 
     """
 
@@ -1239,9 +1468,17 @@ def synthetic_radiograph(obj, size=None, bins=None, ignore_grid: bool = False):
     sanitized_xloc = xloc[nan_mask]
     sanitized_yloc = yloc[nan_mask]
 
+    weights = results_dict.get("weights")
+    if weights is not None:
+        weights = weights[nan_mask]
+
     # Generate the histogram
     intensity, h, v = np.histogram2d(
-        sanitized_xloc, sanitized_yloc, range=size.to(u.m).value, bins=bins
+        sanitized_xloc,
+        sanitized_yloc,
+        range=size.to(u.m).value,
+        bins=bins,
+        weights=weights,
     )
 
     # h, v are the bin edges: compute the centers to produce arrays
@@ -1261,3 +1498,413 @@ def synthetic_radiograph(obj, size=None, bins=None, ignore_grid: bool = False):
         )
 
     return h * u.m, v * u.m, intensity
+
+
+def _accumulate_source(accumulator, source, weights=None, chunk_size=None):
+    """
+    Add ``source`` to ``accumulator`` and return it.  Used to fill
+    partial radiographs in worker processes.
+    """
+    accumulator.add(source, weights=weights, chunk_size=chunk_size)
+    return accumulator
+
+
+class RadiographAccumulator:
+    r"""
+    Accumulate a synthetic radiograph from chunks of particles.
+
+    .. |Tracker| replace:: `~plasmapy.diagnostics.charged_particle_radiography.synthetic_radiography.Tracker`
+    .. |results_dict| replace:: `~plasmapy.diagnostics.charged_particle_radiography.synthetic_radiography.Tracker.results_dict`
+
+    Unlike `synthetic_radiograph`, which loads all of the particle
+    positions at once, a `RadiographAccumulator` histograms the
+    particles into a fixed detector grid one chunk at a time. The
+    particles can be read from any number of |Tracker| objects, results
+    dictionaries, or HDF5 output files, and partial radiographs filled
+    independently (e.g., in separate processes) can be combined with
+    `merge`.
+
+    Parameters
+    ----------
+    size : `~astropy.units.Quantity`, shape ``(2, 2)``
+        The size of the detector array, specified as the minimum
+        and maximum values included in both the horizontal and vertical
+        directions in the detector plane coordinates. Shape is
+        ``((hmin, hmax), (vmin, vmax))``. Units must be convertible to
+        meters.
+
+    bins : array of integers, shape ``(2)``
+        The number of bins in each direction in the format
+        ``(hbins, vbins)``.  The default is ``(200, 200)``.
+
+    energy_bins : `~astropy.units.Quantity`, optional
+        The edges of the bins in kinetic energy into which the particles
+        are sorted, in units convertible to joules. If provided, the
+        intensity has an additional energy axis and ``particle`` is
+        required.
+
+    particle : |particle-like|, optional
+        The particle species, used to calculate the kinetic energy of
+        the particles from their velocities.
+
+    ignore_grid : `bool`, default: `False`
+        If `True`, accumulate the intensity in the image plane in the
+        absence of simulated fields.
+
+    Notes
+    -----
+    Particles that are stopped or removed before reaching the detector
+    plane, or that fall outside of the detector or the energy bins, are
+    not counted.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> accumulator = RadiographAccumulator(size=[[-1, 1], [-1, 1]] * u.cm, bins=(4, 4))
+    >>> x = np.array([-0.005, 0.005, 0.005])
+    >>> y = np.array([0.0, 0.005, 0.005])
+    >>> accumulator.add_particles(x, y, weights=[1, 2, 3])
+    >>> accumulator.intensity.sum()
+    np.float64(6.0)
+    """
+
+    def __init__(
+        self,
+        size: u.Quantity[u.m],
+        bins=None,
+        energy_bins: u.Quantity[u.J] | None = None,
+        particle: particles.ParticleLike | None = None,
+        ignore_grid: bool = False,
+    ) -> None:
+        if not isinstance(size, u.Quantity):
+            raise TypeError(
+                "Argument `size` must be an astropy.units.Quantity object with "
+                "units convertible to meters."
+            )
+        elif not size.unit.is_equivalent(u.m):
+            raise ValueError("Argument `size` must have units convertible to meters.")
+        elif size.shape != (2, 2):
+            raise ValueError(
+                f"Argument `size` must have shape (2, 2), but got {size.shape}."
+            )
+
+        if bins is None:
+            bins = [200, 200]
+
+        size = size.to(u.m).value
+        self._size = size
+        self._bins = tuple(bins)
+        self._edges = [
+            np.linspace(*size[0], bins[0] + 1),
+            np.linspace(*size[1], bins[1] + 1),
+        ]
+
+        self.particle = Particle(particle) if particle is not None else None
+
+        self._mass = None
+        if energy_bins is not None:
+            if particle is None:
+                raise ValueError(
+                    "Argument `particle` is required to sort particles into "
+                    "energy bins."
+                )
+            self._mass = self.particle.mass.to(u.kg).value
+            self._edges.append(np.sort(energy_bins.to(u.J).value))
+
+        self.ignore_grid = ignore_grid
+
+        self._intensity = np.zeros([edges.size - 1 for edges in self._edges])
+        self._num_particles = 0
+        self._num_counted = 0
+
+    @property
+    def hax(self) -> u.Quantity[u.m]:
+        """The horizontal axis of the synthetic radiograph in meters."""
+        h = self._edges[0]
+        return (h[:-1] + h[1:]) / 2 * u.m
+
+    @property
+    def vax(self) -> u.Quantity[u.m]:
+        """The vertical axis of the synthetic radiograph in meters."""
+        v = self._edges[1]
+        return (v[:-1] + v[1:]) / 2 * u.m
+
+    @property
+    def energy_bins(self) -> u.Quantity[u.J] | None:
+        """The edges of the energy bins in joules, if any."""
+        return self._edges[2] * u.J if self._mass is not None else None
+
+    @property
+    def intensity(self) -> np.ndarray:
+        """
+        The (weighted) number of particles counted in each bin, with shape
+        ``(hbins, vbins)`` or ``(hbins, vbins, nenergies)`` if energy
+        bins are used.
+        """
+        return self._intensity
+
+    @property
+    def num_particles(self) -> int:
+        """The number of particles that have been added."""
+        return self._num_particles
+
+    @property
+    def num_counted(self) -> int:
+        """
+        The number of particles that have been added which were counted
+        on the detector.
+        """
+        return self._num_counted
+
+    @property
+    def fraction_counted(self) -> float:
+        """
+        The fraction of the particles that have been added which were
+        counted on the detector.
+        """
+        return self._num_counted / self._num_particles if self._num_particles else 0.0
+
+    def add_particles(self, x, y, v=None, weights=None, num_particles=None) -> None:
+        """
+        Add a chunk of particles to the radiograph.
+
+        Parameters
+        ----------
+        x, y : array_like, shape ``(n,)``
+            The horizontal and vertical locations where the particles
+            hit the detector plane, in meters.
+
+        v : array_like, shape ``(n, 3)``, optional
+            The velocities of the particles in the detector plane
+            coordinates, in meters per second. Particles with a NaN
+            normal velocity have been stopped and are not counted.
+            Required if energy bins are used.
+
+        weights : array_like, shape ``(n,)``, optional
+            A weight for each particle. By default, each particle has
+            a weight of one.
+
+        num_particles : `int`, optional
+            The number of particles that the chunk represents, including
+            any that were removed before reaching the detector. Defaults
+            to ``n``.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        mask = ~np.isnan(x) & ~np.isnan(y)
+        sample = [x, y]
+        if v is not None:
+            v = np.asarray(v, dtype=float)
+            mask &= ~np.isnan(v[:, 0])
+
+        if self._mass is not None:
+            if v is None:
+                raise ValueError(
+                    "Particle velocities are required to sort particles into "
+                    "energy bins."
+                )
+            gamma = 1 / np.sqrt(1 - np.sum(v**2, axis=-1) / const.c.si.value**2)
+            sample.append((gamma - 1) * self._mass * const.c.si.value**2)
+
+        sample = np.stack(sample, axis=-1)[mask]
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)[mask]
+
+        intensity, _ = np.histogramdd(sample, bins=self._edges, weights=weights)
+        self._intensity += intensity
+
+        # Count the particles that landed in the histogram, in the same way
+        # as np.histogramdd (the last bin includes its right edge)
+        counted = np.ones(sample.shape[0], dtype=bool)
+        for i, edges in enumerate(self._edges):
+            counted &= (sample[:, i] >= edges[0]) & (sample[:, i] <= edges[-1])
+
+        self._num_counted += int(np.count_nonzero(counted))
+        self._num_particles += x.size if num_particles is None else num_particles
+
+    def add(self, obj, weights=None, chunk_size: int | None = None) -> None:
+        """
+        Add the particles from the results of a synthetic radiography
+        simulation to the radiograph.
+
+        Parameters
+        ----------
+        obj : `dict` or `~pathlib.Path` or |Tracker|
+            Either a |Tracker| object that has been run, a dictionary
+            equivalent to |results_dict|, or path to a saved output file
+            from a |Tracker| object (HDF5 file). Output files are read
+            in chunks of ``chunk_size`` particles.
+
+        weights : array_like, shape ``(num_particles,)``, optional
+            A weight for each particle. Any array that supports slicing,
+            such as an HDF5 dataset or a memory-mapped array, can be
+            used so that the weights are also read in chunks. By default,
+            the weights stored with the simulation results are used, if any.
+
+        chunk_size : `int`, optional
+            The number of particles to read from an output file at once.
+            By default, all particles are read at once.
+        """
+        x_key, y_key, v_key = ("x0", "y0", "v0") if self.ignore_grid else "xyv"
+
+        if isinstance(obj, str | Path):
+            with h5py.File(obj, "r") as f:
+                if weights is None and "weights" in f:
+                    weights = f["weights"]
+                self._add_chunks(f[x_key], f[y_key], f[v_key], weights, chunk_size)
+            return
+
+        if isinstance(obj, Tracker):
+            # results_dict raises an error if the simulation has not been run.
+            results_dict = obj.results_dict
+        elif isinstance(obj, dict):
+            results_dict = obj
+        else:
+            raise TypeError(
+                f"Expected type `Path`, `dict` or {Tracker} for argument `obj`, but "
+                f"got type {type(obj)}."
+            )
+
+        self._add_chunks(
+            results_dict[x_key],
+            results_dict[y_key],
+            results_dict[v_key],
+            weights if weights is not None else results_dict.get("weights"),
+            chunk_size,
+        )
+
+    def _add_chunks(self, x, y, v, weights, chunk_size) -> None:
+        """Add particles from sliceable arrays in chunks of ``chunk_size``."""
+        num_particles = x.shape[0]
+        if chunk_size is None:
+            chunk_size = max(num_particles, 1)
+
+        for start in range(0, num_particles, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            self.add_particles(
+                x[chunk],
+                y[chunk],
+                v[chunk],
+                weights=weights[chunk] if weights is not None else None,
+            )
+
+    def add_many(
+        self,
+        sources,
+        weights=None,
+        chunk_size: int | None = None,
+        n_workers: int | None = None,
+    ) -> None:
+        """
+        Add the particles from several simulation results, optionally
+        in parallel.
+
+        Each source is histogrammed into a separate partial radiograph,
+        and the partial radiographs are then merged into this one.
+
+        Parameters
+        ----------
+        sources : iterable
+            The simulation results, each of which is of any of the types
+            accepted by `add`.
+
+        weights : iterable, optional
+            The weights for each source, or `None`.
+
+        chunk_size : `int`, optional
+            The number of particles to read from an output file at once.
+
+        n_workers : `int`, optional
+            The number of processes used to fill the partial radiographs.
+            By default, the sources are processed sequentially in this
+            process. The sources and weights must be picklable, e.g.,
+            paths to output files, if ``n_workers`` is given.
+        """
+        sources = list(sources)
+        weights = [None] * len(sources) if weights is None else list(weights)
+
+        if n_workers is None:
+            for source, source_weights in zip(sources, weights, strict=True):
+                self.add(source, weights=source_weights, chunk_size=chunk_size)
+            return
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            partial_radiographs = executor.map(
+                _accumulate_source,
+                [self._empty_copy() for _ in sources],
+                sources,
+                weights,
+                [chunk_size] * len(sources),
+            )
+            for partial_radiograph in partial_radiographs:
+                self.merge(partial_radiograph)
+
+    def _empty_copy(self) -> "RadiographAccumulator":
+        """Return an empty accumulator with the same bins as this one."""
+        return RadiographAccumulator(
+            self._size * u.m,
+            bins=self._bins,
+            energy_bins=self.energy_bins,
+            particle=self.particle,
+            ignore_grid=self.ignore_grid,
+        )
+
+    def merge(self, other: "RadiographAccumulator") -> None:
+        """
+        Add the particles accumulated in another radiograph with the
+        same bins to this one.
+
+        Raises
+        ------
+        ValueError
+            If the bins of ``other`` differ from those of this radiograph.
+        """
+        if (
+            other.intensity.shape != self._intensity.shape
+            or not u.allclose(other.hax, self.hax, rtol=0, atol=0 * u.m)
+            or not u.allclose(other.vax, self.vax, rtol=0, atol=0 * u.m)
+            or (
+                self.energy_bins is not None
+                and not u.allclose(
+                    other.energy_bins, self.energy_bins, rtol=0, atol=0 * u.J
+                )
+            )
+            or other.particle != self.particle
+            or other.ignore_grid != self.ignore_grid
+        ):
+            raise ValueError("Only radiographs with the same bins can be merged.")
+
+        self._intensity += other.intensity
+        self._num_particles += other.num_particles
+        self._num_counted += other.num_counted
+
+    def radiograph(self):
+        """
+        Return the synthetic radiograph.
+
+        Returns
+        -------
+        hax : `~astropy.units.Quantity` array shape ``(hbins,)``
+            The horizontal axis of the synthetic radiograph in meters.
+
+        vax : `~astropy.units.Quantity` array shape ``(vbins, )``
+            The vertical axis of the synthetic radiograph in meters.
+
+        intensity : `~numpy.ndarray`, shape ``(hbins, vbins)``
+            The (weighted) number of particles counted in each bin of
+            the histogram. If energy bins are used, the shape is
+            ``(hbins, vbins, nenergies)``.
+        """
+        # Throw a warning if < 50% of the particles are included on the
+        # histogram
+        if self.fraction_counted < 0.5:
+            warnings.warn(
+                f"Only {self.fraction_counted:.2%} of the particles are shown "
+                "on this synthetic radiograph. Consider increasing "
+                "the size to include more.",
+                RuntimeWarning,
+            )
+
+        return self.hax, self.vax, self._intensity.copy()
@@ -4,6 +4,7 @@
 """
 
 __all__ = [
+    "SpectralDensityFitter",
     "spectral_density",
     "spectral_density_model",
 ]
@@ -11,12 +12,15 @@
 
 import warnings
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import astropy.constants as const
 import astropy.units as u
 import numpy as np
 from lmfit import Model
+from scipy.optimize import OptimizeResult, least_squares
+from scipy.signal import fftconvolve
 
 from plasmapy.formulary import (
     permittivity_1D_Maxwellian_lite,
@@ -47,6 +51,49 @@
 #     atomic species.
 
 
+def _apply_instrument_and_notch(
+    Skw: np.ndarray,
+    wavelengths: np.ndarray,
+    instr_func_arr: np.ndarray | None,
+    notch: np.ndarray | None,
+) -> np.ndarray:
+    """
+    Convolve the spectra ``Skw`` along their last axis with the
+    instrument function ``instr_func_arr`` and set them to zero within
+    each ``notch``, for `spectral_density_lite`.
+    """
+    # Apply an instrument function if one is provided
+    if instr_func_arr is not None:
+        if Skw.ndim == 1:
+            Skw = np.convolve(Skw, instr_func_arr, mode="same")
+        else:
+            Skw = fftconvolve(
+                Skw,
+                np.reshape(instr_func_arr, (1,) * (Skw.ndim - 1) + (-1,)),
+                mode="same",
+                axes=-1,
+            )
+
+    # add notch(es) to the spectrum if any are provided
+    if notch is not None:
+        # If only one notch is included, create a dummy second dimension
+        if np.ndim(notch) == 1:
+            notch = np.array(
+                [
+                    notch,
+                ]
+            )
+
+        for notch_i in notch:
+            # For each notch, identify the index for the beginning and end
+            # wavelengths and set Skw to zero between those indices
+            x0 = np.argmin(np.abs(wavelengths - notch_i[0]))
+            x1 = np.argmin(np.abs(wavelengths - notch_i[1]))
+            Skw[..., x0:x1] = 0
+
+    return Skw
+
+
 @preserve_signature
 def spectral_density_lite(
     wavelengths,
@@ -73,61 +120,65 @@ def spectral_density_lite(
     for computational use and thus has data conditioning safeguards
     removed.
 
+    Many spectra can be computed in a single call by giving the plasma
+    parameters leading batch dimensions, as described in the notes
+    below.
+
     Parameters
     ----------
     wavelengths : (Nλ,) `~numpy.ndarray`
         The wavelengths in meters over which the spectral density
         function will be calculated.
 
-    probe_wavelength : real number
+    probe_wavelength : real number or (...) `~numpy.ndarray`
         Wavelength of the probe laser in meters.
 
-    n : `~numpy.ndarray`
+    n : real number or (...) `~numpy.ndarray`
         Total combined number density of all electron populations in
         m\ :sup:`-3`\ .
 
-    T_e : (Ne,) `~numpy.ndarray`
+    T_e : (..., Ne) `~numpy.ndarray`
         Temperature of each electron population in kelvin, where Ne is
         the number of electron populations.
 
-    T_i : (Ni,) `~numpy.ndarray`
+    T_i : (..., Ni) `~numpy.ndarray`
         Temperature of each ion population in kelvin, where Ni is the
         number of ion populations.
 
-    efract : (Ne,) `~numpy.ndarray`
+    efract : (..., Ne) `~numpy.ndarray`
         An `~numpy.ndarray` where each element represents the fraction
         (or ratio) of the electron population number density to the
         total electron number density. Must sum to 1.0. Default is a
         single electron population.
 
-    ifract : (Ni,) `~numpy.ndarray`
+    ifract : (..., Ni) `~numpy.ndarray`
         An `~numpy.ndarray` object where each element represents the
         fraction (or ratio) of the ion population number density to the
         total ion number density. Must sum to 1.0. Default is a single
         ion species.
 
-    ion_z : (Ni,) `~numpy.ndarray`
+    ion_z : (..., Ni) `~numpy.ndarray`
         An `~numpy.ndarray` of the charge number :math:`Z` of each ion
         species.
 
-    ion_mass : (Ni,) `~numpy.ndarray`
+    ion_mass : (..., Ni) `~numpy.ndarray`
         An `~numpy.ndarray` of the mass number of each ion species in kg.
 
-    electron_vel : (Ne, 3) `~numpy.ndarray`
+    electron_vel : (..., Ne, 3) `~numpy.ndarray`
         Velocity of each electron population in the rest frame (in m/s).
         If set, overrides ``electron_vdir`` and ``electron_speed``.
         Defaults to a stationary plasma ``[0, 0, 0]`` m/s.
 
-    ion_vel : (Ni, 3) `~numpy.ndarray`
+    ion_vel : (..., Ni, 3) `~numpy.ndarray`
         Velocity vectors for each electron population in the rest frame
         (in  m/s). If set, overrides ``ion_vdir`` and ``ion_speed``.
         Defaults to zero drift for all specified ion species.
 
-    probe_vec : (3,) float `~numpy.ndarray`
+    probe_vec : (..., 3) float `~numpy.ndarray`
         Unit vector in the direction of the probe laser. Defaults to
         ``[1, 0, 0]``.
 
-    scatter_vec : (3,) float `~numpy.ndarray`
+    scatter_vec : (..., 3) float `~numpy.ndarray`
         Unit vector pointing from the scattering volume to the detector.
         Defaults to [0, 1, 0] which, along with the default ``probe_vec``,
         corresponds to a 90 degree scattering angle geometry.
@@ -151,28 +202,66 @@ def spectral_density_lite(
 
     Returns
     -------
-    alpha : float
+    alpha : float or (...) `~numpy.ndarray`
         Mean scattering parameter, where ``alpha`` > 1 corresponds to
         collective scattering and ``alpha`` < 1 indicates non-collective
         scattering. The scattering parameter is calculated based on the
         total plasma density :math:`n`.
 
-    Skw : `~numpy.ndarray`
+    Skw : (..., Nλ) `~numpy.ndarray`
         Computed spectral density function over the input
         ``wavelengths`` array with units of s/rad.
+
+    Notes
+    -----
+    The shapes above with a leading ``...`` may have any number of
+    leading batch dimensions, which are broadcast against each other
+    following the NumPy broadcasting rules. For example, a grid of
+    ``(N1, N2)`` densities and electron temperatures of a single
+    electron population is evaluated with ``n`` of shape ``(N1, 1)``
+    and ``T_e`` of shape ``(1, N2, 1)``. ``alpha`` then has the
+    broadcast batch shape ``(N1, N2)`` and ``Skw`` the shape
+    ``(N1, N2, Nλ)``. Without batch dimensions, the results are those
+    for a single set of plasma parameters.
+
+    All of the spectra are computed together as arrays of shape
+    ``(..., N, Nλ)`` for the N electron or ion populations, which is
+    much faster than calling this function once per parameter set, at
+    the cost of memory proportional to the number of spectra. When an
+    instrument function is given for batched spectra, the convolution
+    is performed with FFTs.
     """
 
-    scattering_angle = np.arccos(np.dot(probe_vec, scatter_vec))
+    # Parameters of each spectrum are given trailing axes of length one
+    # so that every array broadcasts to the shape
+    # (*batch, population, wavelength).
+    n = np.asarray(n, dtype=np.float64)[..., np.newaxis, np.newaxis]
+    probe_wavelength = np.asarray(probe_wavelength, dtype=np.float64)[
+        ..., np.newaxis, np.newaxis
+    ]
+    efract = np.asarray(efract)[..., np.newaxis]
+    ifract = np.asarray(ifract)[..., np.newaxis]
+    ion_z = np.asarray(ion_z)[..., np.newaxis]
+    ion_mass = np.asarray(ion_mass)[..., np.newaxis]
+
+    probe_vec = np.asarray(probe_vec)
+    scatter_vec = np.asarray(scatter_vec)
+    electron_vel = np.asarray(electron_vel)
+    ion_vel = np.asarray(ion_vel)
+
+    cos_scattering_angle = np.sum(probe_vec * scatter_vec, axis=-1)[
+        ..., np.newaxis, np.newaxis
+    ]
 
     # Calculate plasma parameters
     # Temperatures here in K!
     coefs = thermal_speed_coefficients("most_probable", 3)
-    vT_e = thermal_speed_lite(T_e, m_e_si_unitless, coefs)
-    vT_i = thermal_speed_lite(T_i, ion_mass, coefs)
+    vT_e = thermal_speed_lite(np.asarray(T_e)[..., np.newaxis], m_e_si_unitless, coefs)
+    vT_i = thermal_speed_lite(np.asarray(T_i)[..., np.newaxis], ion_mass, coefs)
 
     # Compute electron and ion densities
     ne = efract * n
-    zbar = np.sum(ifract * ion_z)
+    zbar = np.sum(ifract * ion_z, axis=-2, keepdims=True)
     ni = ifract * n / zbar  # ne/zbar = sum(ni)
 
     # wpe is calculated for the entire plasma (all electron populations combined)
@@ -193,90 +282,64 @@ def spectral_density_lite(
 
     # Compute the wavenumber shift (required by momentum conservation)
     # Eq. 1.7.10 in Sheffield
-    k = np.sqrt(ks**2 + kl**2 - 2 * ks * kl * np.cos(scattering_angle))
+    k = np.sqrt(ks**2 + kl**2 - 2 * ks * kl * cos_scattering_angle)
     # Normal vector along k
     k_vec = scatter_vec - probe_vec
-    k_vec = k_vec / np.linalg.norm(k_vec)
+    k_vec = k_vec / np.linalg.norm(k_vec, axis=-1, keepdims=True)
 
-    # Compute Doppler-shifted frequencies for both the ions and electrons
-    # Matmul is simultaneously conducting dot products over all wavelengths
-    # and ion populations
-    w_e = w - np.matmul(electron_vel, np.outer(k, k_vec).T)
-    w_i = w - np.matmul(ion_vel, np.outer(k, k_vec).T)
+    # Compute Doppler-shifted frequencies for both the ions and electrons,
+    # using the component of the drift velocity of each population along k
+    k_vec = k_vec[..., np.newaxis, :]
+    w_e = w - np.sum(electron_vel * k_vec, axis=-1)[..., np.newaxis] * k
+    w_i = w - np.sum(ion_vel * k_vec, axis=-1)[..., np.newaxis] * k
 
     # Compute the scattering parameter alpha
     # expressed here using the fact that v_th/w_p = root(2) * Debye length
-    alpha = np.sqrt(2) * wpe / np.outer(k, vT_e)
+    alpha = np.sqrt(2) * wpe / (k * vT_e)
 
     # Calculate the normalized phase velocities (Sec. 3.4.2 in Sheffield)
-    xe = np.outer(1 / vT_e, 1 / k) * w_e
-    xi = np.outer(1 / vT_i, 1 / k) * w_i
-
-    # Calculate the susceptibilities
-    chiE = np.zeros([efract.size, w.size], dtype=np.complex128)
-    for i, _fract in enumerate(efract):
-        wpe = plasma_frequency_lite(ne[i], m_e_si_unitless, 1)
-        chiE[i, :] = permittivity_1D_Maxwellian_lite(w_e[i, :], k, vT_e[i], wpe)
+    xe = w_e / (k * vT_e)
+    xi = w_i / (k * vT_i)
 
+    # Calculate the susceptibilities of every population at once.
     # Treatment of multiple species is an extension of the discussion in
     # Sheffield Sec. 5.1
-    chiI = np.zeros([ifract.size, w.size], dtype=np.complex128)
-    for i, _fract in enumerate(ifract):
-        wpi = plasma_frequency_lite(ni[i], ion_mass[i], ion_z[i])
-        chiI[i, :] = permittivity_1D_Maxwellian_lite(w_i[i, :], k, vT_i[i], wpi)
+    chiE = permittivity_1D_Maxwellian_lite(
+        w_e, k, vT_e, plasma_frequency_lite(ne, m_e_si_unitless, 1)
+    )
+    chiI = permittivity_1D_Maxwellian_lite(
+        w_i, k, vT_i, plasma_frequency_lite(ni, ion_mass, ion_z)
+    )
 
     # Calculate the longitudinal dielectric function
-    epsilon = 1 + np.sum(chiE, axis=0) + np.sum(chiI, axis=0)
-
-    econtr = np.zeros([efract.size, w.size], dtype=np.complex128)
-    for m in range(efract.size):
-        econtr[m, :] = efract[m] * (
-            2
-            * np.sqrt(np.pi)
-            / k
-            / vT_e[m]
-            * np.power(np.abs(1 - np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-(xe[m, :] ** 2))
-        )
+    chiE_total = np.sum(chiE, axis=-2, keepdims=True)
+    epsilon = 1 + chiE_total + np.sum(chiI, axis=-2, keepdims=True)
+
+    econtr = efract * (
+        2
+        * np.sqrt(np.pi)
+        / k
+        / vT_e
+        * np.abs(1 - chiE_total / epsilon) ** 2
+        * np.exp(-(xe**2))
+    )
 
-    icontr = np.zeros([ifract.size, w.size], dtype=np.complex128)
-    for m in range(ifract.size):
-        icontr[m, :] = ifract[m] * (
-            2
-            * np.sqrt(np.pi)
-            * ion_z[m] ** 2
-            / zbar
-            / k
-            / vT_i[m]
-            * np.power(np.abs(np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-(xi[m, :] ** 2))
-        )
+    icontr = ifract * (
+        2
+        * np.sqrt(np.pi)
+        * ion_z**2
+        / zbar
+        / k
+        / vT_i
+        * np.abs(chiE_total / epsilon) ** 2
+        * np.exp(-(xi**2))
+    )
 
-    # Recast as real: imaginary part is already zero
-    Skw = np.real(np.sum(econtr, axis=0) + np.sum(icontr, axis=0))
+    Skw = np.sum(econtr, axis=-2) + np.sum(icontr, axis=-2)
 
-    # Apply an instrument function if one is provided
-    if instr_func_arr is not None:
-        Skw = np.convolve(Skw, instr_func_arr, mode="same")
+    Skw = _apply_instrument_and_notch(Skw, wavelengths, instr_func_arr, notch)
 
-    # add notch(es) to the spectrum if any are provided
-    if notch is not None:
-        # If only one notch is included, create a dummy second dimension
-        if np.ndim(notch) == 1:
-            notch = np.array(
-                [
-                    notch,
-                ]
-            )
-
-        for notch_i in notch:
-            # For each notch, identify the index for the beginning and end
-            # wavelengths and set Skw to zero between those indices
-            x0 = np.argmin(np.abs(wavelengths - notch_i[0]))
-            x1 = np.argmin(np.abs(wavelengths - notch_i[1]))
-            Skw[x0:x1] = 0
-
-    return np.mean(alpha), Skw
+    return np.mean(alpha, axis=(-2, -1)), Skw
 
 
 @validate_quantities(
@@ -745,9 +808,7 @@ def _spectral_density_model(wavelengths, settings=None, **params):
     return model_Skw
 
 
-def spectral_density_model(  # noqa: C901, PLR0912, PLR0915
-    wavelengths, settings, params
-):
+def spectral_density_model(wavelengths, settings, params):
     r"""
     Returns a `lmfit.model.Model` function for Thomson spectral density
     function.
@@ -828,6 +889,30 @@ def spectral_density_model(  # noqa: C901, PLR0912, PLR0915
     `numpy.delete`.
     """
 
+    _setup_spectral_density_model(wavelengths, settings, params)
+
+    def _spectral_density_model_lambda(wavelengths, **params):
+        return _spectral_density_model(wavelengths, settings=settings, **params)
+
+    # Create and return the lmfit.Model
+    return Model(
+        _spectral_density_model_lambda,
+        independent_vars=["wavelengths"],
+        nan_policy="omit",
+    )
+
+
+def _setup_spectral_density_model(  # noqa: C901, PLR0912, PLR0915
+    wavelengths, settings, params
+) -> None:
+    """
+    Validate the ``settings`` and ``params`` of the spectral density
+    model, and add the defaults of any that are not provided to them.
+
+    For descriptions of arguments, see the `spectral_density_model`
+    function.
+    """
+
     required_settings = {
         "probe_wavelength",
         "probe_vec",
@@ -999,12 +1084,389 @@ def spectral_density_model(  # noqa: C901, PLR0912, PLR0915
     #       quantities isn't consistent with the number of that species defined
     #       by ifract or efract.
 
-    def _spectral_density_model_lambda(wavelengths, **params):
-        return _spectral_density_model(wavelengths, settings=settings, **params)
 
-    # Create and return the lmfit.Model
-    return Model(
-        _spectral_density_model_lambda,
-        independent_vars=["wavelengths"],
-        nan_policy="omit",
-    )
+def _fit_frames(fitter, data, warm_start: bool) -> list[OptimizeResult]:
+    """
+    Fit each spectrum in ``data`` in turn with ``fitter``, starting from
+    the best-fit values of the spectrum before it if ``warm_start`` is
+    `True`.
+    """
+    results = []
+    x0 = None
+    for frame in data:
+        result = fitter.fit(frame, x0=x0)
+        results.append(result)
+        if warm_start and result.success:
+            x0 = result.x
+    return results
+
+
+class SpectralDensityFitter:
+    r"""
+    Fit Thomson scattering spectra with the model of
+    `~plasmapy.diagnostics.thomson.spectral_density_model` by nonlinear
+    least squares.
+
+    This is a fast alternative to fitting the `lmfit.model.Model` for
+    spectra that have good initial guesses, such as a sequence of
+    spectra from a time-resolved measurement.
+
+    Parameters
+    ----------
+    wavelengths : numpy.ndarray
+        Wavelength array, in meters.
+
+    settings : dict
+        The non-variable inputs of the spectral density function, as
+        described in `~plasmapy.diagnostics.thomson.spectral_density_model`.
+
+    params : `~lmfit.parameter.Parameters` object
+        The parameters of the spectral density function, as described
+        in `~plasmapy.diagnostics.thomson.spectral_density_model`. The
+        values of the parameters are the initial guesses of the fit,
+        and each varying parameter is bounded by its ``min`` and
+        ``max``.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is constrained by an expression other than
+        those that make the ``efract`` and ``ifract`` parameters sum
+        to 1.
+
+    Notes
+    -----
+    The fit is performed by `scipy.optimize.least_squares` with the
+    trust region reflective method, which finds a local minimum near
+    the initial guess rather than searching the whole of the bounded
+    parameter space as the ``differential_evolution`` method of
+    `lmfit` does.
+
+    The model is evaluated for arrays of parameters that are gathered
+    by index when the fitter is created, rather than by looking up each
+    parameter by name on every evaluation. The notch and instrument
+    function are also prepared once. The Jacobian is approximated by
+    forward differences, with the spectra of the current and every
+    perturbed set of parameters computed in a single batched call of
+    `~plasmapy.diagnostics.thomson.spectral_density_lite`.
+
+    Data points that are `numpy.nan` are omitted from the fit.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from lmfit import Parameters
+    >>> wavelengths = np.linspace(520e-9, 545e-9, 256)
+    >>> settings = {
+    ...     "probe_wavelength": 532e-9,
+    ...     "probe_vec": np.array([1, 0, 0]),
+    ...     "scatter_vec": np.array([0, 1, 0]),
+    ...     "ions": ["p+"],
+    ... }
+    >>> params = Parameters()
+    >>> params.add("n", value=2e23, vary=False)
+    >>> params.add("T_e_0", value=8, min=1, max=50)
+    >>> params.add("T_i_0", value=10, vary=False)
+    >>> fitter = SpectralDensityFitter(wavelengths, settings, params)
+    >>> data = fitter.evaluate([10.0])
+    >>> result = fitter.fit(data)
+    >>> round(result.params["T_e_0"], 3)
+    10.0
+    """
+
+    #: The relative step of the forward differences that approximate
+    #: the Jacobian, which is the default of `scipy.optimize.least_squares`.
+    _jacobian_step = np.sqrt(np.finfo(np.float64).eps)
+
+    def __init__(self, wavelengths, settings, params) -> None:
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        _setup_spectral_density_model(wavelengths, settings, params)
+
+        self._wavelengths = wavelengths
+        self._probe_wavelength = settings["probe_wavelength"]
+        self._probe_vec = np.asarray(settings["probe_vec"])
+        self._scatter_vec = np.asarray(settings["scatter_vec"])
+        self._electron_vdir = settings["electron_vdir"]
+        self._ion_vdir = settings["ion_vdir"]
+        self._instr_func_arr = settings["instr_func_arr"]
+
+        # The notch is applied as a mask, which is found once
+        self._notch_mask = np.ones(wavelengths.size)
+        if settings["notch"] is not None:
+            notch = u.Quantity(settings["notch"], u.m).value
+            for notch_i in np.reshape(notch, (-1, 2)):
+                x0 = np.argmin(np.abs(wavelengths - notch_i[0]))
+                x1 = np.argmin(np.abs(wavelengths - notch_i[1]))
+                self._notch_mask[x0:x1] = 0
+
+        self._names = list(params)
+        index = {name: i for i, name in enumerate(self._names)}
+        self._values = np.array([float(params[name].value) for name in self._names])
+
+        # The last fraction of each species with several populations is
+        # computed from the others, as its expression requires
+        self._constrained = [
+            index[f"{prefix}_{num - 1}"]
+            for prefix in ("efract", "ifract")
+            if (num := _count_populations_in_params(params, prefix)) > 1
+        ]
+        for name in self._names:
+            if params[name].expr is not None and index[name] not in self._constrained:
+                raise ValueError(
+                    f"The parameter {name!r} is constrained by the expression "
+                    f"{params[name].expr!r}, but SpectralDensityFitter only "
+                    "supports the expressions that make the efract and "
+                    "ifract parameters sum to 1."
+                )
+
+        self._varying = np.array(
+            [
+                i
+                for i, name in enumerate(self._names)
+                if params[name].vary and params[name].expr is None
+            ],
+            dtype=int,
+        )
+        self._lower = np.array([params[self._names[i]].min for i in self._varying])
+        self._upper = np.array([params[self._names[i]].max for i in self._varying])
+
+        # The indices of the parameters of each population
+        self._n = index["n"]
+        self._background = index["background"]
+        self._populations = {
+            prefix: [
+                index[f"{prefix}_{num}"]
+                for num in range(_count_populations_in_params(params, prefix))
+            ]
+            for prefix in (
+                "T_e",
+                "T_i",
+                "efract",
+                "ifract",
+                "ion_mu",
+                "ion_z",
+                "electron_speed",
+                "ion_speed",
+            )
+        }
+
+    @property
+    def varying(self) -> list[str]:
+        """The names of the varying parameters, in the order of their values."""
+        return [self._names[i] for i in self._varying]
+
+    def _all_values(self, x) -> np.ndarray:
+        """
+        Return the values of every parameter, shape ``(..., Nparams)``,
+        for the values ``x`` of the varying parameters.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        values = np.empty((*x.shape[:-1], self._values.size))
+        values[...] = self._values
+        values[..., self._varying] = x
+        for i in self._constrained:
+            prefix = "efract" if i in self._populations["efract"] else "ifract"
+            others = self._populations[prefix][:-1]
+            values[..., i] = 1 - np.sum(values[..., others], axis=-1)
+        return values
+
+    def _evaluate_all(self, values) -> np.ndarray:
+        """Evaluate the model for the values of every parameter."""
+        population = {
+            prefix: values[..., indices]
+            for prefix, indices in self._populations.items()
+        }
+
+        _, model_Skw = spectral_density_lite(
+            self._wavelengths,
+            self._probe_wavelength,
+            values[..., self._n],
+            # Convert temperatures from eV to kelvin
+            population["T_e"] * 11604.51812155,
+            population["T_i"] * 11604.51812155,
+            efract=population["efract"],
+            ifract=population["ifract"],
+            ion_z=population["ion_z"],
+            ion_mass=population["ion_mu"] * m_p_si_unitless,
+            electron_vel=population["electron_speed"][..., np.newaxis]
+            * self._electron_vdir,
+            ion_vel=population["ion_speed"][..., np.newaxis] * self._ion_vdir,
+            probe_vec=self._probe_vec,
+            scatter_vec=self._scatter_vec,
+            instr_func_arr=self._instr_func_arr,
+        )
+
+        model_Skw *= self._notch_mask
+        model_Skw /= np.max(model_Skw, axis=-1, keepdims=True)
+
+        # Add background after normalization
+        return model_Skw + values[..., self._background, np.newaxis]
+
+    def evaluate(self, x) -> np.ndarray:
+        """
+        Evaluate the model spectrum.
+
+        Parameters
+        ----------
+        x : (..., Nvary) array_like
+            The values of the varying parameters, in the order of
+            `varying`. Leading dimensions evaluate many spectra at once.
+
+        Returns
+        -------
+        (..., Nλ) `~numpy.ndarray`
+            The model spectra, with the fixed parameters at the values
+            they were given when the fitter was created.
+        """
+        return self._evaluate_all(self._all_values(x))
+
+    def _jacobian(self, x, finite) -> np.ndarray:
+        """
+        Approximate the Jacobian of the model at the finite data points
+        by forward differences, stepping inward from the upper bounds.
+        """
+        step = self._jacobian_step * np.maximum(np.abs(x), 1)
+        step = np.where(x + step > self._upper, -step, step)
+        x_batch = np.vstack([x, x + np.diag(step)])
+        model = self.evaluate(x_batch)[:, finite]
+        return ((model[1:] - model[0]) / step[:, np.newaxis]).T
+
+    def fit(self, data, x0=None, **kwargs) -> OptimizeResult:
+        """
+        Fit a spectrum.
+
+        Parameters
+        ----------
+        data : (Nλ,) array_like
+            The measured spectrum, normalized in the same way as the
+            model of `~plasmapy.diagnostics.thomson.spectral_density_model`.
+
+        x0 : (Nvary,) array_like, optional
+            The initial guess of the varying parameters, in the order of
+            `varying`. Defaults to the values of the parameters that the
+            fitter was created with.
+
+        **kwargs
+            Keyword arguments passed to `scipy.optimize.least_squares`.
+
+        Returns
+        -------
+        `~scipy.optimize.OptimizeResult`
+            The result of `scipy.optimize.least_squares`, with the
+            additional attributes ``params``, a `dict` of the best-fit
+            values of every parameter, and ``redchi``, the reduced
+            chi-square of the fit.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.shape != self._wavelengths.shape:
+            raise ValueError(
+                f"The shape of the data {data.shape} does not match the "
+                f"shape of the wavelengths array {self._wavelengths.shape}."
+            )
+        finite = np.isfinite(data)
+
+        x0 = self._values[self._varying] if x0 is None else np.asarray(x0)
+        result = least_squares(
+            lambda x: self.evaluate(x)[finite] - data[finite],
+            np.clip(x0, self._lower, self._upper),
+            jac=lambda x: self._jacobian(x, finite),
+            bounds=(self._lower, self._upper),
+            x_scale="jac",
+            **kwargs,
+        )
+
+        values = self._all_values(result.x)
+        result.params = dict(zip(self._names, values.tolist(), strict=True))
+        result.redchi = 2 * result.cost / max(np.count_nonzero(finite) - x0.size, 1)
+        return result
+
+    def fit_sequence(
+        self,
+        data,
+        warm_start: bool = True,
+        n_workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> OptimizeResult:
+        """
+        Fit a sequence of spectra, such as the frames of a time-resolved
+        measurement.
+
+        Parameters
+        ----------
+        data : (Nframes, Nλ) array_like
+            The measured spectra.
+
+        warm_start : bool, optional
+            If `True` (the default), the fit of each spectrum starts
+            from the best-fit values of the spectrum before it, which is
+            a good initial guess when the plasma changes slowly between
+            frames. Otherwise every fit starts from the values of the
+            parameters that the fitter was created with.
+
+        n_workers : int, optional
+            If provided, the sequence is split into chunks of
+            consecutive spectra that are fit in parallel by a pool of
+            ``n_workers`` processes. By default, the spectra are fit
+            sequentially in this process.
+
+        chunk_size : int, optional
+            The maximum number of spectra in each chunk. Defaults to
+            splitting the spectra evenly between the processes. The
+            first spectrum of each chunk is fit from the initial
+            values of the parameters.
+
+        Returns
+        -------
+        `~scipy.optimize.OptimizeResult`
+            The results of the fits, with the attributes ``params``, a
+            `dict` of arrays of the best-fit values of every parameter,
+            ``x``, the best-fit values of the varying parameters with
+            shape ``(Nframes, Nvary)``, and the arrays ``redchi``,
+            ``cost``, ``nfev``, and ``success`` of each fit.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[-1] != self._wavelengths.size:
+            raise ValueError(
+                f"The shape of the data {data.shape} must be (Nframes, "
+                f"{self._wavelengths.size}) to match the wavelengths array."
+            )
+
+        if n_workers is None:
+            results = _fit_frames(self, data, warm_start)
+        else:
+            if n_workers < 1:
+                raise ValueError(
+                    f"n_workers must be a positive integer, got {n_workers}."
+                )
+            if chunk_size is None:
+                chunk_size = max(1, -(-len(data) // n_workers))
+            chunks = [
+                data[start : start + chunk_size]
+                for start in range(0, len(data), chunk_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=min(n_workers, max(len(chunks), 1))
+            ) as executor:
+                results = [
+                    result
+                    for chunk_results in executor.map(
+                        _fit_frames,
+                        [self] * len(chunks),
+                        chunks,
+                        [warm_start] * len(chunks),
+                    )
+                    for result in chunk_results
+                ]
+
+        x = np.array([result.x for result in results]).reshape(
+            len(results), self._varying.size
+        )
+        values = self._all_values(x)
+        return OptimizeResult(
+            params={name: values[:, i] for i, name in enumerate(self._names)},
+            x=x,
+            redchi=np.array([result.redchi for result in results]),
+            cost=np.array([result.cost for result in results]),
+            nfev=np.array([result.nfev for result in results]),
+            success=np.array([result.success for result in results]),
+        )
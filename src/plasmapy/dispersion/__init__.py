@@ -16,11 +16,13 @@
     "dispersion_functions",
     "numerical",
     "plasma_dispersion_func",
+    "plasma_dispersion_func_and_deriv",
     "plasma_dispersion_func_deriv",
 ]
 
 from plasmapy.dispersion import analytical, dispersion_functions, numerical
 from plasmapy.dispersion.dispersion_functions import (
     plasma_dispersion_func,
+    plasma_dispersion_func_and_deriv,
     plasma_dispersion_func_deriv,
 )
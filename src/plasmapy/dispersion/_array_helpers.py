@@ -0,0 +1,57 @@
+"""
+Helpers for the :term:`lite-functions <lite-function>` of dispersion
+relations, which broadcast over their arguments whether those are
+`numpy.ndarray` or `xarray.DataArray` objects.
+"""
+
+__all__: list[str] = []
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import xarray as xr
+
+
+def _emath_sqrt(x: Any) -> Any:
+    """
+    Return the square root of ``x`` like `numpy.emath.sqrt`, which is
+    complex for the whole array when any element is real and negative,
+    but without converting an `xarray.DataArray` into an array.
+    """
+    if not np.iscomplexobj(x) and np.any(x < 0):
+        x = x + 0j
+    return np.sqrt(x)
+
+
+def _emath_arccos(x: Any) -> Any:
+    """
+    Return the inverse cosine of ``x`` like `numpy.emath.arccos`, which
+    is complex for the whole array when any element is real with an
+    absolute value greater than one, but without converting an
+    `xarray.DataArray` into an array.
+    """
+    if not np.iscomplexobj(x) and np.any(np.abs(x) > 1):
+        x = x + 0j
+    return np.arccos(x)
+
+
+def _stack_solutions(
+    solutions: Sequence[Any], dim: str, labels: Sequence[Any], axis: int
+) -> Any:
+    """
+    Stack the ``solutions`` of a dispersion relation along a new axis at
+    position ``axis``, which is either ``0`` or ``-1``.
+
+    The solutions are broadcast against each other.  When they are
+    `xarray.DataArray` objects, the new axis is the dimension ``dim``
+    with coordinates ``labels``.
+    """
+    if not any(isinstance(solution, xr.DataArray) for solution in solutions):
+        return np.stack(np.broadcast_arrays(*solutions), axis=axis)
+
+    stacked = xr.concat(
+        xr.broadcast(*[xr.DataArray(solution) for solution in solutions]),
+        dim=xr.DataArray(list(labels), dims=dim, name=dim),
+    )
+    return stacked.transpose(dim, ...) if axis == 0 else stacked.transpose(..., dim)
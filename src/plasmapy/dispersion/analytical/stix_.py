@@ -4,24 +4,138 @@
 """
 
 __all__ = ["stix"]
+__lite_funcs__ = ["stix_lite"]
+
+from collections.abc import Sequence
 
 import astropy.units as u
 import numpy as np
-from astropy.constants.si import c
+from astropy.constants.si import c, e, eps0, m_e
 
-from plasmapy.formulary.frequencies import gyrofrequency, plasma_frequency
+from plasmapy.dispersion._array_helpers import _emath_sqrt, _stack_solutions
 from plasmapy.particles import Particle, ParticleList
-from plasmapy.utils.decorators import validate_quantities
+from plasmapy.utils.decorators import (
+    bind_lite_func,
+    preserve_signature,
+    validate_quantities,
+)
+
+__all__ += __lite_funcs__
 
 c_si_unitless = c.value
 
 
+@preserve_signature
+def stix_lite(
+    B,
+    w,
+    n_i: Sequence,
+    theta,
+    *,
+    m_i: Sequence[float],
+    Z: Sequence[float],
+):
+    r"""
+    The :term:`lite-function` version of
+    `~plasmapy.dispersion.analytical.stix_.stix`.  Performs the same
+    calculation as `~plasmapy.dispersion.analytical.stix_.stix`, but is
+    intended for computational use and thus has data conditioning
+    safeguards removed.
+
+    All arguments broadcast against each other, so that the dispersion
+    relation can be solved for many plasmas and waves in a single call.
+
+    Parameters
+    ----------
+    B : array_like
+        The magnetic field magnitude in T.
+
+    w : array_like
+        Wavefrequency in rad/s.
+
+    n_i : sequence of array_like
+        The number density of each ion species in m\ :sup:`-3`.
+
+    theta : array_like
+        The angle of propagation of the wave with respect to the
+        magnetic field in radians.
+
+    m_i : sequence of `float`, |keyword-only|
+        The mass of each ion species in kg.
+
+    Z : sequence of `float`, |keyword-only|
+        The |charge number| of each ion species.
+
+    Returns
+    -------
+    k : `~numpy.ndarray` or `xarray.DataArray`
+        The complex wavenumbers in rad/m.  The last axis holds the four
+        roots of the Stix polynomial, ordered as in
+        `~plasmapy.dispersion.analytical.stix_.stix`, and the remaining
+        axes are those of the broadcast arguments.  If any argument is
+        an `xarray.DataArray`, the arguments are broadcast by dimension
+        name and the last axis is the dimension ``"root"``, with
+        coordinates ``0`` to ``3``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from plasmapy.particles import ParticleList
+    >>> ions = ParticleList(["H+", "He+"])
+    >>> k = stix_lite(
+    ...     B=8.3e-9,
+    ...     w=np.array([[0.001], [0.002]]),
+    ...     n_i=[4.0e5, 2.0e5],
+    ...     theta=np.deg2rad([30, 60]),
+    ...     m_i=ions.mass.value,
+    ...     Z=ions.charge_number,
+    ... )
+    >>> k.shape
+    (2, 2, 4)
+    >>> k[0, 0]
+    array([ 6.03817661e-09-0.j, -6.03817661e-09+0.j,  6.97262784e-09-0.j,
+           -6.97262784e-09+0.j])
+    """
+    # The electrons neutralize the ions
+    n_e = sum(Z_s * n_s for Z_s, n_s in zip(Z, n_i, strict=True))
+    species = [
+        *zip(n_i, m_i, Z, strict=True),
+        (n_e, m_e.value, -1),
+    ]
+
+    # Stix method implemented
+    S = 1
+    P = 1
+    D = 0
+    for n_s, m_s, Z_s in species:
+        wp = np.sqrt(n_s * (Z_s * e.value) ** 2 / (eps0.value * m_s))
+        wc = Z_s * e.value * np.abs(B) / m_s
+        S -= (wp**2) / (w**2 - wc**2)
+        P -= (wp / w) ** 2
+        D += ((wp**2) / (w**2 - wc**2)) * (wc / w)
+
+    R = S + D
+    L = S - D
+
+    # Generate coefficients to solve, a * k**4 + b * k**2 + c = 0
+    a = (S * np.sin(theta) ** 2) + (P * np.cos(theta) ** 2)
+    b = -((R * L * np.sin(theta) ** 2) + (P * S * (1 + np.cos(theta) ** 2)))
+    c = P * R * L
+
+    # Solve for k values
+    k0 = _emath_sqrt((-b + _emath_sqrt(b**2 - 4 * a * c)) / (2 * a)) * w / c_si_unitless
+    k2 = _emath_sqrt((-b - _emath_sqrt(b**2 - 4 * a * c)) / (2 * a)) * w / c_si_unitless
+    k0, k2 = (k if np.iscomplexobj(k) else k + 0j for k in (k0, k2))
+    return _stack_solutions([k0, -k0, k2, -k2], dim="root", labels=range(4), axis=-1)
+
+
 @validate_quantities(
     B={"can_be_negative": False},
     n_i={"can_be_negative": False},
     w={"can_be_negative": False, "can_be_zero": False},
 )
-def stix(  # noqa: C901, PLR0912, PLR0915
+@bind_lite_func(stix_lite)
+def stix(  # noqa: C901
     B: u.Quantity[u.T],
     w: u.Quantity[u.rad / u.s],
     ions: Particle,
@@ -206,11 +320,6 @@ def stix(  # noqa: C901, PLR0912, PLR0915
     elif n_i.size == 1:
         n_i = np.repeat(n_i, len(ions))
 
-    species = [*ions, Particle("e-")]
-    densities = np.zeros(n_i.size + 1)
-    densities[:-1] = n_i
-    densities[-1] = np.sum(n_i * ions.charge_number)
-
     # Validate B argument
     B = B.squeeze()
     if B.ndim != 0:
@@ -241,43 +350,12 @@ def stix(  # noqa: C901, PLR0912, PLR0915
     # Generate mesh grid of w x theta
     w, theta = np.meshgrid(w, theta, indexing="ij")
 
-    # Generate the plasma parameters needed
-    wps = []
-    wcs = []
-    for par, dens in zip(species, densities, strict=False):
-        wps.append(plasma_frequency(n=dens * u.m**-3, particle=par).value)
-        wcs.append(gyrofrequency(B=B, particle=par, signed=True).value)
-
-    # Stix method implemented
-    S = np.ones_like(w, dtype=np.float64)
-    P = np.ones_like(S)
-    D = np.zeros_like(S)
-    for wc, wp in zip(wcs, wps, strict=False):
-        S -= (wp**2) / (w**2 - wc**2)
-        P -= (wp / w) ** 2
-        D += ((wp**2) / (w**2 - wc**2)) * (wc / w)
-
-    R = S + D
-    L = S - D
-
-    # Generate coefficients to solve, a * k**4 + b * k**2 + c = 0
-    a = (S * np.sin(theta) ** 2) + (P * np.cos(theta) ** 2)
-    b = -((R * L * np.sin(theta) ** 2) + (P * S * (1 + np.cos(theta) ** 2)))
-    c = P * R * L
-
-    # Solve for k values
-    k = np.empty((*w.shape, 4), dtype=np.complex128)
-    k[..., 0] = (
-        np.emath.sqrt((-b + np.emath.sqrt(b**2 - 4 * a * c)) / (2 * a))
-        * w
-        / c_si_unitless
-    )
-    k[..., 1] = -k[..., 0]
-    k[..., 2] = (
-        np.emath.sqrt((-b - np.emath.sqrt(b**2 - 4 * a * c)) / (2 * a))
-        * w
-        / c_si_unitless
+    k = stix_lite(
+        B.value,
+        w,
+        n_i,
+        theta,
+        m_i=ions.mass.value,
+        Z=ions.charge_number,
     )
-    k[..., 3] = -k[..., 2]
-
     return k.squeeze() * u.rad / u.m
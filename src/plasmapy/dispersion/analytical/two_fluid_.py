@@ -4,20 +4,184 @@
 """
 
 __all__ = ["two_fluid"]
+__lite_funcs__ = ["two_fluid_lite"]
 
 import warnings
 from numbers import Real
 
 import astropy.units as u
 import numpy as np
-from astropy.constants.si import c
+from astropy.constants.si import c, e, eps0, k_B, m_e, mu0
 
-from plasmapy.formulary.frequencies import gyrofrequency, plasma_frequency
-from plasmapy.formulary.speeds import Alfven_speed, ion_sound_speed
+from plasmapy.dispersion._array_helpers import (
+    _emath_arccos,
+    _emath_sqrt,
+    _stack_solutions,
+)
 from plasmapy.particles import ParticleLike, particle_input
-from plasmapy.utils.decorators import validate_quantities
+from plasmapy.utils.decorators import (
+    bind_lite_func,
+    preserve_signature,
+    validate_quantities,
+)
 from plasmapy.utils.exceptions import PhysicsWarning
 
+__all__ += __lite_funcs__
+
+_wave_modes = ("fast_mode", "alfven_mode", "acoustic_mode")
+
+
+def _two_fluid_omegas(B, k, n_i, theta, *, T_e, T_i, m_i, Z, gamma_e, gamma_i) -> list:
+    """
+    Return the frequencies of the fast, Alfvén, and acoustic modes for
+    `two_fluid_lite` as a list, in which each mode is complex only if
+    its own solutions are.
+    """
+    n_e = Z * n_i
+    c_s = np.sqrt((gamma_e * Z * k_B.value * T_e + gamma_i * k_B.value * T_i) / m_i)
+    v_A = np.abs(B) / np.sqrt(mu0.value * (m_i + Z * m_e.value) * n_i)
+    omega_ci = np.abs(Z) * e.value * np.abs(B) / m_i
+    omega_pe = np.sqrt(n_e * e.value**2 / (eps0.value * m_e.value))
+
+    # Bellan2012JGR params equation 32
+    alpha = np.cos(theta) ** 2
+    beta = (c_s / v_A) ** 2
+    Lambda = (k * v_A / omega_ci) ** 2
+
+    # Bellan2012JGR params equation 2
+    Q = 1 + (k * c.value / omega_pe) ** 2
+
+    # Bellan2012JGR params equation 35
+    A = ((1 + alpha) / Q) + beta + (alpha * Lambda / Q**2)
+    B = alpha * (1 + 2 * Q * beta + Lambda * beta) / Q**2
+    C = beta * (alpha / Q) ** 2
+
+    # Bellan2012JGR params equation 36
+    p = (3 * B - A**2) / 3
+    q = (9 * A * B - 2 * A**3 - 27 * C) / 27
+
+    # Bellan2012JGR params equation 38
+    R = 2 * Lambda * _emath_sqrt(-p / 3)
+    S = 3 * q / (2 * p) * _emath_sqrt(-3 / p)
+    T = Lambda * A / 3
+    arccos_S = _emath_arccos(S)
+    return [
+        omega_ci * _emath_sqrt(R * np.cos(1 / 3 * arccos_S - 2 * np.pi / 3 * ind) + T)
+        for ind in range(len(_wave_modes))
+    ]
+
+
+@preserve_signature
+def two_fluid_lite(
+    B,
+    k,
+    n_i,
+    theta,
+    *,
+    T_e,
+    T_i,
+    m_i: float,
+    Z: float,
+    gamma_e: float = 1,
+    gamma_i: float = 3,
+):
+    r"""
+    The :term:`lite-function` version of
+    `~plasmapy.dispersion.analytical.two_fluid_.two_fluid`.  Performs
+    the same calculation as
+    `~plasmapy.dispersion.analytical.two_fluid_.two_fluid`, but is
+    intended for computational use and thus has data conditioning
+    safeguards removed.
+
+    All arguments broadcast against each other, so that the dispersion
+    relation can be solved for many plasmas and waves in a single call.
+
+    Parameters
+    ----------
+    B : array_like
+        The magnetic field magnitude in T.
+
+    k : array_like
+        Wavenumber in rad/m.
+
+    n_i : array_like
+        Ion number density in m\ :sup:`-3`.
+
+    theta : array_like
+        The angle of propagation of the wave with respect to the
+        magnetic field in radians.
+
+    T_e : array_like
+        The electron temperature in K.
+
+    T_i : array_like
+        The ion temperature in K.
+
+    m_i : `float`
+        The ion mass in kg.
+
+    Z : `float`
+        The |charge number| of the ion.
+
+    gamma_e : `float`, default: 1
+        The adiabatic index for electrons.
+
+    gamma_i : `float`, default: 3
+        The adiabatic index for ions.
+
+    Returns
+    -------
+    omega : `~numpy.ndarray` or `xarray.DataArray`
+        The wave frequencies in rad/s.  The first axis holds the fast,
+        Alfvén, and acoustic modes, and the remaining axes are those of
+        the broadcast arguments.  If any argument is an
+        `xarray.DataArray`, the arguments are broadcast by dimension
+        name and the first axis is the dimension ``"mode"``, with
+        coordinates ``"fast_mode"``, ``"alfven_mode"``, and
+        ``"acoustic_mode"``.
+
+    Notes
+    -----
+    The ion sound speed is
+    :math:`\sqrt{(γ_e Z k_B T_e + γ_i k_B T_i) / m_i}`, the Alfvén
+    speed is computed from the mass density :math:`(m_i + Z m_e) n_i`,
+    and the electron density is :math:`Z n_i`, as in
+    `~plasmapy.dispersion.analytical.two_fluid_.two_fluid`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from plasmapy.particles import Particle
+    >>> proton = Particle("p+")
+    >>> omega = two_fluid_lite(
+    ...     B=np.array([[8.3e-9], [1e-8]]),
+    ...     k=0.01,
+    ...     n_i=5e6,
+    ...     theta=np.deg2rad([30, 60]),
+    ...     T_e=1.6e6,
+    ...     T_i=4.0e5,
+    ...     m_i=proton.mass.value,
+    ...     Z=1,
+    ... )
+    >>> omega.shape
+    (3, 2, 2)
+    >>> omega[:, 0, 0]
+    array([1.52057...e+03, 1.26175...e+03, 6.88152...e-01])
+    """
+    omegas = _two_fluid_omegas(
+        B,
+        k,
+        n_i,
+        theta,
+        T_e=T_e,
+        T_i=T_i,
+        m_i=m_i,
+        Z=Z,
+        gamma_e=gamma_e,
+        gamma_i=gamma_i,
+    )
+    return _stack_solutions(omegas, dim="mode", labels=_wave_modes, axis=0)
+
 
 @particle_input
 @validate_quantities(
@@ -26,6 +190,7 @@
     T_e={"can_be_negative": False, "equivalencies": u.temperature_energy()},
     T_i={"can_be_negative": False, "equivalencies": u.temperature_energy()},
 )
+@bind_lite_func(two_fluid_lite)
 def two_fluid(
     B: u.Quantity[u.T],
     ion: ParticleLike,
@@ -271,56 +436,28 @@ def two_fluid(
             f"Quantity, got array of shape {k.shape}."
         )
 
-    # Calc needed plasma parameters
-    n_e = n_i * ion.charge_number
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", category=PhysicsWarning)
-        c_s = ion_sound_speed(
-            T_e=T_e,
-            T_i=T_i,
-            ion=ion,
-            n_e=n_e,
-            gamma_e=gamma_e,
-            gamma_i=gamma_i,
-            Z=Z,
-        )
-    v_A = Alfven_speed(B, n_i, ion=ion)
-    omega_ci = gyrofrequency(B=B, particle=ion, signed=False)
-    omega_pe = plasma_frequency(n=n_e, particle="e-")
-
-    # Bellan2012JGR params equation 32
-    alpha = np.cos(theta.value) ** 2
-    beta = (c_s / v_A).to(u.dimensionless_unscaled).value ** 2
-    alphav, kv = np.meshgrid(alpha, k.value)  # create grid
-    Lambda = (kv * v_A.value / omega_ci.value) ** 2
-
-    # Bellan2012JGR params equation 2
-    Q = 1 + (kv * c.value / omega_pe.value) ** 2
-
-    # Bellan2012JGR params equation 35
-    A = ((1 + alphav) / Q) + beta + (alphav * Lambda / Q**2)
-    B = alphav * (1 + 2 * Q * beta + Lambda * beta) / Q**2
-    C = beta * (alphav / Q) ** 2
-
-    # Bellan2012JGR params equation 36
-    p = (3 * B - A**2) / 3
-    q = (9 * A * B - 2 * A**3 - 27 * C) / 27
+    # Solve on a grid of k x theta
+    kv, thetav = np.meshgrid(k.value, theta.value, indexing="ij")
+    omegas = _two_fluid_omegas(
+        B.value,
+        kv,
+        n_i.value,
+        thetav,
+        T_e=T_e.value,
+        T_i=T_i.value,
+        m_i=ion.mass.value,
+        Z=ion.charge_number,
+        gamma_e=gamma_e,
+        gamma_i=gamma_i,
+    )
 
-    # Bellan2012JGR params equation 38
-    R = 2 * Lambda * np.emath.sqrt(-p / 3)
-    S = 3 * q / (2 * p) * np.emath.sqrt(-3 / p)
-    T = Lambda * A / 3
     omega = {}
-    for ind, wave_mode in enumerate(("fast_mode", "alfven_mode", "acoustic_mode")):
-        # The solution corresponding to equation 38
-        ω = omega_ci * np.emath.sqrt(
-            R * np.cos(1 / 3 * np.emath.arccos(S) - 2 * np.pi / 3 * ind) + T
-        )
-        omega[wave_mode] = ω.squeeze()
+    for wave_mode, ω in zip(_wave_modes, omegas, strict=True):
+        omega[wave_mode] = ω.squeeze() * u.rad / u.s
 
         # check for violation of dispersion relation assumptions
         # (i.e. low-frequency, ω/kc << 0.1)
-        wkc_max = np.max(ω.value / (kv * c.value))
+        wkc_max = np.max(ω / (kv * c.value))
         if wkc_max > 0.1:
             warnings.warn(
                 f"The {wave_mode} calculation produced a high-frequency wave (ω/kc == "
@@ -3,16 +3,183 @@
 derivative :math:`Z′(ζ)`.
 """
 
-__all__ = ["plasma_dispersion_func", "plasma_dispersion_func_deriv"]
+__all__ = [
+    "plasma_dispersion_func",
+    "plasma_dispersion_func_and_deriv",
+    "plasma_dispersion_func_deriv",
+]
 
+import functools
+from typing import Literal
 
 import astropy.units as u
 import numpy as np
+from scipy.special import dawsn
 from scipy.special import wofz as faddeeva_function
 
+_methods = ("wofz", "rational", "table")
+
+#: The number of terms of the rational approximation of the Faddeeva
+#: function, which has a relative error below about 1e-12.
+_rational_terms = 32
+
+#: The spacing of the nodes of the table of the Faddeeva function, the
+#: extent of the table in the real and imaginary directions, and the
+#: order of the Taylor expansion about each node.  The relative error
+#: of the expansion is below about 1e-13 within the table.
+_table_spacing = 1 / 16
+_table_real_limit = 10.0
+_table_imag_limit = 6.0
+_table_order = 8
+
+#: The largest absolute value of an argument in the lower half plane
+#: for which the approximations are used with the reflection formula.
+#: Beyond it, the exponential of the reflection loses accuracy and may
+#: overflow, so `~scipy.special.wofz` is used instead.
+_reflection_limit = 20.0
+
+
+@functools.cache
+def _rational_coefficients() -> tuple[float, np.ndarray]:
+    """
+    Return the scale and polynomial coefficients of the rational
+    approximation of the Faddeeva function of :cite:t:`weideman:1994`.
+    """
+    n = _rational_terms
+    m = 2 * n
+    scale = np.sqrt(n / np.sqrt(2))
+    theta = np.arange(-m + 1, m) * np.pi / m
+    t = scale * np.tan(theta / 2)
+    f = np.concatenate([[0], np.exp(-(t**2)) * (scale**2 + t**2)])
+    a = np.real(np.fft.fft(np.fft.fftshift(f))) / (2 * m)
+    return scale, a[n:0:-1]
+
+
+def _faddeeva_rational(z: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the Faddeeva function for ``Im(z) >= 0`` with the rational
+    approximation of :cite:t:`weideman:1994`.
+    """
+    scale, coefficients = _rational_coefficients()
+    denominator = scale - 1j * z
+    x = (scale + 1j * z) / denominator
+    polynomial = np.full(z.shape, coefficients[0], dtype=np.complex128)
+    for coefficient in coefficients[1:]:
+        polynomial *= x
+        polynomial += coefficient
+    return (2 * polynomial / denominator + 1 / np.sqrt(np.pi)) / denominator
+
+
+@functools.cache
+def _taylor_table() -> tuple[int, np.ndarray]:
+    """
+    Return the number of nodes along the real direction and the Taylor
+    coefficients of the Faddeeva function about each node of a grid over
+    the upper half of the complex plane.
+    """
+    real = np.arange(
+        -_table_real_limit, _table_real_limit + _table_spacing / 2, _table_spacing
+    )
+    imag = np.arange(0, _table_imag_limit + _table_spacing / 2, _table_spacing)
+    nodes = (real[np.newaxis, :] + 1j * imag[:, np.newaxis]).ravel()
+
+    # The derivatives follow from w'(z) = -2 z w(z) + 2i/√π, so the
+    # Taylor coefficients satisfy a_{n+2} = -2 (z a_{n+1} + a_n) / (n + 2)
+    coefficients = np.empty((_table_order + 1, nodes.size), dtype=np.complex128)
+    coefficients[0] = faddeeva_function(nodes)
+    coefficients[1] = -2 * nodes * coefficients[0] + 2j / np.sqrt(np.pi)
+    for n in range(_table_order - 1):
+        coefficients[n + 2] = (
+            -2 * (nodes * coefficients[n + 1] + coefficients[n]) / (n + 2)
+        )
+    return real.size, coefficients
+
+
+def _faddeeva_table(z: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the Faddeeva function for ``Im(z) >= 0`` from the Taylor
+    expansion about the nearest node of a table, or with
+    `~scipy.special.wofz` outside of the table.
+    """
+    num_real, coefficients = _taylor_table()
+    num_imag = coefficients.shape[1] // num_real
+
+    i = np.rint((z.real + _table_real_limit) / _table_spacing)
+    j = np.rint(z.imag / _table_spacing)
+    # Written as the negation of the in-table conditions, so that
+    # non-finite arguments are also outside of the table
+    outside = ~((i >= 0) & (i < num_real) & (j < num_imag))
+    i = np.clip(i, 0, num_real - 1).astype(np.intp)
+    j = np.clip(j, 0, num_imag - 1).astype(np.intp)
+
+    node = j * num_real + i
+    dz = z - (i * _table_spacing - _table_real_limit + 1j * j * _table_spacing)
+    result = coefficients[-1][node]
+    for coefficient in coefficients[-2::-1]:
+        result *= dz
+        result += coefficient[node]
+
+    if np.any(outside):
+        result[outside] = faddeeva_function(z[outside])
+    return result
+
+
+def _faddeeva(z: np.ndarray, method: str) -> np.ndarray:
+    """Evaluate the Faddeeva function of the complex array ``z``."""
+    if method == "wofz":
+        return faddeeva_function(z)
+
+    upper_half = _faddeeva_rational if method == "rational" else _faddeeva_table
+
+    # Non-finite arguments, and large arguments in the lower half plane
+    # for which the reflection below is inaccurate, are left to wofz
+    z = np.atleast_1d(z)
+    lower = z.imag < 0
+    special = ~np.isfinite(z) | (lower & (np.abs(z) > _reflection_limit))
+    if not np.any(lower) and not np.any(special):
+        return upper_half(z)
+    lower &= ~special
+
+    # In the lower half plane, w(z) = 2 exp(-z²) - w(-z)
+    result = upper_half(np.where(special, 0, np.where(lower, -z, z)))
+    result[lower] = 2 * np.exp(-(z[lower] ** 2)) - result[lower]
+    if np.any(special):
+        result[special] = faddeeva_function(z[special])
+    return result
+
+
+def _plasma_dispersion(zeta, method: str):
+    """
+    Calculate the plasma dispersion function of ``zeta`` with
+    ``method``, without the conversions of the argument and result
+    that `plasma_dispersion_func` performs.
+    """
+    if method not in _methods:
+        raise ValueError(f"method must be one of {_methods}, not {method!r}.")
+
+    if isinstance(zeta, u.Quantity):
+        return (
+            _plasma_dispersion(zeta.to_value(u.dimensionless_unscaled), method)
+            * u.dimensionless_unscaled
+        )
+
+    zeta = np.asarray(zeta)
+    if zeta.dtype.kind not in "biufc":
+        raise TypeError(f"Unable to evaluate the function for {zeta.dtype} values.")
+
+    if zeta.dtype.kind != "c":
+        # On the real axis, w(x) = exp(-x²) + 2i F(x)/√π, where F is the
+        # Dawson function, which is exact and faster than any method
+        return np.exp(-(zeta**2)) * (1j * np.sqrt(np.pi)) - 2 * dawsn(zeta)
+
+    result = 1j * np.sqrt(np.pi) * _faddeeva(zeta, method)
+    return result.reshape(zeta.shape)[()]
+
 
 def plasma_dispersion_func(
     zeta: complex | np.ndarray | u.Quantity[u.dimensionless_unscaled],
+    *,
+    method: Literal["wofz", "rational", "table"] = "wofz",
 ) -> complex | np.ndarray | u.Quantity[u.dimensionless_unscaled]:
     r"""
     Calculate the plasma dispersion function.
@@ -31,6 +198,11 @@ def plasma_dispersion_func(
         The real or complex value to be provided as an argument to the
         plasma dispersion function.
 
+    method : {"wofz", "rational", "table"}, |keyword-only|, optional
+        The method used to evaluate the function for complex
+        arguments, which trades accuracy for speed as described in the
+        notes below. Defaults to ``"wofz"``.
+
     Returns
     -------
     |array_like| or |Quantity|
@@ -42,9 +214,13 @@ def plasma_dispersion_func(
     ~astropy.units.UnitsError
         If ``zeta`` is a |Quantity| but is not dimensionless.
 
+    ValueError
+        If ``method`` is not one of the available methods.
+
     See Also
     --------
     `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func_deriv`
+    `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func_and_deriv`
 
     Notes
     -----
@@ -53,6 +229,33 @@ def plasma_dispersion_func(
     distribution function.  The argument of this function then refers
     to the ratio of a wave's phase velocity to a thermal velocity.
 
+    The plasma dispersion function is :math:`Z(ζ) = i \sqrt{π} w(ζ)`,
+    where :math:`w` is the Faddeeva function. For complex arguments,
+    :math:`w` is evaluated with one of the following methods:
+
+    - ``"wofz"``: `scipy.special.wofz`, which is accurate to nearly
+      machine precision.
+    - ``"rational"``: the rational approximation with 32 terms of
+      :cite:t:`weideman:1994`.
+    - ``"table"``: the Taylor expansion about the nearest node of a table
+      of :math:`w` with a spacing of 1/16 over
+      :math:`|\mathrm{Re}(ζ)| ≤ 10` and :math:`0 ≤ \mathrm{Im}(ζ) ≤ 6`.
+      The table is computed the first time it is used, and arguments
+      outside of it are evaluated with `scipy.special.wofz`.
+
+    Both approximations have a relative error below about
+    :math:`10^{-12}` and are about twice as fast as
+    `scipy.special.wofz` in the upper half plane. In the lower half
+    plane, they use :math:`w(ζ) = 2 e^{-ζ^2} - w(-ζ)` for
+    :math:`|ζ| ≤ 20`, and evaluating the exponential reduces the speedup
+    to about a quarter. For larger :math:`|ζ|` in the lower half plane,
+    where the exponential loses accuracy and may overflow,
+    `scipy.special.wofz` is used instead. For real
+    arguments, the function is instead calculated exactly for every
+    method with the Dawson function :math:`F(ζ)` as
+    :math:`Z(ζ) = i \sqrt{π} e^{-ζ^2} - 2 F(ζ)`, which is faster than
+    `scipy.special.wofz`.
+
     Examples
     --------
     >>> from plasmapy.dispersion import plasma_dispersion_func
@@ -62,10 +265,12 @@ def plasma_dispersion_func(
     np.complex128(-0.36905845...+0.54014504...j)
     >>> plasma_dispersion_func([0.3, 0.7 + 2.3j])
     array([-0.56526333+1.61990085j, -0.09995023+0.37685142j])
+    >>> plasma_dispersion_func([0.3, 0.7 + 2.3j], method="rational")
+    array([-0.56526333+1.61990085j, -0.09995023+0.37685142j])
     """
     try:
-        return 1j * np.sqrt(np.pi) * faddeeva_function(zeta)
-    except u.UnitTypeError as wrong_units:
+        return _plasma_dispersion(zeta, method)
+    except u.UnitsError as wrong_units:
         raise u.UnitsError(
             "The argument to plasma_dispersion_func "
             "must be dimensionless if it is a Quantity."
@@ -79,6 +284,8 @@ def plasma_dispersion_func(
 
 def plasma_dispersion_func_deriv(
     zeta: complex | np.ndarray | u.Quantity[u.dimensionless_unscaled],
+    *,
+    method: Literal["wofz", "rational", "table"] = "wofz",
 ) -> complex | np.ndarray | u.Quantity[u.dimensionless_unscaled]:
     r"""
     Calculate the derivative of the plasma dispersion function.
@@ -96,6 +303,12 @@ def plasma_dispersion_func_deriv(
     zeta : |array_like| or |Quantity|
         Argument of plasma dispersion function.
 
+    method : {"wofz", "rational", "table"}, |keyword-only|, optional
+        The method used to evaluate the function for complex
+        arguments, as described in the notes of
+        `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func`.
+        Defaults to ``"wofz"``.
+
     Returns
     -------
     complex, `~numpy.ndarray`, or |Quantity|
@@ -107,9 +320,13 @@ def plasma_dispersion_func_deriv(
         If the argument is a `~astropy.units.Quantity` but is not
         dimensionless.
 
+    ValueError
+        If ``method`` is not one of the available methods.
+
     See Also
     --------
     `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func`
+    `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func_and_deriv`
 
     Examples
     --------
@@ -121,7 +338,7 @@ def plasma_dispersion_func_deriv(
     np.complex128(0.165871331...+0.4458797880...j)
     """
     try:
-        return -2 * (1 + zeta * plasma_dispersion_func(zeta))
+        return -2 * (1 + zeta * _plasma_dispersion(zeta, method))
     except u.UnitsError as wrong_units:
         raise u.UnitsError(
             "The argument to plasma_dispersion_func_deriv "
@@ -133,3 +350,75 @@ def plasma_dispersion_func_deriv(
             "must be one of the following types: complex, float, "
             "int, ndarray, or a dimensionless Quantity."
         ) from wrong_type
+
+
+def plasma_dispersion_func_and_deriv(
+    zeta: complex | np.ndarray | u.Quantity[u.dimensionless_unscaled],
+    *,
+    method: Literal["wofz", "rational", "table"] = "wofz",
+) -> tuple[
+    complex | np.ndarray | u.Quantity[u.dimensionless_unscaled],
+    complex | np.ndarray | u.Quantity[u.dimensionless_unscaled],
+]:
+    r"""
+    Calculate the plasma dispersion function and its derivative
+    together.
+
+    The derivative is calculated from the plasma dispersion function
+    as :math:`Z'(ζ) = -2 [1 + ζ Z(ζ)]`, so that the plasma dispersion
+    function is evaluated once for both of them.
+
+    Parameters
+    ----------
+    zeta : |array_like| or |Quantity|
+        Argument of plasma dispersion function.
+
+    method : {"wofz", "rational", "table"}, |keyword-only|, optional
+        The method used to evaluate the function for complex
+        arguments, as described in the notes of
+        `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func`.
+        Defaults to ``"wofz"``.
+
+    Returns
+    -------
+    Z : complex, `~numpy.ndarray`, or |Quantity|
+        The plasma dispersion function evaluated at ``zeta``.
+
+    Zprime : complex, `~numpy.ndarray`, or |Quantity|
+        The first derivative of the plasma dispersion function evaluated
+        at ``zeta``.
+
+    Raises
+    ------
+    ~astropy.units.UnitsError
+        If the argument is a `~astropy.units.Quantity` but is not
+        dimensionless.
+
+    ValueError
+        If ``method`` is not one of the available methods.
+
+    See Also
+    --------
+    `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func`
+    `~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func_deriv`
+
+    Examples
+    --------
+    >>> from plasmapy.dispersion import plasma_dispersion_func_and_deriv
+    >>> plasma_dispersion_func_and_deriv(1j)
+    (np.complex128(0.757872156...j), np.complex128(-0.484255687...+0j))
+    """
+    try:
+        Z = _plasma_dispersion(zeta, method)
+        return Z, -2 * (1 + zeta * Z)
+    except u.UnitsError as wrong_units:
+        raise u.UnitsError(
+            "The argument to plasma_dispersion_func_and_deriv "
+            "must be dimensionless if it is a Quantity."
+        ) from wrong_units
+    except TypeError as wrong_type:
+        raise TypeError(
+            "The argument to plasma_dispersion_func_and_deriv "
+            "must be one of the following types: complex, float, "
+            "int, ndarray, or a dimensionless Quantity."
+        ) from wrong_type
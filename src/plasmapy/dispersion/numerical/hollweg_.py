@@ -5,6 +5,7 @@
 
 __all__ = ["hollweg"]
 
+import itertools
 import warnings
 from numbers import Real
 
@@ -21,6 +22,93 @@
 c_si_unitless = c.value
 
 
+def _polynomial_roots(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Find the roots of many polynomials at once.
+
+    The roots are the eigenvalues of the companion matrix of each
+    polynomial, as in `numpy.roots`, but all of the companion matrices
+    are built at once and their eigenvalues found in one call of
+    `numpy.linalg.eigvals`.
+
+    Parameters
+    ----------
+    coefficients : (N + 1, ...) `~numpy.ndarray`
+        The coefficients of each polynomial of degree :math:`N`, from
+        the highest power to the constant term. The leading
+        coefficients must be nonzero.
+
+    Returns
+    -------
+    (N, ...) `~numpy.ndarray`
+        The complex roots of each polynomial, in no particular order.
+    """
+    coefficients = np.moveaxis(coefficients, 0, -1)
+    degree = coefficients.shape[-1] - 1
+
+    companion = np.zeros((*coefficients.shape[:-1], degree, degree))
+    companion[..., 0, :] = -coefficients[..., 1:] / coefficients[..., :1]
+    companion[..., np.arange(1, degree), np.arange(degree - 1)] = 1
+
+    roots = np.linalg.eigvals(companion).astype(np.complex128)
+    return np.moveaxis(roots, -1, 0)
+
+
+def _track_roots(roots: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    Order the roots of a dispersion relation so that each one varies
+    continuously with wavenumber.
+
+    The roots for the smallest wavenumber are sorted.  The roots for
+    each larger wavenumber are ordered like the roots they are closest
+    to, which are extrapolated linearly from the two previous
+    distinct wavenumbers, so that the modes are followed through places
+    where they cross.  Repeated wavenumbers are given the same ordering.
+
+    Parameters
+    ----------
+    roots : (R, N, ...) `~numpy.ndarray`
+        The R roots for each of the N wavenumbers.
+
+    k : (N,) `~numpy.ndarray`
+        The wavenumbers, in any order.
+
+    Returns
+    -------
+    (R, N, ...) `~numpy.ndarray`
+        The reordered roots.
+    """
+    permutations = np.array(list(itertools.permutations(range(roots.shape[0]))))
+
+    # Follow the modes in order of increasing wavenumber
+    order = np.argsort(k, kind="stable")
+    k = k[order]
+    roots = roots[:, order]
+
+    # The index of the last wavenumber smaller than each wavenumber
+    smaller = np.searchsorted(k, k, side="left") - 1
+
+    tracked = np.empty_like(roots)
+    tracked[:, 0] = np.sort(roots[:, 0], axis=0)
+    for i in range(1, roots.shape[1]):
+        predicted = tracked[:, i - 1]
+        if (j := smaller[i - 1]) >= 0:
+            slope = (k[i] - k[i - 1]) / (k[i - 1] - k[j])
+            predicted = predicted + slope * (tracked[:, i - 1] - tracked[:, j])
+
+        # The distance to the prediction of every ordering of the roots
+        candidates = roots[permutations, i]
+        distance = np.sum(np.abs(candidates - predicted) ** 2, axis=1)
+        best = np.argmin(distance, axis=0)
+        tracked[:, i] = np.take_along_axis(
+            candidates, best[np.newaxis, np.newaxis], axis=0
+        )[0]
+
+    untracked = np.empty_like(tracked)
+    untracked[:, order] = tracked
+    return untracked
+
+
 @validate_quantities(
     B={"can_be_negative": False},
     n_i={"can_be_negative": False},
@@ -28,7 +116,7 @@
     T_i={"can_be_negative": False, "equivalencies": u.temperature_energy()},
 )
 @particle_input
-def hollweg(  # noqa: C901, PLR0912, PLR0915
+def hollweg(  # noqa: C901
     B: u.Quantity[u.T],
     ion: ParticleLike,
     k: u.Quantity[u.rad / u.m],
@@ -41,6 +129,7 @@ def hollweg(  # noqa: C901, PLR0912, PLR0915
     gamma_i: float = 3,
     mass_numb: int | None = None,
     Z: float | None = None,
+    track_modes: bool = False,
 ):
     r"""
     Calculate the two-fluid dispersion relation presented by
@@ -96,6 +185,15 @@ def hollweg(  # noqa: C901, PLR0912, PLR0915
     Z : real number, |keyword-only|, optional
         The charge number corresponding to ``ion``.
 
+    track_modes : `bool`, |keyword-only|, default: `False`
+        If `False`, the modes are labeled by sorting the frequencies at
+        each wavenumber. If `True`, the modes are labeled by sorting the
+        frequencies at the smallest wavenumber and following each mode
+        continuously to larger wavenumbers, so that a mode keeps its
+        label where it crosses another mode. The labels at a given
+        wavenumber then depend on the other wavenumbers in ``k``, which
+        may be in any order.
+
     Returns
     -------
     omega : Dict[str, `~astropy.units.Quantity`]
@@ -197,6 +295,13 @@ def hollweg(  # noqa: C901, PLR0912, PLR0915
 
     This routine solves for :math:`ω` for given :math:`k` values
     by numerically solving for the roots of the above expression.
+    The roots for every :math:`k` and :math:`θ` are found together as
+    the eigenvalues of the companion matrices of the polynomials. With
+    ``track_modes=True``, the modes are labeled by sorting the
+    frequencies for the smallest value of :math:`k`, and are then
+    followed continuously through the larger values of :math:`k` for
+    each :math:`θ`, so that the labels stay with the same modes where
+    they cross.
 
     Examples
     --------
@@ -297,16 +402,8 @@ def hollweg(  # noqa: C901, PLR0912, PLR0915
 
     # Find roots to polynomial
     coefficients = np.array([c3, c2, c1, c0], ndmin=3)
-    nroots = coefficients.shape[0] - 1  # 3
-    nks = coefficients.shape[1]
-    nthetas = coefficients.shape[2]
-    roots = np.empty((nroots, nks, nthetas), dtype=np.complex128)
-    for ii in range(nks):
-        for jj in range(nthetas):
-            roots[:, ii, jj] = np.roots(coefficients[:, ii, jj])
-
-    roots = np.sqrt(roots)
-    roots = np.sort(roots, axis=0)
+    roots = np.sqrt(_polynomial_roots(coefficients))
+    roots = _track_roots(roots, kv[:, 0]) if track_modes else np.sort(roots, axis=0)
 
     # Warn about NOT low-β
     if c_s / v_A > 0.1:
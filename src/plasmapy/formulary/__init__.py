@@ -3,77 +3,80 @@
 from plasma science.
 """
 
-__all__: list[str] = []
-__aliases__: list[str] = []
-__lite_funcs__: list[str] = []
+import functools
+import importlib
 
-from plasmapy.formulary.braginskii import *
-from plasmapy.formulary.collisions import *
-from plasmapy.formulary.densities import *
-from plasmapy.formulary.dielectric import *
-from plasmapy.formulary.dimensionless import *
-from plasmapy.formulary.distribution import *
-from plasmapy.formulary.drifts import *
-from plasmapy.formulary.frequencies import *
-from plasmapy.formulary.ionization import *
-from plasmapy.formulary.laser import *
-from plasmapy.formulary.lengths import *
-from plasmapy.formulary.magnetostatics import *
-from plasmapy.formulary.mathematics import *
-from plasmapy.formulary.misc import *
-from plasmapy.formulary.quantum import *
-from plasmapy.formulary.radiation import *
-from plasmapy.formulary.relativity import *
-from plasmapy.formulary.speeds import *
+# The formulary modules are imported the first time one of their names
+# is accessed (PEP 562), so that importing a single module such as
+# `plasmapy.formulary.speeds` does not import the rest of the formulary
+# and its dependencies.  The module that provides a name is found from
+# the ``__all__`` of the modules, so that the names do not need to be
+# listed here as well.
 
-# auto populate __all__
-import inspect  # isort: skip
 
-for obj_name in list(globals()):
-    if not (
-        obj_name.startswith("__") or obj_name.endswith("__")
-    ) and not inspect.ismodule(globals()[obj_name]):
-        __all__.append(obj_name)  # noqa: PYI056
-__all__.sort()
+@functools.cache
+def _submodules() -> tuple[str, ...]:
+    """Return the names of the formulary modules in alphabetical order."""
+    # pkgutil imports inspect, which takes longer than importing the
+    # formulary, so it is only imported when it is first needed
+    import pkgutil  # noqa: PLC0415
 
-# Put non-formulary imports here so that they don't get included in __all__
+    return tuple(
+        sorted(
+            module.name
+            for module in pkgutil.iter_modules(__path__)
+            if not module.name.startswith("_")
+        )
+    )
 
-import contextlib  # isort: skip
 
-# auto populate __aliases__ & __lite_funcs__
-for modname in (
-    "braginskii",
-    "collisions",
-    "densities",
-    "dielectric",
-    "dimensionless",
-    "distribution",
-    "drifts",
-    "frequencies",
-    "ionization",
-    "lengths",
-    "magnetostatics",
-    "mathematics",
-    "misc",
-    "quantum",
-    "radiation",
-    "relativity",
-    "speeds",
-    "laser",
-):
-    try:
-        obj = globals()[modname]
-    except KeyError:
-        continue
+def _find_submodule(name: str) -> str | None:
+    """
+    Return the name of the formulary module that provides ``name``, or
+    `None` if no module does.
 
-    with contextlib.suppress(AttributeError):
-        __aliases__.extend(obj.__aliases__)
+    The modules are imported in reverse alphabetical order until one
+    with ``name`` in its ``__all__`` is found.  When a name is exported
+    by more than one module, the module that is last alphabetically
+    provides it, as it did when the modules were star imported.
+    """
+    for modname in reversed(_submodules()):
+        if name in importlib.import_module(f"{__name__}.{modname}").__all__:
+            return modname
+    return None
 
-    with contextlib.suppress(AttributeError):
-        __lite_funcs__.extend(obj.__lite_funcs__)
 
-__aliases__ = sorted(set(__aliases__))
-__lite_funcs__ = sorted(set(__lite_funcs__))
+def __getattr__(name: str):
+    """
+    Import the formulary module that provides ``name`` the first time
+    it is accessed.
+    """
+    if name in _submodules():
+        return importlib.import_module(f"{__name__}.{name}")
 
-# cleanup namespace
-del contextlib, inspect, modname, obj, obj_name
+    if name in {"__all__", "__aliases__", "__lite_funcs__"}:
+        # These names are collected from every module, so every module
+        # gets imported.
+        value = sorted(
+            {
+                obj
+                for modname in _submodules()
+                for obj in getattr(__getattr__(modname), name, [])
+            }
+        )
+        globals()[name] = value
+        return value
+
+    # Formulary functions are public, so other names (e.g., those
+    # probed by tools) are not looked up
+    if not name.startswith("_") and (modname := _find_submodule(name)) is not None:
+        value = getattr(importlib.import_module(f"{__name__}.{modname}"), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported names in `dir` of the formulary."""
+    return sorted(set(globals()) | set(_submodules()) | set(__getattr__("__all__")))
@@ -18,7 +18,6 @@
 import astropy.units as u
 import numpy as np
 from astropy.constants.si import c, e, eps0, h, hbar, k_B, m_e
-from lmfit import Parameters, minimize
 
 from plasmapy.formulary import mathematics
 from plasmapy.formulary.relativity import Lorentz_factor
@@ -470,6 +469,9 @@ def residual(params, data):
         complexResidue = abs(data - model)
         return complexResidue  # noqa: RET504
 
+    # lmfit is only needed here, so it is imported when first used
+    from lmfit import Parameters, minimize  # noqa: PLC0415
+
     # setting parameters for fitting along with bounds
     alphaGuess = 1 * u.dimensionless_unscaled
     params = Parameters()
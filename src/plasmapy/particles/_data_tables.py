@@ -0,0 +1,279 @@
+"""
+Lazily loaded tables of the particle data in
+:file:`src/plasmapy/particles/data/`.
+
+Each JSON data file is also compiled into columns of NumPy arrays in
+:file:`particle_data.npz`, which can be loaded without decoding the
+JSON.  After changing a JSON file, regenerate the compiled file with::
+
+    python tools/compile_particle_data.py
+"""
+
+__all__ = ["DataTable"]
+
+import hashlib
+import io
+import json
+import pkgutil
+from collections.abc import Callable, Iterator, Mapping
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+#: The version of the layout of :file:`particle_data.npz`, which is
+#: incremented whenever the layout changes.
+_FORMAT_VERSION = 1
+
+#: The names of the tables in :file:`particle_data.npz`, each of which
+#: is compiled from :file:`particles/data/{name}.json`.
+_COMPILED_TABLES = ("elements", "isotopes", "ionization_energy")
+
+_COMPILED_RESOURCE = "particles/data/particle_data.npz"
+
+
+def _json_resource(name: str) -> str:
+    return f"particles/data/{name}.json"
+
+
+def _apply_object_hook(obj: Any, object_hook: Callable[[dict], Any]) -> Any:
+    """
+    Convert a decoded JSON value the way ``json.loads(...,
+    object_hook=object_hook)`` would have, from the innermost object
+    outward.
+    """
+    if isinstance(obj, dict):
+        return object_hook(
+            {key: _apply_object_hook(value, object_hook) for key, value in obj.items()}
+        )
+    if isinstance(obj, list):
+        return [_apply_object_hook(value, object_hook) for value in obj]
+    return obj
+
+
+#: The types of the arrays that hold the compiled columns.  Quantities
+#: are stored by value in the float array, with the unit recorded in
+#: the kind of the column.
+_ARRAY_TYPES = ("bool", "int", "float", "str")
+
+
+def _kind_of(value: Any) -> str:
+    """
+    Return the kind of a value in a JSON record, which determines the
+    column it is compiled into.
+    """
+    # bool is checked before int, since bool is a subclass of int
+    for kind in (bool, int, float, str):
+        if isinstance(value, kind):
+            return kind.__name__
+    if isinstance(value, dict) and set(value) == {"unit", "value"}:
+        return f"quantity:{value['unit']}"
+    raise TypeError(f"Unable to compile a value of {value!r} into a column.")
+
+
+def _array_of(kind: str) -> str:
+    """Return the name of the array that holds values of ``kind``."""
+    return "float" if kind.startswith("quantity:") else kind
+
+
+def _compile_records(
+    name: str, records: Mapping[str, Mapping[str, Any]], source: bytes
+) -> dict[str, np.ndarray]:
+    """
+    Compile the JSON ``records`` of table ``name`` into columns.
+
+    Each field of the records has one column per kind of value (e.g.,
+    ``"int"``, ``"str"``, or ``"quantity:u"`` for a quantity in atomic
+    mass units).  The columns are stacked into one two-dimensional array
+    per type, ``{name}.{type}``.  The array ``{name}.codes`` has one
+    column per field, which is zero where an entry lacks the field and
+    is otherwise one plus the index of the kind of its value.  The
+    layout is stored as JSON in ``{name}.layout``, along with the
+    SHA-256 hash of ``source`` to detect out of date compiled tables.
+    """
+    keys = list(records)
+    field_kinds: dict[str, list[str]] = {}
+    for record in records.values():
+        for field, value in record.items():
+            kinds = field_kinds.setdefault(field, [])
+            if (kind := _kind_of(value)) not in kinds:
+                kinds.append(kind)
+
+    codes = np.zeros((len(keys), len(field_kinds)), dtype=np.int8)
+    arrays: dict[str, list[list[Any]]] = {array: [] for array in _ARRAY_TYPES}
+    fields = []
+    for i, (field, kinds) in enumerate(field_kinds.items()):
+        kind_columns = []
+        for j, kind in enumerate(kinds):
+            array = _array_of(kind)
+            fill: Any = "" if array == "str" else 0
+            column = []
+            for index, record in enumerate(records.values()):
+                value = record.get(field)
+                if field in record and _kind_of(value) == kind:
+                    codes[index, i] = j + 1
+                    column.append(value["value"] if array != kind else value)
+                else:
+                    column.append(fill)
+            kind_columns.append([kind, len(arrays[array])])
+            arrays[array].append(column)
+        fields.append([field, kind_columns])
+
+    layout = {
+        "format_version": _FORMAT_VERSION,
+        "sha256": hashlib.sha256(source).hexdigest(),
+        "fields": fields,
+    }
+    compiled = {
+        f"{name}.layout": np.array(json.dumps(layout)),
+        f"{name}.keys": np.array(keys, dtype=str),
+        f"{name}.codes": codes,
+    }
+    for array in _ARRAY_TYPES:
+        compiled[f"{name}.{array}"] = np.array(arrays[array], dtype=array).T.reshape(
+            len(keys), len(arrays[array])
+        )
+    return compiled
+
+
+def _write_compiled_tables(path: str | Path) -> None:
+    """
+    Compile the JSON data files in `plasmapy.particles.data` into
+    :file:`particle_data.npz` at ``path``.
+    """
+    compiled: dict[str, np.ndarray] = {}
+    for name in _COMPILED_TABLES:
+        source = pkgutil.get_data("plasmapy", _json_resource(name))
+        compiled |= _compile_records(name, json.loads(source), source)  # type: ignore[arg-type]
+    np.savez_compressed(path, **compiled)
+
+
+class _CompiledRecords(Mapping[str, dict[str, Any]]):
+    """
+    A read-only mapping to the JSON records of a table, which are
+    rebuilt from compiled columns on lookup.
+    """
+
+    def __init__(
+        self,
+        layout: dict[str, Any],
+        keys: np.ndarray,
+        codes: np.ndarray,
+        arrays: dict[str, np.ndarray],
+    ) -> None:
+        self._index = {key: index for index, key in enumerate(keys.tolist())}
+        self._fields = layout["fields"]
+        self._codes = codes
+        self._arrays = arrays
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        index = self._index[key]
+        record: dict[str, Any] = {}
+        for (field, kind_columns), code in zip(
+            self._fields, self._codes[index].tolist(), strict=True
+        ):
+            if not code:
+                continue
+            kind, column = kind_columns[code - 1]
+            value = self._arrays[_array_of(kind)][index, column].item()
+            if kind.startswith("quantity:"):
+                value = {"unit": kind.removeprefix("quantity:"), "value": value}
+            record[field] = value
+        return record
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def _load_compiled_records(name: str, source: bytes) -> _CompiledRecords | None:
+    """
+    Load table ``name`` from :file:`particle_data.npz`, or return `None`
+    if the compiled file is missing, has a different layout version, or
+    was compiled from a JSON file other than ``source``.
+    """
+    try:
+        compiled = pkgutil.get_data("plasmapy", _COMPILED_RESOURCE)
+    except FileNotFoundError:
+        return None
+
+    with np.load(io.BytesIO(compiled), allow_pickle=False) as npz:  # type: ignore[arg-type]
+        if f"{name}.layout" not in npz:
+            return None
+        layout = json.loads(npz[f"{name}.layout"].item())
+        if (
+            layout["format_version"] != _FORMAT_VERSION
+            or layout["sha256"] != hashlib.sha256(source).hexdigest()
+        ):
+            return None
+        return _CompiledRecords(
+            layout,
+            npz[f"{name}.keys"],
+            npz[f"{name}.codes"],
+            {array: npz[f"{name}.{array}"] for array in _ARRAY_TYPES},
+        )
+
+
+class DataTable(Mapping[str, Any]):
+    """
+    A read-only mapping to the entries of a data file in
+    `plasmapy.particles.data`, which is loaded on first use.
+
+    Parameters
+    ----------
+    name : str
+        The name of the data file without the :file:`.json` extension
+        (e.g., ``"isotopes"``).
+
+    object_hook : callable
+        The ``object_hook`` for `json.loads` that converts each entry,
+        for example into an `~astropy.units.Quantity`.
+
+    Notes
+    -----
+    The entries are read from the compiled columns in
+    :file:`particle_data.npz` when those are up to date with the JSON
+    file, and otherwise from the JSON file itself.  Applying
+    ``object_hook`` to every entry takes much longer than loading the
+    file, so each entry is converted only when it is first looked up.
+    Membership tests, iteration over keys, and `len` do not convert any
+    entries.
+    """
+
+    def __init__(self, name: str, object_hook: Callable[[dict], Any]) -> None:
+        self._name = name
+        self._object_hook = object_hook
+        self._converted: dict[str, Any] = {}
+
+    @cached_property
+    def _raw(self) -> Mapping[str, Any]:
+        """The records of the table, before ``object_hook`` is applied."""
+        source = pkgutil.get_data("plasmapy", _json_resource(self._name))
+        compiled = _load_compiled_records(self._name, source)  # type: ignore[arg-type]
+        return json.loads(source) if compiled is None else compiled  # type: ignore[arg-type]
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._converted[key]
+        except KeyError:
+            value = _apply_object_hook(self._raw[key], self._object_hook)
+            self._converted[key] = value
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._name!r})"
@@ -12,12 +12,13 @@
     "element_names_to_symbols",
 ]
 
-import json
-import pkgutil
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import astropy.units as u
 
+from plasmapy.particles._data_tables import DataTable
+
 
 @dataclass
 class PeriodicTable:
@@ -49,9 +50,8 @@ def element_obj_hook(obj):
 #    json.dump(_Elements, f, default=plasma_default, indent=2)
 
 
-data_about_elements: dict[str, str | int | u.Quantity[u.u]] = json.loads(
-    pkgutil.get_data("plasmapy", "particles/data/elements.json"),
-    object_hook=element_obj_hook,
+data_about_elements: Mapping[str, str | int | u.Quantity[u.u]] = DataTable(
+    "elements", element_obj_hook
 )
 
 
@@ -8,11 +8,10 @@
     "data_about_ionization_energy",
 ]
 
-import json
-import pkgutil
-
 import astropy.units as u
 
+from plasmapy.particles._data_tables import DataTable
+
 
 def ionization_energy_obj_hook(obj):
     """Provide an ``object_hook`` designed for `json.load` and `json.loads`."""
@@ -21,8 +20,7 @@ def ionization_energy_obj_hook(obj):
     )
 
 
-#: Dictionary of ionization energy data.
-data_about_ionization_energy = json.loads(
-    pkgutil.get_data("plasmapy", "particles/data/ionization_energy.json"),
-    object_hook=ionization_energy_obj_hook,
+#: Mapping of ionization energy data, which is loaded on first use.
+data_about_ionization_energy = DataTable(
+    "ionization_energy", ionization_energy_obj_hook
 )
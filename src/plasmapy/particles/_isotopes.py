@@ -8,11 +8,10 @@
     "data_about_isotopes",
 ]
 
-import json
-import pkgutil
-
 import astropy.units as u
 
+from plasmapy.particles._data_tables import DataTable
+
 # this code was used to create the JSON file as per vn-ki on Matrix:
 # https://matrix.to/#/!hkWCiyhQyxiYJlUtKF:matrix.org/
 #    $1554667515670438wIKlP:matrix.org?via=matrix.org&via=cadair.com
@@ -32,8 +31,5 @@ def isotope_obj_hook(obj):
     return obj["value"] * u.Unit(obj["unit"]) if "unit" in obj else obj
 
 
-#: Dictionary of isotope data.
-data_about_isotopes = json.loads(
-    pkgutil.get_data("plasmapy", "particles/data/isotopes.json"),
-    object_hook=isotope_obj_hook,
-)
+#: Mapping of isotope data, which is loaded on first use.
+data_about_isotopes = DataTable("isotopes", isotope_obj_hook)
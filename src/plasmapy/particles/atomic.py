@@ -24,12 +24,11 @@
 
 from collections.abc import Callable
 from numbers import Integral
-from typing import Any, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
 import astropy.units as u
-import h5py
 import numpy as np
-from scipy.interpolate import CubicSpline
 
 from plasmapy.particles import _elements, _isotopes
 from plasmapy.particles.decorators import particle_input
@@ -42,11 +41,15 @@
 from plasmapy.particles.particle_class import Particle, ParticleLike
 from plasmapy.particles.particle_collections import ParticleList
 from plasmapy.particles.symbols import atomic_symbol
-from plasmapy.utils.data.downloader import Downloader
 from plasmapy.utils.decorators import validate_quantities
 
+if TYPE_CHECKING:
+    from scipy.interpolate import CubicSpline
+
 __all__.sort()
 
+_NIST_STAR_FILENAME = "NIST_STAR.hdf5"
+
 
 @particle_input
 def atomic_number(element: ParticleLike) -> int:
@@ -1148,6 +1151,8 @@ def stopping_power(
     energies: u.Quantity[u.MeV] | None = None,
     return_interpolator: bool = False,
     component: Literal["total", "electronic", "nuclear"] = "total",
+    *,
+    offline: bool = False,
 ) -> (
     tuple[u.Quantity, u.Quantity]
     | Callable[[u.Quantity[u.J]], u.Quantity[u.MeV * u.cm**2 / u.g]]
@@ -1182,6 +1187,14 @@ def stopping_power(
         values are ``electronic``, ``nuclear``, and ``total`` for the
         electronic, nuclear, and total energies, respectively.
 
+    offline : `bool`, default: `False`
+        If `True`, use the local copy of the NIST data file in
+        :file:`~/.plasmapy/downloads/` without making any network
+        connection, and raise a `FileNotFoundError` if the file has not
+        been downloaded yet. If `False`, the local copy is validated
+        against |PlasmaPy's data repository| the first time that the data
+        for a combination of particle, material, and component is loaded.
+
     Returns
     -------
     ``Tuple[u.Quantity, u.Quantity[u.MeV * u.cm**2 / u.g]]``
@@ -1194,25 +1207,103 @@ def stopping_power(
     Standards and Technology's Stopping-Power and Range Tables :cite:p:`niststar:2005`.
     Valid materials can be found on the NIST STAR website. The default energies
     are taken from the data points in the STAR database.
+
+    The stopping power tables and the interpolators fitted to them are
+    cached for the lifetime of the process, so that repeated calls for
+    the same particle, material, and component neither read the data
+    file nor refit the interpolator.
     """
-    # TODO: figure out a better way of handling the Downloader() here
-    nist_data_path = Downloader().get_file("NIST_STAR.hdf5")
-
-    # Validate particle input. Currently, the only supported particles are protons and electrons.
-    with h5py.File(nist_data_path, "r") as nist_data:
-        if incident_particle == Particle("He-4"):
-            group_name = "helium_ions"
-        elif incident_particle == Particle("e-"):
-            raise NotImplementedError(
-                "Stopping calculations for electrons have not been implemented yet!"
-            )
-        elif incident_particle in {Particle("H+"), Particle("p+")}:
-            group_name = "protons"
-        else:
-            raise ValueError(
-                "Please pass a valid particle type for stopping power calculations."
+    if incident_particle == Particle("He-4"):
+        group_name = "helium_ions"
+    elif incident_particle == Particle("e-"):
+        raise NotImplementedError(
+            "Stopping calculations for electrons have not been implemented yet!"
+        )
+    elif incident_particle in {Particle("H+"), Particle("p+")}:
+        group_name = "protons"
+    else:
+        raise ValueError(
+            "Please pass a valid particle type for stopping power calculations."
+        )
+
+    # To differentiate from "energies" which refers to the user provided
+    # energies, we use "baseline_energies" for the energies in the tables
+    baseline_energies, relevant_stopping = _get_stopping_power_table(
+        group_name, material, component, offline=offline
+    )
+
+    if energies is None and not return_interpolator:
+        return (
+            baseline_energies * u.MeV,
+            relevant_stopping * u.MeV * u.cm**2 / u.g,
+        )
+
+    cs = _get_stopping_power_spline(group_name, material, component)
+
+    # If it has been indicated that the user wants the interpolator, construct
+    # an anonymous function to handle units and sanitize IO
+    if return_interpolator:
+        return lambda x: np.exp(cs(np.log(x.to(u.MeV).value))) * u.MeV * u.cm**2 / u.g
+
+    return (
+        energies,
+        np.exp(cs(np.log(energies.to("MeV").value))) * u.MeV * u.cm**2 / u.g,  # type: ignore[union-attr]
+    )
+
+
+# Stopping power tables read from the NIST STAR data file and the
+# log-log splines fitted to them, keyed by (group name, material,
+# component).  Neither changes within a process, so each is loaded or
+# fitted only once.
+_stopping_power_tables: dict[tuple[str, str, str], tuple[np.ndarray, np.ndarray]] = {}
+_stopping_power_splines: dict[tuple[str, str, str], "CubicSpline"] = {}
+
+
+def _get_nist_star_path(offline: bool = False) -> Path:
+    """
+    Return the path to the NIST STAR data file, downloading it if needed.
+
+    If ``offline`` is `True`, the copy of the file in the default download
+    directory of `~plasmapy.utils.data.downloader.Downloader` is used
+    without making any network connection, and `FileNotFoundError` is
+    raised if the file has not been downloaded yet.
+    """
+    if offline:
+        # The downloader contacts the GitHub API when it is imported, so
+        # the path of the downloaded file is built without importing it
+        path = Path.home() / ".plasmapy" / "downloads" / _NIST_STAR_FILENAME
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"The NIST STAR data file has not been downloaded to {path}, "
+                f"so it cannot be used offline. Call stopping_power with "
+                f"offline=False once to download it."
             )
+        return path
+
+    from plasmapy.utils.data.downloader import Downloader  # noqa: PLC0415
+
+    return Downloader().get_file(_NIST_STAR_FILENAME)
+
+
+def _get_stopping_power_table(
+    group_name: str, material: str, component: str, *, offline: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the baseline energies (in MeV) and stopping powers (in
+    MeV cm² / g) of ``material`` from the NIST STAR data file.
+
+    The arrays are read from the data file on the first request for a
+    combination of ``group_name``, ``material``, and ``component``, and
+    are returned from a cache afterwards.  The returned arrays are read
+    only.
+    """
+    key = (group_name, material, component)
+    if key in _stopping_power_tables:
+        return _stopping_power_tables[key]
 
+    import h5py  # noqa: PLC0415
+
+    with h5py.File(_get_nist_star_path(offline=offline), "r") as nist_data:
         group_data = nist_data[group_name]
 
         if material not in group_data:
@@ -1220,44 +1311,54 @@ def stopping_power(
                 f"Please pass a valid material string! Material {material} not found in {group_name}."
             )
 
-        # Energies are not included in the material data. They must be loaded from a separate data set.
-        # To differentiate from "energies" which refers to the user provided energies, we use "baseline_energies"
-        baseline_energies_data = group_data["energy"]
+        # Energies are not included in the material data. They must be
+        # loaded from a separate data set.
+        baseline_energies = group_data["energy"][()]
         material_data = group_data[material]
 
         if component == "total":
-            relevant_stopping_data = (
-                material_data["electronic_stopping_power"]
-                + material_data["nuclear_stopping_power"]
+            relevant_stopping = (
+                material_data["electronic_stopping_power"][()]
+                + material_data["nuclear_stopping_power"][()]
             )
         elif component == "electronic":
-            relevant_stopping_data = material_data["electronic_stopping_power"]
+            relevant_stopping = material_data["electronic_stopping_power"][()]
         elif component == "nuclear":
-            relevant_stopping_data = material_data["nuclear_stopping_power"]
+            relevant_stopping = material_data["nuclear_stopping_power"][()]
         else:
             raise ValueError(
                 f"Please specify one of: total, electronic, or nuclear for component! (Got {component}.)"
             )
 
-        if energies is None and not return_interpolator:
-            return (
-                baseline_energies_data * u.MeV,
-                relevant_stopping_data * u.MeV * u.cm**2 / u.g,
-            )
+    baseline_energies.flags.writeable = False
+    relevant_stopping.flags.writeable = False
 
-        # Interpolate NIST data to the user-provided energy values. Uses log-log scale fed into a cubic spline.
-        cs = CubicSpline(
-            x=np.log(baseline_energies_data), y=np.log(relevant_stopping_data)
-        )
+    _stopping_power_tables[key] = baseline_energies, relevant_stopping
+    return baseline_energies, relevant_stopping
 
-        # If it has been indicated that the user wants the interpolator, construct
-        # an anonymous function to handle units and sanitize IO
-        if return_interpolator:
-            return (
-                lambda x: np.exp(cs(np.log(x.to(u.MeV).value))) * u.MeV * u.cm**2 / u.g
-            )
 
-        return (
-            energies,
-            np.exp(cs(np.log(energies.to("MeV").value))) * u.MeV * u.cm**2 / u.g,  # type: ignore[union-attr]
+def _get_stopping_power_spline(
+    group_name: str, material: str, component: str
+) -> "CubicSpline":
+    """
+    Return the cubic spline that interpolates the logarithm of the
+    stopping power as a function of the logarithm of the energy.
+
+    The table must already have been loaded with
+    `_get_stopping_power_table`.
+    """
+    from scipy.interpolate import CubicSpline  # noqa: PLC0415
+
+    key = (group_name, material, component)
+    if key not in _stopping_power_splines:
+        baseline_energies, relevant_stopping = _stopping_power_tables[key]
+        _stopping_power_splines[key] = CubicSpline(
+            x=np.log(baseline_energies), y=np.log(relevant_stopping)
         )
+    return _stopping_power_splines[key]
+
+
+def _clear_stopping_power_cache() -> None:
+    """Clear the cached stopping power tables and splines."""
+    _stopping_power_tables.clear()
+    _stopping_power_splines.clear()
@@ -9,4 +9,9 @@
 ``plasmapy.particles._isotopes``. :file:`ionization_energy.json` contains ionization energy
 data that is loaded by the functionality contained in
 ``plasmapy.particles._ionization_energy``.
+
+:file:`particle_data.npz` contains the same three datasets compiled
+into columns of NumPy arrays, which ``plasmapy.particles._data_tables``
+reads in place of the JSON files. It must be regenerated with
+:file:`tools/compile_particle_data.py` whenever a JSON file changes.
 """
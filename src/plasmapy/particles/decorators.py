@@ -25,16 +25,20 @@
 )
 from plasmapy.particles.particle_class import CustomParticle, Particle, ParticleLike
 from plasmapy.particles.particle_collections import ParticleList, ParticleListLike
+from plasmapy.utils.decorators.checks import _compile_argument_binder
 from plasmapy.utils.exceptions import PlasmaPyDeprecationWarning
 
 
 class _CallableDataDict(TypedDict, total=False):
+    accepted_particles: set[tuple[str, tuple[Any, ...]]]
     allow_custom_particles: bool
     allow_particle_lists: bool
     annotations: dict[str, Any]
     any_of: str | Iterable[str] | None
+    argument_binder: Callable[..., dict[str, Any]]
     callable_: Callable[..., Any]
     exclude: str | Iterable[str] | None
+    optional_parameters: set[str]
     parameters_to_process: list[str]
     require: str | Iterable[str] | None
     signature: inspect.Signature
@@ -72,12 +76,33 @@ def _make_into_set_or_none(obj: Any) -> Iterable[str] | None:
     return {obj} if isinstance(obj, str) else set(obj)
 
 
+def _particle_cache_key(particle: Any) -> tuple[Any, ...] | None:
+    """
+    Return a hashable key that identifies a |Particle| or a
+    |ParticleList| containing only |Particle| instances, or `None` for
+    any other object.
+
+    A |Particle| is fully determined by its symbol, so particles with
+    the same key meet the same categorization criteria.
+    |CustomParticle| instances are mutable and do not get a key.
+    """
+    if type(particle) is Particle:
+        return (Particle, particle.symbol)
+    if type(particle) is ParticleList and all(
+        type(item) is Particle for item in particle
+    ):
+        return (ParticleList, *(item.symbol for item in particle))
+    return None
+
+
 def _bind_arguments(
     wrapped_signature: inspect.Signature,
     callable_: Callable[..., Any],
     args: Iterable[Any],
     kwargs: MutableMapping[str, Any],
     instance: Any = None,
+    *,
+    argument_binder: Callable[..., dict[str, Any]] | None = None,
 ) -> inspect.BoundArguments:
     """
     Bind the arguments provided by ``args`` and ``kwargs`` to
@@ -104,6 +129,11 @@ def _bind_arguments(
         If ``callable_`` is a class instance method, then ``instance``
         should be the instance to which ``callable_`` belongs.
 
+    argument_binder : callable, optional
+        A function created by ``_compile_argument_binder`` for
+        ``wrapped_signature``, which is used instead of
+        `inspect.Signature.bind` when provided.
+
     Returns
     -------
     dict
@@ -137,12 +167,16 @@ def _bind_arguments(
     # the "self" parameter but later removed. For a class method,
     # it will be bound to the "cls" parameter instead.
 
-    if instance is None:
-        bound_arguments = wrapped_signature.bind(*args, **kwargs)
-    else:
-        bound_arguments = wrapped_signature.bind(instance, *args, **kwargs)
+    if instance is not None:
+        args = (instance, *args)
 
-    bound_arguments.apply_defaults()
+    if argument_binder is not None:
+        bound_arguments = inspect.BoundArguments(
+            wrapped_signature, argument_binder(args, kwargs)
+        )
+    else:
+        bound_arguments = wrapped_signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
 
     bound_arguments.arguments.pop("self", None)
     bound_arguments.arguments.pop("cls", None)
@@ -150,6 +184,11 @@ def _bind_arguments(
     return bound_arguments
 
 
+#: The maximum number of (parameter, particle) pairs that each callable
+#: decorated with |particle_input| remembers as having passed its checks.
+_MAX_ACCEPTED_PARTICLES = 1024
+
+
 class _ParticleInput:
     """
     Processes arguments for |particle_input|.
@@ -212,7 +251,14 @@ def callable_(self, callable_: Callable[..., Any]) -> None:
         self._data["callable_"] = callable_
         self._data["annotations"] = get_type_hints(callable_)
         self._data["parameters_to_process"] = self.find_parameters_to_process()
+        self._data["optional_parameters"] = {
+            parameter
+            for parameter in self.parameters_to_process
+            if self.annotations[parameter] in _optional_particle_input_annotations
+        }
         self._data["signature"] = inspect.signature(callable_)
+        self._data["argument_binder"] = _compile_argument_binder(self.signature)
+        self._data["accepted_particles"] = set()
 
     @property
     def signature(self) -> inspect.Signature:
@@ -259,6 +305,7 @@ def require(self) -> Iterable[str] | None:
     @require.setter
     def require(self, require_: str | Iterable[str] | None) -> None:
         self._data["require"] = _make_into_set_or_none(require_)
+        self._data["accepted_particles"] = set()
 
     @property
     def any_of(self) -> Iterable[str] | None:
@@ -274,6 +321,7 @@ def any_of(self) -> Iterable[str] | None:
     @any_of.setter
     def any_of(self, any_of_: str | Iterable[str] | None) -> None:
         self._data["any_of"] = _make_into_set_or_none(any_of_)
+        self._data["accepted_particles"] = set()
 
     @property
     def exclude(self) -> Iterable[str] | None:
@@ -289,6 +337,7 @@ def exclude(self) -> Iterable[str] | None:
     @exclude.setter
     def exclude(self, exclude_: str | Iterable[str] | None) -> None:
         self._data["exclude"] = _make_into_set_or_none(exclude_)
+        self._data["accepted_particles"] = set()
 
     @property
     def allow_custom_particles(self) -> bool:
@@ -305,6 +354,7 @@ def allow_custom_particles(self) -> bool:
     @allow_custom_particles.setter
     def allow_custom_particles(self, allow_custom_particles_: bool) -> None:
         self._data["allow_custom_particles"] = allow_custom_particles_
+        self._data["accepted_particles"] = set()
 
     @property
     def allow_particle_lists(self) -> bool:
@@ -320,6 +370,7 @@ def allow_particle_lists(self) -> bool:
     @allow_particle_lists.setter
     def allow_particle_lists(self, allow_particle_lists_: bool) -> None:
         self._data["allow_particle_lists"] = allow_particle_lists_
+        self._data["accepted_particles"] = set()
 
     @property
     def parameters_to_process(self) -> list[str]:
@@ -571,14 +622,14 @@ def process_argument(
             other annotations, this method will return ``argument``
             without alteration.
         """
-        annotation = self.annotations.get(parameter)
-
-        if annotation not in _particle_input_annotations:
+        if parameter not in self.parameters_to_process:
             return argument
 
-        if annotation in _optional_particle_input_annotations and argument is None:
+        if argument is None and parameter in self._data["optional_parameters"]:
             return argument
 
+        annotation = self.annotations[parameter]
+
         # This does not yet include cases like Optional[ParticleList],
         # Union[ParticleList, ParticleLike], etc. and thus needs updating.
 
@@ -596,17 +647,42 @@ def process_argument(
                 # If the passed argument is not an iterable, cast it to a list
                 argument = [argument]
 
-        if annotation in _basic_particle_input_annotations and argument is None:
+        if argument is None and annotation in _basic_particle_input_annotations:
             raise TypeError(f"{parameter} may not be None.")
 
         particle = _physical_particle_factory(argument, Z=Z, mass_numb=mass_numb)
 
+        self.verify_particle(parameter, particle)
+
+        return particle
+
+    def verify_particle(
+        self, parameter: str, particle: Particle | CustomParticle | ParticleList
+    ) -> None:
+        """
+        Verify that the particle meets all of the criteria for
+        ``parameter``.
+
+        The outcome of the checks depends only on the particle, the
+        name of the parameter, and the criteria of the decorator.  A
+        |Particle| or |ParticleList| of |Particle| instances that has
+        passed the checks for ``parameter`` is therefore accepted
+        without repeating them.
+        """
+        particle_key = _particle_cache_key(particle)
+        accepted_particles = self._data["accepted_particles"]
+        if particle_key is not None and (parameter, particle_key) in accepted_particles:
+            return
+
         self.verify_charge_categorization(particle)
         self.verify_particle_categorization(particle)
         self.verify_particle_name_criteria(parameter, particle)
         self.verify_allowed_types(particle)
 
-        return particle
+        if particle_key is not None:
+            if len(accepted_particles) >= _MAX_ACCEPTED_PARTICLES:
+                accepted_particles.clear()
+            accepted_particles.add((parameter, particle_key))
 
     parameters_to_skip = ("Z", "mass_numb")
 
@@ -670,7 +746,12 @@ def process_arguments(
         """
 
         bound_arguments = _bind_arguments(
-            self.signature, self.callable_, args, kwargs, instance
+            self.signature,
+            self.callable_,
+            args,
+            kwargs,
+            instance,
+            argument_binder=self._data["argument_binder"],
         )
 
         Z = bound_arguments.arguments.pop("Z", None)
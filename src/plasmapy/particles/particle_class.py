@@ -15,11 +15,12 @@
     "valid_categories",
 ]
 
+import contextlib
 import json
 import typing
 import warnings
 from abc import ABC, abstractmethod
-from collections import defaultdict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime, timezone
 from numbers import Integral, Real
 from typing import TYPE_CHECKING, TypeAlias
@@ -105,6 +106,77 @@
 """
 
 
+# The attributes and categories of a Particle depend only on the
+# arguments used to create it, so they are computed once per distinct
+# set of arguments and copied into new instances.  Particles created
+# from their own symbol (e.g., "p+" or "He-4 2+") are interned for the
+# life of the process, while other arguments (e.g., aliases or atomic
+# numbers) go into a bounded least recently used cache.  The cached
+# states must be treated as immutable.
+
+_interned_particle_states: dict[tuple, tuple[dict, frozenset]] = {}
+_recent_particle_states: OrderedDict[tuple, tuple[dict, frozenset]] = OrderedDict()
+_RECENT_PARTICLE_STATES_MAXSIZE = 1024
+
+
+def _get_particle_state(key: tuple) -> tuple[dict, frozenset] | None:
+    """
+    Return the cached attributes and categories of the particle created
+    from the arguments in ``key``, or `None` if they are not cached.
+    """
+    state = _interned_particle_states.get(key)
+    if state is None:
+        state = _recent_particle_states.get(key)
+        if state is not None:
+            with contextlib.suppress(KeyError):
+                _recent_particle_states.move_to_end(key)
+    return state
+
+
+def _copy_attributes(attributes: dict) -> dict:
+    """
+    Return a copy of the particle ``attributes`` with copies of its
+    quantities, so that changing a quantity of one particle in place
+    does not change it for other particles.
+    """
+    return {
+        key: value.copy() if isinstance(value, u.Quantity) else value
+        for key, value in attributes.items()
+    }
+
+
+def _store_particle_state(
+    key: tuple, attributes: defaultdict, categories: set[str]
+) -> None:
+    """Cache the attributes and categories of a newly created particle."""
+    _, argument, mass_numb, Z = key
+
+    # Parsing warns about redundant mass number or charge information
+    # and about unlikely charge numbers.  These particles are not cached
+    # so that the warnings are issued each time they are created.
+    if isinstance(argument, str) and (mass_numb is not None or Z is not None):
+        return
+    charge_number = attributes.get("charge number")
+    if charge_number is not None and charge_number <= -3:
+        return
+
+    state = (_copy_attributes(attributes), frozenset(categories))
+    if argument == attributes["symbol"] and mass_numb is None and Z is None:
+        _interned_particle_states[key] = state
+        return
+
+    _recent_particle_states[key] = state
+    if len(_recent_particle_states) > _RECENT_PARTICLE_STATES_MAXSIZE:
+        with contextlib.suppress(KeyError):
+            _recent_particle_states.popitem(last=False)
+
+
+def _clear_particle_states() -> None:
+    """Clear the caches of particle attributes and categories."""
+    _interned_particle_states.clear()
+    _recent_particle_states.clear()
+
+
 def _category_errmsg(particle: str | Particle, category: str) -> str:
     """
     Return an error message when an attribute raises an
@@ -614,14 +686,27 @@ def __init__(
             argument = argument.symbol
 
         self.__inputs = argument, mass_numb, Z
+        self._validate_inputs()
 
-        self._initialize_attributes_and_categories()
-        self._store_particle_identity()
-        self._assign_particle_attributes()
-        self._add_charge_information()
-        self._add_half_life_information()
-        if not self.is_category("isotope"):
-            self._add_electron_binding_energy()
+        # The inputs are validated before the cache is checked, since
+        # invalid inputs may compare equal to valid ones (e.g., 26.0 and
+        # 26) and would otherwise be found in the cache
+        key = (type(self), argument, mass_numb, Z)
+        state = _get_particle_state(key)
+
+        if state is not None:
+            attributes, categories = state
+            self._attributes = defaultdict(type(None), _copy_attributes(attributes))
+            self._categories = set(categories)
+        else:
+            self._initialize_attributes_and_categories()
+            self._store_particle_identity()
+            self._assign_particle_attributes()
+            self._add_charge_information()
+            self._add_half_life_information()
+            if not self.is_category("isotope"):
+                self._add_electron_binding_energy()
+            _store_particle_state(key, self._attributes, self._categories)
 
         # If __name__ is not defined here, then problems with the doc
         # build arise related to the Particle instances that are
@@ -653,7 +738,6 @@ def _validate_inputs(self) -> None:
 
     def _store_particle_identity(self) -> None:
         """Store the particle's symbol and identifying information."""
-        self._validate_inputs()
         argument, mass_numb, Z = self.__inputs
         symbol = _parsing.dealias_particle_aliases(argument)
         if symbol in _special_particles.data_about_special_particles:
@@ -20,9 +20,8 @@
 import astropy.units as u
 import numpy as np
 import pandas as pd
-import scipy.interpolate as interp
 import xarray as xr
-from scipy.spatial import distance
+from scipy.spatial import KDTree
 from scipy.special import erf
 
 from plasmapy.utils.decorators.helpers import modify_docstring
@@ -857,16 +856,7 @@ def on_grid(self, pos):
             pos = pos.si.value
 
         # Find the bounds
-        if self.is_uniform:
-            ax0_min, ax0_max = np.min(self.ax0.si.value), np.max(self.ax0.si.value)
-            ax1_min, ax1_max = np.min(self.ax1.si.value), np.max(self.ax1.si.value)
-            ax2_min, ax2_max = np.min(self.ax2.si.value), np.max(self.ax2.si.value)
-
-        else:
-            pts0, pts1, pts2 = self.grids
-            ax0_min, ax0_max = np.min(self.pts0).si.value, np.max(self.pts0).si.value
-            ax1_min, ax1_max = np.min(self.pts1).si.value, np.max(self.pts1).si.value
-            ax2_min, ax2_max = np.min(self.pts2).si.value, np.max(self.pts2).si.value
+        (ax0_min, ax1_min, ax2_min), (ax0_max, ax1_max, ax2_max) = self._bounds_si
 
         # Check each point elementwise against the bounds
         on_grid = (
@@ -924,9 +914,47 @@ def _interp_units(self):
         """
         return [self.ds[arg].attrs["unit"] for arg in self._interp_args]
 
+    @cached_property
+    def _interp_si_scale(self):
+        r"""
+        Create an array of the factors that convert each quantity in the
+        `_interp_quantities` array from its stored unit to SI.
+        """
+        return np.array([unit.si.scale for unit in self._interp_units])
+
+    @cached_property
+    def _interp_quantities_si(self):
+        r"""
+        The `_interp_quantities` array with each quantity converted to
+        SI units, as used by the interpolators when ``si`` is `True`.
+        """
+        return self._interp_quantities * self._interp_si_scale
+
+    @cached_property
+    def _bounds_si(self):
+        r"""
+        The minimum and maximum value of the grid along each axis in SI
+        units, as an array of shape (2, 3).
+        """
+        if self.is_uniform:
+            axes = (self._ax0_si, self._ax1_si, self._ax2_si)
+        else:
+            axes = [
+                self.ds[f"ax{i}"].to_numpy() * self.si_scale_factors[i]
+                for i in range(3)
+            ]
+        return np.array(
+            [[np.min(ax) for ax in axes], [np.max(ax) for ax in axes]], dtype=np.float64
+        )
+
     @abstractmethod
     def nearest_neighbor_interpolator(
-        self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
+        self,
+        pos: np.ndarray | u.Quantity,
+        *args,
+        persistent: bool = False,
+        si: bool = False,
+        out: np.ndarray | None = None,
     ):
         r"""
         Interpolate values on the grid using a nearest-neighbor scheme with
@@ -938,7 +966,7 @@ def nearest_neighbor_interpolator(
             An array of positions in space, where the second dimension
             corresponds to the three dimensions of the grid. If an
             `~numpy.ndarray` is provided, units will be assumed to match
-            those of the grid.
+            those of the grid (or to be meters if ``si`` is `True`).
 
         *args : `str`
             Strings that correspond to DataArrays in the dataset
@@ -950,10 +978,23 @@ def nearest_neighbor_interpolator(
             interpolations are performed on the same grid in a loop.
             ``persistent`` overrides to `False` if the arguments list
             has changed since the last call.
+
+        si : `bool`, optional
+            If `True`, the interpolator runs in "raw SI" mode: a
+            `~numpy.ndarray` ``pos`` is taken to be in meters, and the
+            interpolated quantities are returned as a single unitless
+            `~numpy.ndarray` of shape (n, len(args)) whose column ``j``
+            holds ``args[j]`` in SI units. No |Quantity| objects are
+            created, which makes this mode suitable for use inside
+            tight loops. The default is `False`.
+
+        out : `~numpy.ndarray`, shape (n, len(args)), optional
+            A preallocated ``float64`` array in which to place the result
+            when ``si`` is `True`. Ignored otherwise.
         """
         ...
 
-    def _persistent_interpolator_setup(self, pos, args, persistent):
+    def _persistent_interpolator_setup(self, pos, args, persistent, si: bool = False):
         r"""
         Setup common to all persistent interpolators.
 
@@ -976,6 +1017,10 @@ def _persistent_interpolator_setup(self, pos, args, persistent):
             ``persistent`` overrides to `False` if the arguments list
             has changed since the last call.
 
+        si : `bool`
+            If `True`, a `~numpy.ndarray` ``pos`` is assumed to already
+            be in meters.
+
         Returns
         -------
         pos: `~numpy.ndarray`
@@ -1003,7 +1048,7 @@ def _persistent_interpolator_setup(self, pos, args, persistent):
         # Condition pos
         if isinstance(pos, u.Quantity):
             pos = pos.to(u.m).value
-        elif self.unit != u.m:
+        elif not si and self.unit != u.m:
             pos *= self.unit.si.scale
         # If a single point was given, add empty dimension
         if pos.ndim == 1:
@@ -1035,9 +1080,34 @@ def _persistent_interpolator_setup(self, pos, args, persistent):
                 del self._interp_quantities
             with contextlib.suppress(AttributeError):
                 del self._interp_units
+            with contextlib.suppress(AttributeError):
+                del self._interp_si_scale
+            with contextlib.suppress(AttributeError):
+                del self._interp_quantities_si
 
         return pos, args, persistent
 
+    @staticmethod
+    def _interpolator_output(
+        vals, args, units, si: bool, out
+    ) -> np.ndarray | u.Quantity | tuple[u.Quantity, ...]:
+        r"""
+        Package the output of an interpolator.
+
+        In "raw SI" mode, ``vals`` (already scaled to SI) is returned as
+        a single array, copied into ``out`` if one was provided.
+        Otherwise ``vals`` is split into one `~astropy.units.Quantity`
+        per quantity in ``args``.
+        """
+        if si:
+            if out is None or vals is out:
+                return vals
+            out[...] = vals
+            return out
+
+        output = [vals[..., index] * units[index] for index in range(len(args))]
+        return output[0] if len(output) == 1 else tuple(output)
+
 
 def _fast_nearest_neighbor_interpolate(pos, ax):
     """
@@ -1092,12 +1162,8 @@ def vector_intersects(self, p1, p2):
         This is a standard ray-box intersection algorithm.
         """
         p1, p2 = p1.si.value, p2.si.value
-        # Calculate the minimum and maximum of each
-        Ax, Bx = np.min(self.pts0.si.value), np.max(self.pts0.si.value)
-        Ay, By = np.min(self.pts1.si.value), np.max(self.pts1.si.value)
-        Az, Bz = np.min(self.pts2.si.value), np.max(self.pts2.si.value)
-        A = np.array([Ax, Ay, Az])
-        B = np.array([Bx, By, Bz])
+        # The minimum and maximum of each axis
+        A, B = self._bounds_si
 
         # Calculate the equation of the line from p1 to p2 such that
         # r = p1 + t*D
@@ -1168,13 +1234,18 @@ def soften_edges(self, width: u.Quantity | None = None) -> None:
 
     @modify_docstring(prepend=AbstractGrid.nearest_neighbor_interpolator.__doc__)
     def nearest_neighbor_interpolator(
-        self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
+        self,
+        pos: np.ndarray | u.Quantity,
+        *args,
+        persistent: bool = False,
+        si: bool = False,
+        out: np.ndarray | None = None,
     ):
         r""" """  # noqa: D419
 
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
-            pos, args, persistent
+            pos, args, persistent, si=si
         )
 
         ax0, ax1, ax2 = self._ax0_si, self._ax1_si, self._ax2_si
@@ -1194,20 +1265,33 @@ def nearest_neighbor_interpolator(
         i1 = _fast_nearest_neighbor_interpolate(pos[:, 1], ax1)
         i2 = _fast_nearest_neighbor_interpolate(pos[:, 2], ax2)
 
-        vals = self._interp_quantities[i0, i1, i2, :]
+        if si:
+            # Gather directly into the output array, without an
+            # intermediate copy
+            quantities = self._interp_quantities_si.reshape(-1, len(args))
+            vals = np.take(
+                quantities,
+                np.ravel_multi_index((i0, i1, i2), self.shape),
+                axis=0,
+                out=out,
+            )
+        else:
+            vals = self._interp_quantities[i0, i1, i2, :]
 
         # Replace values of off-grid particles with NaN
         vals[mask_particle_off, :] = np.nan
 
         # Split output array into arrays with units
         # Apply units to output arrays
-        output = [
-            vals[..., index] * self._interp_units[index] for index, _ in enumerate(args)
-        ]
-        return output[0] if len(output) == 1 else tuple(output)
+        return self._interpolator_output(vals, args, self._interp_units, si, out)
 
     def volume_averaged_interpolator(
-        self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
+        self,
+        pos: np.ndarray | u.Quantity,
+        *args,
+        persistent: bool = False,
+        si: bool = False,
+        out: np.ndarray | None = None,
     ):
         r"""
         Interpolate values on the grid using a volume-averaged scheme with
@@ -1232,6 +1316,19 @@ def volume_averaged_interpolator(
             ``persistent`` overrides to `False` if the arguments list
             has changed since the last call.
 
+        si : `bool`, optional
+            If `True`, the interpolator runs in "raw SI" mode: a
+            `~numpy.ndarray` ``pos`` is taken to be in meters, and the
+            interpolated quantities are returned as a single unitless
+            `~numpy.ndarray` of shape (n, len(args)) whose column ``j``
+            holds ``args[j]`` in SI units. No |Quantity| objects are
+            created, which makes this mode suitable for use inside
+            tight loops. The default is `False`.
+
+        out : `~numpy.ndarray`, shape (n, len(args)), optional
+            A preallocated ``float64`` array in which to place the result
+            when ``si`` is `True`. Ignored otherwise.
+
         Notes
         -----
         This interpolator approximates the value of a quantity at a given
@@ -1245,135 +1342,100 @@ def volume_averaged_interpolator(
         point that overlaps the volume surrounding that vertex. This effectively
         introduces a linear interpolation between grid vertices.
 
+        The overlap volumes are equal to the weights of trilinear
+        interpolation within the grid cell containing the interpolation
+        point, so the interpolated values are computed directly from the
+        fractional position of the point within that cell.
+
         This implementation of this algorithm assumes that the grid is uniformly
         spaced and Cartesian.
         """
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
-            pos, args, persistent
+            pos, args, persistent, si=si
         )
 
         nparticles = pos.shape[0]
         nargs = len(args)
 
-        # Load grid attributes (so this isn't repeated)
-        ax0, ax1, ax2 = self._ax0_si, self._ax1_si, self._ax2_si
-        dx, dy, dz = self._dax0_si, self._dax1_si, self._dax2_si
-        n0, n1, n2 = self.shape
-
-        # find cell nearest to each position
-        nearest_neighbor_index = np.zeros((nparticles, 3), dtype=np.int32)
-        nearest_neighbor_index[..., 0] = _fast_nearest_neighbor_interpolate(
-            pos[:, 0], ax0
-        )
-        nearest_neighbor_index[..., 1] = _fast_nearest_neighbor_interpolate(
-            pos[:, 1], ax1
-        )
-        nearest_neighbor_index[..., 2] = _fast_nearest_neighbor_interpolate(
-            pos[:, 2], ax2
-        )
-
-        # Create a mask for positions that are off the grid. The values at
-        # these points will be set to zero later.
-        mask_particle_off = (
-            (pos[:, 0] < ax0.min())
-            | (pos[:, 0] > ax0.max())
-            | (pos[:, 1] < ax1.min())
-            | (pos[:, 1] > ax1.max())
-            | (pos[:, 2] < ax2.min())
-            | (pos[:, 2] > ax2.max())
-        )
-
-        # Get the physical positions for the nearest neighbor cell
-        # for the each particle
-        xpos = ax0[nearest_neighbor_index[:, 0]]
-        ypos = ax1[nearest_neighbor_index[:, 1]]
-        zpos = ax2[nearest_neighbor_index[:, 2]]
-        nearest_neighbor_pos = np.array([xpos, ypos, zpos]).swapaxes(0, 1)
-
-        # Determine the indices for the grid cells bounding the particle
-        # - The imaginary cell centered on the particle will overlap with
-        #   1 to 8 surrounding cells
-        # - typically this is 8 but will be 4, 2, or 1 when the particle is
-        #   near the boundary of the grid
-        bounding_cell_indices = np.empty((nparticles, 8, 3), dtype=np.int32)
-        lower_indices = np.where(
-            pos >= nearest_neighbor_pos,
-            nearest_neighbor_index,
-            nearest_neighbor_index - 1,
-        )
-
-        # populate x indices
-        bounding_cell_indices[:, 0:4, 0] = np.tile(
-            lower_indices[:, 0], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, 4:, 0] = bounding_cell_indices[:, 0:4, 0] + 1
-
-        # populate y indices
-        bounding_cell_indices[:, [0, 1, 4, 5], 1] = np.tile(
-            lower_indices[:, 1], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, [2, 3, 6, 7], 1] = (
-            bounding_cell_indices[:, [0, 1, 4, 5], 1] + 1
-        )
-
-        # populate z indices
-        bounding_cell_indices[:, 0::2, 2] = np.tile(
-            lower_indices[:, 2], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, 1::2, 2] = bounding_cell_indices[:, 0::2, 2] + 1
-
-        # Create a mask for cells whose locations would be off the grid,
-        # which occurs when the interpolation point is near the edge of the
-        # grid. These values will be weighted as zero later.
-        mask_cell_off = (
-            (bounding_cell_indices < 0).any(axis=2)
-            | (bounding_cell_indices[:, :, 0] >= n0)
-            | (bounding_cell_indices[:, :, 1] >= n1)
-            | (bounding_cell_indices[:, :, 2] >= n2)
-        )
-
-        # Zero any out of bounds indices so IndexError is not raised
-        # during indexing.  This means an incorrect value will be retrieved
-        # but will not be used because of the zero weighting and the
-        # off the grid mask
-        bounding_cell_indices[mask_cell_off, :] = 0
-
-        # Calculate the volume of the overlap between the point volume
-        # and the volume of each of the surrounding vertices
-        lx = dx - np.abs(pos[:, None, 0] - ax0[bounding_cell_indices[..., 0]])
-        ly = dy - np.abs(pos[:, None, 1] - ax1[bounding_cell_indices[..., 1]])
-        lz = dz - np.abs(pos[:, None, 2] - ax2[bounding_cell_indices[..., 2]])
-        bounding_cell_weights = lx * ly * lz
-
-        # Set the weight for any off-grid vertices (cell or particle) to zero
-        bounding_cell_weights[mask_cell_off] = 0.0
-        bounding_cell_weights[mask_particle_off, ...] = 0.0
-        norms = np.sum(bounding_cell_weights, axis=1)
-        mask_norm_zero = norms == 0.0
-        bounding_cell_weights[~mask_norm_zero] = (
-            bounding_cell_weights[~mask_norm_zero, ...] / norms[~mask_norm_zero, None]
-        )
+        # Find particles that are off the grid
+        mask_particle_off = ~self.on_grid(pos)
+
+        # Locate the cell containing each position, along with the fractional
+        # offset of the position within that cell along each axis. On a
+        # uniform grid, the cell index follows directly from the position.
+        # The flat index is the index of the lower corner of the cell in the
+        # interleaved quantities array.
+        flat_index = np.zeros(nparticles, dtype=np.intp)
+        offsets = np.empty((nparticles, 3))
+        for axis, (ax, dax, stride) in enumerate(
+            zip(
+                (self._ax0_si, self._ax1_si, self._ax2_si),
+                (self._dax0_si, self._dax1_si, self._dax2_si),
+                self._interp_strides,
+                strict=True,
+            )
+        ):
+            cell = np.nan_to_num((pos[:, axis] - ax[0]) / dax)
+            np.floor(cell, out=cell)
+            np.clip(cell, 0, ax.size - 2, out=cell)
+            cell_index = cell.astype(np.intp)
+
+            lower = ax[cell_index]
+            offsets[:, axis] = (pos[:, axis] - lower) / (ax[cell_index + 1] - lower)
+            flat_index += cell_index * stride
+
+        # The weight of each of the eight corners of the cell is the product
+        # of one of (1 - offset) or (offset) along each axis
+        axis_weights = np.stack((1 - offsets, offsets), axis=1)
+
+        # Gather all the quantities at each corner of the cell in a single
+        # take from the interleaved array, and accumulate the weighted sum
+        quantities = self._interp_quantities_si if si else self._interp_quantities
+        quantities = quantities.reshape(-1, nargs)
+
+        weighted_ave = out if si and out is not None else np.empty((nparticles, nargs))
+        weighted_ave.fill(0.0)
+        corner_vals = np.empty((nparticles, nargs))
+        for (i, j, k), corner_offset in self._interp_corner_offsets:
+            np.take(quantities, flat_index + corner_offset, axis=0, out=corner_vals)
+            corner_weights = (
+                axis_weights[:, i, 0] * axis_weights[:, j, 1] * axis_weights[:, k, 2]
+            )
+            corner_vals *= corner_weights[:, np.newaxis]
+            weighted_ave += corner_vals
 
-        # Get the values of each of the interpolated quantities at each
-        # of the bounding vertices
-        vals = self._interp_quantities[
-            bounding_cell_indices[..., 0],
-            bounding_cell_indices[..., 1],
-            bounding_cell_indices[..., 2],
-            :,
-        ]
-        # Construct a weighted average of the interpolated quantities
-        weighted_ave = np.sum(bounding_cell_weights[..., None] * vals, axis=1)
         weighted_ave[mask_particle_off, :] = np.nan
 
         # Split output array into arrays with units
         # Apply units to output arrays
-        output = [
-            weighted_ave[..., arg] * self._interp_units[arg] for arg in range(nargs)
-        ]
+        return self._interpolator_output(
+            weighted_ave, args, self._interp_units, si, out
+        )
 
-        return output[0] if len(output) == 1 else tuple(output)
+    @cached_property
+    def _interp_strides(self) -> tuple[int, int, int]:
+        r"""
+        The number of vertices between consecutive grid vertices along each
+        axis in the flattened grid.
+        """
+        _n0, n1, n2 = self.shape
+        return (n1 * n2, n2, 1)
+
+    @cached_property
+    def _interp_corner_offsets(self) -> list[tuple[tuple[int, int, int], int]]:
+        r"""
+        The corners ``(i, j, k)`` of a grid cell, where each index is ``0``
+        for the lower and ``1`` for the upper vertex along that axis, paired
+        with the offset of that corner from the lower corner in the
+        flattened grid.
+        """
+        return [
+            ((i, j, k), np.dot((i, j, k), self._interp_strides))
+            for i in (0, 1)
+            for j in (0, 1)
+            for k in (0, 1)
+        ]
 
 
 class NonUniformCartesianGrid(AbstractGrid):
@@ -1398,9 +1460,10 @@ def grid_resolution(self):
         A scalar estimate of the grid resolution, calculated as the
         closest spacing between any two points.
         """
-        distances = distance.cdist(self.grid, self.grid)
-        np.fill_diagonal(distances, np.inf)
-        return np.min(distances) * self.unit
+        # The nearest neighbor of each point other than itself is the
+        # second-closest point returned by the spatial index
+        distances, _ = self._spatial_index.query(self._grid_points_si, k=2)
+        return (np.min(distances[:, 1]) * u.m).to(self.unit)
 
     def vector_intersects(self, p1, p2):
         r"""
@@ -1412,12 +1475,8 @@ def vector_intersects(self, p1, p2):
         This is a standard ray-box intersection algorithm.
         """
         p1, p2 = p1.si.value, p2.si.value
-        # Calculate the minimum and maximum of each
-        Ax, Bx = np.min(self.pts0.si.value), np.max(self.pts0.si.value)
-        Ay, By = np.min(self.pts1.si.value), np.max(self.pts1.si.value)
-        Az, Bz = np.min(self.pts2.si.value), np.max(self.pts2.si.value)
-        A = np.array([Ax, Ay, Az])
-        B = np.array([Bx, By, Bz])
+        # The minimum and maximum of each axis
+        A, B = self._bounds_si
 
         # Calculate the equation of the line from p1 to p2 such that
         # r = p1 + t*D
@@ -1458,50 +1517,197 @@ def _make_mesh(self, start, stop, num: int, **kwargs):
         return arr0, arr1, arr2
 
     @cached_property
-    def _nearest_neighbor_interpolator(self):
+    def _grid_points_si(self):
+        r"""
+        The positions of the grid points in SI units, as a contiguous
+        array of shape (N, 3).
         """
-        Creates a nearest neighbor interpolator object for this grid, which can
-        then be called repeatedly.
+        return np.ascontiguousarray(
+            np.stack(
+                [
+                    self.ds[f"ax{i}"].to_numpy() * self.si_scale_factors[i]
+                    for i in range(3)
+                ],
+                axis=-1,
+            ),
+            dtype=np.float64,
+        )
+
+    @cached_property
+    def _spatial_index(self):
+        r"""
+        A `~scipy.spatial.KDTree` of the grid points in SI units.
 
+        The tree depends only on the grid geometry, so it is built once
+        and shared by every interpolation regardless of which quantities
+        are being interpolated.
         """
+        return KDTree(self._grid_points_si)
+
+    def _query_spatial_index(self, pos, k: int = 1, workers: int = 1):
+        r"""
+        Find the ``k`` grid points nearest to each position that lies on
+        the grid.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray`, shape (n, 3)
+            Positions in SI units.
+
+        k : `int`, optional
+            The number of nearest grid points to find for each position.
+
+        workers : `int`, optional
+            The number of threads used for the queries, or ``-1`` to use
+            all CPU cores. The default is 1.
+
+        Returns
+        -------
+        mask_particle_on : `~numpy.ndarray` of `bool`, shape (n,)
+            `True` for the positions that lie on the grid.
+
+        distances : `~numpy.ndarray`, shape (m,) or (m, k)
+            The distances to the nearest grid points for each of the
+            ``m`` positions on the grid.
 
-        return interp.NearestNDInterpolator(
-            self.grid.to(u.m).value, self._interp_quantities
+        indices : `~numpy.ndarray`, shape (m,) or (m, k)
+            The indices of the nearest grid points for each of the ``m``
+            positions on the grid.
+        """
+        mask_particle_on = self.on_grid(pos)
+        distances, indices = self._spatial_index.query(
+            pos[mask_particle_on], k=k, workers=workers
         )
+        return mask_particle_on, distances, indices
 
     @modify_docstring(prepend=AbstractGrid.nearest_neighbor_interpolator.__doc__)
     def nearest_neighbor_interpolator(
-        self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
+        self,
+        pos: np.ndarray | u.Quantity,
+        *args,
+        persistent: bool = False,
+        si: bool = False,
+        out: np.ndarray | None = None,
+        workers: int = 1,
     ):
-        r""" """  # noqa: D419
+        r"""
+        workers : `int`, optional
+            The number of threads used to find the nearest grid points,
+            or ``-1`` to use all CPU cores. The default is 1, so that
+            grids used in several processes at once do not start more
+            threads than there are cores.
+        """  # noqa: D403
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
-            pos, args, persistent
+            pos, args, persistent, si=si
         )
 
-        # Clear additional property that is not handled in the
-        # _persistent_interpolator_setup function because it is unique
-        # to this non_uniform grid.
-        if not persistent:
-            with contextlib.suppress(AttributeError):
-                del self._nearest_neighbor_interpolator
+        mask_particle_on, _, indices = self._query_spatial_index(pos, workers=workers)
 
-        pts0 = self.pts0.to(u.m).value
-        pts1 = self.pts1.to(u.m).value
-        pts2 = self.pts2.to(u.m).value
+        quantities = self._interp_quantities_si if si else self._interp_quantities
+        vals = np.full((pos.shape[0], len(args)), np.nan)
+        vals[mask_particle_on] = quantities[indices]
 
-        mask_particle_off = (
-            (pos[:, 0] < pts0.min())
-            | (pos[:, 0] > pts0.max())
-            | (pos[:, 1] < pts1.min())
-            | (pos[:, 1] > pts1.max())
-            | (pos[:, 2] < pts2.min())
-            | (pos[:, 2] > pts2.max())
+        return self._interpolator_output(vals, args, self._interp_units, si, out)
+
+    def inverse_distance_interpolator(
+        self,
+        pos: np.ndarray | u.Quantity,
+        *args,
+        k: int = 8,
+        power: float = 2,
+        persistent: bool = False,
+        si: bool = False,
+        out: np.ndarray | None = None,
+        workers: int = 1,
+    ):
+        r"""
+        Interpolate values on the grid by inverse-distance weighting of
+        the ``k`` nearest grid points.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray` or `~astropy.units.Quantity` array, shape (n,3)
+            An array of positions in space, where the second dimension
+            corresponds to the three dimensions of the grid. If an
+            `~numpy.ndarray` is provided, units will be assumed to match
+            those of the grid (or to be meters if ``si`` is `True`).
+
+        *args : `str`
+            Strings that correspond to DataArrays in the dataset
+
+        k : `int`, optional
+            The number of nearest grid points included in the weighted
+            average. The default is 8.
+
+        power : `float`, optional
+            The power of the inverse distance used to weight each grid
+            point. The default is 2.
+
+        persistent : `bool`
+            If `True`, the interpolator will assume the grid and its
+            contents have not changed since the last interpolation. This
+            substantially speeds up the interpolation when many
+            interpolations are performed on the same grid in a loop.
+            ``persistent`` overrides to `False` if the arguments list
+            has changed since the last call.
+
+        si : `bool`, optional
+            If `True`, the interpolator runs in "raw SI" mode: a
+            `~numpy.ndarray` ``pos`` is taken to be in meters, and the
+            interpolated quantities are returned as a single unitless
+            `~numpy.ndarray` of shape (n, len(args)) whose column ``j``
+            holds ``args[j]`` in SI units. The default is `False`.
+
+        out : `~numpy.ndarray`, shape (n, len(args)), optional
+            A preallocated ``float64`` array in which to place the result
+            when ``si`` is `True`. Ignored otherwise.
+
+        workers : `int`, optional
+            The number of threads used to find the nearest grid points,
+            or ``-1`` to use all CPU cores. The default is 1, so that
+            grids used in several processes at once do not start more
+            threads than there are cores.
+
+        Raises
+        ------
+        ValueError
+            If ``k`` is not a positive integer.
+
+        Notes
+        -----
+        The value at each position is the average of the values at the
+        ``k`` nearest grid points, each weighted by the inverse of its
+        distance from the position raised to ``power``. A position that
+        coincides with a grid point takes the value at that grid point.
+        Positions that lie outside the grid are assigned NaN.
+        """
+        if not isinstance(k, int | np.integer) or k < 1:
+            raise ValueError(f"k must be a positive integer, but got {k}.")
+
+        # Shared setup
+        pos, args, persistent = self._persistent_interpolator_setup(
+            pos, args, persistent, si=si
+        )
+
+        k = min(k, self._grid_points_si.shape[0])
+        mask_particle_on, distances, indices = self._query_spatial_index(
+            pos, k=max(k, 2), workers=workers
         )
+        distances, indices = distances[:, :k], indices[:, :k]
 
-        vals = self._nearest_neighbor_interpolator(pos)
-        vals[mask_particle_off] = np.nan
+        # Positions that coincide with a grid point take the value there
+        coincident = distances == 0
+        with np.errstate(divide="ignore"):
+            weights = np.where(
+                coincident.any(axis=1, keepdims=True),
+                coincident.astype(np.float64),
+                distances ** (-power),
+            )
+        weights /= np.sum(weights, axis=1, keepdims=True)
 
-        output = [vals[:, arg] * self._interp_units[arg] for arg in range(len(args))]
+        quantities = self._interp_quantities_si if si else self._interp_quantities
+        vals = np.full((pos.shape[0], len(args)), np.nan)
+        vals[mask_particle_on] = np.einsum("ij,ijk->ik", weights, quantities[indices])
 
-        return output[0] if len(output) == 1 else tuple(output)
+        return self._interpolator_output(vals, args, self._interp_units, si, out)
@@ -18,6 +18,17 @@
 _c = const.c
 
 
+def _output_arrays(x, v, out):
+    """
+    Return the arrays that an integrator should write the new positions
+    and velocities into, allocating them if ``out`` was not provided.
+    """
+    if out is None:
+        return np.empty_like(x, dtype=np.float64), np.empty_like(v, dtype=np.float64)
+
+    return out
+
+
 class AbstractIntegrator(ABC):
     """Outlines the necessary methods to define a particle integrator."""
 
@@ -32,12 +43,18 @@ def is_relativistic(self):
 
     @staticmethod
     @abstractmethod
-    def push(x, v, B, E, q, m, dt):
+    def push(x, v, B, E, q, m, dt, out=None):
         r"""
         The method for applying a push to the specified ensemble of particles.
 
         The passed parameters should in general not be `~astropy.units.Quantity`
         objects, but rather their SI values. Specific user implementations may vary.
+
+        Implementations should accept an optional ``out`` argument: a
+        tuple of two preallocated arrays (with the shapes of ``x`` and
+        ``v``) into which the new positions and velocities are written.
+        These arrays may be ``x`` and ``v`` themselves, in which case the
+        push is done in place.
         """
         ...
 
@@ -53,7 +70,7 @@ def is_relativistic(self) -> bool:
         return False
 
     @staticmethod
-    def push(x, v, B, E, q, m, dt):
+    def push(x, v, B, E, q, m, dt, out=None):
         r"""
         Parameters
         ----------
@@ -78,6 +95,12 @@ def push(x, v, B, E, q, m, dt):
         dt : `float`
             Timestep, in SI (second) units.
 
+        out : `tuple` of two `~numpy.ndarray`, optional
+            Preallocated arrays, with the same shapes as ``x`` and ``v``,
+            in which to place the new positions and velocities. These may
+            be ``x`` and ``v`` themselves to push the particles in place.
+            By default, new arrays are allocated.
+
         Returns
         -------
         x : `~numpy.ndarray`
@@ -168,8 +191,11 @@ def push(x, v, B, E, q, m, dt):
         This ends up causing the magnetic field action to be properly "centered" in
         time, and the algorithm, being a symplectic integrator, conserves energy.
         """
+        x_new, v_new = _output_arrays(x, v, out)
+
         hqmdt = 0.5 * dt * q / m
-        vminus = v + hqmdt * E
+        half_impulse = hqmdt * E
+        vminus = v + half_impulse
 
         # rotate to add magnetic field
         t = B * hqmdt
@@ -178,8 +204,14 @@ def push(x, v, B, E, q, m, dt):
         vplus = vminus + np.cross(vprime, s)
 
         # add second half of electric impulse
-        v = vplus + hqmdt * E
-        return x + v * dt, v
+        np.add(vplus, half_impulse, out=v_new)
+
+        # ``x`` is not read again after this point, so it is safe for
+        # ``x_new`` to be the same array
+        np.multiply(v_new, dt, out=vplus)
+        np.add(x, vplus, out=x_new)
+
+        return x_new, v_new
 
 
 class RelativisticBorisIntegrator(AbstractIntegrator):
@@ -194,7 +226,7 @@ def is_relativistic(self) -> bool:
         return True
 
     @staticmethod
-    def push(x, v, B, E, q, m, dt):
+    def push(x, v, B, E, q, m, dt, out=None):
         r"""
         Parameters
         ----------
@@ -212,6 +244,10 @@ def push(x, v, B, E, q, m, dt):
             particle mass, in SI (kg) units.
         dt : float
             timestep, in SI (second) units.
+        out : `tuple` of two `~numpy.ndarray`, optional
+            preallocated arrays, with the same shapes as ``x`` and ``v``,
+            in which to place the new positions and velocities. These may
+            be ``x`` and ``v`` themselves to push the particles in place.
 
         Notes
         -----
@@ -235,6 +271,8 @@ def push(x, v, B, E, q, m, dt):
         .. [1] C. K. Birdsall, A. B. Langdon, "Plasma Physics via Computer
                Simulation", 2004, p. 58-63
         """
+        x_new, v_new = _output_arrays(x, v, out)
+
         γ = 1 / np.sqrt(
             1 - (np.linalg.norm(v, axis=1, keepdims=True) / _c.si.value) ** 2
         )
@@ -259,6 +297,11 @@ def push(x, v, B, E, q, m, dt):
             1 + (np.linalg.norm(uvel_new, axis=1, keepdims=True) / _c.si.value) ** 2
         )
 
-        v = uvel_new / γ2
+        np.divide(uvel_new, γ2, out=v_new)
+
+        # ``x`` is not read again after this point, so it is safe for
+        # ``x_new`` to be the same array
+        np.multiply(v_new, dt, out=uvel_new)
+        np.add(x, uvel_new, out=x_new)
 
-        return x + v * dt, v
+        return x_new, v_new
@@ -7,15 +7,23 @@
 ]
 
 import collections
+import copy
+import inspect
+import os
 import sys
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import cached_property
+from multiprocessing import shared_memory
+from pathlib import Path
 from typing import Literal
 
 import astropy.constants as const
 import astropy.units as u
+import h5py
 import numpy as np
+import xarray as xr
 from numpy.typing import NDArray
 from tqdm import tqdm
 
@@ -39,6 +47,141 @@
 
 _c = const.c
 _m_p = const.m_p
+_MeV_to_J = (1 * u.MeV).to_value(u.J)
+
+
+def _share_grid(
+    grid: AbstractGrid, shared_blocks: list[shared_memory.SharedMemory]
+) -> tuple[AbstractGrid, list[tuple]]:
+    """
+    Copy the quantities defined on a grid into shared memory.
+
+    Returns a copy of the grid without its quantities, which is cheap to
+    send to another process, along with the information needed to attach
+    the quantities from shared memory with `_attach_grid`.
+    """
+    template = copy.copy(grid)
+    template.__dict__ = {
+        key: value
+        for key, value in grid.__dict__.items()
+        if not isinstance(getattr(type(grid), key, None), cached_property)
+    }
+    template.ds = grid.ds.drop_vars(grid.quantities)
+
+    quantities = []
+    for name in grid.quantities:
+        data_array = grid.ds[name]
+        data = np.ascontiguousarray(data_array.to_numpy())
+
+        block = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        shared_blocks.append(block)
+        np.ndarray(data.shape, dtype=data.dtype, buffer=block.buf)[...] = data
+
+        quantities.append(
+            (
+                name,
+                data_array.dims,
+                data_array.attrs,
+                block.name,
+                data.shape,
+                data.dtype,
+            )
+        )
+
+    return template, quantities
+
+
+def _attach_grid(
+    template: AbstractGrid,
+    quantities: list[tuple],
+    shared_blocks: list[shared_memory.SharedMemory],
+) -> AbstractGrid:
+    """Attach the quantities of a grid shared with `_share_grid`."""
+    for name, dims, attrs, block_name, shape, dtype in quantities:
+        block = shared_memory.SharedMemory(name=block_name)
+        shared_blocks.append(block)
+
+        data = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        data.flags.writeable = False
+
+        template.ds[name] = xr.DataArray(
+            data,
+            dims=dims,
+            coords={dim: template.ds.coords[dim] for dim in dims},
+            attrs=attrs,
+        )
+
+    return template
+
+
+# State of a process in the pool used by `ParticleTracker.run` to push
+# chunks of particles, set by `_init_chunk_worker`
+_chunk_worker_state: dict = {}
+
+
+def _init_chunk_worker(chunk_spec: dict) -> None:
+    """Attach to the shared grids in a newly started worker process."""
+    shared_blocks: list[shared_memory.SharedMemory] = []
+    grids = [
+        _attach_grid(template, quantities, shared_blocks)
+        for template, quantities in chunk_spec["grids"]
+    ]
+
+    _chunk_worker_state.clear()
+    _chunk_worker_state.update(chunk_spec, grids=grids, shared_blocks=shared_blocks)
+
+
+def _run_chunk(x, v, dt, field_scales=None) -> dict:
+    """Push a chunk of particles in a worker process."""
+    spec = _chunk_worker_state
+
+    termination_condition = copy.deepcopy(spec["termination_condition"])
+    save_routine = copy.deepcopy(spec["save_routine"])
+
+    with warnings.catch_warnings():
+        # The grids were already validated by the parent tracker
+        warnings.filterwarnings(
+            "ignore", message="Quantities should go to zero at edges of grid"
+        )
+        tracker = ParticleTracker(
+            spec["grids"],
+            termination_condition,
+            save_routine,
+            particle_integrator=spec["particle_integrator"],
+            dt=dt,
+            dt_range=spec["dt_range"],
+            field_weighting=spec["field_weighting"],
+            verbose=False,
+            compact_particles=spec["compact_particles"],
+        )
+
+    if spec["adaptive_time_step"] is not None:
+        tracker.setup_adaptive_time_step(*spec["adaptive_time_step"])
+
+    tracker.load_particles(x * u.m, v * u.m / u.s, spec["particle"])
+    tracker._field_scales = field_scales  # noqa: SLF001
+
+    if spec["stopping"] is not None:
+        tracker.add_stopping(*spec["stopping"])
+
+    # Warnings are passed back to be raised by the parent process
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        tracker.run()
+
+    unique_warnings = {(w.category, str(w.message)) for w in caught_warnings}
+
+    return {
+        "x": tracker.x,
+        "v": tracker.v,
+        "time": tracker.time,
+        "iteration_number": tracker.iteration_number,
+        "ever_entered_any_grid": tracker.ever_entered_any_grid,
+        "num_entered": tracker.num_entered,
+        "num_particles_tracked": tracker.num_particles_tracked,
+        "saved": save_routine._results if save_routine is not None else {},  # noqa: SLF001
+        "warnings": sorted(unique_warnings, key=str),
+    }
 
 
 class ParticleTracker:
@@ -109,6 +252,17 @@ class to the ``run`` method.
         If true, updates on the status of the program will be printed
         into the standard output while running. The default is True.
 
+    compact_particles : bool, optional
+        If `True`, the positions and velocities of the particles that are
+        still being tracked are kept packed at the start of the tracker's
+        work arrays during `run`, along with an index map back to their
+        rows in ``x`` and ``v``. Stopped and removed particles are dropped
+        from the packed arrays, so the cost of each push step scales with
+        the number of tracked particles rather than the number of loaded
+        particles. ``x`` and ``v`` are still updated after every push.
+        This is most useful when many particles are stopped or removed
+        during a run. The default is `False`.
+
     Warns
     -----
     `~plasmapy.utils.exceptions.RelativityWarning`
@@ -176,13 +330,34 @@ def __init__(
         dt_range=None,
         field_weighting: str = "volume averaged",
         verbose: bool = True,
+        compact_particles: bool = False,
     ) -> None:
         # Verbose flag controls whether or not output is printed to stdout
         self.verbose = verbose
 
+        # Compaction flag controls whether tracked particles are kept packed
+        # in the work buffers during the run
+        self._compact_particles = compact_particles
+
+        # Indices (in ``x`` and ``v``) of the tracked particles, in the order
+        # in which they are packed in the work buffers. This is only set while
+        # the particles are compacted.
+        self._tracked_particle_indices: NDArray[np.intp] | None = None
+
+        # Shape (number of members, number of particles per member) and
+        # per-particle field scale factors of an ensemble loaded with
+        # ``load_ensemble``
+        self._ensemble_shape: tuple[int, int] | None = None
+        self._field_scales: NDArray[np.float64] | None = None
+
         # This flag records whether the simulation has been run
         self._has_run = False
 
+        # Path of the checkpoint file and the number of push steps between
+        # checkpoints, set by ``setup_checkpointing``
+        self._checkpoint_path: Path | None = None
+        self._checkpoint_interval: int | None = None
+
         # Should the tracker update particle energies after every time step to
         # reflect stopping?
         self._do_stopping = False
@@ -194,6 +369,12 @@ def __init__(
             else particle_integrator()
         )
 
+        # Integrators that accept the ``out`` keyword can write the pushed
+        # positions and velocities directly into the tracker's work buffers
+        self._integrator_accepts_out = (
+            "out" in inspect.signature(self._integrator.push).parameters
+        )
+
         self._raised_relativity_warning = False
 
         # Quantities required for tracking - if they are not defined on a grid
@@ -301,6 +482,7 @@ def setup_adaptive_time_step(
         self,
         time_steps_per_gyroperiod: int | None = 12,
         Courant_parameter: float | None = 0.5,
+        max_subcycling_level: int = 0,
     ) -> None:
         """Set parameters for the adaptive time step candidates.
 
@@ -314,6 +496,12 @@ def setup_adaptive_time_step(
             The Courant parameter is the minimum ratio of the timestep to the grid crossing time,
             grid cell length / particle velocity. Lower Courant numbers correspond to higher temporal resolution.
 
+        max_subcycling_level : int, optional
+            The maximum number of power-of-two sub-cycling levels used with a
+            synchronized adaptive time step. Particles on level ``ℓ`` are pushed
+            ``2**ℓ`` times per synchronized step. The default is zero, which
+            disables sub-cycling.
+
 
         Notes
         -----
@@ -323,6 +511,16 @@ def setup_adaptive_time_step(
         how many times the orbit of a gyrating particles will be subdivided. The other candidate,
         associated with the spatial resolution of the grid object, calculates a time step using the time
         it would take the fastest particle to cross some fraction of a grid cell length. This fraction is the Courant number.
+
+        With a synchronized time step, every particle is otherwise pushed with the smallest time
+        step required by any of them. If ``max_subcycling_level`` is positive, each push step
+        instead advances all particles by a common step ``Δt`` of at most
+        ``2**max_subcycling_level`` times the smallest required time step. Each particle is
+        assigned to the lowest level ``ℓ`` for which ``Δt / 2**ℓ`` does not exceed its own
+        required time step, and is pushed ``2**ℓ`` times with that time step. All particles are
+        synchronized again at the end of the step, so save routines and termination conditions
+        still observe a synchronized time. The levels are reassigned at the start of every step.
+        Sub-cycling keeps the tracked particles compacted (see ``compact_particles``).
         """
 
         if not self._is_adaptive_time_step:
@@ -330,8 +528,15 @@ def setup_adaptive_time_step(
                 "The setup adaptive time step method only applies to adaptive time steps!"
             )
 
+        if max_subcycling_level < 0:
+            raise ValueError(
+                "The maximum sub-cycling level must be a non-negative integer, "
+                f"got {max_subcycling_level}."
+            )
+
         self._steps_per_gyroperiod = time_steps_per_gyroperiod
         self._Courant_parameter = Courant_parameter
+        self._max_subcycling_level = int(max_subcycling_level)
 
     def _validate_constructor_inputs(
         self, grids, termination_condition, save_routine, field_weighting: str
@@ -421,6 +626,139 @@ def load_particles(
         self.x = x.to(u.m).value
         self.v = v.to(u.m / u.s).value
 
+        # Particles loaded individually are not part of an ensemble
+        self._ensemble_shape = None
+        self._field_scales = None
+
+    def load_ensemble(
+        self,
+        x,
+        v,
+        particle: Particle,
+        E_scale=None,
+        B_scale=None,
+    ) -> None:
+        r"""
+        Load an ensemble of simulations that differ in their field
+        amplitudes or particle distributions, to be advanced together.
+
+        Each member of the ensemble pushes its own copy of the particles
+        through the grids, with the electric and magnetic fields multiplied
+        by that member's scale factors. The members are stored one after
+        the other in ``x`` and ``v``, so the whole ensemble is advanced by
+        each push step, and the grids are set up once for all members.
+        The state of each member is available through `x_ensemble` and
+        `v_ensemble`.
+
+        Parameters
+        ----------
+        x : `~astropy.units.Quantity`, shape (N,3) or (M,N,3)
+            Positions of the N particles, either shared by all members of
+            the ensemble or given separately for each of the M members.
+            Positions that differ between members can be used to scan the
+            position of the particle source.
+
+        v : `~astropy.units.Quantity`, shape (N,3) or (M,N,3)
+            Velocities of the N particles, either shared by all members of
+            the ensemble or given separately for each of the M members.
+            Velocities that differ between members can be used to scan the
+            particle energy.
+
+        particle : |particle-like|
+            Representation of the particle species as either a |Particle| object
+            or a string representation.
+
+        E_scale : array_like, shape (M,), optional
+            The factor by which the electric fields of the grids are
+            multiplied for each member of the ensemble. The default is 1
+            for every member.
+
+        B_scale : array_like, shape (M,), optional
+            The factor by which the magnetic fields of the grids are
+            multiplied for each member of the ensemble. The default is 1
+            for every member.
+
+        Raises
+        ------
+        ValueError
+            If the number of members implied by the arguments is not
+            consistent.
+
+        Notes
+        -----
+        The termination condition and save routine apply to the ensemble
+        as a whole, and saved positions and velocities can be reshaped to
+        separate the members in the same way as `x_ensemble`. A
+        synchronized adaptive time step is the smallest time step required
+        by any member.
+        """
+        self._enforce_order()
+
+        x = np.atleast_2d(x.to_value(u.m))
+        v = np.atleast_2d(v.to_value(u.m / u.s))
+        scales = [
+            np.atleast_1d(np.asarray(scale, dtype=np.float64))
+            for scale in (E_scale, B_scale)
+            if scale is not None
+        ]
+
+        member_counts = {array.shape[0] for array in (x, v) if array.ndim == 3}
+        member_counts.update(scale.shape[0] for scale in scales)
+        if len(member_counts) > 1:
+            raise ValueError(
+                "The positions, velocities, and field scales describe "
+                f"different numbers of ensemble members: {sorted(member_counts)}."
+            )
+        num_members = member_counts.pop() if member_counts else 1
+        num_particles = x.shape[-2]
+
+        x = np.broadcast_to(x, (num_members, num_particles, 3))
+        v = np.broadcast_to(v, (num_members, *v.shape[-2:]))
+
+        self.load_particles(
+            np.reshape(x, (-1, 3)) * u.m, np.reshape(v, (-1, 3)) * u.m / u.s, particle
+        )
+
+        self._ensemble_shape = (num_members, num_particles)
+        self._field_scales = np.ones((num_members, num_particles, 2))
+        if E_scale is not None:
+            self._field_scales[..., 0] = np.reshape(E_scale, (-1, 1))
+        if B_scale is not None:
+            self._field_scales[..., 1] = np.reshape(B_scale, (-1, 1))
+        self._field_scales = np.reshape(self._field_scales, (-1, 2))
+
+    @property
+    def num_ensemble_members(self) -> int | None:
+        """The number of members of the ensemble loaded with `load_ensemble`,
+        or `None` if the particles were loaded with `load_particles`.
+        """
+        if self._ensemble_shape is None:
+            return None
+
+        return self._ensemble_shape[0]
+
+    @property
+    def x_ensemble(self) -> NDArray[np.float64]:
+        """Positions of the particles of each member of the ensemble, as a view
+        of ``x`` with shape (M, N, 3).
+        """
+        return self._ensemble_view(self.x)
+
+    @property
+    def v_ensemble(self) -> NDArray[np.float64]:
+        """Velocities of the particles of each member of the ensemble, as a view
+        of ``v`` with shape (M, N, 3).
+        """
+        return self._ensemble_view(self.v)
+
+    def _ensemble_view(self, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        if self._ensemble_shape is None:
+            raise ValueError(
+                "The particles were not loaded as an ensemble with load_ensemble."
+            )
+
+        return np.reshape(values, (*self._ensemble_shape, *values.shape[1:]))
+
     def _validate_stopping_inputs(
         self,
         method: Literal["NIST", "Bethe"],
@@ -542,6 +880,7 @@ def inner_Bethe_stopping(v, n_e):
 
         self._do_stopping = True
         self._stopping_method = method
+        self._stopping_arguments = (method, materials, I)
         self._stopping_power_interpolators = stopping_power_interpolators
 
         self._log(f"Stopping module activated using the {method} method")
@@ -615,54 +954,238 @@ def _setup_for_interpolator(self) -> None:
             )
             self._log(f"On grid {i}, interpolating: {quantities}")
 
-        # Construct a dictionary to store the interpolation results
-        #  Each quantity is initialized as a zeros array with its respective units
-        # Arrays are ``num_particles`` sized so they don't need to be recreated
-        # when the number of tracked particles changes
-        self._total_grid_values = {
-            field_name: np.zeros(self.num_particles)
-            * AbstractGrid.recognized_quantities()[field_name].unit
-            for field_name in self._interpolated_quantities_any_grid
-        }
-
         # These variables indicate whether any E or B fields exist
         # on any of the grids
         self._E_on_grids = any(
-            k in self._total_grid_values for k in ["E_x", "E_y", "E_z"]
+            k in self._interpolated_quantities_any_grid for k in ["E_x", "E_y", "E_z"]
         )
         self._B_on_grids = any(
-            k in self._total_grid_values for k in ["B_x", "B_y", "B_z"]
+            k in self._interpolated_quantities_any_grid for k in ["B_x", "B_y", "B_z"]
         )
 
-        # Make sure the complete set of E, B arrays are available
-        for key in ["E_x", "E_y", "E_z"]:
-            if key not in self._total_grid_values:
-                self._total_grid_values[key] = 0.0 * u.V / u.m
-        for key in ["B_x", "B_y", "B_z"]:
-            if key not in self._total_grid_values:
-                self._total_grid_values[key] = 0.0 * u.T
+    def _setup_push_buffers(self) -> None:
+        """Allocate the work buffers used during each push step.
 
-        # Initialize some variables for interpolator
-        self._E = np.zeros((self.num_particles, 3))
-        self._B = np.zeros((self.num_particles, 3))
+        The buffers are sized for the full particle population, and the
+        leading ``num_particles_tracked`` rows are used on each step, so
+        they never need to be reallocated while the simulation runs.
+        """
+        # Column index of each interpolated quantity within the
+        # interpolation buffer
+        self._interpolated_quantity_index = {
+            field_name: k
+            for k, field_name in enumerate(
+                sorted(self._interpolated_quantities_any_grid)
+            )
+        }
+
+        # Interpolated quantities for the tracked particles, summed over grids
+        # All values are in SI units, so that no unit conversions need to be
+        # done within the push loop
+        self._interpolation_buffer = np.zeros(
+            (self.num_particles, len(self._interpolated_quantity_index))
+        )
+
+        # Output arrays for the interpolator of each grid
+        self._grid_value_buffers = [
+            np.zeros((self.num_particles, len(quantities)))
+            for quantities in self._interpolated_quantities_per_grid
+        ]
+
+        # Positions, velocities and fields of the tracked particles, which
+        # are passed to the integrator
+        self._x_buffer = np.zeros((self.num_particles, 3))
+        self._v_buffer = np.zeros((self.num_particles, 3))
+        self._E_buffer = np.zeros((self.num_particles, 3))
+        self._B_buffer = np.zeros((self.num_particles, 3))
+
+        # Electric and magnetic field scale factors of the tracked particles,
+        # for an ensemble of simulations
+        if self._field_scales is not None:
+            self._field_scale_buffer = np.zeros((self.num_particles, 2))
+
+    def _compact(self) -> None:
+        """Pack the tracked particles into the leading rows of the work buffers.
+
+        From this point on, the work buffers hold the authoritative state of
+        the tracked particles, and ``x`` and ``v`` are updated from them
+        after each push.
+        """
+        self._tracked_particle_indices = np.flatnonzero(self._tracked_particle_mask)
+        num_tracked = self._tracked_particle_indices.size
+
+        np.take(
+            self.x,
+            self._tracked_particle_indices,
+            axis=0,
+            out=self._x_buffer[:num_tracked],
+        )
+        np.take(
+            self.v,
+            self._tracked_particle_indices,
+            axis=0,
+            out=self._v_buffer[:num_tracked],
+        )
+
+        self._reset_cache()
+
+    def _drop_from_compacted(self, particles_to_drop_mask) -> None:
+        """Remove particles from the packed work buffers."""
+        self._keep_tracked_rows(~particles_to_drop_mask[self._tracked_particle_indices])
+
+    def _keep_tracked_rows(self, keep) -> None:
+        """
+        Keep only the rows of the work buffers selected by the boolean
+        array ``keep``, which has one entry per currently tracked particle.
+
+        The remaining tracked particles are shifted down so that they stay
+        packed in the leading rows of the buffers, in their original order.
+        """
+        num_tracked = keep.size
+        num_kept = int(np.count_nonzero(keep))
+
+        if num_kept == num_tracked:
+            return
+
+        for buffer in (self._x_buffer, self._v_buffer, self._interpolation_buffer):
+            buffer[:num_kept] = buffer[:num_tracked][keep]
+
+        if isinstance(self.dt, np.ndarray) and self.dt.shape[0] == num_tracked:
+            self.dt = self.dt[keep]
 
-    def run(self) -> None:
+        if self._tracked_particle_indices is not None:
+            self._tracked_particle_indices = self._tracked_particle_indices[keep]
+
+    @property
+    def _tracked_particle_selector(self):
+        """
+        An index array (if the particles are compacted) or a boolean mask
+        that selects the tracked particles from arrays over all particles.
+
+        In both cases, the selected particles are in the same order as
+        they are stored in the work buffers.
+        """
+        if self._tracked_particle_indices is not None:
+            return self._tracked_particle_indices
+
+        return self._tracked_particle_mask
+
+    def _tracked_state(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Return the positions and velocities of the tracked particles."""
+        if self._tracked_particle_indices is not None:
+            num_tracked = self.num_particles_tracked
+            return self._x_buffer[:num_tracked], self._v_buffer[:num_tracked]
+
+        mask = self._tracked_particle_mask
+        return self.x[mask], self.v[mask]
+
+    def _gather_tracked(self) -> None:
+        """Copy the tracked particles into the leading rows of the work buffers.
+
+        This is a no-op if the particles are compacted, since the work
+        buffers already hold the tracked particles.
+        """
+        if self._tracked_particle_indices is not None:
+            return
+
+        num_tracked = self.num_particles_tracked
+        mask = self._tracked_particle_mask
+        np.compress(mask, self.x, axis=0, out=self._x_buffer[:num_tracked])
+        np.compress(mask, self.v, axis=0, out=self._v_buffer[:num_tracked])
+
+    def _leading_rows_selector(self, num_rows: int):
+        """
+        Return a selector for the particles stored in the leading
+        ``num_rows`` rows of the work buffers.
+
+        Selecting fewer than all tracked particles requires the particles
+        to be compacted.
+        """
+        if num_rows == self.num_particles_tracked:
+            return self._tracked_particle_selector
+
+        return self._tracked_particle_indices[:num_rows]
+
+    def _scatter_tracked(self, num_rows: int | None = None) -> None:
+        """Copy the tracked particles from the work buffers back to ``x`` and ``v``.
+
+        If ``num_rows`` is provided, only the particles in the leading
+        ``num_rows`` rows of the work buffers are copied.
+        """
+        if num_rows is None:
+            num_rows = self.num_particles_tracked
+        selector = self._leading_rows_selector(num_rows)
+
+        self.x[selector] = self._x_buffer[:num_rows]
+        self.v[selector] = self._v_buffer[:num_rows]
+
+    def run(self, n_workers: int | None = None, chunk_size: int | None = None) -> None:
         r"""
         Runs a particle-tracing simulation.
         Time steps are adaptively calculated based on the local grid resolution
         of the particles and the electric and magnetic fields they are
         experiencing.
 
+        Parameters
+        ----------
+        n_workers : int, optional
+            If provided, the tracked particles are split into chunks that
+            are pushed in parallel by a pool of ``n_workers`` processes.
+            If only ``chunk_size`` is provided, the number of processes
+            defaults to the number of CPUs.
+
+        chunk_size : int, optional
+            The maximum number of particles in each chunk. If only
+            ``n_workers`` is provided, the particles are split evenly
+            between the processes.
+
         Returns
         -------
         None
 
+        Notes
+        -----
+        Since the particles do not interact, each chunk is run as an
+        independent simulation with the same grids, time step settings,
+        stopping and termination condition. The grid quantities are placed
+        in shared memory once and attached to by every process rather than
+        being copied into each of them. The final positions and velocities
+        of the chunks are gathered back into this tracker.
+
+        Quantities that are computed over the whole population, such as a
+        synchronized adaptive time step or a termination condition based
+        on the fraction of particles on the grids, are instead evaluated
+        for each chunk, so results may differ slightly from a serial run.
+
+        Save routines that save at intervals during the run require a fixed
+        time step in this mode. The snapshots of each chunk are merged into
+        this tracker's save routine, which is then written to disk if an
+        output directory was specified. Other save routines are saved once
+        with the merged final state.
         """
 
         self._enforce_particle_creation()
 
+        if n_workers is not None or chunk_size is not None:
+            if self._checkpoint_path is not None:
+                raise ValueError(
+                    "Checkpointing is not supported when the particles are "
+                    "pushed in chunks."
+                )
+
+            self._run_in_chunks(n_workers, chunk_size)
+            return
+
         self._setup_for_interpolator()
 
+        self._setup_push_buffers()
+
+        self._initialize_run_state()
+
+        self._run_push_loop()
+
+    def _initialize_run_state(self) -> None:
+        """Reset the time, iteration count and entered-grid records for a new run."""
         # Keep track of how many push steps have occurred for trajectory tracing
         # This number is independent of the current "time" of the simulation
         self.iteration_number = 0
@@ -683,6 +1206,12 @@ def run(self) -> None:
         self.ever_entered_any_grid: NDArray[np.bool_] = np.zeros(
             [self.num_particles]
         ).astype(np.bool_)
+        self._num_entered = 0
+
+    def _run_push_loop(self) -> None:
+        """Push the particles until the simulation has finished."""
+        if self._compact_particles or self._is_subcycling:
+            self._compact()
 
         # Initialize a "progress bar" (really more of a meter)
         # Setting sys.stdout lets this play nicely with regular print()
@@ -726,26 +1255,405 @@ def run(self) -> None:
             if self.save_routine is not None:
                 self.save_routine.post_push_hook()
 
+            # No checkpoint is needed once the last push step has been made
+            if (
+                self._checkpoint_path is not None
+                and not is_finished
+                and self.iteration_number % self._checkpoint_interval == 0
+            ):
+                self.write_checkpoint(self._checkpoint_path)
+
         # Simulation has finished running
         self._has_run = True
 
+        # ``x`` and ``v`` are up to date, so the packed buffers are released
+        # and the tracked particles are identified from ``x`` and ``v`` again
+        if self._tracked_particle_indices is not None:
+            self._tracked_particle_indices = None
+            self._reset_cache()
+
         # Force save of the final state of the simulation if a save routine is
         # provided
         if self.save_routine is not None:
             self.save_routine.save()
+            self.save_routine.post_run_hook()
 
         pbar.close()
 
         self._log("Run completed")
 
+    def setup_checkpointing(self, path: Path | str, interval: int = 100) -> None:
+        r"""
+        Periodically write a checkpoint of the simulation state to disk
+        during `run`.
+
+        Parameters
+        ----------
+        path : `~pathlib.Path` or `str`
+            The path of the checkpoint file. Each checkpoint replaces the
+            previous one.
+
+        interval : `int`, optional
+            The number of push steps between checkpoints. The default is
+            100.
+
+        Notes
+        -----
+        See `write_checkpoint` for the contents of a checkpoint, and
+        `resume` for how to continue a simulation from one. Checkpointing
+        is not supported when the particles are pushed in chunks.
+        """
+        self._enforce_order()
+
+        if not isinstance(interval, int | np.integer) or interval < 1:
+            raise ValueError(
+                f"The checkpoint interval must be a positive integer, got {interval}."
+            )
+
+        self._checkpoint_path = Path(path)
+        self._checkpoint_interval = int(interval)
+
+    def write_checkpoint(self, path: Path | str) -> None:
+        r"""
+        Write the current state of a running simulation to an HDF5 file.
+
+        The checkpoint holds the positions and velocities of all particles
+        (whose ``NaN`` entries record which particles were stopped or
+        removed), the simulation time, the iteration number, the record of
+        which particles entered the grids, and the progress of the save
+        routine. The grids, fields and simulation settings are not
+        written, so checkpoints stay small and fast to write.
+
+        The file is written to a temporary path and then moved into place,
+        so an interrupted write never replaces a valid checkpoint.
+
+        Parameters
+        ----------
+        path : `~pathlib.Path` or `str`
+            The path of the checkpoint file.
+        """
+        path = Path(path)
+        temporary_path = path.with_name(f"{path.name}.tmp")
+
+        with h5py.File(temporary_path, "w") as checkpoint:
+            checkpoint.attrs["iteration_number"] = self.iteration_number
+            checkpoint.attrs["num_entered"] = self._num_entered
+            checkpoint.attrs["raised_relativity_warning"] = (
+                self._raised_relativity_warning
+            )
+            checkpoint.attrs["q"] = self.q
+            checkpoint.attrs["m"] = self.m
+
+            checkpoint.create_dataset("x", data=self.x)
+            checkpoint.create_dataset("v", data=self.v)
+            checkpoint.create_dataset("time", data=self.time)
+            checkpoint.create_dataset(
+                "ever_entered_any_grid", data=self.ever_entered_any_grid
+            )
+
+            save_routine_group = checkpoint.create_group("save_routine")
+            for key, value in self.save_routine._checkpoint_state().items():  # noqa: SLF001
+                save_routine_group.create_dataset(key, data=value)
+
+        temporary_path.replace(path)
+
+    def resume(self, path: Path | str) -> None:
+        r"""
+        Continue a simulation from a checkpoint written during an earlier
+        run.
+
+        The tracker must be set up exactly as for the run that wrote the
+        checkpoint: the same grids, termination condition, save routine,
+        time step settings and stopping, with the original particles
+        loaded with `load_particles`. The state of the particles, the
+        simulation time and the progress of the save routine are then
+        restored from the checkpoint, and the simulation continues as
+        `run` would have.
+
+        Parameters
+        ----------
+        path : `~pathlib.Path` or `str`
+            The path of the checkpoint file.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint does not match the loaded particles.
+        """
+        self._enforce_particle_creation()
+        self._enforce_order()
+
+        self._setup_for_interpolator()
+
+        self._setup_push_buffers()
+
+        self._initialize_run_state()
+
+        with h5py.File(path, "r") as checkpoint:
+            x = checkpoint["x"][...]
+            if (
+                x.shape != self.x.shape
+                or checkpoint.attrs["q"] != self.q
+                or checkpoint.attrs["m"] != self.m
+            ):
+                raise ValueError(
+                    f"The checkpoint {path} does not match the loaded particles."
+                )
+
+            self.x = x
+            self.v = checkpoint["v"][...]
+            self.ever_entered_any_grid = checkpoint["ever_entered_any_grid"][...]
+
+            time = checkpoint["time"][...]
+            self.time = time if time.ndim > 0 else float(time)
+
+            self.iteration_number = int(checkpoint.attrs["iteration_number"])
+            self._num_entered = int(checkpoint.attrs["num_entered"])
+            self._raised_relativity_warning = bool(
+                checkpoint.attrs["raised_relativity_warning"]
+            )
+
+            self.save_routine._restore_checkpoint_state(  # noqa: SLF001
+                {
+                    key: dataset[...]
+                    for key, dataset in checkpoint["save_routine"].items()
+                }
+            )
+
+        self._reset_cache()
+
+        self._log(f"Resuming from iteration {self.iteration_number}")
+
+        self._run_push_loop()
+
+    def _run_in_chunks(self, n_workers: int | None, chunk_size: int | None) -> None:
+        """Push the tracked particles in chunks using a pool of processes."""
+        if n_workers is not None and n_workers < 1:
+            raise ValueError(f"n_workers must be a positive integer, got {n_workers}.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be a positive integer, got {chunk_size}."
+            )
+
+        saves_during_run = self.save_routine.require_synchronized_dt
+        if saves_during_run and self._is_adaptive_time_step:
+            raise ValueError(
+                "Save routines that save during the run require a fixed time "
+                "step when the particles are pushed in chunks."
+            )
+
+        self._setup_for_interpolator()
+
+        self.iteration_number = 0
+        self.time: NDArray[np.float64] | float = (
+            np.zeros((self.num_particles, 1))
+            if not self.is_synchronized_time_step
+            else 0
+        )
+        self.on_grid: NDArray[np.bool_] = np.zeros(
+            [self.num_particles, self.num_grids]
+        ).astype(np.bool_)
+        self.ever_entered_any_grid: NDArray[np.bool_] = np.zeros(
+            [self.num_particles]
+        ).astype(np.bool_)
+        self._num_entered = 0
+
+        tracked_indices = np.flatnonzero(self._tracked_particle_mask)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-tracked_indices.size // n_workers))
+
+        chunks = [
+            tracked_indices[start : start + chunk_size]
+            for start in range(0, tracked_indices.size, chunk_size)
+        ]
+
+        self._log(
+            f"Pushing {tracked_indices.size} particles in {len(chunks)} chunks "
+            f"using {n_workers} processes"
+        )
+
+        shared_blocks: list[shared_memory.SharedMemory] = []
+        results = [None] * len(chunks)
+        try:
+            chunk_spec = self._chunk_spec(shared_blocks, saves_during_run)
+
+            with ProcessPoolExecutor(
+                max_workers=min(n_workers, max(len(chunks), 1)),
+                initializer=_init_chunk_worker,
+                initargs=(chunk_spec,),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_chunk,
+                        self.x[indices],
+                        self.v[indices],
+                        self._chunk_dt(indices),
+                        (
+                            self._field_scales[indices]
+                            if self._field_scales is not None
+                            else None
+                        ),
+                    ): i
+                    for i, indices in enumerate(chunks)
+                }
+
+                for future in tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    disable=not self.verbose,
+                    unit="chunks",
+                    file=sys.stdout,
+                ):
+                    results[futures[future]] = future.result()
+        finally:
+            for block in shared_blocks:
+                block.close()
+                block.unlink()
+
+        self._merge_chunk_results(chunks, results, saves_during_run)
+
+        # Simulation has finished running
+        self._has_run = True
+
+        if not saves_during_run:
+            self.save_routine.save()
+        elif self.save_routine.output_directory is not None:
+            self.save_routine._save_to_disk()  # noqa: SLF001
+        self.save_routine.post_run_hook()
+
+        self._log("Run completed")
+
+    def _chunk_spec(
+        self, shared_blocks: list[shared_memory.SharedMemory], saves_during_run: bool
+    ) -> dict:
+        """
+        Collect everything needed to rebuild this tracker for a chunk of
+        particles in another process.
+
+        The grid quantities are copied into shared memory blocks, which are
+        appended to ``shared_blocks`` so that the caller can release them.
+        """
+        termination_condition = copy.copy(self.termination_condition)
+        termination_condition.tracker = None
+
+        save_routine = None
+        if saves_during_run:
+            save_routine = copy.copy(self.save_routine)
+            save_routine.tracker = None
+            save_routine.output_directory = None
+            save_routine._results = {}  # noqa: SLF001
+
+        return {
+            "grids": [_share_grid(grid, shared_blocks) for grid in self.grids],
+            "termination_condition": termination_condition,
+            "save_routine": save_routine,
+            "particle_integrator": type(self._integrator),
+            "dt_range": self.dt_range * u.s if self._is_adaptive_time_step else None,
+            "adaptive_time_step": (
+                (
+                    self._steps_per_gyroperiod,
+                    self._Courant_parameter,
+                    self._max_subcycling_level,
+                )
+                if self._is_adaptive_time_step
+                else None
+            ),
+            "field_weighting": self.field_weighting,
+            "compact_particles": self._compact_particles,
+            "particle": self._particle,
+            "stopping": self._stopping_arguments if self._do_stopping else None,
+        }
+
+    def _chunk_dt(self, indices) -> u.Quantity | None:
+        """Return the time step for a chunk of particles."""
+        if self.dt is None:
+            return None
+
+        dt = np.asarray(self.dt)
+        if dt.ndim > 0 and dt.shape[0] == self.num_particles:
+            dt = dt[indices]
+
+        return dt * u.s
+
+    def _merge_chunk_results(self, chunks, results, saves_during_run: bool) -> None:
+        """Gather the final state of each chunk back into this tracker."""
+        for indices, result in zip(chunks, results, strict=True):
+            self.x[indices] = result["x"]
+            self.v[indices] = result["v"]
+            self.ever_entered_any_grid[indices] = result["ever_entered_any_grid"]
+            self._num_entered += result["num_entered"]
+            self.iteration_number = max(
+                self.iteration_number, result["iteration_number"]
+            )
+
+            if self.is_synchronized_time_step:
+                self.time = max(self.time, result["time"])
+            else:
+                self.time[indices] = result["time"]
+
+            for category, message in result["warnings"]:
+                warnings.warn(message, category)
+
+        self._reset_cache()
+
+        if saves_during_run:
+            self.save_routine._results = self._merge_saved_results(  # noqa: SLF001
+                chunks, results
+            )
+
+    def _merge_saved_results(self, chunks, results) -> dict[str, list]:
+        """
+        Merge the snapshots saved by each chunk into snapshots of the whole
+        particle population.
+
+        Particles that were not pushed keep their state from before the run.
+        A chunk whose particles were all stopped or removed before the end
+        of the run keeps its final state in the remaining snapshots, as
+        those particles would no longer be evolved in a serial run.
+        """
+        saved = [result["saved"] for result in results]
+        num_saves = [len(chunk_saved.get("time", [])) for chunk_saved in saved]
+        longest = int(np.argmax(num_saves)) if num_saves else 0
+
+        for result, chunk_num_saves in zip(results, num_saves, strict=True):
+            if chunk_num_saves < num_saves[longest] and result["num_particles_tracked"]:
+                raise ValueError(
+                    "The chunks were saved a different number of times, so their "
+                    "snapshots cannot be merged. Use a termination condition that "
+                    "ends every chunk at the same time."
+                )
+
+        quantities = self.save_routine._quantities  # noqa: SLF001
+        merged = {}
+        for quantity, (_units, data_type) in quantities.items():
+            # Attributes and the (synchronized) time are the same for every chunk
+            if data_type != "dataset" or quantity == "time":
+                merged[quantity] = saved[longest][quantity] if saved else []
+                continue
+
+            snapshots = []
+            for k in range(num_saves[longest] if saved else 0):
+                snapshot = np.copy(getattr(self, quantity))
+                for indices, chunk_saved in zip(chunks, saved, strict=True):
+                    history = chunk_saved[quantity]
+                    snapshot[indices] = history[min(k, len(history) - 1)]
+                snapshots.append(snapshot)
+
+            merged[quantity] = snapshots
+
+        return merged
+
     @property
     def num_entered(self):
         """Count the number of particles that have entered the grids.
-        This number is calculated by summing the number of non-zero entries in the
-        entered grid array.
+        This number is the number of non-zero entries in the entered grid
+        array, which is updated after every push.
         """
 
-        return (self.ever_entered_any_grid > 0).sum()
+        return self._num_entered
 
     @property
     def fract_entered(self):
@@ -770,6 +1678,9 @@ def _stop_particles(self, particles_to_stop_mask) -> None:
 
         self.v[particles_to_stop_mask] = np.nan
 
+        if self._tracked_particle_indices is not None:
+            self._drop_from_compacted(particles_to_stop_mask)
+
         # Reset the cache to update the particle masks
         self._reset_cache()
 
@@ -788,6 +1699,9 @@ def _remove_particles(self, particles_to_remove_mask) -> None:
         self.x[particles_to_remove_mask] = np.nan
         self.v[particles_to_remove_mask] = np.nan
 
+        if self._tracked_particle_indices is not None:
+            self._drop_from_compacted(particles_to_remove_mask)
+
         # Reset the cache to update the particle masks
         self._reset_cache()
 
@@ -795,17 +1709,20 @@ def _remove_particles(self, particles_to_remove_mask) -> None:
     # Run/push loop methods
     # *************************************************************************
 
-    def _adaptive_dt(self) -> NDArray[np.float64] | float:
+    def _adaptive_dt(self, per_particle: bool = False) -> NDArray[np.float64] | float:
         r"""
         Calculate the appropriate dt for each grid based on a number of
         considerations including the local grid resolution (ds) and the
         gyroperiod of the particles in the current fields.
+
+        If ``per_particle`` is `True`, a separate dt is returned for each
+        tracked particle even if the time step is synchronized.
         """
 
         # candidate time steps includes one per grid (based on the grid resolution)
-        # plus additional _dt_candidates based on the field at each particle
+        # plus additional _dt_candidates based on the field at each tracked particle
         candidates = np.full(
-            (self.num_particles, self.num_grids + 1), fill_value=np.inf
+            (self.num_particles_tracked, self.num_grids + 1), fill_value=np.inf
         )
 
         # Compute the time step indicated by the grid resolution
@@ -818,14 +1735,14 @@ def _adaptive_dt(self) -> NDArray[np.float64] | float:
         # give it the grid step of the highest resolution grid
         for i, _grid in enumerate(self.grids):
             candidates[:, i] = np.where(
-                self.particles_on_grid[:, i] > 0, _gridstep[i], _min_gridstep
+                self._tracked_particles_on_grid[:, i], _gridstep[i], _min_gridstep
             )
 
         # If not, compute a number of possible time steps
 
         # Compute the cyclotron gyroperiod for each particle
         if self._B_on_grids:
-            Bmag = np.linalg.norm(self._B, axis=-1)
+            Bmag = np.linalg.norm(self._B_buffer[: self.num_particles_tracked], axis=-1)
             mask = Bmag != 0
             gyroperiod = np.full(Bmag.shape, fill_value=np.inf)
             # TODO: Replace with formulary gyrofrequency lite function once available
@@ -840,7 +1757,7 @@ def _adaptive_dt(self) -> NDArray[np.float64] | float:
         # Enforce limits on dt
         candidates = np.clip(candidates, self.dt_range[0], self.dt_range[1])
 
-        if not self._is_synchronized_time_step:
+        if not self._is_synchronized_time_step or per_particle:
             # dt is the min of all the candidates for each particle
             # a separate dt is returned for each particle
             dt = np.min(candidates, axis=-1)
@@ -855,17 +1772,27 @@ def _adaptive_dt(self) -> NDArray[np.float64] | float:
 
         return dt
 
-    def _interpolate_grid(self) -> None:
+    def _interpolate_grid(self, num_rows: int | None = None) -> None:
+        """
+        Interpolate the grid quantities at the positions of the tracked
+        particles, or only of the particles in the leading ``num_rows`` rows
+        of the work buffers if ``num_rows`` is provided.
+        """
+        num_tracked = self.num_particles_tracked if num_rows is None else num_rows
+
         # Get a list of positions (input for interpolator)
-        pos_tracked = self.x[self._tracked_particle_mask]
+        pos_tracked = self._x_buffer[:num_tracked]
 
         # Zero out the array of results
-        self._total_grid_values = {
-            field_name: required_quantity * 0
-            for field_name, required_quantity in self._total_grid_values.items()
-        }
+        tracked_values = self._interpolation_buffer[:num_tracked]
+        tracked_values.fill(0.0)
 
         for i, grid in enumerate(self.grids):
+            quantities = self._interpolated_quantities_per_grid[i]
+
+            if not quantities:
+                continue
+
             match self.field_weighting:
                 case "volume averaged":
                     interpolation_method = grid.volume_averaged_interpolator
@@ -873,37 +1800,80 @@ def _interpolate_grid(self) -> None:
                     interpolation_method = grid.nearest_neighbor_interpolator
 
             # Use the keys of `total_grid_values` as input quantity strings to the interpolator
+            # The interpolator is run in SI mode, so positions are passed in meters
+            # and a single unitless array of shape [num_tracked, num_quantities]
+            # is returned
             grid_values = interpolation_method(
-                pos_tracked * u.m,
-                *self._interpolated_quantities_per_grid[i],
+                pos_tracked,
+                *quantities,
                 persistent=True,
+                si=True,
+                out=self._grid_value_buffers[i][:num_tracked],
             )
 
-            # If only a single quantity is defined on the grid, the interpolator does not
-            # wrap it in a tuple, so we do so here
-            if not isinstance(grid_values, tuple):
-                grid_values = (grid_values,)
+            # NaN values (particles off of this grid) are zeroed
+            np.nan_to_num(grid_values, copy=False, nan=0.0)
 
             # Iterate through the interpolated fields and add them to the running sum
-            # NaN values are zeroed
-            for grid_value, field_name in zip(
-                grid_values,
-                self._interpolated_quantities_per_grid[i],
-                strict=True,
-            ):
-                self._total_grid_values[field_name][self._tracked_particle_mask] += (
-                    np.nan_to_num(
-                        grid_value,
-                        0.0 * AbstractGrid.recognized_quantities()[field_name].unit,
-                    )
-                )
-        self._E[:, 0] = self._total_grid_values["E_x"].to(u.V / u.m).value
-        self._E[:, 1] = self._total_grid_values["E_y"].to(u.V / u.m).value
-        self._E[:, 2] = self._total_grid_values["E_z"].to(u.V / u.m).value
+            for j, field_name in enumerate(quantities):
+                k = self._interpolated_quantity_index[field_name]
+                tracked_values[:, k] += grid_values[:, j]
+
+        # Assemble the field vectors, where missing components are zero
+        E = self._E_buffer[:num_tracked]
+        B = self._B_buffer[:num_tracked]
+        for field, components in (
+            (E, ["E_x", "E_y", "E_z"]),
+            (B, ["B_x", "B_y", "B_z"]),
+        ):
+            for axis, field_name in enumerate(components):
+                if field_name in self._interpolated_quantity_index:
+                    k = self._interpolated_quantity_index[field_name]
+                    field[:, axis] = tracked_values[:, k]
+                else:
+                    field[:, axis] = 0.0
+
+        if self._field_scales is not None:
+            self._scale_ensemble_fields(num_tracked)
+
+    def _scale_ensemble_fields(self, num_rows: int) -> None:
+        """
+        Multiply the fields in the leading ``num_rows`` rows of the work
+        buffers by the field scale factors of the ensemble member that each
+        particle belongs to.
+        """
+        field_scales = self._field_scale_buffer[:num_rows]
+        selector = self._leading_rows_selector(num_rows)
+        if selector.dtype == np.bool_:
+            np.compress(selector, self._field_scales, axis=0, out=field_scales)
+        else:
+            np.take(self._field_scales, selector, axis=0, out=field_scales)
 
-        self._B[:, 0] = self._total_grid_values["B_x"].to(u.T).value
-        self._B[:, 1] = self._total_grid_values["B_y"].to(u.T).value
-        self._B[:, 2] = self._total_grid_values["B_z"].to(u.T).value
+        self._E_buffer[:num_rows] *= field_scales[:, 0:1]
+        self._B_buffer[:num_rows] *= field_scales[:, 1:2]
+
+    def _tracked_grid_values(
+        self, field_name: str, num_rows: int | None = None
+    ) -> NDArray[np.float64]:
+        """
+        Return the interpolated values of a quantity at the positions of
+        the tracked particles, summed over all grids, in SI units.
+        """
+        if num_rows is None:
+            num_rows = self.num_particles_tracked
+
+        k = self._interpolated_quantity_index[field_name]
+        return self._interpolation_buffer[:num_rows, k]
+
+    def _leading_rows_dt(self, num_rows: int):
+        """
+        Return the time step for the particles in the leading ``num_rows``
+        rows of the work buffers.
+        """
+        if isinstance(self.dt, np.ndarray) and self.dt.ndim == 2:
+            return self.dt[:num_rows]
+
+        return self.dt
 
     def _update_time(self):
         r"""
@@ -918,56 +1888,83 @@ def _update_time(self):
 
         # Make sure the time step can be multiplied by a [num_particles, 3] shape field array
         if isinstance(dt, np.ndarray) and dt.size > 1:
-            dt = dt[self._tracked_particle_mask, np.newaxis]
-            self.time[self._tracked_particle_mask] += dt
+            # Adaptive time steps are only calculated for the tracked particles
+            if not self._is_adaptive_time_step:
+                dt = dt[self._tracked_particle_selector]
+            dt = np.reshape(dt, (-1, 1))
+            self.time[self._tracked_particle_selector] += dt
         else:
             self.time += dt
 
         return dt
 
-    def _update_position(self) -> None:
+    def _update_position(self, num_rows: int | None = None) -> None:
         r"""
         Update the positions and velocities of the simulated particles using the
         integrator provided at instantiation.
+
+        If ``num_rows`` is provided, only the particles in the leading
+        ``num_rows`` rows of the work buffers are pushed.
         """
-        x_results, v_results = self._integrator.push(
-            self.x[self._tracked_particle_mask],
-            self.v[self._tracked_particle_mask],
-            self._B[self._tracked_particle_mask],
-            self._E[self._tracked_particle_mask],
-            self.q,
-            self.m,
-            self.dt,
-        )
+        num_tracked = self.num_particles_tracked if num_rows is None else num_rows
+        dt = self._leading_rows_dt(num_tracked)
+
+        # The tracked particles and the fields acting on them are already
+        # in the work buffers
+        x = self._x_buffer[:num_tracked]
+        v = self._v_buffer[:num_tracked]
+        B = self._B_buffer[:num_tracked]
+        E = self._E_buffer[:num_tracked]
+
+        if self._integrator_accepts_out:
+            self._integrator.push(x, v, B, E, self.q, self.m, dt, out=(x, v))
+        else:
+            x[...], v[...] = self._integrator.push(x, v, B, E, self.q, self.m, dt)
 
-        self.x[self._tracked_particle_mask], self.v[self._tracked_particle_mask] = (
-            x_results,
-            v_results,
-        )
+        self._scatter_tracked(num_tracked)
+
+        # Particles whose position or velocity became NaN during the push are
+        # no longer tracked (see the class docstring), so they are dropped
+        # from the work buffers
+        nan_mask = np.logical_or(np.isnan(x[:, 0]), np.isnan(v[:, 0]))
+        tracked_set_changed = bool(nan_mask.any())
+        if tracked_set_changed:
+            keep = np.ones(self.num_particles_tracked, dtype=np.bool_)
+            keep[:num_tracked] = ~nan_mask
+            self._keep_tracked_rows(keep)
 
         # Reset cached properties since particles may have moved off-grid
-        self._reset_cache()
+        # The set of tracked particles only changes when particles are stopped
+        # or removed, so that part of the cache is kept while compacted
+        self._reset_cache(
+            positions_only=(
+                self._tracked_particle_indices is not None and not tracked_set_changed
+            )
+        )
 
-    def _update_velocity_stopping(self) -> None:
+    def _update_velocity_stopping(self, num_rows: int | None = None) -> None:
         r"""
         Apply stopping to the simulated particles using the provided stopping
         routine. The stopping is applied to the simulation by calculating the
         new energy values of the particles, and then updating the particles'
         velocity to match these energies.
+
+        If ``num_rows`` is provided, stopping is only applied to the particles
+        in the leading ``num_rows`` rows of the work buffers.
         """
 
-        current_speeds = np.linalg.norm(
-            self.v[self._tracked_particle_mask], axis=-1, keepdims=True
-        )
-        velocity_unit_vectors = np.multiply(
-            1 / current_speeds, self.v[self._tracked_particle_mask]
-        )
-        dx = np.multiply(current_speeds, self.dt)
+        num_tracked = self.num_particles_tracked if num_rows is None else num_rows
+        selector = self._leading_rows_selector(num_tracked)
+        v_tracked = self._v_buffer[:num_tracked]
 
-        stopping_power = np.zeros((self.num_particles_tracked, 1))
-        relevant_kinetic_energy = (
-            self._particle_kinetic_energy[self._tracked_particle_mask] * u.J
-        )
+        current_speeds = np.linalg.norm(v_tracked, axis=-1, keepdims=True)
+        velocity_unit_vectors = np.multiply(1 / current_speeds, v_tracked)
+        dx = np.multiply(current_speeds, self._leading_rows_dt(num_tracked))
+
+        stopping_power = np.zeros((num_tracked, 1))
+        # TODO: how should the relativistic case be handled?
+        kinetic_energy = 0.5 * self.m * np.square(current_speeds)
+        relevant_kinetic_energy = kinetic_energy * u.J
 
         # Apply all previously created stopping power interpolators
         # These are created prior to run, for each grid where they apply
@@ -980,17 +1977,15 @@ def _update_velocity_stopping(self) -> None:
 
                 energy_loss_per_length = np.multiply(
                     stopping_power,
-                    self._total_grid_values["rho"].si.value[
-                        self._tracked_particle_mask, np.newaxis
-                    ],
+                    self._tracked_grid_values("rho", num_tracked)[:, np.newaxis],
                 )
             case "Bethe":
                 for cs in self._stopping_power_interpolators:
                     if cs is not None:
                         interpolation_result = cs(
                             current_speeds,
-                            self._total_grid_values["n_e"].si.value[
-                                self._tracked_particle_mask, np.newaxis
+                            self._tracked_grid_values("n_e", num_tracked)[
+                                :, np.newaxis
                             ],
                         )
 
@@ -1000,7 +1995,7 @@ def _update_velocity_stopping(self) -> None:
 
                 if (
                     not self._raised_energy_warning
-                    and np.min(energy_loss_per_length * u.J).to(u.MeV).value < 1
+                    and np.min(energy_loss_per_length) < _MeV_to_J
                 ):
                     self._raised_energy_warning = True
 
@@ -1014,25 +2009,27 @@ def _update_velocity_stopping(self) -> None:
 
         # Update the velocities of the particles using the new energy values
         # TODO: again, figure out how to differentiate relativistic and classical cases
-        E = self._particle_kinetic_energy[self._tracked_particle_mask] + dE
+        E = kinetic_energy + dE
 
         particles_to_be_stopped_mask = np.full(
-            shape=self._tracked_particle_mask.shape, fill_value=False
+            shape=self.num_particles, fill_value=False
         )
         tracked_particles_to_be_stopped_mask = (
             E < 0
         ).flatten()  # A subset of the tracked particles!
-        # Of the tracked particles, stop the ones indicated by the subset mask
-        particles_to_be_stopped_mask[self._tracked_particle_mask] = (
-            tracked_particles_to_be_stopped_mask
-        )
 
         # Eliminate negative energies before calculating new speeds
         E = np.where(E < 0, 0, E)
         new_speeds = np.sqrt(2 * E / self.m)
-        self.v[self._tracked_particle_mask] = np.multiply(
-            new_speeds, velocity_unit_vectors
-        )
+        np.multiply(new_speeds, velocity_unit_vectors, out=v_tracked)
+        self.v[selector] = v_tracked
+
+        # Particles whose velocity is no longer defined (e.g. those that were
+        # already at rest) are stopped as well
+        tracked_particles_to_be_stopped_mask |= np.isnan(v_tracked[:, 0])
+
+        # Of the tracked particles, stop the ones indicated by the subset mask
+        particles_to_be_stopped_mask[selector] = tracked_particles_to_be_stopped_mask
 
         # Stop particles, which resets the cache
         self._stop_particles(particles_to_be_stopped_mask)
@@ -1044,6 +2041,13 @@ def _push(self) -> None:
         """
         self.iteration_number += 1
 
+        if self._is_subcycling:
+            self._push_subcycled()
+            return
+
+        # Make sure the tracked particles are in the work buffers
+        self._gather_tracked()
+
         # Interpolate fields at particle positions
         self._interpolate_grid()
 
@@ -1054,28 +2058,142 @@ def _push(self) -> None:
         # calculations as well as the magnitude of E and B fields
         self._update_position()
 
-        if not self._integrator.is_relativistic and not self._raised_relativity_warning:
-            beta_max = self.vmax / const.c.si.value
-
-            if beta_max >= 0.001:
-                warnings.warn(
-                    f"Particles have reached {beta_max}% of the speed of light. Consider using a relativistic integrator for more accurate results.",
-                    RelativityWarning,
-                )
-
-                self._raised_relativity_warning = True
+        self._check_relativity()
 
         # Update velocities to reflect stopping
         if self._do_stopping:
             self._update_velocity_stopping()
 
+        self._record_entered()
+
+    def _push_subcycled(self) -> None:
+        r"""
+        Advance all particles by a common synchronized time step, pushing
+        each particle as many times as its own adaptive time step requires.
+
+        The particles are sorted in the work buffers from the finest to the
+        coarsest sub-cycling level, so the particles that are pushed on
+        each sub-step are always the leading rows of the buffers.
+        """
+        self._interpolate_grid()
+
+        # Assign each particle the coarsest level whose time step does not
+        # exceed the particle's own adaptive time step
+        particle_dt = self._adaptive_dt(per_particle=True)
+        step = min(
+            np.max(particle_dt), np.min(particle_dt) * 2**self._max_subcycling_level
+        )
+        levels = np.clip(
+            np.ceil(np.log2(step / particle_dt)), 0, self._max_subcycling_level
+        ).astype(np.intp)
+
+        # Sort the particles from the finest to the coarsest level
+        order = np.argsort(-levels, kind="stable")
+        num_tracked = self.num_particles_tracked
+        for buffer in (
+            self._x_buffer,
+            self._v_buffer,
+            self._E_buffer,
+            self._B_buffer,
+            self._interpolation_buffer,
+        ):
+            buffer[:num_tracked] = buffer[:num_tracked][order]
+        self._tracked_particle_indices = self._tracked_particle_indices[order]
+        self._reset_cache(positions_only=True)
+
+        # The time step of each particle, ordered like the work buffers
+        self.dt = step / 2.0 ** levels[order, np.newaxis]
+
+        max_level = int(levels.max())
+        for substep in range(2**max_level):
+            # Particles on level ``ℓ`` are pushed on every ``2**(max_level - ℓ)``th
+            # sub-step, so the levels pushed on this sub-step are the ones of at
+            # least ``min_level``
+            trailing_zeros = (substep & -substep).bit_length() - 1
+            min_level = 0 if substep == 0 else max_level - trailing_zeros
+            max_dt = step / 2.0**min_level
+
+            num_rows = self._num_rows_with_dt(max_dt)
+            if num_rows == 0:
+                continue
+
+            # The fields were already interpolated for the first sub-step
+            if substep > 0:
+                self._interpolate_grid(num_rows)
+
+            self._update_position(num_rows)
+
+            # Particles may have been dropped from the work buffers by the push
+            num_rows = self._num_rows_with_dt(max_dt)
+
+            if self._do_stopping:
+                self._update_velocity_stopping(num_rows)
+                num_rows = self._num_rows_with_dt(max_dt)
+
+            self._record_entered(num_rows)
+
+        self.time += step
+
+        self._check_relativity()
+
+    def _num_rows_with_dt(self, max_dt: float) -> int:
+        """
+        Return the number of leading rows of the work buffers holding
+        particles whose sub-cycling time step is at most ``max_dt``.
+
+        The sub-cycling time steps are sorted in increasing order.
+        """
+        return int(np.searchsorted(self.dt[:, 0], max_dt, side="right"))
+
+    def _check_relativity(self) -> None:
+        """Warn if a non-relativistic integrator is used for fast particles."""
+        if self._integrator.is_relativistic or self._raised_relativity_warning:
+            return
+
+        beta_max = self.vmax / const.c.si.value
+
+        if beta_max >= 0.001:
+            warnings.warn(
+                f"Particles have reached {beta_max}% of the speed of light. Consider using a relativistic integrator for more accurate results.",
+                RelativityWarning,
+            )
+
+            self._raised_relativity_warning = True
+
+    def _record_entered(self, num_rows: int | None = None) -> None:
+        """
+        Record which of the tracked particles, or of the particles in the
+        leading ``num_rows`` rows of the work buffers, are currently on
+        any grid.
+        """
+        if num_rows is None:
+            selector = self._tracked_particle_selector
+            on_any_grid = self._tracked_particles_on_any_grid
+        else:
+            selector = self._leading_rows_selector(num_rows)
+            x = self._x_buffer[:num_rows]
+            on_any_grid = np.zeros(num_rows, dtype=np.bool_)
+            for grid in self.grids:
+                on_any_grid |= grid.on_grid(x)
+
         # Update this array, which will have zero elements at the end
         # only for particles that never entered any grid
-        self.ever_entered_any_grid += np.sum(self.particles_on_grid, axis=-1).astype(
-            np.bool_
+        newly_entered = np.logical_and(
+            on_any_grid, ~self.ever_entered_any_grid[selector]
         )
+        self._num_entered += int(np.count_nonzero(newly_entered))
+        self.ever_entered_any_grid[selector] |= newly_entered
 
-    def _reset_cache(self) -> None:
+    @property
+    def _is_subcycling(self) -> bool:
+        """Whether synchronized adaptive steps are advanced by sub-cycling."""
+        return (
+            self._is_adaptive_time_step
+            and self._is_synchronized_time_step
+            and self._max_subcycling_level > 0
+        )
+
+    def _reset_cache(self, positions_only: bool = False) -> None:
         """
         Reset the cached properties.
 
@@ -1083,24 +2201,56 @@ def _reset_cache(self) -> None:
         velocities. This includes the ``_update_positions`` and
         the ``_stop_particles`` and ``_remove_particles`` methods,
         which set some positions or velocities to NaN.
+
+        If ``positions_only`` is `True`, the properties that only depend on
+        which particles are being tracked are kept.
         """
         properties = [
+            "_tracked_particles_on_grid",
+            "_tracked_particles_on_any_grid",
             "particles_on_grid",
             "on_any_grid",
+            "num_particles_on_any_grid",
             "vmax",
             "_particle_kinetic_energy",
-            "_tracked_particle_mask",
-            "num_particles_tracked",
-            "_stopped_particle_mask",
-            "num_particles_stopped",
-            "_removed_particle_mask",
-            "num_particles_removed",
         ]
 
+        if not positions_only:
+            properties += [
+                "_tracked_particle_mask",
+                "num_particles_tracked",
+                "_stopped_particle_mask",
+                "num_particles_stopped",
+                "_removed_particle_mask",
+                "num_particles_removed",
+            ]
+
         for prop in properties:
             if prop in self.__dict__:
                 del self.__dict__[prop]
 
+    @cached_property
+    def _tracked_particles_on_grid(self) -> NDArray[np.bool_]:
+        """
+        Boolean mask of shape [num_particles_tracked, ngrids] corresponding
+        to whether or not each tracked particle is on the associated grid.
+        """
+        x_tracked, _ = self._tracked_state()
+
+        on_grid = np.empty((x_tracked.shape[0], self.num_grids), dtype=np.bool_)
+        for i, grid in enumerate(self.grids):
+            on_grid[:, i] = grid.on_grid(x_tracked)
+
+        return on_grid
+
+    @cached_property
+    def _tracked_particles_on_any_grid(self) -> NDArray[np.bool_]:
+        """
+        Boolean array indicating whether each tracked particle is currently
+        on ANY grid.
+        """
+        return np.any(self._tracked_particles_on_grid, axis=-1)
+
     @cached_property
     def particles_on_grid(self):
         r"""
@@ -1108,8 +2258,8 @@ def particles_on_grid(self):
         whether or not the particle is on the associated grid.
         """
 
-        all_particles = np.array([grid.on_grid(self.x * u.m) for grid in self.grids]).T
-        all_particles[~self._tracked_particle_mask] = False
+        all_particles = np.zeros((self.num_particles, self.num_grids), dtype=np.bool_)
+        all_particles[self._tracked_particle_selector] = self._tracked_particles_on_grid
 
         return all_particles
 
@@ -1119,7 +2269,17 @@ def on_any_grid(self) -> NDArray[np.bool_]:
         Binary array for each particle indicating whether it is currently
         on ANY grid.
         """
-        return np.sum(self.particles_on_grid, axis=-1) > 0
+        all_particles = np.zeros(self.num_particles, dtype=np.bool_)
+        all_particles[self._tracked_particle_selector] = (
+            self._tracked_particles_on_any_grid
+        )
+
+        return all_particles
+
+    @cached_property
+    def num_particles_on_any_grid(self) -> int:
+        """Return the number of particles currently on ANY grid."""
+        return int(np.count_nonzero(self._tracked_particles_on_any_grid))
 
     @cached_property
     def vmax(self) -> float:
@@ -1127,9 +2287,9 @@ def vmax(self) -> float:
 
         This quantity is used for determining the grid crossing maximum time step.
         """
-        return float(
-            np.max(np.linalg.norm(self.v[self._tracked_particle_mask], axis=-1))
-        )
+        _, v_tracked = self._tracked_state()
+
+        return float(np.max(np.linalg.norm(v_tracked, axis=-1)))
 
     @cached_property
     def _particle_kinetic_energy(self):
@@ -1145,6 +2305,11 @@ def _tracked_particle_mask(self) -> NDArray[np.bool_]:
         """
         Calculates a boolean mask corresponding to particles that have not been stopped or removed.
         """
+        if self._tracked_particle_indices is not None:
+            mask = np.zeros(self.num_particles, dtype=np.bool_)
+            mask[self._tracked_particle_indices] = True
+            return mask
+
         # See Class docstring for definition of `stopped` and `removed`
         return ~np.logical_or(np.isnan(self.x[:, 0]), np.isnan(self.v[:, 0]))
 
@@ -1153,6 +2318,9 @@ def num_particles_tracked(self) -> int:
         """Return the number of particles currently being tracked.
         That is, they do not have NaN position or velocity.
         """
+        if self._tracked_particle_indices is not None:
+            return int(self._tracked_particle_indices.size)
+
         return int(self._tracked_particle_mask.sum())
 
     @cached_property
@@ -7,8 +7,12 @@
     "DoNotSaveSaveRoutine",
     "SaveOnceOnCompletion",
     "IntervalSaveRoutine",
+    "StreamingIntervalSaveRoutine",
+    "TrajectoryReader",
 ]
 
+import queue
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -138,6 +142,22 @@ def _apply_units_to_results(self):
 
         return results_copy
 
+    def _checkpoint_state(self) -> dict[str, np.ndarray]:
+        """Return the progress of this save routine as a dictionary of arrays,
+        to be written to a checkpoint of the simulation.
+        """
+        return {
+            quantity: np.stack(history) for quantity, history in self._results.items()
+        }
+
+    def _restore_checkpoint_state(self, state: dict[str, np.ndarray]) -> None:
+        """Restore the progress of this save routine from a checkpoint."""
+        self._results = {
+            quantity: list(state[quantity])
+            for quantity in self._quantities
+            if quantity in state
+        }
+
     def post_push_hook(self) -> None:
         """Function called after a push step.
 
@@ -151,6 +171,14 @@ def post_push_hook(self) -> None:
         if self.save_now:
             self.save()
 
+    def post_run_hook(self) -> None:  # noqa: B027
+        """Function called once the simulation has finished and the final
+        state has been saved.
+
+        Save routines that hold resources for the duration of a run, such as
+        open files, release them here.
+        """
+
 
 class DoNotSaveSaveRoutine(AbstractSaveRoutine):
     """The default save routine for the `~plasmapy.simulation.particle_tracker.particle_tracker.ParticleTracker` class.
@@ -229,3 +257,351 @@ def save(self) -> None:
         super().save()
 
         self.time_of_last_save = self.tracker.time
+
+    def _checkpoint_state(self) -> dict[str, np.ndarray]:
+        state = super()._checkpoint_state()
+        state["time_of_last_save"] = np.asarray(self.time_of_last_save)
+        return state
+
+    def _restore_checkpoint_state(self, state: dict[str, np.ndarray]) -> None:
+        super()._restore_checkpoint_state(state)
+        self.time_of_last_save = float(state["time_of_last_save"])
+
+
+class _TrajectoryWriter:
+    """Append snapshots to resizable HDF5 datasets from a background thread.
+
+    Snapshots are passed to the writer thread through a bounded queue, so
+    at most ``max_queued_snapshots`` snapshots are held in memory while
+    waiting to be written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        units: dict[str, u.UnitBase | None],
+        compression: str | None,
+        max_queued_snapshots: int,
+        num_existing_snapshots: int = 0,
+    ) -> None:
+        self.path = path
+        self.units = units
+        self.compression = compression
+        self.num_existing_snapshots = num_existing_snapshots
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_snapshots)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def append(self, snapshot: dict[str, np.ndarray]) -> None:
+        """Queue a snapshot to be appended to the file.
+
+        Blocks if the queue is full until the writer thread catches up.
+        """
+        self._raise_error()
+        self._queue.put(snapshot)
+
+    def flush(self) -> None:
+        """Wait until all queued snapshots have been written to disk."""
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write all queued snapshots and close the file."""
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise OSError(
+                f"Writing the trajectory to {self.path} failed."
+            ) from self._error
+
+    def _write_loop(self) -> None:
+        finished = False
+        try:
+            # When continuing a trajectory, the snapshots written after the
+            # last checkpoint are discarded
+            mode = "a" if self.num_existing_snapshots else "w"
+            with h5py.File(self.path, mode) as output_file:
+                for dataset in output_file.values():
+                    dataset.resize(self.num_existing_snapshots, axis=0)
+
+                while (item := self._queue.get()) is not None:
+                    if isinstance(item, threading.Event):
+                        output_file.flush()
+                        item.set()
+                    else:
+                        self._write_snapshot(output_file, item)
+                finished = True
+        except Exception as ex:  # noqa: BLE001
+            self._error = ex
+
+        # After a failure, keep draining the queue so that the simulation
+        # is not blocked, and report the error on the next call to
+        # ``append``, ``flush``, or ``close``
+        while not finished:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+            finished = item is None
+
+    def _write_snapshot(
+        self, output_file: h5py.File, snapshot: dict[str, np.ndarray]
+    ) -> None:
+        for key, value in snapshot.items():
+            if key not in output_file:
+                output_file.create_dataset(
+                    key,
+                    shape=(0, *value.shape),
+                    maxshape=(None, *value.shape),
+                    dtype=value.dtype,
+                    chunks=True,
+                    compression=self.compression,
+                )
+                if self.units.get(key) is not None:
+                    output_file[key].attrs["unit"] = self.units[key].to_string()
+
+            dataset = output_file[key]
+            dataset.resize(dataset.shape[0] + 1, axis=0)
+            dataset[-1] = value
+
+
+class StreamingIntervalSaveRoutine(IntervalSaveRoutine):
+    """Save at every interval by appending to a single HDF5 file during the run.
+
+    Unlike `IntervalSaveRoutine`, the saved snapshots are not kept in
+    memory. Each snapshot is appended to resizable, chunked, compressed
+    HDF5 datasets (``time``, ``x``, and ``v``) in the file
+    ``output_directory / f"{output_basename}.h5"`` by a background thread,
+    so that writing to disk overlaps with pushing the particles.
+
+    Parameters
+    ----------
+    interval : `~astropy.units.Quantity`
+        The simulation time between saves.
+
+    output_directory : `~pathlib.Path`
+        The directory in which the trajectory file is written.
+
+    output_basename : `str`, optional
+        The basename of the trajectory file.
+
+    compression : `str`, optional
+        The HDF5 compression filter applied to the datasets, or `None` for
+        no compression. The default is ``"lzf"``, which is fast and always
+        available with `h5py`.
+
+    max_queued_snapshots : `int`, optional
+        The maximum number of snapshots waiting to be written. If the
+        writer falls behind, the simulation waits until a snapshot has
+        been written. The default is 4.
+
+    Notes
+    -----
+    The saved trajectory can be read lazily with `TrajectoryReader`.
+    Reading `~AbstractSaveRoutine.results` loads the whole trajectory into
+    memory.
+    """
+
+    def __init__(
+        self,
+        interval: u.Quantity,
+        output_directory: Path,
+        output_basename: str = "output",
+        compression: str | None = "lzf",
+        max_queued_snapshots: int = 4,
+    ) -> None:
+        super().__init__(
+            interval, output_directory=output_directory, output_basename=output_basename
+        )
+
+        if max_queued_snapshots < 1:
+            raise ValueError(
+                "The maximum number of queued snapshots must be a positive "
+                f"integer, got {max_queued_snapshots}."
+            )
+
+        self.compression = compression
+        self.max_queued_snapshots = max_queued_snapshots
+
+        self._writer: _TrajectoryWriter | None = None
+        self._num_snapshots = 0
+        self._num_existing_snapshots = 0
+
+    @property
+    def path(self) -> Path:
+        """The path of the trajectory file."""
+        return Path(self.output_directory) / f"{self.output_basename}.h5"
+
+    @property
+    def results(self) -> dict[str, u.Quantity]:
+        """Return the results of the simulation, read from the trajectory file."""
+        if self._results or self.output_directory is None:
+            return super().results
+
+        with TrajectoryReader(self.path) as reader:
+            return {quantity: reader.read(quantity) for quantity in reader.quantities}
+
+    def save(self) -> None:
+        """Queue the current state of the simulation to be written to disk.
+
+        Sets the time of last save attribute.
+        """
+        # Without an output directory, e.g. for a chunk of a run pushed in
+        # another process, the snapshots are kept in memory
+        if self.output_directory is None:
+            super().save()
+            return
+
+        self._append(
+            {
+                quantity: np.copy(getattr(self.tracker, quantity, 0))
+                for quantity in self._quantities
+            }
+        )
+
+        self.time_of_last_save = self.tracker.time
+
+    def _save_to_disk(self) -> None:
+        """Write the snapshots held in memory to the trajectory file."""
+        num_snapshots = len(self._results.get("time", []))
+        for k in range(num_snapshots):
+            self._append(
+                {quantity: self._results[quantity][k] for quantity in self._quantities}
+            )
+
+        self._results = {}
+
+    def _append(self, snapshot: dict[str, np.ndarray]) -> None:
+        if self._writer is None:
+            self._writer = _TrajectoryWriter(
+                self.path,
+                {quantity: units for quantity, (units, _) in self._quantities.items()},
+                self.compression,
+                self.max_queued_snapshots,
+                self._num_existing_snapshots,
+            )
+
+        self._writer.append({key: np.asarray(value) for key, value in snapshot.items()})
+        self._num_snapshots += 1
+
+    def _checkpoint_state(self) -> dict[str, np.ndarray]:
+        # Make sure that the trajectory file holds every snapshot counted in
+        # the checkpoint
+        if self._writer is not None:
+            self._writer.flush()
+
+        state = super()._checkpoint_state()
+        state["num_snapshots"] = np.asarray(self._num_snapshots)
+        return state
+
+    def _restore_checkpoint_state(self, state: dict[str, np.ndarray]) -> None:
+        super()._restore_checkpoint_state(state)
+        self._num_snapshots = int(state["num_snapshots"])
+        self._num_existing_snapshots = self._num_snapshots
+
+    def post_run_hook(self) -> None:
+        """Write the remaining snapshots and close the trajectory file."""
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+
+
+class TrajectoryReader:
+    """Lazily read a trajectory written by `StreamingIntervalSaveRoutine`.
+
+    The trajectory file stays open until the reader is closed, and only
+    the requested subset of a trajectory is read from disk.
+
+    The datasets are chunked and may be compressed, so they cannot be
+    memory-mapped. Instead, the reader returns `h5py.Dataset` objects
+    or new in-memory arrays of the selected values. Reading a selection
+    decompresses every chunk that it overlaps.
+
+    Parameters
+    ----------
+    path : `~pathlib.Path` or `str`
+        The path of the trajectory file.
+
+    Examples
+    --------
+    >>> with TrajectoryReader(path) as reader:  # doctest: +SKIP
+    ...     x = reader.read("x", snapshots=slice(-10, None), particles=[0, 5])
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._file = h5py.File(path, "r")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the trajectory file."""
+        self._file.close()
+
+    @property
+    def quantities(self) -> list[str]:
+        """The names of the saved quantities."""
+        return list(self._file.keys())
+
+    @property
+    def num_snapshots(self) -> int:
+        """The number of saved snapshots."""
+        return self._file["time"].shape[0]
+
+    def __getitem__(self, quantity: str) -> h5py.Dataset:
+        """Return the lazily loaded dataset of a saved quantity.
+
+        The dataset is an `h5py.Dataset` rather than a memory-mapped
+        array. Indexing it reads the selected elements from disk into a
+        new `numpy.ndarray`, which does not share memory with the file.
+        """
+        return self._file[quantity]
+
+    def read(self, quantity: str, snapshots=slice(None), particles=slice(None)):
+        """Read a subset of a saved quantity.
+
+        Parameters
+        ----------
+        quantity : `str`
+            The name of the saved quantity, e.g. ``"x"``.
+
+        snapshots : `slice` or `int`, optional
+            The snapshots to read. By default all snapshots are read.
+
+        particles : `slice`, `int`, or array of `int`, optional
+            The particles to read. Ignored for quantities that are not
+            defined per particle, such as a synchronized ``time``. By
+            default all particles are read.
+
+        Returns
+        -------
+        `~astropy.units.Quantity`
+            The selected values, with the snapshots along the first axis,
+            read into memory.
+        """
+        dataset = self._file[quantity]
+
+        if dataset.ndim == 1:
+            values = dataset[snapshots]
+        elif isinstance(particles, slice) or np.ndim(particles) == 0:
+            values = dataset[snapshots, particles]
+        else:
+            # HDF5 selections must be increasing, so read each requested
+            # particle once and reorder afterwards
+            unique_particles, order = np.unique(particles, return_inverse=True)
+            values = dataset[snapshots, unique_particles]
+            values = np.take(
+                values, order, axis=1 if isinstance(snapshots, slice) else 0
+            )
+
+        unit = dataset.attrs.get("unit")
+        return values * u.Unit(unit) if unit is not None else values
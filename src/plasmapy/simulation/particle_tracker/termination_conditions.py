@@ -10,10 +10,13 @@
 ]
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import astropy.units as u
-import numpy as np
-import numpy.typing as npt
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 
 class AbstractTerminationCondition(ABC):
@@ -200,7 +203,7 @@ def is_finished(self) -> bool:
         if self._particle_tracker.num_entered > 0:
             # Normalize to the number that have entered a grid
             still_on = (
-                np.sum(self._particle_tracker.on_any_grid)
+                self._particle_tracker.num_particles_on_any_grid
                 / self._particle_tracker.num_entered
             )
         else:
@@ -216,7 +219,7 @@ def is_finished(self) -> bool:
     @property
     def progress(self) -> float:
         """The progress of the simulation is defined in the context of how many particles are on the grids."""
-        return self._particle_tracker.on_any_grid.sum()
+        return self._particle_tracker.num_particles_on_any_grid
 
     @property
     def total(self) -> float:
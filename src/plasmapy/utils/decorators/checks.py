@@ -31,6 +31,71 @@
 )
 
 
+def _compile_argument_binder(signature: inspect.Signature):
+    """
+    Build a function that maps the positional and keyword arguments of a
+    call onto the parameter names of ``signature``, with the parameter
+    defaults applied.
+
+    The returned function takes the tuple of positional arguments and
+    the `dict` of keyword arguments, and returns a `dict` with the same
+    contents as :attr:`inspect.BoundArguments.arguments` after
+    :meth:`inspect.BoundArguments.apply_defaults`.  For signatures
+    without positional-only or variadic parameters the arguments are
+    zipped directly onto the parameter names, which avoids the overhead
+    of :meth:`inspect.Signature.bind`.  Any other call, including calls
+    that do not match the signature, falls back to
+    :meth:`inspect.Signature.bind` so the usual `TypeError` is raised.
+    """
+
+    def bind_arguments(args, kwargs):
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return bound_args.arguments
+
+    parameters = signature.parameters.values()
+    if not {param.kind for param in parameters}.isdisjoint(
+        {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        }
+    ):
+        return bind_arguments
+
+    names = tuple(signature.parameters)
+    positional_names = tuple(
+        param.name
+        for param in parameters
+        if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    )
+    defaults = {
+        param.name: param.default
+        for param in parameters
+        if param.default is not inspect.Parameter.empty
+    }
+    required_names = frozenset(names) - defaults.keys()
+
+    def bind_arguments_fast(args, kwargs):
+        if len(args) > len(positional_names):
+            return bind_arguments(args, kwargs)
+
+        arguments = dict(zip(positional_names, args, strict=False))
+        for name, value in kwargs.items():
+            if name in arguments or name not in signature.parameters:
+                return bind_arguments(args, kwargs)
+            arguments[name] = value
+
+        if len(arguments) != len(names):
+            if not required_names <= arguments.keys():
+                return bind_arguments(args, kwargs)
+            arguments = {**defaults, **arguments}
+
+        return arguments
+
+    return bind_arguments_fast
+
+
 class CheckBase:
     """
     Base class for 'Check' decorator classes.
@@ -160,16 +225,24 @@ def __call__(self, f):
         """
         self.f = f
         wrapped_sign = inspect.signature(f)
+        bind_arguments = _compile_argument_binder(wrapped_sign)
+
+        # the checks only depend on the signature of f, so they are
+        # compiled on the first call and reused afterwards
+        compiled_checks = None
 
         @preserve_signature
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
+            nonlocal compiled_checks
+
             # map args and kwargs to function parameters
-            bound_args = wrapped_sign.bind(*args, **kwargs)
-            bound_args.apply_defaults()
+            arguments = bind_arguments(args, kwargs)
 
             # get checks
-            checks = self._get_value_checks(bound_args)
+            if compiled_checks is None:
+                compiled_checks = self._get_value_checks(wrapped_sign.bind_partial())
+            checks = compiled_checks
 
             # check input arguments
             for arg_name in checks:
@@ -178,12 +251,10 @@ def wrapper(*args, **kwargs):
                     continue
 
                 # check argument
-                self._check_value(
-                    bound_args.arguments[arg_name], arg_name, checks[arg_name]
-                )
+                self._check_value(arguments[arg_name], arg_name, checks[arg_name])
 
             # call function
-            _return = f(**bound_args.arguments)
+            _return = f(**arguments)
 
             # check function return
             if "checks_on_return" in checks:
@@ -488,16 +559,24 @@ def __call__(self, f):
         """
         self.f = f
         wrapped_sign = inspect.signature(f)
+        bind_arguments = _compile_argument_binder(wrapped_sign)
+
+        # the checks only depend on the signature of f, so they are
+        # compiled on the first call and reused afterwards
+        compiled_checks = None
 
         @preserve_signature
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
+            nonlocal compiled_checks
+
             # combine args and kwargs into dictionary
-            bound_args = wrapped_sign.bind(*args, **kwargs)
-            bound_args.apply_defaults()
+            arguments = bind_arguments(args, kwargs)
 
             # get checks
-            checks = self._get_unit_checks(bound_args)
+            if compiled_checks is None:
+                compiled_checks = self._get_unit_checks(wrapped_sign.bind_partial())
+            checks = compiled_checks
 
             # check (input) argument units
             for arg_name in checks:
@@ -506,12 +585,10 @@ def wrapper(*args, **kwargs):
                     continue
 
                 # check argument
-                self._check_unit(
-                    bound_args.arguments[arg_name], arg_name, checks[arg_name]
-                )
+                self._check_unit(arguments[arg_name], arg_name, checks[arg_name])
 
             # call function
-            _return = f(**bound_args.arguments)
+            _return = f(**arguments)
 
             # check output
             if "checks_on_return" in checks:
@@ -781,7 +858,7 @@ def _check_unit(self, arg, arg_name: str, arg_checks: dict[str, Any]):
         if err is not None:
             raise err
 
-    def _check_unit_core(  # noqa: C901, PLR0912, PLR0915
+    def _check_unit_core(  # noqa: C901, PLR0912
         self, arg, arg_name: str, arg_checks: dict[str, Any]
     ) -> tuple[
         u.Quantity | None,
@@ -823,28 +900,12 @@ def _check_unit_core(  # noqa: C901, PLR0912, PLR0915
             err_msg = f"The argument '{arg_name}' "
         err_msg += f"to function {self.f.__name__}()"
 
-        # initialize ValueError message
-        valueerror_msg = f"{err_msg} can not contain"
-
-        # initialize TypeError message
-        typeerror_msg = f"{err_msg} should be an astropy Quantity with "
-        if len(arg_checks["units"]) == 1:
-            typeerror_msg += f"the following unit: {arg_checks['units'][0]}"
-        else:
-            typeerror_msg += "one of the following units: "
-            for unit in arg_checks["units"]:
-                typeerror_msg += str(unit)
-                if unit != arg_checks["units"][-1]:
-                    typeerror_msg += ", "
-        if arg_checks["none_shall_pass"]:
-            typeerror_msg += "or None "
-
         # pass Nones if allowed
         if arg is None:
             if arg_checks["none_shall_pass"]:
                 return arg, None, None, None
             else:
-                return None, None, None, ValueError(f"{valueerror_msg} Nones")
+                return None, None, None, ValueError(f"{err_msg} can not contain Nones")
 
         # check units
         in_acceptable_units = []
@@ -873,7 +934,7 @@ def _check_unit_core(  # noqa: C901, PLR0912, PLR0915
         if nacceptable == 0:
             # NO equivalent units
             arg = None
-            err = u.UnitTypeError(typeerror_msg)
+            err = u.UnitTypeError(self._get_unit_typeerror_msg(err_msg, arg_checks))
         else:
             # is there an exact match?
             units_arr = np.array(arg_checks["units"])
@@ -888,13 +949,37 @@ def _check_unit_core(  # noqa: C901, PLR0912, PLR0915
                 unit = units_arr[in_acceptable_units][0]
                 equiv = arg_checks["equivalencies"]
                 if not arg_checks["pass_equivalent_units"]:
-                    err = u.UnitTypeError(typeerror_msg)
+                    err = u.UnitTypeError(
+                        self._get_unit_typeerror_msg(err_msg, arg_checks)
+                    )
             elif not arg_checks["pass_equivalent_units"]:
                 # there is a match to more than 1 equivalent units
                 arg = None
-                err = u.UnitTypeError(typeerror_msg)
+                err = u.UnitTypeError(self._get_unit_typeerror_msg(err_msg, arg_checks))
         return arg, unit, equiv, err
 
+    @staticmethod
+    def _get_unit_typeerror_msg(err_msg: str, arg_checks: dict[str, Any]) -> str:
+        """
+        Build the `TypeError` message for an argument that failed the
+        unit checks ``arg_checks``.
+
+        The message is only built once a check has failed, since
+        formatting the target units is comparatively expensive.
+        """
+        typeerror_msg = f"{err_msg} should be an astropy Quantity with "
+        if len(arg_checks["units"]) == 1:
+            typeerror_msg += f"the following unit: {arg_checks['units'][0]}"
+        else:
+            typeerror_msg += "one of the following units: "
+            for unit in arg_checks["units"]:
+                typeerror_msg += str(unit)
+                if unit != arg_checks["units"][-1]:
+                    typeerror_msg += ", "
+        if arg_checks["none_shall_pass"]:
+            typeerror_msg += "or None "
+        return typeerror_msg
+
     @staticmethod
     def _condition_target_units(
         targets: list[str | u.Unit | u.Quantity],
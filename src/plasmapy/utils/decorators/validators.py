@@ -12,7 +12,11 @@
 
 import astropy.units as u
 
-from plasmapy.utils.decorators.checks import CheckUnits, CheckValues
+from plasmapy.utils.decorators.checks import (
+    CheckUnits,
+    CheckValues,
+    _compile_argument_binder,
+)
 from plasmapy.utils.decorators.helpers import preserve_signature
 
 
@@ -177,16 +181,26 @@ def __call__(self, f):
         """
         self.f = f
         wrapped_sign = inspect.signature(f, eval_str=True)
+        bind_arguments = _compile_argument_binder(wrapped_sign)
+
+        # the validations only depend on the signature of f, so they are
+        # compiled on the first call and reused afterwards
+        compiled_validations = None
 
         @preserve_signature
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
+            nonlocal compiled_validations
+
             # combine args and kwargs into dictionary
-            bound_args = wrapped_sign.bind(*args, **kwargs)
-            bound_args.apply_defaults()
+            arguments = bind_arguments(args, kwargs)
 
             # get conditioned validations
-            validations = self._get_validations(bound_args)
+            if compiled_validations is None:
+                compiled_validations = self._get_validations(
+                    wrapped_sign.bind_partial()
+                )
+            validations = compiled_validations
 
             # validate (input) argument units and values
             for arg_name in validations:
@@ -195,13 +209,12 @@ def wrapper(*args, **kwargs):
                     continue
 
                 # validate argument & update for conversion
-                arg = self._validate_quantity(
-                    bound_args.arguments[arg_name], arg_name, validations[arg_name]
+                arguments[arg_name] = self._validate_quantity(
+                    arguments[arg_name], arg_name, validations[arg_name]
                 )
-                bound_args.arguments[arg_name] = arg
 
             # call function
-            _return = f(**bound_args.arguments)
+            _return = f(**arguments)
 
             # validate output
             if "validations_on_return" in validations:
@@ -285,7 +298,7 @@ def _get_validations(
 
         return validations
 
-    def _validate_quantity(  # noqa: C901
+    def _validate_quantity(
         self,
         arg,
         arg_name: str,
@@ -326,29 +339,20 @@ def _validate_quantity(  # noqa: C901
             err_msg = f"The argument '{arg_name}' "
         err_msg += f"to function {self.f.__name__}()"
 
-        # initialize TypeError message
-        typeerror_msg = (
-            f"{err_msg} should be an astropy Quantity with units equivalent to one of ["
-        )
-        for ii, unit in enumerate(arg_validations["units"]):
-            typeerror_msg += f"{unit}"
-
-            if ii != len(arg_validations["units"]) - 1:
-                typeerror_msg += ", "
-        typeerror_msg += "]"
-
         # add units to arg if possible
         # * a None value will be taken care of by `_check_unit_core`
         #
         if arg is None or hasattr(arg, "unit"):
             pass
         elif len(arg_validations["units"]) != 1:
-            raise TypeError(typeerror_msg)
+            raise TypeError(self._get_quantity_typeerror_msg(err_msg, arg_validations))
         else:
             try:
                 arg = arg * arg_validations["units"][0]
             except (TypeError, ValueError) as ex:
-                raise TypeError(typeerror_msg) from ex
+                raise TypeError(
+                    self._get_quantity_typeerror_msg(err_msg, arg_validations)
+                ) from ex
             else:
                 warnings.warn(
                     u.UnitsWarning(
@@ -377,6 +381,25 @@ def _validate_quantity(  # noqa: C901
 
         return arg
 
+    @staticmethod
+    def _get_quantity_typeerror_msg(
+        err_msg: str, arg_validations: dict[str, Any]
+    ) -> str:
+        """
+        Build the `TypeError` message for an argument that can not be
+        converted to a |Quantity| satisfying ``arg_validations``.
+        """
+        typeerror_msg = (
+            f"{err_msg} should be an astropy Quantity with units equivalent to one of ["
+        )
+        for ii, unit in enumerate(arg_validations["units"]):
+            typeerror_msg += f"{unit}"
+
+            if ii != len(arg_validations["units"]) - 1:
+                typeerror_msg += ", "
+        typeerror_msg += "]"
+        return typeerror_msg
+
     @property
     def validations(self):
         """
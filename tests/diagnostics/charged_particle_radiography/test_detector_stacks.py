@@ -148,3 +148,136 @@ def test_film_stack_energy_bands_inum_active(hdv2_stack) -> None:
     # Expected first 5 energy bands
     expected = np.array([[0.1, 4.2], [3.5, 3.8], [3.9, 5.1], [4.6, 4.9], [4.9, 6]])
     assert np.allclose(ebands.to(u.MeV).value[0:5, :], expected, atol=0.15)
+
+
+@pytest.fixture
+def synthetic_stack():
+    """
+    A Stack object with a Bragg-peak-like stopping power, which does not
+    require the data repository.
+    """
+    energy_axis = np.geomspace(1e-3, 1e3, 130) * u.MeV
+    mass_stopping_power = (
+        300
+        * np.log(1 + 10 * energy_axis.value)
+        / (energy_axis.value + 0.05)
+        * u.MeV
+        * u.cm**2
+        / u.g
+    )
+    density = 1.04 * u.g / u.cm**3
+
+    film = [
+        Layer(12 * u.um, energy_axis, mass_stopping_power * density),
+        Layer(97 * u.um, energy_axis, mass_stopping_power * density, active=False),
+    ]
+    return Stack(
+        [
+            Layer(
+                100 * u.um,
+                energy_axis,
+                mass_stopping_power * 3 * density,
+                active=False,
+            ),
+            *film * 10,
+        ]
+    )
+
+
+def test_layer_csda_range_constant_stopping_power() -> None:
+    """
+    Test the CSDA range and transmitted energies of a layer with a
+    constant stopping power, for which the range is linear in energy.
+    """
+    energy_axis = [1, 2, 4, 8] * u.MeV
+    layer = Layer(10 * u.um, energy_axis, np.full(4, 0.1) * u.MeV / u.um)
+
+    csda_range = layer.csda_range([1, 1.5, 4, 8, 0.5, 9] * u.MeV)
+    assert u.allclose(csda_range[:4], [0, 5, 30, 70] * u.um)
+    assert np.all(np.isnan(csda_range[4:]))
+
+    exit_energies = (
+        layer._transmitted_energies(([0.5, 1, 1.5, 2.5, 8, 9] * u.MeV).to(u.J).value)
+        * u.J
+    )
+    assert u.allclose(exit_energies, [0.5, 0, 0, 1.5, 7, 0] * u.MeV)
+
+
+def test_layer_csda_range_follows_changes() -> None:
+    """
+    Test that the CSDA range is computed again when the energy axis or
+    stopping power of a layer is reassigned or modified in place.
+    """
+    energy_axis = [1, 2, 4, 8] * u.MeV
+    layer = Layer(10 * u.um, energy_axis, np.full(4, 0.1) * u.MeV / u.um)
+    assert u.isclose(layer.csda_range(4 * u.MeV), 30 * u.um)
+
+    layer.linear_stopping_power = np.full(4, 0.2) * u.MeV / u.um
+    assert u.isclose(layer.csda_range(4 * u.MeV), 15 * u.um)
+
+    layer.linear_stopping_power[:] = 0.3 * u.MeV / u.um
+    assert u.isclose(layer.csda_range(4 * u.MeV), 10 * u.um)
+
+    layer.energy_axis = [0, 2, 4, 8] * u.MeV
+    assert u.isclose(layer.csda_range(4 * u.MeV), 40 / 3 * u.um)
+
+    layer.energy_axis[0] = 3 * u.MeV
+    assert u.isclose(layer.csda_range(4 * u.MeV), 20 / 3 * u.um)
+
+
+def test_layer_transmits_energies_below_energy_axis() -> None:
+    """
+    Test that particles with energies below the energy axis of a layer
+    cross it without losing energy, as when the stopping power is
+    integrated numerically.
+    """
+    energy_axis = [1, 2, 4, 8] * u.MeV
+    layer = Layer(10 * u.um, energy_axis, np.full(4, 0.1) * u.MeV / u.um)
+    energies = ([0.1, 0.5, 0.9] * u.MeV).to(u.J).value
+
+    assert np.array_equal(layer._transmitted_energies(energies), energies)
+
+    deposited_energy = np.zeros((1, energies.size))
+    Stack([layer])._integrate_deposition(energies.copy(), 1 * u.um, deposited_energy)
+    assert np.all(deposited_energy == 0)
+
+
+def test_layer_csda_range_round_trip(synthetic_stack) -> None:
+    layer = synthetic_stack._layers[1]
+    energies = np.geomspace(1.1e-3, 900, 50) * u.MeV
+    csda_range = layer.csda_range(energies)
+
+    assert np.all(np.diff(csda_range) > 0)
+    assert u.allclose(
+        layer._csda_energy(csda_range.to(u.m).value) * u.J, energies, rtol=1e-10
+    )
+
+
+def test_film_stack_deposition_curves_csda(synthetic_stack) -> None:
+    """
+    Test that the deposition calculated from the CSDA ranges converges
+    with the numerical integration of the stopping power.
+    """
+    energies = np.arange(1, 60, 1) * u.MeV
+    deposited = synthetic_stack.deposition_curves(energies, return_only_active=False)
+    integrated = synthetic_stack.deposition_curves(
+        energies, dx=0.1 * u.um, return_only_active=False
+    )
+
+    assert deposited.shape == (21, energies.size)
+    assert np.allclose(np.sum(deposited, axis=0), 1)
+    assert np.allclose(deposited, integrated, atol=5e-3)
+
+    active = synthetic_stack.deposition_curves(energies)
+    assert np.array_equal(active, deposited[1::2])
+
+
+def test_film_stack_energy_bands_csda(synthetic_stack) -> None:
+    ebands = synthetic_stack.energy_bands([0.1, 60] * u.MeV, 0.1 * u.MeV)
+    integrated = synthetic_stack.energy_bands(
+        [0.1, 60] * u.MeV, 0.1 * u.MeV, dx=0.2 * u.um
+    )
+
+    assert ebands.shape == (10, 2)
+    assert np.all(np.diff(ebands[:, 0]) > 0)
+    assert u.allclose(ebands, integrated, atol=0.1 * u.MeV)
@@ -442,6 +442,129 @@ def test_create_particles() -> None:
     assert np.allclose(vdir, src_vdir, atol=0.05)
 
 
+@pytest.mark.parametrize(
+    ("distribution", "num_particles", "expected_num_particles"),
+    [
+        ("monte-carlo", 1000, 1000),
+        ("stratified", 1000, 961),
+        ("sobol", 1000, 1000),
+        ("halton", 1000, 1000),
+    ],
+)
+@pytest.mark.parametrize("grid_fraction", [None, 0.8])
+def test_create_particles_sampling(
+    distribution, num_particles, expected_num_particles, grid_fraction
+) -> None:
+    """
+    Test that the angular distributions are uniform per solid angle, and
+    that importance weighting toward the grid compensates for the extra
+    particles sent toward the grid.
+    """
+    grid = _test_grid("electrostatic_gaussian_sphere", num=50)
+    source = (0 * u.mm, -10 * u.mm, 0 * u.mm)
+    detector = (0 * u.mm, 200 * u.mm, 0 * u.mm)
+    sim = cpr.Tracker(grid, source, detector, verbose=False)
+
+    max_theta = 0.5
+    sim.create_particles(
+        num_particles,
+        15 * u.MeV,
+        max_theta=max_theta * u.rad,
+        distribution=distribution,
+        random_seed=42,
+        grid_fraction=grid_fraction,
+    )
+    assert sim.num_particles == expected_num_particles
+    assert np.all(sim.theta <= max_theta + 1e-12)
+
+    weights = np.ones(sim.num_particles) if sim.weights is None else sim.weights
+    assert np.isclose(np.mean(weights), 1, atol=0.05)
+
+    # The weighted fraction of particles within theta, and the mean of
+    # cos(theta), should match the fraction of the solid angle
+    solid_angle = 1 - np.cos(max_theta)
+    inside = sim.theta <= sim.max_theta_hit_grid
+    expected = (1 - np.cos(sim.max_theta_hit_grid)) / solid_angle
+    assert np.isclose(np.average(inside, weights=weights), expected, atol=0.03)
+    assert np.isclose(
+        np.average(np.cos(sim.theta), weights=weights),
+        (1 + np.cos(max_theta)) / 2,
+        rtol=2e-3,
+    )
+
+    if grid_fraction is None:
+        assert sim.weights is None
+    else:
+        assert np.isclose(np.mean(inside), grid_fraction, atol=0.03)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "exception"),
+    [
+        ({"distribution": "not a distribution"}, ValueError),
+        ({"distribution": "uniform", "grid_fraction": 0.5}, ValueError),
+        ({"grid_fraction": 1}, ValueError),
+        ({"grid_fraction": 0}, ValueError),
+    ],
+)
+def test_create_particles_invalid_sampling(kwargs, exception) -> None:
+    grid = _test_grid("electrostatic_gaussian_sphere", num=50)
+    source = (0 * u.mm, -10 * u.mm, 0 * u.mm)
+    detector = (0 * u.mm, 200 * u.mm, 0 * u.mm)
+    sim = cpr.Tracker(grid, source, detector, verbose=False)
+
+    with pytest.raises(exception):
+        sim.create_particles(1e3, 15 * u.MeV, **kwargs)
+
+
+def test_particle_weights_in_synthetic_radiograph(tmp_path) -> None:
+    """
+    Test that the particle weights are saved with the results and used
+    in the synthetic radiograph.
+    """
+    grid = _test_grid("electrostatic_gaussian_sphere", L=1 * u.mm, num=50)
+    source = (0 * u.mm, -10 * u.mm, 0 * u.mm)
+    detector = (0 * u.mm, 200 * u.mm, 0 * u.mm)
+    sim = cpr.Tracker(
+        grid,
+        source,
+        detector,
+        field_weighting="nearest neighbor",
+        output_directory=tmp_path,
+        verbose=False,
+    )
+    sim.create_particles(
+        1e3,
+        15 * u.MeV,
+        max_theta=20 * u.deg,
+        distribution="sobol",
+        random_seed=42,
+        grid_fraction=0.9,
+    )
+    sim.run()
+
+    size = np.array([[-1, 1], [-1, 1]]) * 10 * u.cm
+    results = sim.results_dict
+    assert np.array_equal(results["weights"], sim.weights)
+
+    *_, intensity = cpr.synthetic_radiograph(sim, size=size)
+    counted = ~np.isnan(results["x"]) & ~np.isnan(results["v"][:, 0])
+    assert np.isclose(np.sum(intensity), np.sum(sim.weights[counted]))
+
+    # The weights are saved to and read from the output file
+    *_, saved_intensity = cpr.synthetic_radiograph(tmp_path / "output.h5", size=size)
+    assert np.allclose(saved_intensity, intensity)
+
+    accumulator = cpr.RadiographAccumulator(size)
+    accumulator.add(tmp_path / "output.h5", chunk_size=100)
+    assert np.allclose(accumulator.intensity, intensity)
+
+    unweighted = results.copy()
+    del unweighted["weights"]
+    *_, unweighted_intensity = cpr.synthetic_radiograph(unweighted, size=size)
+    assert np.sum(unweighted_intensity) == np.count_nonzero(counted)
+
+
 @pytest.mark.slow
 def test_load_particles() -> None:
     grid = _test_grid("electrostatic_gaussian_sphere", num=50)
@@ -677,6 +800,159 @@ def test_intensity_histogram(self, args, kwargs, expected) -> None:
         assert histogram.shape == expected["bins"]
 
 
+@pytest.mark.slow
+class TestRadiographAccumulator:
+    """
+    Tests for
+    `plasmapy.diagnostics.charged_particle_radiography.RadiographAccumulator`.
+    """
+
+    sim_results = TestSyntheticRadiograph.sim_results
+    size = np.array([[-1, 1], [-1, 1]]) * 3 * u.cm
+    bins = (100, 60)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "_raises"),
+        [
+            ({"size": "not a Quantity"}, TypeError),
+            ({"size": 5 * u.ms}, ValueError),
+            ({"size": [-1, 1] * u.cm}, ValueError),
+            ({"size": size, "energy_bins": [1, 2] * u.MeV}, ValueError),
+        ],
+    )
+    def test_raises(self, kwargs, _raises) -> None:
+        with pytest.raises(_raises):
+            cpr.RadiographAccumulator(**kwargs)
+
+    @pytest.mark.parametrize("ignore_grid", [False, True])
+    @pytest.mark.parametrize("chunk_size", [None, 999])
+    def test_matches_synthetic_radiograph(self, ignore_grid, chunk_size) -> None:
+        hax, vax, expected = cpr.synthetic_radiograph(
+            self.sim_results, size=self.size, bins=self.bins, ignore_grid=ignore_grid
+        )
+
+        accumulator = cpr.RadiographAccumulator(
+            self.size, bins=self.bins, ignore_grid=ignore_grid
+        )
+        accumulator.add(
+            TestSyntheticRadiograph.tracker_obj_simulated, chunk_size=chunk_size
+        )
+        h, v, intensity = accumulator.radiograph()
+
+        assert u.allclose(h, hax)
+        assert u.allclose(v, vax)
+        assert np.array_equal(intensity, expected)
+        assert accumulator.num_particles == self.sim_results["num_particles"]
+        assert accumulator.num_counted == np.sum(expected)
+
+    def test_weights_and_energy_bins(self) -> None:
+        num_particles = self.sim_results["num_particles"]
+        weights = np.linspace(0, 1, num_particles)
+        energy_bins = np.linspace(2.5, 3.5, 11) * u.MeV
+
+        accumulator = cpr.RadiographAccumulator(
+            self.size, bins=self.bins, energy_bins=energy_bins, particle="p+"
+        )
+        accumulator.add(self.sim_results, weights=weights, chunk_size=1234)
+
+        unbinned = cpr.RadiographAccumulator(self.size, bins=self.bins)
+        unbinned.add(self.sim_results, weights=weights)
+
+        assert accumulator.intensity.shape == (*self.bins, 10)
+        assert u.allclose(accumulator.energy_bins, energy_bins)
+        assert np.allclose(accumulator.intensity.sum(axis=-1), unbinned.intensity)
+
+        # All particles are created with 3 MeV and the fields are
+        # electrostatic, so that the particles regain their energy by
+        # the time they reach the detector
+        assert np.all(accumulator.intensity[..., [0, 1, 2, 7, 8, 9]] == 0)
+
+    def test_warns(self) -> None:
+        accumulator = cpr.RadiographAccumulator([[-1, 1], [-1, 1]] * u.mm)
+        accumulator.add(self.sim_results)
+        with pytest.warns(RuntimeWarning):
+            accumulator.radiograph()
+
+    def test_merge(self) -> None:
+        num_particles = self.sim_results["num_particles"]
+        half = num_particles // 2
+
+        accumulator = cpr.RadiographAccumulator(self.size, bins=self.bins)
+        accumulator.add(self.sim_results)
+
+        first = cpr.RadiographAccumulator(self.size, bins=self.bins)
+        second = cpr.RadiographAccumulator(self.size, bins=self.bins)
+        for partial, chunk in ((first, slice(None, half)), (second, slice(half, None))):
+            partial.add_particles(
+                self.sim_results["x"][chunk],
+                self.sim_results["y"][chunk],
+                self.sim_results["v"][chunk],
+            )
+        first.merge(second)
+
+        assert np.array_equal(first.intensity, accumulator.intensity)
+        assert first.num_particles == num_particles
+        assert first.num_counted == accumulator.num_counted
+
+        with pytest.raises(ValueError):
+            first.merge(cpr.RadiographAccumulator(self.size, bins=(100, 61)))
+        with pytest.raises(ValueError):
+            first.merge(
+                cpr.RadiographAccumulator(self.size, bins=self.bins, ignore_grid=True)
+            )
+
+
+@pytest.mark.slow
+def test_run_in_chunks() -> None:
+    """
+    Test that pushing the particles in chunks with a pool of processes
+    gives the same radiograph as a serial run.
+    """
+    serial = create_tracker_obj(dt=1e-12 * u.s, field_weighting="nearest neighbor")
+    serial.run()
+
+    chunked = create_tracker_obj(dt=1e-12 * u.s, field_weighting="nearest neighbor")
+    chunked.run(n_workers=2)
+
+    assert serial.num_entered == chunked.num_entered
+
+    serial_results = serial.results_dict
+    chunked_results = chunked.results_dict
+    for key in ("x", "y", "v"):
+        assert np.allclose(serial_results[key], chunked_results[key], equal_nan=True)
+
+
+def test_projection_chunk_size() -> None:
+    """
+    Test that the projections of the particles between the source, a wire
+    mesh, the grid, and the detector do not depend on the chunk size, and
+    that the time spent in each stage is recorded.
+    """
+    results = []
+    for chunk_size in (None, 777):
+        sim = create_tracker_obj(dt=1e-12 * u.s, field_weighting="nearest neighbor")
+        sim.add_wire_mesh(
+            (0 * u.mm, -5 * u.mm, 0 * u.mm), (2 * u.mm, 1.5 * u.mm), (5, 4), 40 * u.um
+        )
+        if chunk_size is not None:
+            sim.projection_chunk_size = chunk_size
+        sim.run()
+        results.append(sim.results_dict)
+
+        assert set(sim.projection_timings) == {
+            "wire_mesh",
+            "coast_untracked",
+            "null_distribution",
+            "coast_to_grid",
+            "remove_deflected",
+            "coast_to_detector",
+        }
+        assert all(t > 0 for t in sim.projection_timings.values())
+
+    for key in ("x", "y", "v", "x0", "y0", "v0"):
+        assert np.array_equal(results[0][key], results[1][key], equal_nan=True)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize(
     "case",
@@ -958,6 +1234,14 @@ def test_radiography_disk_save_routine(tmp_path) -> None:
     # The two synthetic radiographs should be identical
     assert np.allclose(i1, i2)
 
+    # Accumulate the radiograph from several copies of the file in parallel
+    size = np.array([[-1, 1], [-1, 1]]) * 5 * u.cm
+    *_, expected = cpr.synthetic_radiograph(sim, size=size)
+    accumulator = cpr.RadiographAccumulator(size)
+    accumulator.add_many([path, path], chunk_size=300, n_workers=2)
+    assert np.array_equal(accumulator.intensity, 2 * expected)
+    assert accumulator.num_particles == 2 * sim.num_particles
+
 
 def test_radiography_memory_save_routine() -> None:
     grid = _test_grid("electrostatic_gaussian_sphere", L=1 * u.mm, num=50)
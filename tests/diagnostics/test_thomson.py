@@ -374,6 +374,41 @@ def multiple_species_collective_args():
     return kwargs
 
 
+@pytest.mark.parametrize(
+    "extra_kwargs",
+    [
+        {},
+        {"instr_func_arr": example_instr_func(np.linspace(-12.5, 12.5, 2500) * u.nm)},
+        {"notch": np.array([531e-9, 533e-9])},
+    ],
+)
+def test_spectral_density_lite_batched(
+    multiple_species_collective_args, extra_kwargs
+) -> None:
+    """
+    Test that spectra computed with batch dimensions match those
+    computed one parameter set at a time.
+    """
+    kwargs = args_to_lite_args(multiple_species_collective_args) | extra_kwargs
+
+    # A (3, 2) grid of densities and scalings of the electron temperatures
+    n = kwargs["n"] * np.array([0.5, 1.0, 2.0])
+    T_e = kwargs["T_e"] * np.array([1.0, 3.0])[:, np.newaxis]
+    batched_kwargs = kwargs | {"n": n[:, np.newaxis], "T_e": T_e}
+
+    alpha, Skw = thomson.spectral_density_lite(**batched_kwargs)
+
+    assert alpha.shape == (3, 2)
+    assert Skw.shape == (3, 2, kwargs["wavelengths"].size)
+
+    for i, j in np.ndindex(3, 2):
+        alpha_ij, Skw_ij = thomson.spectral_density_lite(
+            **(kwargs | {"n": n[i], "T_e": T_e[j]})
+        )
+        assert np.isclose(alpha[i, j], alpha_ij, rtol=1e-12)
+        assert np.allclose(Skw[i, j], Skw_ij, rtol=1e-10, atol=1e-10 * Skw_ij.max())
+
+
 def test_efract_sum_error(single_species_collective_args) -> None:
     args, kwargs = spectral_density_args_kwargs(single_species_collective_args)
     kwargs["efract"] = np.array([2.0])  # Sum is not 1
@@ -1399,3 +1434,107 @@ def test_model_input_validation(
             if msg is not None:
                 print(excinfo.value)  # noqa: T201
                 assert msg in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "epw_single_species_settings_params",
+        "iaw_single_species_settings_params",
+        "iaw_multi_species_settings_params",
+    ],
+)
+def test_spectral_density_fitter(fixture, request) -> None:
+    """
+    Test that SpectralDensityFitter recovers the parameters of a
+    spectrum from an initial guess near them.
+    """
+    wavelengths, params, settings = spectral_density_model_settings_params(
+        request.getfixturevalue(fixture)
+    )
+    fitter = thomson.SpectralDensityFitter(wavelengths, settings, params)
+
+    x_true = 1.1 * np.array([params[name].value for name in fitter.varying])
+    data = fitter.evaluate(x_true)
+    # Points that are nan are omitted from the fit
+    data[:10] = np.nan
+
+    result = fitter.fit(data)
+
+    assert result.success
+    assert np.allclose(result.x, x_true, rtol=1e-4)
+    for name, value in zip(fitter.varying, x_true, strict=True):
+        assert np.isclose(result.params[name], value, rtol=1e-4)
+    assert result.redchi < 1e-10
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.parametrize("instr_func", [None, example_instr_func])
+def test_spectral_density_fitter_matches_model(
+    instr_func, iaw_multi_species_settings_params
+) -> None:
+    """
+    Test that the spectra of SpectralDensityFitter are those of the
+    `lmfit.Model` returned by spectral_density_model.
+    """
+    iaw_multi_species_settings_params["instr_func"] = instr_func
+    wavelengths, params, settings = spectral_density_model_settings_params(
+        iaw_multi_species_settings_params
+    )
+    model = thomson.spectral_density_model(wavelengths, copy.deepcopy(settings), params)
+    fitter = thomson.SpectralDensityFitter(wavelengths, settings, params)
+
+    expected = model.eval(params, wavelengths=wavelengths)
+    x = [params[name].value for name in fitter.varying]
+
+    assert np.allclose(fitter.evaluate(x), expected)
+    assert np.allclose(fitter.evaluate([x, x]), expected)
+
+
+def test_spectral_density_fitter_sequence(iaw_single_species_settings_params) -> None:
+    """
+    Test fitting a sequence of spectra with and without warm starts,
+    sequentially and in parallel.
+    """
+    wavelengths, params, settings = spectral_density_model_settings_params(
+        iaw_single_species_settings_params
+    )
+    fitter = thomson.SpectralDensityFitter(wavelengths, settings, params)
+
+    T_i = np.linspace(20, 30, num=6)
+    data = fitter.evaluate(T_i[:, np.newaxis])
+
+    warm = fitter.fit_sequence(data)
+    cold = fitter.fit_sequence(data, warm_start=False)
+    parallel = fitter.fit_sequence(data, n_workers=2)
+
+    for result in (warm, cold, parallel):
+        assert np.all(result.success)
+        assert result.x.shape == (T_i.size, 1)
+        assert np.allclose(result.params["T_i_0"], T_i, rtol=1e-4)
+        assert np.allclose(result.params["T_e_0"], params["T_e_0"].value)
+
+    # Starting from the previous frame takes fewer evaluations
+    assert np.sum(warm.nfev) < np.sum(cold.nfev)
+
+
+def test_spectral_density_fitter_errors(iaw_single_species_settings_params) -> None:
+    wavelengths, params, settings = spectral_density_model_settings_params(
+        iaw_single_species_settings_params
+    )
+    fitter = thomson.SpectralDensityFitter(
+        wavelengths, copy.deepcopy(settings), copy.deepcopy(params)
+    )
+
+    with pytest.raises(ValueError, match="does not match"):
+        fitter.fit(np.ones(wavelengths.size + 1))
+
+    with pytest.raises(ValueError, match="must be"):
+        fitter.fit_sequence(np.ones(wavelengths.size))
+
+    with pytest.raises(ValueError, match="n_workers"):
+        fitter.fit_sequence(np.ones((2, wavelengths.size)), n_workers=0)
+
+    params["T_e_0"].expr = "T_i_0 / 2"
+    with pytest.raises(ValueError, match="expression"):
+        thomson.SpectralDensityFitter(wavelengths, settings, params)
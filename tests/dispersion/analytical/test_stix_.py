@@ -3,9 +3,10 @@
 import astropy.units as u
 import numpy as np
 import pytest
+import xarray as xr
 from astropy.constants.si import c
 
-from plasmapy.dispersion.analytical.stix_ import stix
+from plasmapy.dispersion.analytical.stix_ import stix, stix_lite
 from plasmapy.formulary import gyrofrequency, plasma_frequency
 from plasmapy.particles import Particle, ParticleList
 from plasmapy.particles.exceptions import InvalidParticleError
@@ -377,3 +378,87 @@ def test_vals_theta_90deg(self, kwargs) -> None:
         assert np.allclose(ns[..., 1], -n_soln1)
         assert np.allclose(ns[..., 2], n_soln2)
         assert np.allclose(ns[..., 3], -n_soln2)
+
+
+class TestStixLite:
+    _ions = ParticleList(["H+", "He+"])
+    _w = np.logspace(-3, 1, 5)[:, np.newaxis]
+    _theta = np.deg2rad([0, 30, 60, 90])
+
+    # solar-wind-like plasmas
+    _B = np.array([5e-9, 8.3e-9, 1.2e-8])
+    _n_i = np.array([[3e6, 4e6, 5e6], [1e5, 2e5, 4e5]])
+
+    def test_binding(self) -> None:
+        assert stix.lite is stix_lite
+
+    def test_matches_stix(self) -> None:
+        """Test that the lite-function matches the original function."""
+        ks = stix(
+            B=self._B[0] * u.T,
+            w=self._w[:, 0] * u.rad / u.s,
+            ions=self._ions,
+            n_i=self._n_i[:, 0] * u.m**-3,
+            theta=self._theta * u.rad,
+        )
+        ks_lite = stix_lite(
+            self._B[0],
+            self._w,
+            self._n_i[:, 0],
+            self._theta,
+            m_i=self._ions.mass.value,
+            Z=self._ions.charge_number,
+        )
+
+        assert ks_lite.shape == (5, 4, 4)
+        assert np.allclose(ks.value, ks_lite, rtol=1e-12, atol=0)
+
+    def test_broadcasts_over_plasmas(self) -> None:
+        """
+        Test that broadcasting over the plasma parameters gives the same
+        wavenumbers as solving for each plasma in turn.
+        """
+        kwargs = {"m_i": self._ions.mass.value, "Z": self._ions.charge_number}
+        ks = stix_lite(
+            self._B,
+            self._w[..., np.newaxis],
+            self._n_i,
+            self._theta[:, np.newaxis],
+            **kwargs,
+        )
+
+        assert ks.shape == (5, 4, 3, 4)
+        for ii in range(self._B.size):
+            expected = stix_lite(
+                self._B[ii], self._w, self._n_i[:, ii], self._theta, **kwargs
+            )
+            assert np.allclose(ks[:, :, ii], expected, rtol=1e-12, atol=0)
+
+    def test_dataarray(self) -> None:
+        """Test that `xarray.DataArray` arguments broadcast by name."""
+        time = np.arange(self._B.size)
+        ks = stix_lite(
+            xr.DataArray(self._B, dims="time", coords={"time": time}),
+            xr.DataArray(self._w[:, 0], dims="w"),
+            [xr.DataArray(n_i, dims="time") for n_i in self._n_i],
+            xr.DataArray(self._theta, dims="theta"),
+            m_i=self._ions.mass.value,
+            Z=self._ions.charge_number,
+        )
+
+        assert isinstance(ks, xr.DataArray)
+        assert ks.dims[-1] == "root"
+        assert set(ks.dims) == {"time", "w", "theta", "root"}
+        assert list(ks.root.values) == [0, 1, 2, 3]
+
+        expected = stix_lite(
+            self._B[2],
+            self._w,
+            self._n_i[:, 2],
+            self._theta,
+            m_i=self._ions.mass.value,
+            Z=self._ions.charge_number,
+        )
+        assert np.allclose(
+            ks.sel(time=2).transpose("w", "theta", "root"), expected, rtol=1e-12
+        )
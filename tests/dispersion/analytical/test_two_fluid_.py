@@ -3,8 +3,9 @@
 import astropy.units as u
 import numpy as np
 import pytest
+import xarray as xr
 
-from plasmapy.dispersion.analytical.two_fluid_ import two_fluid
+from plasmapy.dispersion.analytical.two_fluid_ import two_fluid, two_fluid_lite
 from plasmapy.formulary.frequencies import wc_
 from plasmapy.formulary.speeds import cs_, va_
 from plasmapy.particles import Particle
@@ -176,3 +177,80 @@ def test_return_structure(self, kwargs, expected) -> None:
             assert isinstance(val, u.Quantity)
             assert val.unit == u.rad / u.s
             assert val.shape == expected["shape"]
+
+
+class TestTwoFluidLite:
+    _ion = Particle("p+")
+    _kwargs = {
+        "k": np.logspace(-7, -2, 4)[:, np.newaxis],
+        "theta": np.deg2rad([10, 45, 80, 90]),
+        "T_e": 1.6e6,
+        "T_i": 4.0e5,
+        "m_i": _ion.mass.value,
+        "Z": _ion.charge_number,
+    }
+
+    # solar-wind-like plasmas
+    _B = np.array([5e-9, 8.3e-9, 1.2e-8])
+    _n_i = np.array([3e6, 5e6, 1e7])
+
+    def test_binding(self) -> None:
+        assert two_fluid.lite is two_fluid_lite
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    def test_matches_two_fluid(self) -> None:
+        """Test that the lite-function matches the original function."""
+        ws = two_fluid(
+            B=self._B[0] * u.T,
+            ion=self._ion,
+            k=self._kwargs["k"][:, 0] * u.rad / u.m,
+            n_i=self._n_i[0] * u.m**-3,
+            theta=self._kwargs["theta"] * u.rad,
+            T_e=self._kwargs["T_e"] * u.K,
+            T_i=self._kwargs["T_i"] * u.K,
+        )
+        ws_lite = two_fluid_lite(B=self._B[0], n_i=self._n_i[0], **self._kwargs)
+
+        assert ws_lite.shape == (3, 4, 4)
+        for val, val_lite in zip(ws.values(), ws_lite, strict=True):
+            assert np.allclose(val.value, val_lite, rtol=1e-12, atol=0)
+
+    def test_broadcasts_over_plasmas(self) -> None:
+        """
+        Test that broadcasting over the plasma parameters gives the same
+        frequencies as solving for each plasma in turn.
+        """
+        kwargs = {
+            **self._kwargs,
+            "k": self._kwargs["k"][..., np.newaxis],
+            "theta": self._kwargs["theta"][:, np.newaxis],
+        }
+        ws = two_fluid_lite(B=self._B, n_i=self._n_i, **kwargs)
+
+        assert ws.shape == (3, 4, 4, 3)
+        for ii, (B, n_i) in enumerate(zip(self._B, self._n_i, strict=True)):
+            expected = two_fluid_lite(B=B, n_i=n_i, **self._kwargs)
+            assert np.allclose(ws[..., ii], expected, rtol=1e-12, atol=0)
+
+    def test_dataarray(self) -> None:
+        """Test that `xarray.DataArray` arguments broadcast by name."""
+        time = np.arange(self._B.size)
+        kwargs = {
+            **self._kwargs,
+            "k": xr.DataArray(self._kwargs["k"][:, 0], dims="k"),
+            "theta": xr.DataArray(self._kwargs["theta"], dims="theta"),
+            "B": xr.DataArray(self._B, dims="time", coords={"time": time}),
+            "n_i": xr.DataArray(self._n_i, dims="time", coords={"time": time}),
+        }
+        ws = two_fluid_lite(**kwargs)
+
+        assert isinstance(ws, xr.DataArray)
+        assert ws.dims[0] == "mode"
+        assert set(ws.dims) == {"mode", "time", "k", "theta"}
+        assert list(ws.mode.values) == ["fast_mode", "alfven_mode", "acoustic_mode"]
+        assert np.array_equal(ws.time, time)
+
+        expected = two_fluid_lite(B=self._B[1], n_i=self._n_i[1], **self._kwargs)
+        assert np.allclose(
+            ws.sel(time=1).transpose("mode", "k", "theta"), expected, rtol=1e-12
+        )
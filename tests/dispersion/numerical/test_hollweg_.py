@@ -4,7 +4,11 @@
 import numpy as np
 import pytest
 
-from plasmapy.dispersion.numerical.hollweg_ import hollweg
+from plasmapy.dispersion.numerical.hollweg_ import (
+    _polynomial_roots,
+    _track_roots,
+    hollweg,
+)
 from plasmapy.formulary import speeds
 from plasmapy.particles import Particle
 from plasmapy.particles.exceptions import InvalidIonError
@@ -376,3 +380,121 @@ def test_return_structure(self, kwargs, expected) -> None:
             assert isinstance(val, u.Quantity)
             assert val.unit == u.rad / u.s
             assert val.shape == expected["shape"]
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    def test_matches_roots_of_each_polynomial(self) -> None:
+        """
+        Test that the frequencies for a grid of k and theta are those
+        found by solving the dispersion relation for each pair alone.
+        """
+        k = np.geomspace(1e-4, 1, num=7) * u.rad / u.m
+        theta = np.linspace(80, 90, num=5) * u.deg
+        ws = hollweg(**{**self._kwargs_single_valued, "k": k, "theta": theta})
+
+        for i, j in np.ndindex(k.size, theta.size):
+            ws_ij = hollweg(
+                **{**self._kwargs_single_valued, "k": k[i], "theta": theta[j]}
+            )
+            for mode, val in ws.items():
+                # Two of the frequencies vanish at theta = 90 deg
+                assert np.isclose(
+                    val[i, j].value, ws_ij[mode].value, rtol=1e-10, atol=1e-9
+                )
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    @pytest.mark.parametrize(
+        "k",
+        [
+            np.logspace(-3, -8, 12),
+            np.array([1e-7, 1e-6, 1e-6, 2e-6]),
+            np.array([1e-6, 1e-7, 2e-6, 1e-6, 1e-7]),
+        ],
+    )
+    @pytest.mark.parametrize("track_modes", [False, True])
+    def test_unsorted_k(self, k, track_modes) -> None:
+        """
+        Test that the modes for wavenumbers in any order, including
+        repeated wavenumbers, are those for the sorted wavenumbers.
+        """
+        kwargs = {
+            **self._kwargs_single_valued,
+            "theta": [80, 88] * u.deg,
+            "track_modes": track_modes,
+        }
+        ws = hollweg(**{**kwargs, "k": k * u.rad / u.m})
+        ws_sorted = hollweg(**{**kwargs, "k": np.unique(k) * u.rad / u.m})
+
+        indices = np.searchsorted(np.unique(k), k)
+        for mode, val in ws.items():
+            assert np.all(np.isfinite(val))
+            assert np.allclose(val, ws_sorted[mode][indices], rtol=1e-12, atol=0)
+
+        # The fast mode is the fastest and the acoustic mode the slowest
+        assert np.all(ws["fast_mode"].real > ws["alfven_mode"].real)
+        assert np.all(ws["alfven_mode"].real > ws["acoustic_mode"].real)
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    def test_track_modes(self) -> None:
+        """
+        Test that the modes are sorted at each wavenumber by default, so
+        that they do not depend on the other wavenumbers, and that the
+        tracked modes are the same frequencies.
+        """
+        k = np.geomspace(1e-7, 1e-2, num=41) * u.rad / u.m
+        kwargs = {**self._kwargs_single_valued, "k": k, "theta": [80, 88] * u.deg}
+        # The modes are returned from the fastest to the slowest
+        sorted_roots = np.array(list(hollweg(**kwargs).values()))[::-1]
+        tracked_roots = np.array(list(hollweg(**kwargs, track_modes=True).values()))
+
+        assert np.array_equal(sorted_roots, np.sort(sorted_roots, axis=0))
+        assert np.allclose(np.sort(tracked_roots, axis=0), sorted_roots, rtol=1e-12)
+
+        last_roots = np.array(list(hollweg(**{**kwargs, "k": k[-1]}).values()))[::-1]
+        assert np.allclose(sorted_roots[:, -1], last_roots, rtol=1e-12)
+
+
+def test_polynomial_roots() -> None:
+    """Test that the batched root solver agrees with numpy.roots."""
+    rng = np.random.default_rng(seed=1)
+    coefficients = rng.normal(size=(4, 5, 6))
+    roots = _polynomial_roots(coefficients)
+
+    assert roots.shape == (3, 5, 6)
+    for i, j in np.ndindex(5, 6):
+        expected = np.roots(coefficients[:, i, j])
+        assert np.allclose(np.sort_complex(roots[:, i, j]), np.sort_complex(expected))
+
+
+def test_track_roots() -> None:
+    """Test that tracked roots follow modes through a crossing."""
+    k = np.linspace(0, 2, num=21)
+    modes = np.array([k, 2 - k, 3 + 0 * k])[..., np.newaxis]
+
+    # Scramble the order of the roots at each k
+    rng = np.random.default_rng(seed=1)
+    scrambled = np.array([modes[rng.permutation(3), i] for i in range(k.size)])
+    scrambled = np.moveaxis(scrambled, 0, 1)
+
+    tracked = _track_roots(scrambled, k)
+
+    assert np.allclose(tracked, modes)
+
+
+@pytest.mark.parametrize(
+    "k",
+    [np.linspace(2, 0, num=21), np.repeat(np.linspace(0, 2, num=11), 2)],
+)
+def test_track_roots_unsorted_k(k) -> None:
+    """
+    Test that tracked roots follow modes through a crossing for
+    wavenumbers in descending order and for repeated wavenumbers.
+    """
+    modes = np.array([k, 2 - k, 3 + 0 * k])[..., np.newaxis]
+
+    rng = np.random.default_rng(seed=1)
+    scrambled = np.array([modes[rng.permutation(3), i] for i in range(k.size)])
+    scrambled = np.moveaxis(scrambled, 0, 1)
+
+    tracked = _track_roots(scrambled, k)
+
+    assert np.allclose(tracked, modes)
@@ -3,9 +3,15 @@
 import astropy.units as u
 import numpy as np
 import pytest
-from astropy.constants.si import c
+import xarray as xr
+from astropy.constants.si import c, k_B
 
-from plasmapy.dispersion.numerical.kinetic_alfven_ import kinetic_alfven
+from plasmapy.dispersion.numerical.kinetic_alfven_ import (
+    kinetic_alfven,
+    kinetic_alfven_lite,
+)
+from plasmapy.formulary.frequencies import gyrofrequency
+from plasmapy.formulary.speeds import Alfven_speed
 from plasmapy.particles import Particle
 from plasmapy.particles.exceptions import InvalidParticleError
 from plasmapy.utils.exceptions import PhysicsWarning
@@ -149,3 +155,119 @@ def test_warning(self, kwargs, _warning) -> None:
         """Test scenarios that raise a `Warning`."""
         with pytest.warns(_warning):
             kinetic_alfven(**kwargs)
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    def test_parallel_and_perpendicular(self) -> None:
+        """
+        Test that ``theta`` is an angle in the given units, so that the
+        wave is an Alfvén wave at 0° and does not propagate at 90°.
+        """
+        kwargs = {**self._kwargs_single_valued, "theta": [0, 90] * u.deg}
+        ws = kinetic_alfven(**kwargs)
+        v_A = Alfven_speed(kwargs["B"], kwargs["n_i"], ion=kwargs["ion"])
+
+        assert list(ws) == [0, 90]
+        assert u.allclose(ws[0], kwargs["k"] * v_A)
+        assert u.allclose(ws[90], 0 * u.rad / u.s, atol=1e-12 * ws[0])
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    @pytest.mark.parametrize("theta", [60 * u.deg, np.pi / 3 * u.rad])
+    def test_oblique(self, theta) -> None:
+        """
+        Test an oblique wave against the dispersion relation written out
+        for an angle of 60°, for which k_z = k / 2 and k_x = √3 k / 2.
+        """
+        kwargs = {**self._kwargs_single_valued, "theta": theta}
+        ion = kwargs["ion"]
+        k = kwargs["k"]
+        v_A = Alfven_speed(kwargs["B"], kwargs["n_i"], ion=ion)
+        c_s = np.sqrt(
+            (
+                kwargs["gamma_e"] * k_B * kwargs["T_e"]
+                + kwargs["gamma_i"] * k_B * kwargs["T_i"]
+            )
+            / ion.mass
+        )
+        omega_ci = gyrofrequency(kwargs["B"], ion)
+        expected = (
+            (k / 2) * v_A * np.sqrt(1 + (np.sqrt(3) * k / 2 * c_s / omega_ci) ** 2)
+        )
+
+        (omega,) = kinetic_alfven(**kwargs).values()
+
+        assert u.allclose(omega, expected, rtol=1e-12)
+
+
+class TestKineticAlfvenLite:
+    _ion = Particle("p+")
+    _kwargs = {
+        "k": np.logspace(-7, -2, 4)[:, np.newaxis],
+        "theta": np.deg2rad([10, 45, 80]),
+        "T_e": 1.6e6,
+        "T_i": 4.0e5,
+        "m_i": _ion.mass.value,
+        "Z": _ion.charge_number,
+        "gamma_e": 3,
+    }
+
+    # solar-wind-like plasmas
+    _B = np.array([5e-9, 8.3e-9, 1.2e-8])
+    _n_i = np.array([3e6, 5e6, 1e7])
+
+    def test_binding(self) -> None:
+        assert kinetic_alfven.lite is kinetic_alfven_lite
+
+    @pytest.mark.filterwarnings("ignore::plasmapy.utils.exceptions.PhysicsWarning")
+    def test_matches_kinetic_alfven(self) -> None:
+        """Test that the lite-function matches the original function."""
+        ws = kinetic_alfven(
+            B=self._B[0] * u.T,
+            ion=self._ion,
+            k=self._kwargs["k"][:, 0] * u.rad / u.m,
+            n_i=self._n_i[0] * u.m**-3,
+            theta=self._kwargs["theta"] * u.rad,
+            T_e=self._kwargs["T_e"] * u.K,
+            T_i=self._kwargs["T_i"] * u.K,
+            gamma_e=3,
+        )
+        ws_lite = kinetic_alfven_lite(B=self._B[0], n_i=self._n_i[0], **self._kwargs)
+
+        assert ws_lite.shape == (4, 3)
+        for ii, val in enumerate(ws.values()):
+            assert np.allclose(val.value, ws_lite[:, ii], rtol=1e-12, atol=0)
+
+    def test_broadcasts_over_plasmas(self) -> None:
+        """
+        Test that broadcasting over the plasma parameters gives the same
+        frequencies as solving for each plasma in turn.
+        """
+        kwargs = {
+            **self._kwargs,
+            "k": self._kwargs["k"][..., np.newaxis],
+            "theta": self._kwargs["theta"][:, np.newaxis],
+        }
+        ws = kinetic_alfven_lite(B=self._B, n_i=self._n_i, **kwargs)
+
+        assert ws.shape == (4, 3, 3)
+        for ii, (B, n_i) in enumerate(zip(self._B, self._n_i, strict=True)):
+            expected = kinetic_alfven_lite(B=B, n_i=n_i, **self._kwargs)
+            assert np.allclose(ws[..., ii], expected, rtol=1e-12, atol=0)
+
+    def test_dataarray(self) -> None:
+        """Test that `xarray.DataArray` arguments broadcast by name."""
+        time = np.arange(self._B.size)
+        kwargs = {
+            **self._kwargs,
+            "k": xr.DataArray(self._kwargs["k"][:, 0], dims="k"),
+            "theta": xr.DataArray(self._kwargs["theta"], dims="theta"),
+            "B": xr.DataArray(self._B, dims="time", coords={"time": time}),
+            "n_i": xr.DataArray(self._n_i, dims="time", coords={"time": time}),
+        }
+        ws = kinetic_alfven_lite(**kwargs)
+
+        assert isinstance(ws, xr.DataArray)
+        assert set(ws.dims) == {"time", "k", "theta"}
+        assert np.array_equal(ws.time, time)
+
+        expected = kinetic_alfven_lite(B=self._B[1], n_i=self._n_i[1], **self._kwargs)
+        assert np.allclose(ws.sel(time=1).transpose("k", "theta"), expected, rtol=1e-12)
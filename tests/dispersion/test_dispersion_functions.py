@@ -12,6 +12,7 @@
 
 from plasmapy.dispersion.dispersion_functions import (
     plasma_dispersion_func,
+    plasma_dispersion_func_and_deriv,
     plasma_dispersion_func_deriv,
 )
 
@@ -260,3 +261,129 @@ def test_plasma_dispersion_deriv_errors(self, w, expected_error) -> None:
                 f"plasma_dispersion_func_deriv({w}) did not raise "
                 f"{expected_error.__name__} as expected."
             )
+
+
+class TestPlasmaDispersionFunctionMethods:
+    """
+    Test the approximate methods of evaluating the plasma dispersion
+    function and its derivative.
+    """
+
+    methods = ["wofz", "rational", "table"]
+
+    @pytest.mark.parametrize("method", methods)
+    @pytest.mark.parametrize(("w", "expected"), plasma_dispersion_func_table)
+    def test_tabulated_values(self, method, w, expected) -> None:
+        Z_of_w = plasma_dispersion_func(w, method=method)
+
+        assert u.isclose(Z_of_w, expected, atol=1e-12 * (1 + 1j), rtol=1e-11)
+
+    @pytest.mark.parametrize("method", methods)
+    @given(complex_numbers(allow_infinity=False, allow_nan=False, max_magnitude=10))
+    def test_agrees_with_wofz(self, method, w) -> None:
+        assert u.isclose(
+            plasma_dispersion_func(w, method=method),
+            plasma_dispersion_func(w),
+            atol=1e-13 * (1 + 1j),
+            rtol=1e-11,
+        )
+
+    @pytest.mark.parametrize("method", methods)
+    def test_arrays(self, method) -> None:
+        # Includes arguments in both half planes, on the real axis, and
+        # outside of the table
+        w = np.array(
+            [[0.5 + 0.1j, -2.5 - 1.7j, 3 + 0j], [15 + 2j, 3 + 8j, -1 - 12j]],
+            dtype=np.complex128,
+        )
+
+        Z_of_w = plasma_dispersion_func(w, method=method)
+
+        assert Z_of_w.shape == w.shape
+        assert np.allclose(Z_of_w, plasma_dispersion_func(w), rtol=1e-11, atol=0)
+
+    @pytest.mark.parametrize("method", ["rational", "table"])
+    @pytest.mark.filterwarnings("error::RuntimeWarning")
+    def test_large_arguments_in_lower_half_plane(self, method) -> None:
+        """
+        Test that large arguments in the lower half plane, where the
+        reflection formula loses accuracy and overflows, agree with
+        `scipy.special.wofz`.
+        """
+        magnitude = np.geomspace(10, 1000, num=21)
+        angle = np.linspace(-np.pi, 0, num=25)[1:-1]
+        w = (magnitude[:, np.newaxis] * np.exp(1j * angle)).ravel()
+        # Keep the arguments for which the function does not overflow
+        w = w[w.imag**2 - w.real**2 < 700]
+
+        Z_of_w = plasma_dispersion_func(w, method=method)
+
+        assert np.allclose(Z_of_w, plasma_dispersion_func(w), rtol=1e-12, atol=0)
+
+    @pytest.mark.parametrize("method", methods)
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_non_finite_arguments(self, method) -> None:
+        """Test that NaN and infinite arguments agree with `scipy.special.wofz`."""
+        nan, inf = np.nan, np.inf
+        w = np.array(
+            [
+                complex(nan, 1),
+                complex(1, nan),
+                complex(nan, nan),
+                complex(1, inf),
+                complex(inf, 1),
+                complex(-inf, 1),
+                complex(1, -inf),
+                complex(inf, -1),
+                complex(inf, inf),
+                0.5 + 0.1j,
+                -2.5 - 1.7j,
+            ]
+        )
+
+        Z_of_w = plasma_dispersion_func(w, method=method)
+
+        assert np.allclose(
+            Z_of_w, plasma_dispersion_func(w), rtol=1e-11, atol=0, equal_nan=True
+        )
+
+    @pytest.mark.parametrize(
+        "w", [0.7, -3, np.linspace(-30, 30, num=101), 0.3 * u.dimensionless_unscaled]
+    )
+    def test_real_arguments(self, w) -> None:
+        """Test the evaluation of real arguments with the Dawson function."""
+        Z_of_w = plasma_dispersion_func(w)
+        expected = plasma_dispersion_func(np.asarray(w, dtype=np.complex128))
+
+        assert np.allclose(Z_of_w, expected, rtol=1e-14, atol=1e-300)
+        assert isinstance(Z_of_w, u.Quantity) == isinstance(w, u.Quantity)
+
+    @pytest.mark.parametrize("method", methods)
+    @pytest.mark.parametrize(
+        "w",
+        [0, 1.5 - 0.2j, np.array([0.5, 1 + 1j]), 2j * u.dimensionless_unscaled],
+    )
+    def test_func_and_deriv(self, method, w) -> None:
+        Z, Z_deriv = plasma_dispersion_func_and_deriv(w, method=method)
+
+        assert u.isclose(Z, plasma_dispersion_func(w, method=method), rtol=1e-15).all()
+        assert u.isclose(
+            Z_deriv, plasma_dispersion_func_deriv(w, method=method), rtol=1e-15
+        ).all()
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            plasma_dispersion_func,
+            plasma_dispersion_func_deriv,
+            plasma_dispersion_func_and_deriv,
+        ],
+    )
+    def test_invalid_method(self, func) -> None:
+        with pytest.raises(ValueError, match="method"):
+            func(1 + 1j, method="pade")
+
+    @pytest.mark.parametrize(("w", "expected_error"), plasma_disp_func_errors_table)
+    def test_func_and_deriv_errors(self, w, expected_error) -> None:
+        with pytest.raises(expected_error, match="plasma_dispersion_func_and_deriv"):
+            plasma_dispersion_func_and_deriv(w)
@@ -0,0 +1,92 @@
+"""Tests for the lazy loading of the `plasmapy.formulary` namespace."""
+
+import importlib
+
+import pytest
+
+from plasmapy import formulary
+
+submodule_names = formulary._submodules()
+
+
+def test_submodules() -> None:
+    """Test that the public formulary modules are found."""
+    assert submodule_names == (
+        "braginskii",
+        "collisions",
+        "densities",
+        "dielectric",
+        "dimensionless",
+        "distribution",
+        "drifts",
+        "frequencies",
+        "ionization",
+        "laser",
+        "lengths",
+        "magnetostatics",
+        "mathematics",
+        "misc",
+        "quantum",
+        "radiation",
+        "relativity",
+        "speeds",
+    )
+
+
+@pytest.mark.parametrize("modname", submodule_names)
+def test_all_includes_submodule_all(modname) -> None:
+    """
+    Test that the ``__all__`` of the formulary includes everything in
+    the ``__all__`` of each formulary module.
+    """
+    module = importlib.import_module(f"plasmapy.formulary.{modname}")
+    assert set(module.__all__) <= set(formulary.__all__)
+
+
+def test_name_provided_by_last_module() -> None:
+    """
+    Test that a name exported by more than one module is provided by
+    the module that is last alphabetically.
+    """
+    assert formulary._find_submodule("quantum_theta") == "quantum"
+
+
+@pytest.mark.parametrize("name", formulary.__all__)
+def test_lazy_attribute(name) -> None:
+    """Test that each name in the formulary is found in its module."""
+    modname = formulary._find_submodule(name)
+    module = importlib.import_module(f"plasmapy.formulary.{modname}")
+    assert getattr(formulary, name) is getattr(module, name)
+
+
+def test_submodule_attributes() -> None:
+    """Test that the formulary modules are accessible as attributes."""
+    for modname in submodule_names:
+        assert getattr(formulary, modname).__name__ == f"plasmapy.formulary.{modname}"
+
+
+@pytest.mark.parametrize("dunder", ["__aliases__", "__lite_funcs__"])
+def test_aliases_and_lite_funcs(dunder) -> None:
+    """
+    Test that ``__aliases__`` and ``__lite_funcs__`` collect the
+    aliases and lite-functions of every formulary module.
+    """
+    expected = set()
+    for modname in submodule_names:
+        module = importlib.import_module(f"plasmapy.formulary.{modname}")
+        expected.update(getattr(module, dunder, []))
+    assert getattr(formulary, dunder) == sorted(expected)
+    assert set(getattr(formulary, dunder)) <= set(formulary.__all__)
+
+
+def test_dir_includes_lazy_names() -> None:
+    """Test that `dir` lists the names that have not been loaded yet."""
+    names = dir(formulary)
+    assert set(formulary.__all__) <= set(names)
+    assert set(submodule_names) <= set(names)
+
+
+def test_missing_attribute() -> None:
+    """Test that an unknown name raises an `AttributeError`."""
+    with pytest.raises(AttributeError, match="not_a_formula"):
+        formulary.not_a_formula  # noqa: B018
@@ -1,8 +1,14 @@
+import socket
+import sys
+from pathlib import Path
+
 import astropy.constants as const
 import astropy.units as u
+import h5py
 import numpy as np
 import pytest
 
+from plasmapy.particles import atomic
 from plasmapy.particles._isotopes import data_about_isotopes
 from plasmapy.particles.atomic import (
     _is_electron,
@@ -37,6 +43,7 @@
 from plasmapy.particles.particle_class import Particle
 from plasmapy.particles.symbols import atomic_symbol, element_name, isotope_symbol
 from plasmapy.utils._pytest_helpers import run_test
+from plasmapy.utils.data import downloader
 
 # function to be tested, argument(s), expected result/outcome
 
@@ -708,6 +715,133 @@ def test_stopping_power_no_interpolation() -> None:
     assert type(result) is tuple
 
 
+@pytest.fixture
+def fake_nist_star_file(tmp_path, monkeypatch):
+    """
+    Replace the NIST STAR data file with a small table of proton
+    stopping powers in hydrogen, and count how often the file is opened.
+    """
+    path = tmp_path / "NIST_STAR.hdf5"
+    energies = np.geomspace(1e-3, 1e3, 50)
+    with h5py.File(path, "w") as nist_data:
+        group = nist_data.create_group("protons")
+        group["energy"] = energies
+        group["HYDROGEN/electronic_stopping_power"] = 1e3 / energies
+        group["HYDROGEN/nuclear_stopping_power"] = 1e1 / energies**2
+
+    opened = []
+
+    def get_nist_star_path(offline=False):
+        opened.append(offline)
+        return path
+
+    atomic._clear_stopping_power_cache()
+    monkeypatch.setattr(atomic, "_get_nist_star_path", get_nist_star_path)
+    yield opened
+    atomic._clear_stopping_power_cache()
+
+
+@pytest.mark.usefixtures("fake_nist_star_file")
+@pytest.mark.parametrize(
+    ("component", "expected"),
+    [("total", 1e3 / 2 + 1e1 / 4), ("electronic", 1e3 / 2), ("nuclear", 1e1 / 4)],
+)
+def test_stopping_power_fake_table(component, expected) -> None:
+    energies = [2, 2] * u.MeV
+    _, values = stopping_power("p+", "HYDROGEN", energies, component=component)
+    assert u.allclose(values, expected * u.MeV * u.cm**2 / u.g, rtol=1e-6)
+
+    interpolator = stopping_power(
+        "p+", "HYDROGEN", return_interpolator=True, component=component
+    )
+    assert u.allclose(interpolator(energies), values)
+
+
+def test_stopping_power_reads_table_once(fake_nist_star_file) -> None:
+    """Test that the tables and interpolators are only loaded once."""
+    baseline_energies, table = stopping_power("p+", "HYDROGEN")
+    _, values = stopping_power("H+", "HYDROGEN", [1, 10] * u.MeV)
+    interpolator = stopping_power("p+", "HYDROGEN", return_interpolator=True)
+    assert fake_nist_star_file == [False]
+    assert len(atomic._stopping_power_splines) == 1
+    assert u.allclose(interpolator([1, 10] * u.MeV), values)
+
+    # the cached arrays are not shared with the returned quantities
+    table[0] = 0 * table.unit
+    baseline_energies_again, table_again = stopping_power("p+", "HYDROGEN")
+    assert u.allclose(baseline_energies_again, baseline_energies)
+    assert table_again[0] != 0
+
+    stopping_power("p+", "HYDROGEN", component="electronic", offline=True)
+    assert fake_nist_star_file == [False, True]
+    assert len(atomic._stopping_power_tables) == 2
+
+
+@pytest.mark.usefixtures("fake_nist_star_file")
+@pytest.mark.parametrize(
+    ("material", "component"), [("BENZENE", "total"), ("HYDROGEN", "Lorem Ipsum")]
+)
+def test_stopping_power_errors_are_not_cached(material, component) -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            stopping_power("p+", material, component=component)
+    assert not atomic._stopping_power_tables
+
+
+def test_get_nist_star_path_validates(monkeypatch) -> None:
+    """Test that the data file is validated when not offline."""
+    downloaders = []
+
+    class FakeDownloader:
+        def __init__(self, validate=True) -> None:
+            downloaders.append(validate)
+
+        def get_file(self, filename):
+            return filename
+
+    monkeypatch.setattr(downloader, "Downloader", FakeDownloader)
+    assert atomic._get_nist_star_path() == "NIST_STAR.hdf5"
+    assert downloaders == [True]
+
+
+@pytest.fixture
+def no_network(tmp_path, monkeypatch):
+    """
+    Use ``tmp_path`` as the home directory, block all network connections,
+    and forget that the downloader was imported, since it contacts the
+    GitHub API when it is imported.  Yields the blocked hosts.
+    """
+    blocked = []
+
+    def getaddrinfo(host, *args, **kwargs):
+        blocked.append(host)
+        raise OSError(f"network access to {host} is blocked")
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    monkeypatch.setattr(socket, "create_connection", getaddrinfo)
+    for module in ("plasmapy.utils.data", "plasmapy.utils.data.downloader"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    return blocked
+
+
+def test_get_nist_star_path_offline(tmp_path, no_network) -> None:
+    """Test that the offline mode makes no network connection."""
+    path = tmp_path / ".plasmapy" / "downloads" / "NIST_STAR.hdf5"
+    path.parent.mkdir(parents=True)
+    path.touch()
+
+    assert atomic._get_nist_star_path(offline=True) == path
+    assert not no_network
+    assert "plasmapy.utils.data.downloader" not in sys.modules
+
+
+def test_get_nist_star_path_offline_not_downloaded(no_network) -> None:
+    with pytest.raises(FileNotFoundError, match="offline=False"):
+        atomic._get_nist_star_path(offline=True)
+    assert not no_network
+
+
 def test_element_name_used_on_numpy_integer() -> None:
     """
     Test that `element_name` works when provided with a numpy.integer
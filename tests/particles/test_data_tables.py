@@ -0,0 +1,120 @@
+"""Tests for functionality contained in `plasmapy.particles._data_tables`."""
+
+import json
+import pkgutil
+
+import numpy as np
+import pytest
+
+from plasmapy.particles import _data_tables, _elements, _ionization_energy, _isotopes
+from plasmapy.particles._data_tables import DataTable
+
+tables = [
+    ("elements", _elements.element_obj_hook),
+    ("isotopes", _isotopes.isotope_obj_hook),
+    ("ionization_energy", _ionization_energy.ionization_energy_obj_hook),
+]
+
+
+def _assert_identical(actual, expected) -> None:
+    """Assert that two decoded JSON values are equal and of equal types."""
+    assert type(actual) is type(expected)
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected)
+        for key in expected:
+            _assert_identical(actual[key], expected[key])
+    else:
+        assert np.all(actual == expected)
+
+
+@pytest.mark.parametrize(("name", "object_hook"), tables)
+def test_data_table_matches_json_loads(name, object_hook) -> None:
+    """
+    Test that a `DataTable` has the same contents as the dictionary
+    created by decoding the whole JSON file with ``object_hook``.
+    """
+    source = pkgutil.get_data("plasmapy", f"particles/data/{name}.json")
+    expected = json.loads(source, object_hook=object_hook)
+    table = DataTable(name, object_hook)
+
+    assert len(table) == len(expected)
+    assert list(table) == list(expected)
+    for key, value in expected.items():
+        assert key in table
+        _assert_identical(table[key], value)
+
+
+@pytest.mark.parametrize("name", _data_tables._COMPILED_TABLES)
+def test_compiled_tables_are_up_to_date(name) -> None:
+    """
+    Test that :file:`particle_data.npz` was compiled from the current
+    JSON files.  If this test fails, run
+    ``python tools/compile_particle_data.py``.
+    """
+    source = pkgutil.get_data("plasmapy", f"particles/data/{name}.json")
+    compiled = _data_tables._load_compiled_records(name, source)
+    assert compiled is not None
+    records = json.loads(source)
+    assert list(compiled) == list(records)
+    for key, record in records.items():
+        _assert_identical(compiled[key], record)
+
+
+def test_out_of_date_compiled_table_is_not_used() -> None:
+    """Test that compiled columns are ignored if the JSON has changed."""
+    assert _data_tables._load_compiled_records("elements", b"{}") is None
+
+
+def test_compile_records_round_trip(tmp_path, monkeypatch) -> None:
+    """
+    Test that records with missing fields and fields with values of
+    several kinds are rebuilt exactly from the compiled columns.
+    """
+    records = {
+        "a": {"n": 1, "x": {"unit": "u", "value": 1.5}, "flag": True},
+        "b": {"n": 2.5, "x": "unknown", "name": "bee"},
+        "c": {"x": {"unit": "s", "value": 3.0}, "flag": False},
+        "d": {},
+    }
+    source = json.dumps(records).encode()
+    compiled = _data_tables._compile_records("test", records, source)
+    np.savez_compressed(tmp_path / "test.npz", **compiled)
+
+    def get_data(*args):
+        return (tmp_path / "test.npz").read_bytes()
+
+    monkeypatch.setattr(_data_tables.pkgutil, "get_data", get_data)
+    rebuilt = _data_tables._load_compiled_records("test", source)
+
+    assert list(rebuilt) == list(records)
+    for key, record in records.items():
+        assert rebuilt[key] == record
+        for field, value in record.items():
+            assert type(rebuilt[key][field]) is type(value)
+    assert "e" not in rebuilt
+
+
+def test_data_table_converts_on_lookup() -> None:
+    """
+    Test that entries are converted once, when they are first looked
+    up, and that membership tests do not convert entries.
+    """
+    calls = []
+
+    def object_hook(obj):
+        calls.append(obj)
+        return obj
+
+    table = DataTable("elements", object_hook)
+    assert "He" in table
+    assert "Xx" not in table
+    assert not calls
+
+    helium = table["He"]
+    number_of_calls = len(calls)
+    assert number_of_calls > 0
+    assert table["He"] is helium
+    assert len(calls) == number_of_calls
+
+    with pytest.raises(KeyError):
+        table["Xx"]
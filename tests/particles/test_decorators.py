@@ -9,7 +9,7 @@
 import astropy.units as u
 import pytest
 
-from plasmapy.particles.decorators import particle_input
+from plasmapy.particles.decorators import _ParticleInput, particle_input
 from plasmapy.particles.exceptions import (
     ChargeError,
     InvalidElementError,
@@ -787,3 +787,82 @@ def get_particle(
 
     with pytest.raises(exception):  # type: ignore[call-overload]
         get_particle(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "argument",
+    [Particle("He-4 2+"), "He-4 2+", ParticleList(["p+", "alpha"])],
+)
+def test_particle_input_accepts_verified_particles(monkeypatch, argument) -> None:
+    """
+    Test that the categorization criteria are only checked the first
+    time that a particle is passed to a decorated callable.
+    """
+    num_verifications = 0
+    verify = _ParticleInput.verify_particle_categorization
+
+    def counting_verify(self, particle):
+        nonlocal num_verifications
+        num_verifications += 1
+        return verify(self, particle)
+
+    monkeypatch.setattr(
+        _ParticleInput, "verify_particle_categorization", counting_verify
+    )
+
+    @particle_input(require="ion")
+    def get_particle(particle: ParticleLike | ParticleListLike, x: int = 1):
+        return particle
+
+    for _ in range(3):
+        assert get_particle(argument) == argument
+        assert get_particle(argument, x=2) == argument
+
+    assert num_verifications == 1
+
+
+def test_particle_input_accepted_particles_depend_on_criteria() -> None:
+    """
+    Test that a particle accepted for one set of criteria or for one
+    parameter is still checked against other criteria and parameters.
+    """
+
+    @particle_input(require="ion")
+    def get_ion(particle: ParticleLike):
+        return particle
+
+    @particle_input
+    def get_particles(particle: ParticleLike, isotope: ParticleLike):
+        return particle, isotope
+
+    proton = Particle("p+")
+    helium = Particle("He")
+    lithium_ion = Particle("Li 1+")
+
+    assert get_particles(helium, proton) == (helium, proton)
+    with pytest.raises(InvalidIsotopeError):
+        get_particles(proton, helium)
+
+    assert get_ion(lithium_ion) == lithium_ion
+    lithium_ion.recombine(inplace=True)
+    with pytest.raises(ParticleError):
+        get_ion(lithium_ion)
+
+    with pytest.raises(ParticleError):
+        get_ion(helium)
+    with pytest.raises(ParticleError):
+        get_ion(helium)
+
+
+def test_particle_input_accepted_particles_reset() -> None:
+    """Test that changing the criteria forgets the accepted particles."""
+
+    def get_particle(particle: ParticleLike):
+        return particle
+
+    particle_validator = _ParticleInput(get_particle, require="element")
+    particle_validator.process_arguments(("He",), {})
+    particle_validator.exclude = "noble gas"
+
+    with pytest.raises(ParticleError):
+        particle_validator.process_arguments(("He",), {})
@@ -9,7 +9,12 @@
 import pytest
 from astropy.constants import c, e, m_e, m_n, m_p
 
-from plasmapy.particles import json_load_particle, json_loads_particle, molecule
+from plasmapy.particles import (
+    json_load_particle,
+    json_loads_particle,
+    molecule,
+    particle_class,
+)
 from plasmapy.particles._isotopes import data_about_isotopes
 from plasmapy.particles.atomic import known_isotopes
 from plasmapy.particles.exceptions import (
@@ -892,6 +897,75 @@ def test_particleing_a_particle(arg) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("arg", "kwargs"),
+    [
+        ("p+", {}),
+        ("proton", {}),
+        ("He-4 2+", {}),
+        ("alpha", {}),
+        (26, {"Z": 3}),
+        ("Li", {}),
+    ],
+)
+def test_particle_state_cache(arg, kwargs) -> None:
+    """
+    Test that particles created from cached attributes and categories
+    match particles created from scratch, and do not share mutable state.
+    """
+    particle_class._clear_particle_states()
+    uncached = Particle(arg, **kwargs)
+    cached = Particle(arg, **kwargs)
+
+    assert cached is not uncached
+    assert cached._attributes is not uncached._attributes
+    assert cached._categories is not uncached._categories
+    assert dict(cached._attributes) == dict(uncached._attributes)
+    assert cached.categories == uncached.categories
+    assert cached == uncached
+
+    key = (Particle, arg, kwargs.get("mass_numb"), kwargs.get("Z"))
+    assert particle_class._get_particle_state(key) is not None
+
+
+def test_particle_state_cache_inplace() -> None:
+    """Test that changing a particle in place does not alter the cache."""
+    particle_class._clear_particle_states()
+    lithium = Particle("Li")
+    lithium.ionize(inplace=True)
+
+    assert lithium == Particle("Li 1+")
+    assert Particle("Li").symbol == "Li"
+    assert Particle("Li").categories.isdisjoint({"ion", "charged"})
+
+
+@pytest.mark.parametrize(
+    ("arg", "kwargs"), [("He-4", {"mass_numb": 4}), ("H----", {}), ("H", {"Z": -3})]
+)
+def test_particle_state_cache_warnings(arg, kwargs) -> None:
+    """Test that particles which warn on creation warn every time."""
+    particle_class._clear_particle_states()
+    for _ in range(2):
+        with pytest.warns(ParticleWarning):
+            Particle(arg, **kwargs)
+
+
+def test_particle_state_cache_is_bounded(monkeypatch) -> None:
+    """Test that uncommon particle arguments are evicted from the cache."""
+    particle_class._clear_particle_states()
+    monkeypatch.setattr(particle_class, "_RECENT_PARTICLE_STATES_MAXSIZE", 2)
+
+    for Z in range(1, 5):
+        Particle(26, Z=Z)
+    Particle("Fe 1+")
+
+    assert list(particle_class._recent_particle_states) == [
+        (Particle, 26, None, 3),
+        (Particle, 26, None, 4),
+    ]
+    assert (Particle, "Fe 1+", None, None) in particle_class._interned_particle_states
+
+
 @pytest.mark.parametrize(
     "key",
     [Particle("H"), Particle("e+"), CustomParticle(2 * 126.90447 * u.u, 0 * u.C, "I2")],
@@ -1714,3 +1788,38 @@ def test_infinite_ionization() -> None:
     helium = Particle("He-4 0+")
     pytest.raises(TypeError, helium.ionize, n=0.5)
     pytest.raises(ValueError, helium.ionize, n=-1)
+
+
+@pytest.mark.parametrize(
+    ("valid", "invalid"),
+    [
+        ((26, {"Z": 3}), (26.0, {"Z": 3})),
+        ((26, {"Z": 3}), (26, {"Z": 3.0})),
+        ((2, {"mass_numb": 4}), (2, {"mass_numb": 4.0})),
+    ],
+)
+def test_particle_state_cache_validates_inputs(valid, invalid) -> None:
+    """
+    Test that invalid inputs raise an exception even when they compare
+    equal to the inputs of a cached particle.
+    """
+    particle_class._clear_particle_states()
+    arg, kwargs = valid
+    Particle(arg, **kwargs)
+
+    arg, kwargs = invalid
+    with pytest.raises(TypeError):
+        Particle(arg, **kwargs)
+
+
+def test_particle_state_cache_copies_quantities() -> None:
+    """
+    Test that changing a quantity of a particle in place does not
+    change the cached attributes.
+    """
+    particle_class._clear_particle_states()
+    mass = Particle("alpha")._attributes["isotope mass"].copy()
+    cached = Particle("alpha")
+    cached._attributes["isotope mass"] *= 3
+
+    assert Particle("alpha")._attributes["isotope mass"] == mass
@@ -7,6 +7,7 @@
 import numpy as np
 import pytest
 from astropy.tests.helper import assert_quantity_allclose
+from scipy.spatial import distance
 
 from plasmapy.plasma import grids
 
@@ -779,6 +780,104 @@ def test_nonuniform_cartesian_nearest_neighbor_interpolator() -> None:
     assert np.allclose(pout1, pout2)
 
 
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+def test_nonuniform_cartesian_spatial_index_cached(nonuniform_cartesian_grid) -> None:
+    """
+    Test that the spatial index is built once per grid and is shared by
+    interpolations of different quantities.
+    """
+    pos = np.array([[0.1, -0.3, 0], [0.2, 0.5, 0.2]]) * u.cm
+    nonuniform_cartesian_grid.nearest_neighbor_interpolator(pos, "x")
+    spatial_index = nonuniform_cartesian_grid._spatial_index
+
+    nonuniform_cartesian_grid.nearest_neighbor_interpolator(pos, "y", "z")
+    nonuniform_cartesian_grid.inverse_distance_interpolator(pos, "rho")
+    assert nonuniform_cartesian_grid._spatial_index is spatial_index
+
+
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+def test_nonuniform_cartesian_spatial_index_workers(
+    nonuniform_cartesian_grid, monkeypatch
+) -> None:
+    """
+    Test that the spatial index is queried with one thread unless more
+    are requested, so that grids used in a pool of processes do not
+    oversubscribe the CPU cores.
+    """
+    grid = nonuniform_cartesian_grid
+    spatial_index = grid._spatial_index
+    query = spatial_index.query
+    workers = []
+
+    def counting_query(*args, **kwargs):
+        workers.append(kwargs.get("workers", 1))
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(spatial_index, "query", counting_query)
+    pos = np.array([[0.1, -0.3, 0], [0.2, 0.5, 0.2]]) * u.cm
+    expected = grid.nearest_neighbor_interpolator(pos, "x")
+    grid.inverse_distance_interpolator(pos, "x")
+    _ = grid.grid_resolution
+    assert workers == [1, 1, 1]
+
+    pout = grid.nearest_neighbor_interpolator(pos, "x", workers=-1)
+    grid.inverse_distance_interpolator(pos, "x", workers=2)
+    assert workers[3:] == [-1, 2]
+    assert np.allclose(pout, expected)
+
+
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+def test_nonuniform_cartesian_inverse_distance_interpolator(
+    nonuniform_cartesian_grid,
+) -> None:
+    grid = nonuniform_cartesian_grid
+
+    # Positions at grid points return the values at those grid points
+    pts = grid.grid[::7]
+    pout = grid.inverse_distance_interpolator(pts, "x", "z")
+    assert np.allclose(pout[0], pts[:, 0])
+    assert np.allclose(pout[1], pts[:, 2])
+
+    # A quantity that is constant on the grid is reproduced exactly,
+    # and out of bounds positions are NaN
+    grid.add_quantities(n_e=np.full(grid.shape, 3.0) * u.m**-3)
+    pos = np.array([[0.1, -0.3, 0], [0.2, 0.5, 0.2], [2, 0, 0]]) * u.cm
+    pout = grid.inverse_distance_interpolator(pos, "n_e", k=4, power=1)
+    assert np.allclose(pout, [3, 3, np.nan] * u.m**-3, equal_nan=True)
+
+    # Raw SI mode fills the provided output array
+    out = np.empty((3, 1))
+    pout = grid.inverse_distance_interpolator(pos, "x", si=True, out=out)
+    assert pout is out
+    assert np.isnan(out[2, 0])
+
+    # The result is the weighted average of the 8 nearest grid points
+    points = grid.grid.si.value.reshape(-1, 3)
+    for row, position in zip(out[:2, 0], pos[:2].si.value, strict=True):
+        distances = np.linalg.norm(points - position, axis=1)
+        nearest = np.argsort(distances)[:8]
+        weights = distances[nearest] ** -2
+        expected = np.sum(weights * points[nearest, 0]) / np.sum(weights)
+        assert np.isclose(row, expected, rtol=1e-12)
+
+    # With a single neighbor, the interpolator is a nearest neighbor
+    # interpolator
+    assert np.allclose(
+        grid.inverse_distance_interpolator(pos, "x", k=1),
+        grid.nearest_neighbor_interpolator(pos, "x"),
+        equal_nan=True,
+    )
+
+    with pytest.raises(ValueError, match="positive integer"):
+        grid.inverse_distance_interpolator(pos, "x", k=0)
+
+
 @pytest.mark.parametrize(
     ("pos", "what", "expected"),
     [
@@ -906,6 +1005,28 @@ def test_volume_averaged_interpolator_known_solutions() -> None:
     )
 
 
+def test_volume_averaged_interpolator_trilinear_exact() -> None:
+    # The interpolator is trilinear, so it must reproduce any field that is
+    # linear in each coordinate exactly, for several quantities at once
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=(5, 7, 9))
+    x, y, z = (grid.grids[i].to(u.m).value for i in range(3))
+
+    def field_1(x, y, z):
+        return 2 * x - 3 * y + 5 * z + 1
+
+    def field_2(x, y, z):
+        return x * y * z + x * y - 4 * z
+
+    grid.add_quantities(E_x=field_1(x, y, z) * u.V / u.m, B_y=field_2(x, y, z) * u.T)
+
+    rng = np.random.default_rng(seed=1)
+    pos = rng.uniform(-0.01, 0.01, size=(200, 3))
+    Ex, By = grid.volume_averaged_interpolator(pos * u.m, "E_x", "B_y")
+
+    assert np.allclose(Ex.to(u.V / u.m).value, field_1(*pos.T))
+    assert np.allclose(By.to(u.T).value, field_2(*pos.T))
+
+
 def test_volume_averaged_interpolator_compare_NN_1D(uniform_cartesian_grid) -> None:
     # Create a low resolution test grid and check that the volume-avg
     # interpolator returns a higher resolution version
@@ -963,6 +1084,46 @@ def test_volume_averaged_interpolator_compare_NN_3D(uniform_cartesian_grid) -> N
     assert va_error < nn_error
 
 
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+@pytest.mark.parametrize(
+    ("fixture", "method"),
+    [
+        ("uniform_cartesian_grid", "nearest_neighbor_interpolator"),
+        ("uniform_cartesian_grid", "volume_averaged_interpolator"),
+        ("nonuniform_cartesian_grid", "nearest_neighbor_interpolator"),
+    ],
+)
+def test_interpolator_si_mode(fixture, method, request) -> None:
+    """
+    Test that the "raw SI" interpolation mode returns the same values as
+    the default mode, as a single unitless array in SI units.
+    """
+    grid = request.getfixturevalue(fixture)
+    interpolator = getattr(grid, method)
+
+    pos = np.array([[0.1, -0.3, 0.2], [-0.25, -0.1, 0.8], [2.0, 0.0, 0.0]]) * u.cm
+    quantities = ("x", "rho")
+
+    expected = interpolator(pos, *quantities)
+    result = interpolator(pos.to(u.m).value, *quantities, persistent=True, si=True)
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (3, 2)
+    for j, quantity in enumerate(expected):
+        assert np.allclose(result[:, j], quantity.si.value, equal_nan=True)
+
+    # The result is written into a preallocated output array
+    out = np.zeros((3, 2))
+    result = interpolator(
+        pos.to(u.m).value, *quantities, persistent=True, si=True, out=out
+    )
+    assert result is out
+    for j, quantity in enumerate(expected):
+        assert np.allclose(out[:, j], quantity.si.value, equal_nan=True)
+
+
 @pytest.mark.filterwarnings(
     "ignore:.*MultiIndex.*:DeprecationWarning"
 )  # see issue 2319
@@ -984,6 +1145,9 @@ def test_NonUniformCartesianGrid() -> None:
 
     # Test grid resolution for non-uniform grids
     assert 0 * u.cm < grid.grid_resolution < 2 * u.cm
+    distances = distance.cdist(grid.grid, grid.grid)
+    np.fill_diagonal(distances, np.inf)
+    assert u.isclose(grid.grid_resolution, np.min(distances) * grid.unit)
 
     # Test that many properties are unavailable
     with pytest.raises(ValueError):
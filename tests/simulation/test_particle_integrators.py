@@ -0,0 +1,42 @@
+"""
+Tests for particle_integrators.py
+"""
+
+import numpy as np
+import pytest
+
+from plasmapy.simulation.particle_integrators import (
+    BorisIntegrator,
+    RelativisticBorisIntegrator,
+)
+
+rng = np.random.default_rng(seed=7)
+
+
+@pytest.mark.parametrize("integrator", [BorisIntegrator, RelativisticBorisIntegrator])
+@pytest.mark.parametrize("dt", [1e-9, np.full((10, 1), 1e-9)])
+def test_push_out_arguments(integrator, dt) -> None:
+    """
+    Test that writing the results of a push into preallocated arrays,
+    including the input arrays themselves, gives the same result as
+    allocating new arrays.
+    """
+    x = rng.uniform(-1, 1, size=(10, 3))
+    v = rng.uniform(-1e6, 1e6, size=(10, 3))
+    B = rng.uniform(-1, 1, size=(10, 3))
+    E = rng.uniform(-1e3, 1e3, size=(10, 3))
+    args = (B, E, 1.6e-19, 1.67e-27, dt)
+
+    x_expected, v_expected = integrator.push(x, v, *args)
+
+    x_out, v_out = np.empty_like(x), np.empty_like(v)
+    x_new, v_new = integrator.push(x, v, *args, out=(x_out, v_out))
+    assert x_new is x_out
+    assert v_new is v_out
+    assert np.allclose(x_out, x_expected)
+    assert np.allclose(v_out, v_expected)
+
+    # Push in place
+    integrator.push(x, v, *args, out=(x, v))
+    assert np.allclose(x, x_expected)
+    assert np.allclose(v, v_expected)
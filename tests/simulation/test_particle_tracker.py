@@ -7,6 +7,7 @@
 
 import astropy.constants as const
 import astropy.units as u
+import h5py
 import numpy as np
 import pytest
 from hypothesis import given, settings
@@ -20,7 +21,10 @@
 from plasmapy.plasma.grids import CartesianGrid
 from plasmapy.simulation.particle_integrators import BorisIntegrator
 from plasmapy.simulation.particle_tracker.particle_tracker import ParticleTracker
-from plasmapy.simulation.particle_tracker.save_routines import IntervalSaveRoutine
+from plasmapy.simulation.particle_tracker.save_routines import (
+    IntervalSaveRoutine,
+    StreamingIntervalSaveRoutine,
+)
 from plasmapy.simulation.particle_tracker.termination_conditions import (
     NoParticlesOnGridsTerminationCondition,
     TimeElapsedTerminationCondition,
@@ -452,6 +456,176 @@ def test_setup_adaptive_time_step(
     simulation.run()
 
 
+class _CountingBorisIntegrator(BorisIntegrator):
+    """A Boris integrator that counts the number of particle pushes."""
+
+    num_pushes = 0
+
+    @staticmethod
+    def push(x, v, B, E, q, m, dt, out=None):
+        _CountingBorisIntegrator.num_pushes += x.shape[0]
+        return BorisIntegrator.push(x, v, B, E, q, m, dt, out=out)
+
+
+def _run_mixed_field_simulation(max_subcycling_level: int) -> ParticleTracker:
+    """
+    Run a simulation with a synchronized adaptive time step where half of
+    the grid has a much stronger magnetic field than the other half.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=20)
+    Bz = np.where(grid.grids[0].value < 0, 1.0, 1e-3) * u.T
+    grid.add_quantities(B_z=Bz)
+
+    num_particles = 50
+    rng = np.random.default_rng(seed=1)
+    x = np.zeros((num_particles, 3))
+    x[:, 0] = rng.uniform(-0.8, 0.8, size=num_particles)
+    x[:, 1] = rng.uniform(-0.5, 0.5, size=num_particles)
+    v = np.zeros((num_particles, 3))
+    v[:, 1] = 1e4
+
+    _CountingBorisIntegrator.num_pushes = 0
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="Quantities should go to zero at edges of grid"
+        )
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(5e-6 * u.s),
+            particle_integrator=_CountingBorisIntegrator,
+            dt_range=[0, 2.5e-7] * u.s,
+            field_weighting="nearest neighbor",
+            verbose=False,
+        )
+
+    simulation.setup_adaptive_time_step(max_subcycling_level=max_subcycling_level)
+    simulation.load_particles(x * u.m, v * u.m / u.s, Particle("p+"))
+    simulation.run()
+
+    return simulation
+
+
+def test_adaptive_time_step_subcycling() -> None:
+    """
+    Test that sub-cycling pushes the particles in weak fields less often,
+    while keeping them synchronized and close to the trajectories found
+    with the smallest time step.
+    """
+    reference = _run_mixed_field_simulation(max_subcycling_level=0)
+    reference_pushes = _CountingBorisIntegrator.num_pushes
+
+    subcycled = _run_mixed_field_simulation(max_subcycling_level=8)
+    subcycled_pushes = _CountingBorisIntegrator.num_pushes
+
+    assert subcycled_pushes < 0.8 * reference_pushes
+    assert subcycled.iteration_number < reference.iteration_number
+    assert np.isscalar(subcycled.time)
+    assert subcycled.time >= 5e-6
+    assert np.allclose(subcycled.x, reference.x, atol=5e-3)
+
+
+def test_adaptive_time_step_subcycling_error(
+    time_elapsed_termination_condition_instantiated,
+) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    simulation = ParticleTracker(
+        grid, time_elapsed_termination_condition_instantiated, verbose=False
+    )
+
+    with pytest.raises(ValueError, match="maximum sub-cycling level"):
+        simulation.setup_adaptive_time_step(max_subcycling_level=-1)
+
+
+def _run_ensemble_member_simulation(
+    x, v, E_scale=1.0, B_scale=1.0, ensemble=None, **run_kwargs
+) -> ParticleTracker:
+    """
+    Run a simulation in uniform electric and magnetic fields, either for a
+    single field configuration or for an ensemble loaded with the keyword
+    arguments in ``ensemble``.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=5)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 10.0 * E_scale) * u.V / u.m,
+        B_z=np.full(grid.shape, 1.0 * B_scale) * u.T,
+    )
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="Quantities should go to zero at edges of grid"
+        )
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(1e-6 * u.s),
+            dt=1e-9 * u.s,
+            field_weighting="nearest neighbor",
+            verbose=False,
+        )
+
+    if ensemble is None:
+        simulation.load_particles(x, v, Particle("p+"))
+    else:
+        simulation.load_ensemble(x, v, Particle("p+"), **ensemble)
+    simulation.run(**run_kwargs)
+
+    return simulation
+
+
+@pytest.mark.parametrize("run_kwargs", [{}, {"n_workers": 2}])
+def test_particle_tracker_ensemble(run_kwargs) -> None:
+    """
+    Test that each member of an ensemble matches a separate simulation
+    with the same scaled fields and particle positions.
+    """
+    rng = np.random.default_rng(seed=2)
+    x = rng.uniform(-0.01, 0.01, size=(4, 3)) * u.m
+    v = rng.uniform(-1e4, 1e4, size=(4, 3)) * u.m / u.s
+
+    E_scale = [0.5, 1.0, 2.0]
+    B_scale = [1.0, 0.1, 3.0]
+    source_offsets = np.array([[0, 0, 0], [0.1, 0, 0], [0, -0.2, 0]]) * u.m
+    x_members = x + source_offsets[:, np.newaxis, :]
+
+    ensemble = _run_ensemble_member_simulation(
+        x_members,
+        v,
+        ensemble={"E_scale": E_scale, "B_scale": B_scale},
+        **run_kwargs,
+    )
+
+    assert ensemble.num_ensemble_members == 3
+    assert ensemble.num_particles == 12
+    assert ensemble.x_ensemble.shape == (3, 4, 3)
+
+    for k in range(3):
+        member = _run_ensemble_member_simulation(
+            x_members[k], v, E_scale=E_scale[k], B_scale=B_scale[k]
+        )
+
+        assert np.allclose(ensemble.x_ensemble[k], member.x)
+        assert np.allclose(ensemble.v_ensemble[k], member.v)
+
+
+def test_particle_tracker_ensemble_errors(
+    time_elapsed_termination_condition_instantiated,
+) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    simulation = ParticleTracker(
+        grid, time_elapsed_termination_condition_instantiated, verbose=False
+    )
+
+    x = np.zeros((2, 5, 3)) * u.m
+    v = np.zeros((5, 3)) * u.m / u.s
+    with pytest.raises(ValueError, match="different numbers of ensemble members"):
+        simulation.load_ensemble(x, v, "p+", E_scale=[1, 2, 3])
+
+    simulation.load_particles(x[0], v, "p+")
+    assert simulation.num_ensemble_members is None
+    with pytest.raises(ValueError, match="not loaded as an ensemble"):
+        simulation.x_ensemble  # noqa: B018
+
+
 def test_particle_tracker_stop_particles(request) -> None:
     E_strength = 1 * u.V / u.m
     L = 1 * u.m
@@ -514,6 +688,246 @@ def test_particle_tracker_stop_particles(request) -> None:
     assert np.isnan(simulation.x[0, :]).all()
 
 
+@pytest.mark.parametrize("dt", [1e-9 * u.s, None])
+def test_particle_tracker_compact_particles(dt) -> None:
+    """
+    Test that compacting the tracked particles gives the same results as
+    masking them, when particles are stopped during the run.
+    """
+    L = 1 * u.m
+    num = 3
+    num_particles = 20
+    grid_shape = (num,) * 3
+
+    rng = np.random.default_rng(seed=0)
+    x = rng.uniform(-0.5, 0.5, size=(num_particles, 3)) * u.m
+    directions = rng.normal(size=(num_particles, 3))
+    directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+    speeds = np.geomspace(1e5, 3e7, num=num_particles)[:, np.newaxis]
+    v = directions * speeds * u.m / u.s
+
+    simulations = []
+    for compact_particles in (False, True):
+        grid = CartesianGrid(-L, L, num=num)
+        grid.add_quantities(
+            n_e=np.full(grid_shape, 1e29) * u.m**-3,
+            B_z=np.full(grid_shape, 0.05) * u.T,
+            E_x=np.full(grid_shape, 1e3) * u.V / u.m,
+        )
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=PhysicsWarning)
+            warnings.filterwarnings(
+                "ignore", message="Quantities should go to zero at edges of grid"
+            )
+            simulation = ParticleTracker(
+                grid,
+                TimeElapsedTerminationCondition(5e-8 * u.s),
+                dt=dt,
+                field_weighting="nearest neighbor",
+                verbose=False,
+                compact_particles=compact_particles,
+            )
+            simulation.load_particles(x, v, Particle("p+"))
+            simulation.add_stopping(method="Bethe", I=[166 * u.eV])
+            simulation.run()
+
+        simulations.append(simulation)
+
+    masked, compacted = simulations
+
+    assert masked.num_particles_stopped > 0
+    assert compacted._tracked_particle_indices is None
+    assert masked.iteration_number == compacted.iteration_number
+    assert masked.num_entered == compacted.num_entered
+    assert masked.num_particles_tracked == compacted.num_particles_tracked
+    assert np.array_equal(masked.x, compacted.x, equal_nan=True)
+    assert np.array_equal(masked.v, compacted.v, equal_nan=True)
+    assert np.array_equal(masked.on_any_grid, compacted.on_any_grid)
+
+
+def _run_stopping_simulation(
+    save_routine=None, checkpoint_path=None, resume_path=None, **run_kwargs
+) -> ParticleTracker:
+    """
+    Run a simulation in which some particles are stopped.
+
+    If ``checkpoint_path`` is provided, checkpoints are written during the
+    run. If ``resume_path`` is provided, the simulation is resumed from that
+    checkpoint instead of being run from the start.
+    """
+    L = 1 * u.m
+    num = 3
+    num_particles = 20
+    grid_shape = (num,) * 3
+
+    grid = CartesianGrid(-L, L, num=num)
+    grid.add_quantities(
+        n_e=np.full(grid_shape, 1e29) * u.m**-3,
+        B_z=np.full(grid_shape, 0.05) * u.T,
+        E_x=np.full(grid_shape, 1e3) * u.V / u.m,
+    )
+
+    rng = np.random.default_rng(seed=0)
+    x = rng.uniform(-0.5, 0.5, size=(num_particles, 3)) * u.m
+    directions = rng.normal(size=(num_particles, 3))
+    directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+    speeds = np.geomspace(1e5, 3e7, num=num_particles)[:, np.newaxis]
+    v = directions * speeds * u.m / u.s
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(5e-8 * u.s),
+            IntervalSaveRoutine(1e-8 * u.s) if save_routine is None else save_routine,
+            dt=1e-9 * u.s,
+            verbose=False,
+        )
+        simulation.load_particles(x, v, Particle("p+"))
+        simulation.add_stopping(method="Bethe", I=[166 * u.eV])
+
+        if checkpoint_path is not None:
+            simulation.setup_checkpointing(checkpoint_path, interval=7)
+
+        if resume_path is not None:
+            simulation.resume(resume_path)
+        else:
+            simulation.run(**run_kwargs)
+
+    return simulation
+
+
+@pytest.mark.parametrize(
+    "run_kwargs",
+    [{"n_workers": 2}, {"n_workers": 3, "chunk_size": 4}, {"chunk_size": 6}],
+)
+def test_particle_tracker_run_in_chunks(run_kwargs) -> None:
+    """
+    Test that pushing the particles in chunks with a pool of processes
+    gives the same results and saved snapshots as a serial run.
+    """
+    serial = _run_stopping_simulation()
+    chunked = _run_stopping_simulation(**run_kwargs)
+
+    assert serial.num_particles_stopped > 0
+    assert serial.iteration_number == chunked.iteration_number
+    assert serial.time == chunked.time
+    assert serial.num_entered == chunked.num_entered
+    assert np.array_equal(serial.x, chunked.x, equal_nan=True)
+    assert np.array_equal(serial.v, chunked.v, equal_nan=True)
+
+    serial_results = serial.save_routine.results
+    chunked_results = chunked.save_routine.results
+    for quantity in ("time", "x", "v"):
+        assert np.array_equal(
+            serial_results[quantity], chunked_results[quantity], equal_nan=True
+        )
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_particle_tracker_checkpoint_resume(tmp_path, streaming) -> None:
+    """
+    Test that resuming a simulation from a checkpoint gives the same results
+    and saved snapshots as an uninterrupted run.
+    """
+
+    def save_routine():
+        if streaming:
+            return StreamingIntervalSaveRoutine(1e-8 * u.s, output_directory=tmp_path)
+        return IntervalSaveRoutine(1e-8 * u.s)
+
+    checkpoint_path = tmp_path / "checkpoint.h5"
+
+    uninterrupted = _run_stopping_simulation(
+        save_routine(), checkpoint_path=checkpoint_path
+    )
+    expected_results = uninterrupted.save_routine.results
+
+    with h5py.File(checkpoint_path, "r") as checkpoint:
+        assert checkpoint.attrs["iteration_number"] == 49
+
+    resumed = _run_stopping_simulation(save_routine(), resume_path=checkpoint_path)
+
+    assert resumed.num_particles_stopped > 0
+    assert resumed.iteration_number == uninterrupted.iteration_number
+    assert resumed.time == uninterrupted.time
+    assert resumed.num_entered == uninterrupted.num_entered
+    assert np.array_equal(resumed.x, uninterrupted.x, equal_nan=True)
+    assert np.array_equal(resumed.v, uninterrupted.v, equal_nan=True)
+
+    resumed_results = resumed.save_routine.results
+    for quantity in ("time", "x", "v"):
+        assert np.array_equal(
+            resumed_results[quantity], expected_results[quantity], equal_nan=True
+        )
+
+
+def test_particle_tracker_checkpoint_errors(
+    tmp_path, no_particles_on_grids_instantiated
+) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+
+    simulation = ParticleTracker(
+        grid, no_particles_on_grids_instantiated, dt=1e-2 * u.s, verbose=False
+    )
+    simulation.load_particles([[0, 0, 0]] * u.m, [[1, 0, 0]] * u.m / u.s, "p+")
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        simulation.setup_checkpointing(tmp_path / "checkpoint.h5", interval=0)
+
+    simulation.setup_checkpointing(tmp_path / "checkpoint.h5", interval=1)
+    with pytest.raises(ValueError, match="not supported when the particles"):
+        simulation.run(n_workers=2)
+
+    simulation.run()
+
+    other_simulation = ParticleTracker(
+        grid, NoParticlesOnGridsTerminationCondition(), dt=1e-2 * u.s, verbose=False
+    )
+    other_simulation.load_particles(
+        [[0, 0, 0], [0, 0, 0]] * u.m, [[1, 0, 0], [1, 0, 0]] * u.m / u.s, "p+"
+    )
+    with pytest.raises(ValueError, match="does not match the loaded particles"):
+        other_simulation.resume(tmp_path / "checkpoint.h5")
+
+
+@pytest.mark.parametrize(
+    ("run_kwargs", "match"),
+    [
+        ({"n_workers": 0}, "n_workers must be a positive integer"),
+        ({"chunk_size": -1}, "chunk_size must be a positive integer"),
+    ],
+)
+def test_particle_tracker_run_in_chunks_errors(
+    run_kwargs, match, no_particles_on_grids_instantiated
+) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+
+    simulation = ParticleTracker(
+        grid, no_particles_on_grids_instantiated, verbose=False
+    )
+    simulation.load_particles([[0, 0, 0]] * u.m, [[1, 0, 0]] * u.m / u.s, "p+")
+
+    with pytest.raises(ValueError, match=match):
+        simulation.run(**run_kwargs)
+
+
+def test_particle_tracker_run_in_chunks_adaptive_interval_save_error() -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+
+    simulation = ParticleTracker(
+        grid,
+        TimeElapsedTerminationCondition(1 * u.s),
+        IntervalSaveRoutine(0.1 * u.s),
+        verbose=False,
+    )
+    simulation.load_particles([[0, 0, 0]] * u.m, [[1, 0, 0]] * u.m / u.s, "p+")
+
+    with pytest.raises(ValueError, match="require a fixed time step"):
+        simulation.run(n_workers=2)
+
+
 @pytest.mark.parametrize(
     ("kwargs", "expected_error", "match_string"),
     [
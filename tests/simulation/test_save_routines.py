@@ -11,7 +11,11 @@
 from plasmapy.particles import CustomParticle
 from plasmapy.plasma.grids import CartesianGrid
 from plasmapy.simulation.particle_tracker.particle_tracker import ParticleTracker
-from plasmapy.simulation.particle_tracker.save_routines import IntervalSaveRoutine
+from plasmapy.simulation.particle_tracker.save_routines import (
+    IntervalSaveRoutine,
+    StreamingIntervalSaveRoutine,
+    TrajectoryReader,
+)
 from plasmapy.simulation.particle_tracker.termination_conditions import (
     NoParticlesOnGridsTerminationCondition,
     TimeElapsedTerminationCondition,
@@ -84,3 +88,81 @@ def test_interval_save_routine(request, stop_condition, save_routine) -> None:
         # Ignore warning raises by this special small grid
         warnings.filterwarnings("ignore", message="Quantities should go to zero")
         simulation.run()
+
+
+def _run_interval_save_simulation(save_routine) -> None:
+    rng = np.random.default_rng(seed=3)
+    x = rng.uniform(-0.5, 0.5, size=(5, 3)) * u.m
+    v = rng.uniform(-1, 1, size=(5, 3)) * u.m / u.s
+    point_particle = CustomParticle(1 * u.kg, 1 * u.C)
+
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(B_z=np.full((3, 3, 3), 1) * u.T)
+
+    simulation = ParticleTracker(
+        grid,
+        TimeElapsedTerminationCondition(2 * u.s),
+        save_routine,
+        dt=1e-2 * u.s,
+        field_weighting="nearest neighbor",
+    )
+    simulation.load_particles(x, v, point_particle)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Quantities should go to zero")
+        simulation.run()
+
+
+@pytest.mark.parametrize("compression", ["lzf", None])
+def test_streaming_interval_save_routine(tmp_path, compression) -> None:
+    """
+    Test that streaming the snapshots to disk saves the same snapshots as
+    keeping them in memory, and that they can be read back lazily.
+    """
+    memory_save_routine = IntervalSaveRoutine(0.1 * u.s)
+    _run_interval_save_simulation(memory_save_routine)
+
+    streaming_save_routine = StreamingIntervalSaveRoutine(
+        0.1 * u.s,
+        output_directory=tmp_path,
+        output_basename="trajectory",
+        compression=compression,
+        max_queued_snapshots=2,
+    )
+    _run_interval_save_simulation(streaming_save_routine)
+
+    assert streaming_save_routine.path == tmp_path / "trajectory.h5"
+    assert not streaming_save_routine._results
+
+    expected = memory_save_routine.results
+    results = streaming_save_routine.results
+    for quantity in ("time", "x", "v"):
+        assert u.allclose(results[quantity], expected[quantity])
+
+    with TrajectoryReader(streaming_save_routine.path) as reader:
+        assert reader.num_snapshots == len(expected["time"])
+        assert sorted(reader.quantities) == ["time", "v", "x"]
+        assert reader["x"].shape == (reader.num_snapshots, 5, 3)
+
+        x = reader.read("x", snapshots=slice(-3, None), particles=[4, 1, 4])
+        assert u.allclose(x, expected["x"][-3:, [4, 1, 4]])
+
+        v = reader.read("v", snapshots=2, particles=[3, 0])
+        assert u.allclose(v, expected["v"][2, [3, 0]])
+
+        time = reader.read("time", snapshots=slice(0, 2), particles=[1])
+        assert u.allclose(time, expected["time"][:2])
+
+
+def test_streaming_interval_save_routine_errors(tmp_path) -> None:
+    with pytest.raises(ValueError, match="positive integer"):
+        StreamingIntervalSaveRoutine(
+            0.1 * u.s, output_directory=tmp_path, max_queued_snapshots=0
+        )
+
+    # A missing output directory is reported once the run finishes
+    save_routine = StreamingIntervalSaveRoutine(
+        0.1 * u.s, output_directory=tmp_path / "missing"
+    )
+    with pytest.raises(OSError, match="Writing the trajectory"):
+        _run_interval_save_simulation(save_routine)
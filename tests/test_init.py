@@ -0,0 +1,69 @@
+"""Tests for the lazy loading of the subpackages of `plasmapy`."""
+
+import subprocess
+import sys
+
+import pytest
+
+import plasmapy
+
+subpackages = sorted(plasmapy._subpackages)
+
+
+def _modules_imported_by(statement: str) -> set[str]:
+    """Return the modules imported by ``statement`` in a new interpreter."""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("subpackage", subpackages)
+def test_subpackage_attribute(subpackage) -> None:
+    """Test that the subpackages are accessible as attributes."""
+    assert getattr(plasmapy, subpackage).__name__ == f"plasmapy.{subpackage}"
+    assert subpackage in dir(plasmapy)
+
+
+def test_missing_attribute() -> None:
+    """Test that an unknown name raises an `AttributeError`."""
+    with pytest.raises(AttributeError, match="not_a_subpackage"):
+        plasmapy.not_a_subpackage  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    ("statement", "unexpected"),
+    [
+        ("import plasmapy", {f"plasmapy.{name}" for name in subpackages}),
+        (
+            "import plasmapy.formulary",
+            {"plasmapy.formulary.speeds", "plasmapy.particles"},
+        ),
+        (
+            "from plasmapy.formulary import thermal_speed",
+            {"plasmapy.formulary.braginskii", "plasmapy.analysis", "lmfit"},
+        ),
+        (
+            "import plasmapy.particles",
+            {
+                "h5py",
+                "lmfit",
+                "matplotlib",
+                "plasmapy.formulary",
+                "plasmapy.utils.data.downloader",
+                "requests",
+                "scipy.interpolate",
+            },
+        ),
+    ],
+)
+def test_lazy_imports(statement, unexpected) -> None:
+    """
+    Test that importing part of PlasmaPy does not import unrelated
+    subpackages or optional heavy dependencies.
+    """
+    assert not _modules_imported_by(statement) & unexpected
@@ -20,6 +20,7 @@
     CheckUnits,
     CheckValues,
     _check_relativistic,
+    _compile_argument_binder,
     check_relativistic,
     check_units,
     check_values,
@@ -54,6 +55,65 @@ def test_checks(self) -> None:
             assert cb.checks == case["output"]
 
 
+def _binder_foo(x, y, z=3, *, w=4, v):
+    return x, y, z, w, v
+
+
+def _binder_foo_pos_only(x, /, y=2):
+    return x, y
+
+
+def _binder_foo_stars(x, *args, y=2, **kwargs):
+    return x, args, y, kwargs
+
+
+@pytest.mark.parametrize(
+    ("function", "args", "kwargs"),
+    [
+        (_binder_foo, (1, 2), {"v": 5}),
+        (_binder_foo, (1, 2, 6), {"v": 5, "w": 7}),
+        (_binder_foo, (1,), {"y": 2, "v": 5}),
+        (_binder_foo, (), {"v": 5, "z": 6, "y": 2, "x": 1}),
+        (_binder_foo_pos_only, (1,), {}),
+        (_binder_foo_pos_only, (1, 5), {}),
+        (_binder_foo_stars, (1, 2, 3), {"y": 4, "u": 5}),
+    ],
+)
+def test_compile_argument_binder(function, args, kwargs) -> None:
+    """
+    Test the argument binder used by the 'check' decorators maps arguments
+    the same way as `inspect.Signature.bind`.
+    """
+    signature = inspect.signature(function)
+    bound_args = signature.bind(*args, **kwargs)
+    bound_args.apply_defaults()
+
+    arguments = _compile_argument_binder(signature)(args, kwargs)
+    assert arguments == bound_args.arguments
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((1, 2, 3, 4), {"v": 5}),
+        ((1, 2), {}),
+        ((1, 2), {"v": 5, "x": 1}),
+        ((1, 2), {"v": 5, "u": 6}),
+    ],
+)
+def test_compile_argument_binder_errors(args, kwargs) -> None:
+    """
+    Test the argument binder raises the same `TypeError` as
+    `inspect.Signature.bind` for arguments that do not match the signature.
+    """
+    signature = inspect.signature(_binder_foo)
+    with pytest.raises(TypeError) as expected:
+        signature.bind(*args, **kwargs)
+
+    with pytest.raises(TypeError, match=str(expected.value)):
+        _compile_argument_binder(signature)(args, kwargs)
+
+
 # ----------------------------------------------------------------------------------------
 # Test Decorator class `CheckValues` and decorator `check_values`
 # ----------------------------------------------------------------------------------------
@@ -686,6 +746,24 @@ def bar(self, x) -> u.cm:
         foo = Foo(10.0 * u.cm)
         assert foo.bar(-3 * u.cm) == 7 * u.cm
 
+    def test_cu_compiles_checks_once(self) -> None:
+        """
+        Test `CheckUnits.__call__` builds the unit checks on the first call
+        and reuses them on later calls.
+        """
+        with mock.patch.object(
+            CheckUnits,
+            "_get_unit_checks",
+            autospec=True,
+            side_effect=CheckUnits._get_unit_checks,
+        ) as mock_get:
+            wfoo = CheckUnits(x=u.cm, y=u.cm, checks_on_return=u.cm)(self.foo_no_anno)
+            assert wfoo(2 * u.cm, 3 * u.cm) == 5 * u.cm
+            assert wfoo(2 * u.cm, y=3 * u.cm) == 5 * u.cm
+            with pytest.raises(u.UnitTypeError):
+                wfoo(2 * u.cm, 3 * u.s)
+            assert mock_get.call_count == 1
+
     def test_cu_preserves_signature(self) -> None:
         """Test `CheckValues` preserves signature of wrapped function."""
         # I'd like to directly test the @preserve_signature is used (??)
@@ -1186,6 +1264,24 @@ def bar(self, x):
         with pytest.raises(ValueError):
             foo.bar(1)
 
+    def test_cv_compiles_checks_once(self) -> None:
+        """
+        Test `CheckValues.__call__` builds the value checks on the first call
+        and reuses them on later calls.
+        """
+        with mock.patch.object(
+            CheckValues,
+            "_get_value_checks",
+            autospec=True,
+            side_effect=CheckValues._get_value_checks,
+        ) as mock_get:
+            wfoo = CheckValues(x={"can_be_negative": False})(self.foo)
+            assert wfoo(2, 3) == 5
+            assert wfoo(2, y=3) == 5
+            with pytest.raises(ValueError):
+                wfoo(-2, 3)
+            assert mock_get.call_count == 1
+
     def test_cv_preserves_signature(self) -> None:
         """Test CheckValues preserves signature of wrapped function."""
         # I'd like to directly test the @preserve_signature is used (??)
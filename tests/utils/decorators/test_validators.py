@@ -455,6 +455,18 @@ def test_vq_called_as_decorator(self) -> None:
             assert mock_vq_get.call_count == 1
             assert mock_vq_validate.call_count == len(validations)
 
+        # validations are built on the first call and reused afterwards
+        with mock.patch.object(
+            ValidateQuantities,
+            "_get_validations",
+            autospec=True,
+            side_effect=ValidateQuantities._get_validations,
+        ) as mock_vq_get:
+            wfoo = ValidateQuantities(x=u.cm, validations_on_return=u.m)(self.foo)
+            assert wfoo(5 * u.cm).unit == u.m
+            assert wfoo(x=5 * u.km) == 5 * u.km
+            assert mock_vq_get.call_count == 1
+
         # validation 'checks_on_return' not allowed
         with pytest.raises(TypeError):
             ValidateQuantities(checks_on_return=u.cm)
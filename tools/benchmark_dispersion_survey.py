@@ -0,0 +1,119 @@
+"""
+Benchmark solving the two fluid and kinetic Alfvén dispersion relations
+for a survey of solar-wind-like plasmas.
+
+Each plasma has its own magnetic field, ion density, and temperatures,
+and the dispersion relations are solved on the same grid of wavenumbers
+and propagation angles for every plasma.  The survey is solved by
+calling `~plasmapy.dispersion.analytical.two_fluid_.two_fluid` and
+`~plasmapy.dispersion.numerical.kinetic_alfven_.kinetic_alfven` once per
+plasma, and by calling their lite-functions once for the whole survey
+with `numpy.ndarray` and with `xarray.DataArray` arguments.
+
+Run from the repository root with:
+
+    python tools/benchmark_dispersion_survey.py
+"""
+
+import time
+import warnings
+
+import astropy.units as u
+import numpy as np
+import xarray as xr
+
+from plasmapy.dispersion.analytical.two_fluid_ import two_fluid
+from plasmapy.dispersion.numerical.kinetic_alfven_ import kinetic_alfven
+from plasmapy.particles import Particle
+from plasmapy.utils.exceptions import PhysicsWarning
+
+proton = Particle("p+")
+
+
+def solar_wind(num: int) -> dict[str, np.ndarray]:
+    """Return the parameters of ``num`` random solar-wind-like plasmas."""
+    rng = np.random.default_rng(seed=1)
+    return {
+        "B": rng.lognormal(np.log(6e-9), 0.3, size=num),
+        "n_i": rng.lognormal(np.log(5e6), 0.5, size=num),
+        "T_e": rng.lognormal(np.log(1.5e5), 0.3, size=num),
+        "T_i": rng.lognormal(np.log(1e5), 0.5, size=num),
+    }
+
+
+def looped(function, plasmas, k, theta) -> np.ndarray:
+    """Solve the dispersion relation with one call per plasma."""
+    solutions = []
+    for B, n_i, T_e, T_i in zip(*plasmas.values(), strict=True):
+        omega = function(
+            B=B * u.T,
+            ion=proton,
+            k=k * u.rad / u.m,
+            n_i=n_i * u.m**-3,
+            theta=theta,
+            T_e=T_e * u.K,
+            T_i=T_i * u.K,
+        )
+        solutions.append(np.array([val.value for val in omega.values()]))
+    return np.array(solutions)
+
+
+def vectorized(function, plasmas, k, theta) -> np.ndarray:
+    """Solve the dispersion relation for all plasmas with one call."""
+    plasmas = {key: val[:, np.newaxis, np.newaxis] for key, val in plasmas.items()}
+    return function.lite(
+        k=k[:, np.newaxis],
+        theta=theta.to_value(u.rad),
+        m_i=proton.mass.value,
+        Z=proton.charge_number,
+        **plasmas,
+    )
+
+
+def labeled(function, plasmas, k, theta) -> xr.DataArray:
+    """Solve the dispersion relation for all plasmas with labeled arrays."""
+    plasmas = {key: xr.DataArray(val, dims="sample") for key, val in plasmas.items()}
+    return function.lite(
+        k=xr.DataArray(k, dims="k"),
+        theta=xr.DataArray(theta.to_value(u.rad), dims="theta"),
+        m_i=proton.mass.value,
+        Z=proton.charge_number,
+        **plasmas,
+    )
+
+
+def main(num: int = 2000) -> None:
+    """Run the benchmarks."""
+    plasmas = solar_wind(num)
+    k = np.geomspace(1e-7, 1e-4, 64)
+    theta = np.linspace(5, 85, 17) * u.deg
+    print(f"{num} plasmas on a grid of {k.size} x {theta.size} (k, theta)")
+
+    for function in (two_fluid, kinetic_alfven):
+        print(function.__name__)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=PhysicsWarning)
+            start = time.perf_counter()
+            expected = looped(function, plasmas, k, theta)
+            print(f"  {'one call per plasma':<28}{time.perf_counter() - start:>8.3f} s")
+
+        start = time.perf_counter()
+        omega = vectorized(function, plasmas, k, theta)
+        print(f"  {'lite, ndarray':<28}{time.perf_counter() - start:>8.3f} s")
+
+        start = time.perf_counter()
+        labeled(function, plasmas, k, theta)
+        print(f"  {'lite, DataArray':<28}{time.perf_counter() - start:>8.3f} s")
+
+        # two_fluid stacks the modes first, while kinetic_alfven returns
+        # one frequency per angle
+        if function is two_fluid:
+            omega = np.moveaxis(omega, 0, 1)
+        else:
+            omega = np.moveaxis(omega, -1, 1)
+        agree = np.allclose(omega, expected, rtol=1e-6, atol=0)
+        print(f"  agrees with one call per plasma: {agree}")
+
+
+if __name__ == "__main__":
+    main()
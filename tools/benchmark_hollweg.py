@@ -0,0 +1,90 @@
+"""
+Benchmark finding the roots of Hollweg's dispersion relation over a grid
+of wavenumbers and propagation angles.
+
+The roots of the polynomials for every pair of wavenumber and angle are
+found by calling `numpy.roots` once per pair, as
+`~plasmapy.dispersion.numerical.hollweg_.hollweg` did before, and by the
+batched solver that it now uses, with and without tracking the modes
+along the wavenumbers.
+
+Run from the repository root with:
+
+    python tools/benchmark_hollweg.py
+"""
+
+import time
+
+import numpy as np
+
+from plasmapy.dispersion.numerical.hollweg_ import _polynomial_roots, _track_roots
+
+
+def looped_roots(coefficients: np.ndarray) -> np.ndarray:
+    """Find the roots of each polynomial with `numpy.roots`."""
+    roots = np.empty((3, *coefficients.shape[1:]), dtype=np.complex128)
+    for ii in range(coefficients.shape[1]):
+        for jj in range(coefficients.shape[2]):
+            roots[:, ii, jj] = np.roots(coefficients[:, ii, jj])
+    return roots
+
+
+def hollweg_coefficients(num_k: int, num_theta: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return wavenumbers and the coefficients of the dispersion relation
+    in normalized units, for a low-β plasma.
+    """
+    k = np.geomspace(1e-2, 10, num=num_k)
+    theta = np.linspace(np.deg2rad(80), np.pi / 2, num=num_theta)
+    thetav, kv = np.meshgrid(theta, k)
+    kz = np.cos(thetav) * kv
+    kx = np.sin(thetav) * kv
+
+    # Normalized to the Alfvén speed and ion inertial length
+    beta, D, F = 0.01, 0.01, 1 / 1836
+    alpha_A = kv**2
+    alpha_s = beta * kv**2
+    sigma = kz**2
+    coefficients = np.array(
+        [
+            F * kx**2 + 1,
+            -alpha_A * (1 + beta + F * kx**2) - sigma * (1 + D * kx**2),
+            sigma * alpha_A * (1 + 2 * beta + D * kx**2),
+            -alpha_s * sigma**2,
+        ]
+    )
+    return k, coefficients
+
+
+def benchmark(num_k: int, num_theta: int, loop: bool = True) -> None:
+    """Print the time to find the roots on a grid of the given size."""
+    k, coefficients = hollweg_coefficients(num_k, num_theta)
+    print(f"{num_k} x {num_theta} grid")
+
+    if loop:
+        start = time.perf_counter()
+        expected = np.sort(np.sqrt(looped_roots(coefficients)), axis=0)
+        print(f"  {'numpy.roots per pair':<28}{time.perf_counter() - start:>8.2f} s")
+
+    start = time.perf_counter()
+    roots = np.sqrt(_polynomial_roots(coefficients))
+    print(f"  {'batched eigenvalues':<28}{time.perf_counter() - start:>8.2f} s")
+
+    start = time.perf_counter()
+    tracked = _track_roots(roots, k)
+    print(f"  {'mode tracking':<28}{time.perf_counter() - start:>8.2f} s")
+
+    if loop:
+        agree = np.allclose(tracked, expected, rtol=1e-8, atol=1e-12)
+        print(f"  agrees with numpy.roots: {agree}")
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    benchmark(100, 100)
+    benchmark(300, 300)
+    benchmark(1000, 1000, loop=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark the time taken to import PlasmaPy and its subpackages.
+
+Each import is timed in a new interpreter, so that modules imported by
+an earlier measurement are not already in `sys.modules`.  The import of
+``astropy.units`` is timed as a reference, since nearly every part of
+PlasmaPy depends on it.
+
+Run from the repository root with:
+
+    python tools/benchmark_import_time.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import astropy.units",
+    "import plasmapy",
+    "import plasmapy.particles",
+    "import plasmapy.formulary",
+    "from plasmapy.formulary import thermal_speed",
+    "from plasmapy.formulary import *",
+    "import plasmapy.dispersion",
+    "import plasmapy.diagnostics",
+    "import plasmapy.analysis",
+]
+
+
+def time_import(statement: str, repeat: int = 5) -> float:
+    """Return the median time in milliseconds to run ``statement``."""
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        times.append(float(result.stdout.split()[-1]))
+    return statistics.median(times) * 1e3
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    print("Median import time in a new interpreter [ms]")
+    for statement in STATEMENTS:
+        print(f"{statement:<48}{time_import(statement):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
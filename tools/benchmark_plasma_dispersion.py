@@ -0,0 +1,66 @@
+"""
+Benchmark the speed and accuracy of the methods of
+`~plasmapy.dispersion.dispersion_functions.plasma_dispersion_func`.
+
+Each method is timed for random arguments in the upper and lower half
+of the complex plane and on the real axis, and its maximum relative
+error is measured against `scipy.special.wofz` evaluated with complex
+arguments.  The time to build the table of the ``"table"`` method,
+which is paid the first time it is used, is reported separately.
+
+Run from the repository root with:
+
+    python tools/benchmark_plasma_dispersion.py
+"""
+
+import time
+import timeit
+
+import numpy as np
+from scipy.special import wofz
+
+from plasmapy.dispersion import dispersion_functions
+from plasmapy.dispersion.dispersion_functions import plasma_dispersion_func
+
+methods = ("wofz", "rational", "table")
+
+
+def benchmark(label: str, zeta: np.ndarray) -> None:
+    """Print the time per element and the maximum relative error of each method."""
+    expected = 1j * np.sqrt(np.pi) * wofz(zeta.astype(np.complex128))
+    for method in methods:
+        result = plasma_dispersion_func(zeta, method=method)
+        error = np.max(np.abs(result - expected) / np.abs(expected))
+        time_per_element = (
+            min(
+                timeit.repeat(
+                    lambda method=method: plasma_dispersion_func(zeta, method=method),
+                    number=3,
+                    repeat=3,
+                )
+            )
+            / 3
+            / zeta.size
+            * 1e9
+        )
+        print(f"{label:<20}{method:<10}{time_per_element:>14.1f}{error:>16.1e}")
+
+
+def main(num: int = 1_000_000) -> None:
+    """Run the benchmarks."""
+    start = time.perf_counter()
+    dispersion_functions._taylor_table()
+    print(f"Built the table in {time.perf_counter() - start:.3f} s\n")
+
+    rng = np.random.default_rng(seed=1)
+    real = rng.normal(scale=4, size=num)
+    imag = rng.uniform(0, 3, size=num)
+
+    print(f"{'arguments':<20}{'method':<10}{'time [ns]':>14}{'max rel error':>16}")
+    benchmark("upper half plane", real + 1j * imag)
+    benchmark("lower half plane", real - 1j * imag)
+    benchmark("real axis", real)
+
+
+if __name__ == "__main__":
+    main()
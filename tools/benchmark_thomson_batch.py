@@ -0,0 +1,184 @@
+"""
+Benchmark computing many Thomson spectra with
+`~plasmapy.diagnostics.thomson.spectral_density_lite`.
+
+The spectra of a set of random two electron, two ion population plasmas
+are computed three ways: by calling the implementation of
+``spectral_density_lite`` used before batching was supported once per
+parameter set, by calling the current function once per parameter set,
+and by a single call with a leading batch dimension.
+
+Run from the repository root with:
+
+    python tools/benchmark_thomson_batch.py
+"""
+
+import time
+
+import numpy as np
+
+from plasmapy.diagnostics.thomson import spectral_density_lite
+from plasmapy.formulary import (
+    permittivity_1D_Maxwellian_lite,
+    plasma_frequency_lite,
+    thermal_speed_coefficients,
+    thermal_speed_lite,
+)
+
+c = 299792458.0
+m_e = 9.1093837015e-31
+m_p = 1.67262192369e-27
+
+
+def looped_spectral_density_lite(
+    wavelengths,
+    probe_wavelength,
+    n,
+    *,
+    T_e,
+    T_i,
+    efract,
+    ifract,
+    ion_z,
+    ion_mass,
+    electron_vel,
+    ion_vel,
+    probe_vec,
+    scatter_vec,
+):
+    """
+    Compute one spectrum with loops over the electron and ion
+    populations, as ``spectral_density_lite`` did before it supported
+    batches.
+    """
+    scattering_angle = np.arccos(np.dot(probe_vec, scatter_vec))
+    coefs = thermal_speed_coefficients("most_probable", 3)
+    vT_e = thermal_speed_lite(T_e, m_e, coefs)
+    vT_i = thermal_speed_lite(T_i, ion_mass, coefs)
+    ne = efract * n
+    zbar = np.sum(ifract * ion_z)
+    ni = ifract * n / zbar
+    wpe = plasma_frequency_lite(n, m_e, 1)
+    ws = 2 * np.pi * c / wavelengths
+    wl = 2 * np.pi * c / probe_wavelength
+    w = ws - wl
+    ks = np.sqrt(ws**2 - wpe**2) / c
+    kl = np.sqrt(wl**2 - wpe**2) / c
+    k = np.sqrt(ks**2 + kl**2 - 2 * ks * kl * np.cos(scattering_angle))
+    k_vec = scatter_vec - probe_vec
+    k_vec = k_vec / np.linalg.norm(k_vec)
+    w_e = w - np.matmul(electron_vel, np.outer(k, k_vec).T)
+    w_i = w - np.matmul(ion_vel, np.outer(k, k_vec).T)
+    alpha = np.sqrt(2) * wpe / np.outer(k, vT_e)
+    xe = np.outer(1 / vT_e, 1 / k) * w_e
+    xi = np.outer(1 / vT_i, 1 / k) * w_i
+
+    chiE = np.zeros([efract.size, w.size], dtype=np.complex128)
+    for i in range(efract.size):
+        wpe = plasma_frequency_lite(ne[i], m_e, 1)
+        chiE[i, :] = permittivity_1D_Maxwellian_lite(w_e[i, :], k, vT_e[i], wpe)
+    chiI = np.zeros([ifract.size, w.size], dtype=np.complex128)
+    for i in range(ifract.size):
+        wpi = plasma_frequency_lite(ni[i], ion_mass[i], ion_z[i])
+        chiI[i, :] = permittivity_1D_Maxwellian_lite(w_i[i, :], k, vT_i[i], wpi)
+    epsilon = 1 + np.sum(chiE, axis=0) + np.sum(chiI, axis=0)
+
+    econtr = np.zeros([efract.size, w.size], dtype=np.complex128)
+    for m in range(efract.size):
+        econtr[m, :] = efract[m] * (
+            2
+            * np.sqrt(np.pi)
+            / k
+            / vT_e[m]
+            * np.power(np.abs(1 - np.sum(chiE, axis=0) / epsilon), 2)
+            * np.exp(-(xe[m, :] ** 2))
+        )
+    icontr = np.zeros([ifract.size, w.size], dtype=np.complex128)
+    for m in range(ifract.size):
+        icontr[m, :] = ifract[m] * (
+            2
+            * np.sqrt(np.pi)
+            * ion_z[m] ** 2
+            / zbar
+            / k
+            / vT_i[m]
+            * np.power(np.abs(np.sum(chiE, axis=0) / epsilon), 2)
+            * np.exp(-(xi[m, :] ** 2))
+        )
+    Skw = np.real(np.sum(econtr, axis=0) + np.sum(icontr, axis=0))
+    return np.mean(alpha), Skw
+
+
+def random_parameters(num: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Return ``num`` random sets of plasma parameters."""
+    rng = np.random.default_rng(seed)
+    efract = rng.uniform(0.2, 0.8, size=(num, 1)) * [1, -1] + [0, 1]
+    ifract = rng.uniform(0.2, 0.8, size=(num, 1)) * [1, -1] + [0, 1]
+    return {
+        "n": rng.uniform(1e23, 1e25, size=num),
+        "T_e": rng.uniform(1e4, 1e6, size=(num, 2)),
+        "T_i": rng.uniform(1e4, 1e6, size=(num, 2)),
+        "efract": efract,
+        "ifract": ifract,
+        "ion_z": np.broadcast_to([1.0, 5.0], (num, 2)),
+        "ion_mass": np.broadcast_to([m_p, 12 * m_p], (num, 2)),
+        "electron_vel": rng.normal(0, 1e5, size=(num, 2, 3)),
+        "ion_vel": rng.normal(0, 1e5, size=(num, 2, 3)),
+    }
+
+
+def benchmark(num: int, num_wavelengths: int) -> None:
+    """Time computing ``num`` spectra of ``num_wavelengths`` each."""
+    fixed = {
+        "wavelengths": np.linspace(520e-9, 545e-9, num_wavelengths),
+        "probe_wavelength": 532e-9,
+        "probe_vec": np.array([1.0, 0.0, 0.0]),
+        "scatter_vec": np.array([0.0, 1.0, 0.0]),
+    }
+    parameters = random_parameters(num)
+    parameter_sets = [
+        {key: value[i] for key, value in parameters.items()} for i in range(num)
+    ]
+
+    print(f"{num} spectra of {num_wavelengths} wavelengths each")
+    print(f"{'method':<28}{'time [s]':>10}{'per spectrum [us]':>20}")
+
+    start = time.perf_counter()
+    looped = [looped_spectral_density_lite(**fixed, **p) for p in parameter_sets]
+    looped_time = time.perf_counter() - start
+    print(
+        f"{'looped, one call each':<28}{looped_time:>10.3f}{looped_time / num * 1e6:>20.1f}"
+    )
+
+    start = time.perf_counter()
+    for p in parameter_sets:
+        spectral_density_lite(**fixed, **p)
+    single_time = time.perf_counter() - start
+    print(
+        f"{'current, one call each':<28}{single_time:>10.3f}{single_time / num * 1e6:>20.1f}"
+    )
+
+    start = time.perf_counter()
+    _, Skw = spectral_density_lite(**fixed, **parameters)
+    batch_time = time.perf_counter() - start
+    print(
+        f"{'current, one batched call':<28}{batch_time:>10.3f}{batch_time / num * 1e6:>20.1f}"
+    )
+
+    print(f"Speedup of the batched call: {looped_time / batch_time:.1f}x")
+    looped_Skw = np.array([result[1] for result in looped])
+    error = np.max(np.abs(Skw - looped_Skw)) / np.max(np.abs(looped_Skw))
+    print(f"Maximum relative difference from the looped spectra: {error:.1e}\n")
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    # With few wavelengths the time per call is dominated by the
+    # overhead of the Python code, and with many by the evaluation of
+    # the plasma dispersion function.
+    benchmark(num=20000, num_wavelengths=50)
+    benchmark(num=2000, num_wavelengths=1000)
+
+
+if __name__ == "__main__":
+    main()
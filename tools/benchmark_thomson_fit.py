@@ -0,0 +1,95 @@
+"""
+Benchmark fitting a sequence of Thomson spectra with
+`~plasmapy.diagnostics.thomson.SpectralDensityFitter`.
+
+A sequence of synthetic spectra of a plasma whose density and
+temperatures change slowly from frame to frame is fit four ways: with
+the `lmfit.model.Model` of
+`~plasmapy.diagnostics.thomson.spectral_density_model` using the
+Levenberg-Marquardt method from the same initial guess for every frame,
+and with `~plasmapy.diagnostics.thomson.SpectralDensityFitter` without
+warm starts, with warm starts, and with warm starts split between
+processes. The ``nfev`` of `lmfit` includes the evaluations that
+approximate the Jacobian, while that of
+`~plasmapy.diagnostics.thomson.SpectralDensityFitter` does not, since
+its Jacobian is approximated by one batched evaluation per iteration.
+
+Run from the repository root with:
+
+    python tools/benchmark_thomson_fit.py
+"""
+
+import copy
+import time
+
+import numpy as np
+from lmfit import Parameters
+
+from plasmapy.diagnostics.thomson import (
+    SpectralDensityFitter,
+    spectral_density_model,
+)
+
+
+def settings_params():
+    """Return the settings and parameters of a two electron population fit."""
+    settings = {
+        "probe_wavelength": 532e-9,
+        "probe_vec": np.array([1, 0, 0]),
+        "scatter_vec": np.array([np.cos(np.deg2rad(63)), np.sin(np.deg2rad(63)), 0]),
+        "ions": ["p+"],
+        "notch": np.array([531e-9, 533e-9]),
+    }
+    params = Parameters()
+    params.add("n", value=2e23, min=5e22, max=6e23)
+    params.add("T_e_0", value=10, min=1, max=50)
+    params.add("T_e_1", value=40, min=1, max=200)
+    params.add("T_i_0", value=20, vary=False)
+    params.add("efract_0", value=0.6, min=0.1, max=0.9)
+    params.add("efract_1", value=0.4)
+    params.add("background", value=0.01, min=0, max=0.1)
+    return settings, params
+
+
+def main(num_frames: int = 24, n_workers: int = 4) -> None:
+    """Run the benchmark."""
+    wavelengths = np.linspace(492e-9, 572e-9, 512)
+    settings, params = settings_params()
+    fitter = SpectralDensityFitter(wavelengths, *settings_params())
+
+    # The plasma heats and compresses by 30% over the sequence
+    x_initial = np.array([params[name].value for name in fitter.varying])
+    ramp = np.linspace(1, 1.3, num_frames)[:, np.newaxis]
+    x_true = x_initial * np.where(
+        np.isin(fitter.varying, ["n", "T_e_0", "T_e_1"]), ramp, 1
+    )
+    rng = np.random.default_rng(seed=1)
+    data = fitter.evaluate(x_true)
+    data *= 1 + rng.normal(scale=0.02, size=data.shape)
+
+    print(f"Fitting {num_frames} spectra of {wavelengths.size} wavelengths")
+    print(f"{'method':<36}{'time [s]':>10}{'nfev':>8}")
+
+    model = spectral_density_model(wavelengths, settings, params)
+    start = time.perf_counter()
+    nfev = 0
+    for frame in data:
+        result = model.fit(
+            frame, copy.deepcopy(params), wavelengths=wavelengths, method="leastsq"
+        )
+        nfev += result.nfev
+    print(f"{'lmfit Model, leastsq':<36}{time.perf_counter() - start:>10.2f}{nfev:>8}")
+
+    for label, kwargs in [
+        ("SpectralDensityFitter, cold starts", {"warm_start": False}),
+        ("SpectralDensityFitter, warm starts", {}),
+        (f"SpectralDensityFitter, {n_workers} processes", {"n_workers": n_workers}),
+    ]:
+        start = time.perf_counter()
+        result = fitter.fit_sequence(data, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<36}{elapsed:>10.2f}{np.sum(result.nfev):>8}")
+
+
+if __name__ == "__main__":
+    main()
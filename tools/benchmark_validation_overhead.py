@@ -0,0 +1,101 @@
+"""
+Benchmark the per-call overhead of `~plasmapy.utils.decorators.validate_quantities`.
+
+The overhead of the decorator is the time of a decorated call minus the
+time of calling the undecorated function.  For comparison, the script
+also times the validation path used before the validations were
+compiled, which binds the call with `inspect.Signature.bind` and
+rebuilds the complete validations dictionary on every call.
+
+Run from the repository root with:
+
+    python tools/benchmark_validation_overhead.py
+"""
+
+import inspect
+import timeit
+
+import astropy.units as u
+
+from plasmapy.formulary import gyrofrequency, thermal_speed
+from plasmapy.utils.decorators.validators import ValidateQuantities
+
+
+def velocity(x: u.m, t: u.s = 1 * u.s) -> u.m / u.s:
+    """Return the velocity of something that travelled ``x`` in time ``t``."""
+    return x / t
+
+
+def speed(
+    T: u.K,
+    mass: u.kg,
+    ndim: int = 3,
+    coef: u.dimensionless_unscaled = None,
+) -> u.m / u.s:
+    """Return a thermal speed, with a signature like the formulary's."""
+    if coef is None:
+        coef = 2 * u.dimensionless_unscaled
+    return (coef * T * 1.380649e-23 * u.J / u.K / mass) ** 0.5 * (ndim / 3)
+
+
+def _call_rebuilding_validations(vq, func, args, kwargs):
+    """Validate and call ``func`` the way the uncompiled decorator did."""
+    bound_args = inspect.signature(func, eval_str=True).bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    validations = vq._get_validations(bound_args)
+    for arg_name in validations:
+        if arg_name == "validations_on_return":
+            continue
+        bound_args.arguments[arg_name] = vq._validate_quantity(
+            bound_args.arguments[arg_name], arg_name, validations[arg_name]
+        )
+    _return = func(**bound_args.arguments)
+    if "validations_on_return" in validations:
+        _return = vq._validate_quantity(
+            _return, "validations_on_return", validations["validations_on_return"]
+        )
+    return _return
+
+
+def _time_per_call(func, number) -> float:
+    """Return the best time per call of ``func`` in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def benchmark_overhead(func, *args, number=5000, **validations) -> None:
+    """Print the overhead of validating the arguments and return of ``func``."""
+    vq = ValidateQuantities(**validations)
+    wrapped = vq(func)
+
+    bare = _time_per_call(lambda: func(*args), number)
+    rebuilt = _time_per_call(
+        lambda: _call_rebuilding_validations(vq, func, args, {}), number
+    )
+    compiled = _time_per_call(lambda: wrapped(*args), number)
+
+    print(
+        f"{func.__name__:<16}{bare:>10.1f}{rebuilt - bare:>18.1f}"
+        f"{compiled - bare:>16.1f}{(rebuilt - bare) / (compiled - bare):>10.1f}x"
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    print("Per-call overhead of validate_quantities [us]")
+    print(
+        f"{'function':<16}{'bare':>10}{'rebuilt per call':>18}"
+        f"{'compiled':>16}{'speedup':>11}"
+    )
+    benchmark_overhead(velocity, 5 * u.m)
+    benchmark_overhead(speed, 1e6 * u.K, 1.67e-27 * u.kg, T={"can_be_negative": False})
+
+    print("\nTotal time per call of formulary functions [us]")
+    number = 1000
+    time = _time_per_call(lambda: thermal_speed(1e6 * u.K, "p+"), number)
+    print(f"{'thermal_speed':<16}{time:>10.1f}")
+    time = _time_per_call(lambda: gyrofrequency(0.1 * u.T, "p+"), number)
+    print(f"{'gyrofrequency':<16}{time:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Compile the JSON particle data files into :file:`particle_data.npz`.
+
+`plasmapy.particles` reads the elements, isotopes, and ionization
+energy data from the columns of NumPy arrays in
+:file:`src/plasmapy/particles/data/particle_data.npz`, as long as these
+were compiled from the current JSON files.  Run this script from the
+repository root after changing any of the JSON files:
+
+    python tools/compile_particle_data.py
+"""
+
+from pathlib import Path
+
+from plasmapy.particles._data_tables import _write_compiled_tables
+
+DATA_PATH = Path(__file__).parent.parent / "src" / "plasmapy" / "particles" / "data"
+
+if __name__ == "__main__":
+    _write_compiled_tables(DATA_PATH / "particle_data.npz")